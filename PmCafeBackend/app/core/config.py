@@ -18,6 +18,24 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
 
+    # 워커 간 캐시 무효화 채널: auto (PostgreSQL이면 LISTEN/NOTIFY), postgres, local
+    CACHE_INVALIDATION: str = "auto"
+
+    # 워커 간 실시간 이벤트 전달 채널: auto (PostgreSQL이면 LISTEN/NOTIFY), postgres, local
+    EVENT_FANOUT: str = "auto"
+
+    # 워커에서 outbox 릴레이 실행 여부 (테스트에서는 끄고 직접 drain)
+    OUTBOX_RELAY: bool = True
+
+    # 응답 gzip 압축: 이 크기(바이트) 이상인 응답만, 압축 레벨 1-9
+    GZIP_MINIMUM_SIZE: int = 1024
+    GZIP_COMPRESS_LEVEL: int = 6
+
+    # 업로드 미디어 (메뉴 이미지): 저장 디렉터리, 제공 경로, 업로드 최대 크기(바이트)
+    MEDIA_ROOT: str = "media"
+    MEDIA_URL: str = "/media"
+    MENU_IMAGE_MAX_BYTES: int = 10 * 1024 * 1024
+
     # CORS (쉼표로 구분된 허용 도메인)
     BACKEND_CORS_ORIGINS: str = "http://localhost:5173,http://localhost:3000"
 
@@ -0,0 +1,23 @@
+"""
+Cache invalidation dependencies
+"""
+from fastapi import Depends, Request
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.invalidation import invalidation_bus
+
+READ_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+def invalidates(*topics: str):
+    """
+    Router dependency: writes of the request invalidate `topics` in every worker
+
+    Only requests that commit invalidate anything (see app/invalidation.py).
+    """
+    def dependency(request: Request, db: Session = Depends(get_db)) -> None:
+        if request.method not in READ_METHODS:
+            invalidation_bus.mark(db, *topics)
+
+    return dependency
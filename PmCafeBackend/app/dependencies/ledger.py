@@ -0,0 +1,9 @@
+"""
+Ledger service dependency injection
+"""
+from app.services.ledger_service import LedgerService
+
+
+def get_ledger_service() -> LedgerService:
+    """Get LedgerService instance for dependency injection"""
+    return LedgerService()
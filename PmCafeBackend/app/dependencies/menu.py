@@ -0,0 +1,15 @@
+"""
+Menu service dependency injection
+"""
+from app.services.menu_service import MenuService
+from app.services.menu_image_service import MenuImageService
+
+
+def get_menu_service() -> MenuService:
+    """Get MenuService instance for dependency injection"""
+    return MenuService()
+
+
+def get_menu_image_service() -> MenuImageService:
+    """Get MenuImageService instance for dependency injection"""
+    return MenuImageService()
@@ -0,0 +1,9 @@
+"""
+Settlement service dependency injection
+"""
+from app.services.settlement_service import SettlementService
+
+
+def get_settlement_service() -> SettlementService:
+    """Get SettlementService instance for dependency injection"""
+    return SettlementService()
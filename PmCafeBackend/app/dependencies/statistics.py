@@ -0,0 +1,9 @@
+"""
+Statistics service dependency injection
+"""
+from app.services.statistics_service import StatisticsService
+
+
+def get_statistics_service() -> StatisticsService:
+    """Get StatisticsService instance for dependency injection"""
+    return StatisticsService()
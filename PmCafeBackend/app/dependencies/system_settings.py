@@ -0,0 +1,19 @@
+"""
+System settings dependency injection
+"""
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.services.settings_service import SettingsService, SettingsCache, settings_cache
+
+
+def get_settings_service() -> SettingsService:
+    """Get SettingsService instance for dependency injection"""
+    return SettingsService()
+
+
+def get_settings(db: Session = Depends(get_db)) -> SettingsCache:
+    """Settings cache, reloaded first when stale (normally no query)"""
+    settings_cache.ensure_fresh(db)
+    return settings_cache
@@ -0,0 +1,82 @@
+"""
+In-process order and catalog event bus
+Event names and payloads follow docs/backend/10-websocket.md
+"""
+import logging
+from datetime import datetime
+from typing import Callable, List
+
+from app.models.order import Order
+from app.schemas.order import build_order_response
+
+logger = logging.getLogger(__name__)
+
+ORDER_CREATED = "order:created"
+ORDER_STATUS_CHANGED = "order:status_changed"
+MENU_SOLD_OUT_CHANGED = "menu:sold_out_changed"
+
+EventHandler = Callable[[str, dict], None]
+
+
+class EventBus:
+    """
+    Synchronous publish/subscribe for order and catalog events
+
+    Handlers run in the publisher's thread right after the change is committed,
+    so they must be quick and must not touch the publisher's DB session.
+    A failing handler is logged and never fails the request that published.
+    """
+
+    def __init__(self):
+        self._handlers: List[EventHandler] = []
+
+    def subscribe(self, handler: EventHandler) -> EventHandler:
+        if handler not in self._handlers:
+            self._handlers.append(handler)
+        return handler
+
+    def unsubscribe(self, handler: EventHandler) -> None:
+        if handler in self._handlers:
+            self._handlers.remove(handler)
+
+    def publish(self, event: str, data: dict) -> None:
+        for handler in list(self._handlers):
+            try:
+                handler(event, data)
+            except Exception:
+                logger.exception("Event handler %r failed for %s", handler, event)
+
+
+event_bus = EventBus()
+
+
+def order_created_payload(order: Order) -> dict:
+    """Build the `order:created` payload (OrderResponse shape) from an order with items/options/cell loaded"""
+    return build_order_response(order).model_dump(mode="json")
+
+
+def order_status_changed_payload(order, previous_status: str) -> dict:
+    """Build the `order:status_changed` payload from an Order or an updated order row"""
+    return {
+        "orderId": order.order_id,
+        "dailyNum": order.daily_num,
+        "payType": order.pay_type.value,
+        "totalAmount": order.total_amount,
+        "status": order.status.value,
+        "previousStatus": previous_status,
+        "version": order.version,
+        "createdAt": order.created_at.isoformat() if order.created_at else None,
+        "updatedAt": order.updated_at.isoformat() if order.updated_at else None,
+        "makingStartedAt": order.making_started_at.isoformat() if order.making_started_at else None,
+        "completedAt": order.completed_at.isoformat() if order.completed_at else None,
+    }
+
+
+def menu_sold_out_changed_payload(menu_id: int, menu_name: str, is_sold_out: bool, updated_at: datetime) -> dict:
+    """Build the `menu:sold_out_changed` payload"""
+    return {
+        "menuId": menu_id,
+        "menuName": menu_name,
+        "isSoldOut": is_sold_out,
+        "updatedAt": updated_at.isoformat(),
+    }
@@ -71,6 +71,14 @@ class CategoryNotFoundError(ResourceNotFoundError):
         self.code = "CATEGORY_NOT_FOUND"
 
 
+class OptionGroupNotFoundError(ResourceNotFoundError):
+    """Raised when option group is not found"""
+
+    def __init__(self, option_group_id: Optional[str] = None):
+        super().__init__("옵션 그룹", option_group_id)
+        self.code = "OPTION_GROUP_NOT_FOUND"
+
+
 # Business Logic Errors
 class InsufficientBalanceError(BusinessException):
     """Raised when cell balance is insufficient"""
@@ -113,6 +121,82 @@ class InvalidOrderStatusTransitionError(BusinessException):
         )
 
 
+class OrderConflictError(BusinessException):
+    """Raised when an order was changed concurrently (stale status or version)"""
+
+    def __init__(self, order_id: str):
+        super().__init__(
+            f"주문 {order_id}이(가) 이미 다른 상태로 변경되었습니다. 새로고침 후 다시 시도하세요",
+            "ORDER_CONFLICT"
+        )
+
+
+# Settlement Errors
+class SettlementNotFoundError(BusinessException):
+    """Raised when a day has no settlement yet"""
+
+    def __init__(self):
+        super().__init__("정산 내역이 없습니다", "SETTLEMENT_NOT_FOUND")
+
+
+class SettlementAlreadyConfirmedError(BusinessException):
+    """Raised when confirming a settlement that is already confirmed"""
+
+    def __init__(self):
+        super().__init__("이미 확정된 정산입니다", "ALREADY_CONFIRMED")
+
+
+class FutureSettlementDateError(BusinessException):
+    """Raised when settling a day that has not started yet"""
+
+    def __init__(self):
+        super().__init__("미래 날짜는 정산할 수 없습니다", "FUTURE_DATE")
+
+
+# Setting Errors
+class SettingNotFoundError(BusinessException):
+    """Raised when a setting key is neither stored nor known"""
+
+    def __init__(self, key: str):
+        super().__init__(f"설정 ({key})을(를) 찾을 수 없습니다", "SETTING_NOT_FOUND")
+
+
+class InvalidSettingValueError(BusinessException):
+    """Raised when a setting value does not match its type or range"""
+
+    def __init__(self, key: str, expected: str):
+        super().__init__(f"{key} 설정 값은 {expected}이어야 합니다", "INVALID_VALUE")
+
+
+class DuplicateSettingKeyError(BusinessException):
+    """Raised when adding a setting key that already exists"""
+
+    def __init__(self, key: str):
+        super().__init__(f"이미 존재하는 설정 키입니다 ({key})", "DUPLICATE_KEY")
+
+
+class KioskInactiveError(BusinessException):
+    """Raised when ordering while the kiosk is deactivated or in maintenance"""
+
+    def __init__(self, message: str = "키오스크가 비활성화되어 있습니다"):
+        super().__init__(message, "KIOSK_INACTIVE")
+
+
+# Image Errors
+class InvalidImageError(BusinessException):
+    """Raised when an upload is not a supported image"""
+
+    def __init__(self):
+        super().__init__("이미지 파일을 읽을 수 없습니다 (JPEG, PNG, WebP만 가능)", "INVALID_IMAGE")
+
+
+class ImageTooLargeError(BusinessException):
+    """Raised when an upload exceeds the size limit"""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"이미지는 {max_bytes // (1024 * 1024)}MB 이하여야 합니다", "IMAGE_TOO_LARGE")
+
+
 # Validation Errors
 class ValidationError(BusinessException):
     """Raised when validation fails"""
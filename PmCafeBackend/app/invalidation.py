@@ -0,0 +1,279 @@
+"""
+Cross-worker cache invalidation
+
+Writers mark the topics a DB session changes; when the session commits,
+every worker's in-process caches for those topics are invalidated. The
+local worker is notified right after the commit, other workers through a
+channel: PostgreSQL LISTEN/NOTIFY in production (the NOTIFY is part of
+the writer's transaction, so rolled-back writes never invalidate), or an
+in-memory channel joining several buses in one process for tests.
+"""
+import itertools
+import json
+import logging
+import os
+import select
+import threading
+import uuid
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import event, func
+from sqlalchemy import select as sql_select
+from sqlalchemy.engine import Connection, make_url
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "pmcafe_invalidation"
+
+MENUS = "menus"
+CATEGORIES = "categories"
+OPTIONS = "options"
+CELLS = "cells"
+SETTINGS = "settings"
+ALL = "*"  # everything: sent after a missed message or a listener reconnect
+
+InvalidationHandler = Callable[[str], None]
+
+_PENDING = "invalidation_pending"  # session.info: (bus, topics) marked in the current transaction
+_OUTGOING = "invalidation_outgoing"  # session.info: messages of the committing transaction
+
+
+class LocalChannel:
+    """Single worker: nothing to send, nothing to listen to"""
+
+    transactional = False
+
+    def send(self, message: dict, connection: Optional[Connection] = None) -> None:
+        pass
+
+    def start(self, bus: "InvalidationBus") -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+
+class MemoryChannel:
+    """
+    Buses of one process joined as if they were separate workers (tests)
+
+    Messages are delivered after the writer's commit, like NOTIFY.
+    """
+
+    transactional = False
+
+    def __init__(self):
+        self._buses: List["InvalidationBus"] = []
+
+    def send(self, message: dict, connection: Optional[Connection] = None) -> None:
+        for bus in list(self._buses):
+            bus.receive(message)
+
+    def start(self, bus: "InvalidationBus") -> None:
+        if bus not in self._buses:
+            self._buses.append(bus)
+
+    def stop(self) -> None:
+        self._buses.clear()
+
+
+class PostgresChannel:
+    """
+    PostgreSQL LISTEN/NOTIFY
+
+    `send` runs pg_notify on the writer's connection inside its transaction;
+    PostgreSQL delivers it to every listener on commit. `start` runs a
+    listener thread on its own connection; after every (re)connect the bus
+    invalidates everything, since messages may have been missed meanwhile.
+    Scripts only send and never start the listener.
+    """
+
+    transactional = True
+
+    def __init__(
+        self,
+        database_url: str,
+        name: str = CHANNEL,
+        reconnect_seconds: float = 1.0,
+        poll_seconds: float = 1.0
+    ):
+        self._dsn = make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+        self.name = name
+        self._reconnect_seconds = reconnect_seconds
+        self._poll_seconds = poll_seconds
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def send(self, message: dict, connection: Optional[Connection] = None) -> None:
+        if connection is None:
+            raise ValueError("PostgresChannel sends inside the writer's transaction")
+        connection.execute(sql_select(func.pg_notify(self.name, json.dumps(message))))
+
+    def start(self, bus) -> None:
+        """Listen in a thread, passing notifications to `bus.receive` (`bus.resync` after each connect)"""
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._listen, args=(bus,), name=f"listen-{self.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._poll_seconds + 1)
+            self._thread = None
+
+    def _listen(self, bus) -> None:
+        import psycopg2
+        import psycopg2.extensions
+
+        while not self._stopped.is_set():
+            conn = None
+            try:
+                conn = psycopg2.connect(self._dsn)
+                conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+                conn.cursor().execute(f"LISTEN {self.name}")
+                bus.resync()
+                while not self._stopped.is_set():
+                    if select.select([conn], [], [], self._poll_seconds) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        notify = conn.notifies.pop(0)
+                        bus.receive(json.loads(notify.payload))
+            except Exception:
+                logger.exception("Listener on %s failed; reconnecting", self.name)
+                self._stopped.wait(self._reconnect_seconds)
+            finally:
+                if conn is not None:
+                    conn.close()
+
+
+class InvalidationBus:
+    """
+    Invalidation messages between the workers' caches
+
+    A message is {"topic", "origin", "seq"}: `seq` numbers the messages of
+    one worker (`origin`), so a receiver that sees a gap treats everything
+    as stale. Messages of concurrent transactions may arrive out of order;
+    late ones are still applied. Handlers get the topic (or ALL) and must
+    be quick; a failing handler is logged and never fails the writer.
+    """
+
+    def __init__(self, origin: Optional[str] = None):
+        self.origin = origin or f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._lock = threading.Lock()
+        self._handlers: List[InvalidationHandler] = []
+        self._seq = itertools.count(1)
+        self._seen: Dict[str, int] = {}
+        self.channel = LocalChannel()
+
+    def use(self, channel, listen: bool = True) -> None:
+        """Switch channel (the previous one is stopped); scripts that only write pass listen=False"""
+        self.channel.stop()
+        self.channel = channel
+        if listen:
+            channel.start(self)
+
+    def subscribe(self, handler: InvalidationHandler) -> InvalidationHandler:
+        with self._lock:
+            if handler not in self._handlers:
+                self._handlers.append(handler)
+        return handler
+
+    def unsubscribe(self, handler: InvalidationHandler) -> None:
+        with self._lock:
+            if handler in self._handlers:
+                self._handlers.remove(handler)
+
+    def mark(self, db: Session, *topics: str) -> None:
+        """Invalidate `topics` everywhere when this session's transaction commits (dropped on rollback)"""
+        if not db.in_transaction():
+            # Tie the topics to a transaction, so a rollback before any query still drops them
+            db.begin()
+        _, marked = db.info.setdefault(_PENDING, (self, set()))
+        marked.update(topics)
+
+    def publish(self, topic: str, connection: Optional[Connection] = None) -> None:
+        """Invalidate a topic now, outside any session (sent on `connection` for PostgreSQL)"""
+        message = self._message(topic)
+        self._dispatch(topic)
+        self.channel.send(message, connection)
+
+    def receive(self, message: dict) -> None:
+        """Channel callback: apply another worker's message"""
+        origin, seq = message["origin"], message["seq"]
+        if origin == self.origin:
+            return
+        with self._lock:
+            last = self._seen.get(origin)
+            self._seen[origin] = seq if last is None else max(last, seq)
+        self._dispatch(ALL if last is not None and seq > last + 1 else message["topic"])
+
+    def resync(self) -> None:
+        """Invalidate everything (messages may have been missed)"""
+        self._dispatch(ALL)
+
+    def _message(self, topic: str) -> dict:
+        return {"topic": topic, "origin": self.origin, "seq": next(self._seq)}
+
+    def _dispatch(self, topic: str) -> None:
+        with self._lock:
+            handlers = list(self._handlers)
+        for handler in handlers:
+            try:
+                handler(topic)
+            except Exception:
+                logger.exception("Invalidation handler %r failed for %s", handler, topic)
+
+
+@event.listens_for(Session, "before_commit")
+def _send_in_transaction(session: Session) -> None:
+    pending = session.info.pop(_PENDING, None)
+    if not pending:
+        return
+    bus, topics = pending
+    messages = [bus._message(topic) for topic in sorted(topics)]
+    if bus.channel.transactional:
+        connection = session.connection()
+        for message in messages:
+            bus.channel.send(message, connection)
+    session.info[_OUTGOING] = (bus, messages)
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_after_commit(session: Session) -> None:
+    outgoing = session.info.pop(_OUTGOING, None)
+    if outgoing is None:
+        return
+    bus, messages = outgoing
+    for message in messages:
+        bus._dispatch(message["topic"])
+        if not bus.channel.transactional:
+            bus.channel.send(message)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING, None)
+    session.info.pop(_OUTGOING, None)
+
+
+def channel_for(database_url: str, backend: str = "auto"):
+    """
+    Channel for a deployment
+
+    Args:
+        backend: "postgres", "local" or "auto" (postgres for PostgreSQL URLs)
+    """
+    if backend == "auto":
+        backend = "postgres" if make_url(database_url).get_backend_name() == "postgresql" else "local"
+    if backend == "postgres":
+        return PostgresChannel(database_url)
+    if backend == "local":
+        return LocalChannel()
+    raise ValueError(f"Unknown cache invalidation backend: {backend}")
+
+
+invalidation_bus = InvalidationBus()
@@ -1,14 +1,44 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from app.core.config import settings
-from app.routers import auth, menus, cells, orders, categories, options, statistics, settlements
+from app.database import SessionLocal
+from app.events import event_bus
+from app.media import ImmutableStaticFiles, MediaSkippingGZipMiddleware
+from app.invalidation import invalidation_bus, channel_for, LocalChannel
+from app.realtime import event_fanout, event_channel_for, LoopbackChannel
+from app.outbox import outbox
+from app.routers import (
+    auth, menus, cells, orders, categories, options, statistics, settlements, system_settings, realtime
+)
+from app.services.dashboard_service import dashboard_aggregate
+from app.services.kitchen_queue import active_orders
+from app.services.order_metrics import order_metrics
+from app.services.catalog_cache import catalog_cache
+from app.services.settings_service import settings_cache
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Listen for other workers' cache invalidations and events, and relay the outbox, while serving"""
+    invalidation_bus.use(channel_for(settings.DATABASE_URL, settings.CACHE_INVALIDATION))
+    event_fanout.use(event_channel_for(settings.DATABASE_URL, settings.EVENT_FANOUT))
+    if settings.OUTBOX_RELAY:
+        outbox.start(SessionLocal)
+    yield
+    outbox.stop()
+    event_fanout.use(LoopbackChannel())
+    invalidation_bus.use(LocalChannel())
+
 
 app = FastAPI(
     title="P.M CAFE API",
     description="교회 카페 키오스크 백엔드 API",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 
@@ -35,6 +65,14 @@ app.add_middleware(
     allow_headers=["*"],  # Authorization, Content-Type 등 모든 헤더 허용
 )
 
+# 큰 응답 압축 (Accept-Encoding: gzip, SSE 스트림과 미디어 파일 제외)
+app.add_middleware(
+    MediaSkippingGZipMiddleware,
+    media_path=settings.MEDIA_URL,
+    minimum_size=settings.GZIP_MINIMUM_SIZE,
+    compresslevel=settings.GZIP_COMPRESS_LEVEL,
+)
+
 # Register routers
 app.include_router(auth.router)
 app.include_router(menus.router)
@@ -44,6 +82,34 @@ app.include_router(categories.router)
 app.include_router(options.router)
 app.include_router(statistics.router)
 app.include_router(settlements.router)
+app.include_router(system_settings.router)
+app.include_router(realtime.router)
+
+# 업로드한 메뉴 이미지 (내용 해시 파일명, 1년 immutable 캐시)
+app.mount(settings.MEDIA_URL, ImmutableStaticFiles(directory=settings.MEDIA_ROOT, check_dir=False), name="media")
+
+# In-memory projections fed by order events
+event_bus.subscribe(dashboard_aggregate.handle_event)
+event_bus.subscribe(active_orders.handle_event)
+event_bus.subscribe(order_metrics.handle_event)
+
+
+
+# Other workers' events arrive through the fan-out; after a gap the projections reload
+@event_fanout.on_resync
+def reload_projections() -> None:
+    """This worker may have missed events: rebuild the projections from the database"""
+    active_orders.reset()
+    db = SessionLocal()
+    try:
+        dashboard_aggregate.reload(db)
+    finally:
+        db.close()
+
+
+# In-process caches dropped on writes from any worker
+invalidation_bus.subscribe(catalog_cache.handle_invalidation)
+invalidation_bus.subscribe(settings_cache.handle_invalidation)
 
 
 @app.get("/")
@@ -0,0 +1,38 @@
+"""
+Uploaded media served by the API (menu images)
+
+Media files are named by content hash (app/services/menu_image_service.py),
+so a URL always serves the same bytes: they are sent with a one-year
+immutable Cache-Control, and kiosks never revalidate them. A changed image
+has new URLs. Media is already compressed, so it skips the gzip middleware.
+"""
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+class ImmutableStaticFiles(StaticFiles):
+    """Static files with content-hash names: cache forever"""
+
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        if response.status_code in (200, 304):
+            response.headers["Cache-Control"] = IMMUTABLE
+        return response
+
+
+class MediaSkippingGZipMiddleware(GZipMiddleware):
+    """gzip for API responses, not for media files under `media_path`"""
+
+    def __init__(self, app: ASGIApp, media_path: str, **kwargs):
+        super().__init__(app, **kwargs)
+        self.media_prefix = media_path.rstrip("/") + "/"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(self.media_prefix):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
@@ -4,13 +4,15 @@ from app.database import Base
 from app.models.user import User, UserRole
 from app.models.cell import Cell
 from app.models.menu import Category, OptionGroup, OptionItem, OptionType, Menu, MenuOptionGroup
-from app.models.order import Order, OrderItem, OrderItemOption, PayType, OrderStatus
-from app.models.transaction import PointTransaction, TransactionType
+from app.models.order import Order, OrderItem, OrderItemOption, PayType, OrderStatus, MenuDailySales, OrderTimeBucket
+from app.models.transaction import PointTransaction, TransactionType, CellBalanceSnapshot
 from app.models.settlement import DailySettlement, SystemSetting
+from app.models.outbox import OutboxEvent
 
 __all__ = [
     "Base", "User", "UserRole", "Cell", "Category", "OptionGroup", "OptionItem",
     "OptionType", "Menu", "MenuOptionGroup", "Order", "OrderItem", "OrderItemOption",
-    "PayType", "OrderStatus", "PointTransaction", "TransactionType",
-    "DailySettlement", "SystemSetting",
+    "PayType", "OrderStatus", "MenuDailySales", "OrderTimeBucket", "PointTransaction",
+    "TransactionType", "CellBalanceSnapshot", "DailySettlement", "SystemSetting",
+    "OutboxEvent",
 ]
@@ -32,6 +32,9 @@ class OptionType(str, enum.Enum):
 class OptionGroup(Base):
     """옵션 그룹 모델"""
     __tablename__ = "option_groups"
+    __table_args__ = (
+        UniqueConstraint('name', name='uq_option_groups_name'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False)  # '온도 선택', '사이즈 선택'
@@ -52,6 +55,9 @@ class OptionGroup(Base):
 class OptionItem(Base):
     """옵션 항목 모델"""
     __tablename__ = "option_items"
+    __table_args__ = (
+        UniqueConstraint('option_group_id', 'name', name='uq_option_items_group_name'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     option_group_id = Column(Integer, ForeignKey("option_groups.id", ondelete="CASCADE"), nullable=False)
@@ -71,6 +77,9 @@ class OptionItem(Base):
 class Menu(Base):
     """메뉴 모델"""
     __tablename__ = "menus"
+    __table_args__ = (
+        UniqueConstraint('name', name='uq_menus_name'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False)
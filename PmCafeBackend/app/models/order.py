@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, Index
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Enum, Index, UniqueConstraint, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -23,9 +23,20 @@ class Order(Base):
     """주문 모델"""
     __tablename__ = "orders"
     __table_args__ = (
-        Index('idx_orders_status', 'status'),
         Index('idx_orders_created_at', 'created_at'),
         Index('idx_orders_daily_num', 'daily_num'),
+        # 상태/결제 타입 필터 + 최신순 정렬 (주문 목록)
+        Index('idx_orders_status_created_at', 'status', 'created_at'),
+        Index('idx_orders_pay_type_created_at', 'pay_type', 'created_at'),
+        Index('idx_orders_cell_id_created_at', 'cell_id', 'created_at'),
+        # 제조 대기 주문만 (바리스타 화면)
+        Index(
+            'idx_orders_active', 'created_at', 'id',
+            postgresql_where=text("status IN ('PENDING', 'MAKING')"),
+            sqlite_where=text("status IN ('PENDING', 'MAKING')")
+        ),
+        # 오프라인 주문 재전송 중복 방지
+        Index('uq_orders_idempotency_key', 'idempotency_key', unique=True),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -37,8 +48,12 @@ class Order(Base):
     status = Column(Enum(OrderStatus), nullable=False, default=OrderStatus.PENDING)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    making_started_at = Column(DateTime(timezone=True), nullable=True)  # PENDING → MAKING 시각
     completed_at = Column(DateTime(timezone=True), nullable=True)
     cancelled_at = Column(DateTime(timezone=True), nullable=True)
+    version = Column(Integer, nullable=False, default=1, server_default="1")  # 상태 변경마다 +1 (낙관적 잠금)
+    idempotency_key = Column(String(100), nullable=True)  # 키오스크 오프라인 큐 주문 키 (일괄 업로드)
+    client_created_at = Column(DateTime(timezone=True), nullable=True)  # 키오스크에서 주문받은 시각
 
     # 관계
     items = relationship("OrderItem", back_populates="order", cascade="all, delete-orphan")
@@ -51,6 +66,9 @@ class Order(Base):
 class OrderItem(Base):
     """주문 항목 모델"""
     __tablename__ = "order_items"
+    __table_args__ = (
+        Index('idx_order_items_order_id', 'order_id'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     order_id = Column(Integer, ForeignKey("orders.id", ondelete="CASCADE"), nullable=False)
@@ -72,6 +90,9 @@ class OrderItem(Base):
 class OrderItemOption(Base):
     """주문 항목의 선택된 옵션"""
     __tablename__ = "order_item_options"
+    __table_args__ = (
+        Index('idx_order_item_options_order_item_id', 'order_item_id'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     order_item_id = Column(Integer, ForeignKey("order_items.id", ondelete="CASCADE"), nullable=False)
@@ -85,3 +106,44 @@ class OrderItemOption(Base):
 
     def __repr__(self):
         return f"<OrderItemOption(group='{self.option_group_name}', item='{self.option_item_name}')>"
+
+
+class MenuDailySales(Base):
+    """메뉴별 일별 판매 집계 (하루 마감 기준, 메뉴 통계용)"""
+    __tablename__ = "menu_daily_sales"
+    __table_args__ = (
+        UniqueConstraint('sale_date', 'menu_id', name='uq_menu_daily_sales_date_menu'),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    sale_date = Column(Date, nullable=False)
+    menu_id = Column(Integer, ForeignKey("menus.id"), nullable=False)
+    quantity = Column(Integer, nullable=False, default=0)  # 판매 수량 합계
+    revenue = Column(Integer, nullable=False, default=0)  # order_items.total_price 합계
+    order_count = Column(Integer, nullable=False, default=0)  # 해당 메뉴가 포함된 주문 수
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<MenuDailySales(date={self.sale_date}, menu_id={self.menu_id}, quantity={self.quantity})>"
+
+
+class OrderTimeBucket(Base):
+    """15분 단위 주문 집계 (하루 마감 기준, 시간대/요일별 통계용)"""
+    __tablename__ = "order_time_buckets"
+    __table_args__ = (
+        UniqueConstraint('bucket_date', 'minute', name='uq_order_time_buckets_date_minute'),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    bucket_date = Column(Date, nullable=False)
+    minute = Column(Integer, nullable=False)  # 0시 기준 분 (15분 단위, 서버 로컬 시간)
+    weekday = Column(Integer, nullable=False)  # 0=월 ... 6=일
+    order_count = Column(Integer, nullable=False, default=0)
+    revenue = Column(Integer, nullable=False, default=0)
+    item_count = Column(Integer, nullable=False, default=0)  # 주문 항목 수량 합계
+    completed_count = Column(Integer, nullable=False, default=0)
+    prep_seconds = Column(Integer, nullable=False, default=0)  # 완료 주문의 주문~완료 시간 합계
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<OrderTimeBucket(date={self.bucket_date}, minute={self.minute}, orders={self.order_count})>"
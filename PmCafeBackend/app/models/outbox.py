@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Index, text
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class OutboxEvent(Base):
+    """실시간 이벤트 outbox (변경과 같은 트랜잭션에 기록, 릴레이가 전달)"""
+    __tablename__ = "outbox_events"
+    __table_args__ = (
+        # 아직 전달되지 않은 이벤트만 (릴레이가 id 순으로 읽음)
+        Index(
+            'idx_outbox_events_unpublished', 'id',
+            postgresql_where=text("published_at IS NULL"),
+            sqlite_where=text("published_at IS NULL")
+        ),
+        Index('idx_outbox_events_published_at', 'published_at'),
+    )
+
+    id = Column(Integer, primary_key=True)  # 이벤트 순번 (WebSocket 메시지 id)
+    event = Column(String(50), nullable=False)  # 'order:created' 등
+    payload = Column(JSON, nullable=False)
+    origin = Column(String(50), nullable=False)  # 기록한 워커
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    published_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<OutboxEvent(id={self.id}, event='{self.event}', published_at={self.published_at})>"
@@ -18,6 +18,9 @@ class DailySettlement(Base):
     personal_revenue = Column(Integer, default=0)
     cell_orders = Column(Integer, default=0)
     cell_revenue = Column(Integer, default=0)
+    cancelled_orders = Column(Integer, nullable=False, default=0, server_default="0")
+    cancelled_amount = Column(Integer, nullable=False, default=0, server_default="0")
+    calculated_at = Column(DateTime(timezone=True), nullable=True)  # 마지막 집계 시각 (이후 취소가 있으면 재계산)
     is_confirmed = Column(Boolean, default=False)
     confirmed_by = Column(Integer, ForeignKey("users.id"), nullable=True)
     confirmed_at = Column(DateTime(timezone=True), nullable=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Index
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, ForeignKey, Enum, Index, UniqueConstraint, text
 from sqlalchemy.sql import func
 from app.database import Base
 import enum
@@ -15,8 +15,15 @@ class PointTransaction(Base):
     """셀 포인트 거래 내역"""
     __tablename__ = "point_transactions"
     __table_args__ = (
-        Index('idx_point_transactions_cell_id', 'cell_id'),
+        Index('idx_point_transactions_cell_id_created_at', 'cell_id', 'created_at'),
         Index('idx_point_transactions_created_at', 'created_at'),
+        Index('idx_point_transactions_order_id', 'order_id'),
+        # 주문당 환불은 한 번만
+        Index(
+            'uq_point_transactions_refund_order', 'order_id', unique=True,
+            postgresql_where=text("type = 'REFUND'"),
+            sqlite_where=text("type = 'REFUND'")
+        ),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -31,3 +38,26 @@ class PointTransaction(Base):
 
     def __repr__(self):
         return f"<PointTransaction(id={self.id}, type='{self.type}', amount={self.amount}, balance_after={self.balance_after})>"
+
+
+class CellBalanceSnapshot(Base):
+    """셀 일별 잔액 스냅샷 (하루 마감 기준)"""
+    __tablename__ = "cell_balance_snapshots"
+    __table_args__ = (
+        UniqueConstraint('cell_id', 'snapshot_date', name='uq_cell_balance_snapshots_cell_date'),
+        Index('idx_cell_balance_snapshots_date', 'snapshot_date'),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    cell_id = Column(Integer, ForeignKey("cells.id"), nullable=False)
+    snapshot_date = Column(Date, nullable=False)
+    balance = Column(Integer, nullable=False)  # 해당일 마감 잔액
+    last_transaction_id = Column(Integer, nullable=True)  # 스냅샷에 포함된 마지막 거래
+    charged = Column(Integer, nullable=False, default=0)  # 해당일 충전 합계
+    used = Column(Integer, nullable=False, default=0)  # 해당일 사용 합계 (양수)
+    refunded = Column(Integer, nullable=False, default=0)  # 해당일 환불 합계
+    transaction_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<CellBalanceSnapshot(cell_id={self.cell_id}, date={self.snapshot_date}, balance={self.balance})>"
@@ -0,0 +1,148 @@
+"""
+Transactional outbox for real-time events
+
+Services record an event in the same transaction as the change it
+describes (`outbox.record`), so an event goes out if and only if its change
+commits, even when the worker dies right after the commit. A relay thread
+drains unpublished rows in id order, in batches, to the event fan-out
+(app/realtime.py) and marks them published in the same transaction as the
+NOTIFY. The outbox id is the event's sequence id.
+
+Delivery is at-least-once: a relay that fails between sending a batch and
+committing it sends the batch again, so consumers may see an id twice.
+The relay is woken right after a commit that recorded events and polls
+otherwise; the committing request never waits for delivery.
+"""
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.outbox import OutboxEvent
+from app.realtime import EventFanout, event_fanout
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 100
+POLL_SECONDS = 1.0
+RETENTION = timedelta(days=1)  # published rows kept this long
+PURGE_SECONDS = 3600.0
+
+_RECORDED = "outbox_recorded"  # session.info: outbox that recorded events in this transaction
+
+
+class Outbox:
+    """Event rows written with the change, relayed after the commit"""
+
+    def __init__(
+        self,
+        fanout: EventFanout = event_fanout,
+        batch_size: int = BATCH_SIZE,
+        poll_seconds: float = POLL_SECONDS,
+        retention: timedelta = RETENTION
+    ):
+        self.fanout = fanout
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.retention = retention
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def record(self, db: Session, event_name: str, data: dict) -> None:
+        """Add an event to the session's transaction (sent once it commits)"""
+        db.add(OutboxEvent(event=event_name, payload=data, origin=self.fanout.origin))
+        db.info[_RECORDED] = self
+
+    def drain(self, db: Session) -> int:
+        """
+        Send the oldest unpublished events (one batch) and mark them published
+
+        Rows are locked, so relays of several workers take turns instead of
+        sending the same batch.
+
+        Returns:
+            Number of events sent
+        """
+        rows = db.query(OutboxEvent).filter(
+            OutboxEvent.published_at.is_(None)
+        ).order_by(OutboxEvent.id).limit(self.batch_size).with_for_update().all()
+        if not rows:
+            db.rollback()
+            return 0
+
+        connection = db.connection()
+        now = datetime.now()
+        for row in rows:
+            self.fanout.publish(
+                {"id": row.id, "origin": row.origin, "event": row.event, "data": row.payload}, connection
+            )
+            row.published_at = now
+        db.commit()
+        return len(rows)
+
+    def purge(self, db: Session, before: Optional[datetime] = None) -> int:
+        """Delete events published before `before` (default: older than the retention)"""
+        before = before or datetime.now() - self.retention
+        deleted = db.query(OutboxEvent).filter(
+            OutboxEvent.published_at < before
+        ).delete(synchronize_session=False)
+        db.commit()
+        return deleted
+
+    def wake(self) -> None:
+        """Run the relay now instead of at its next poll"""
+        self._wakeup.set()
+
+    def start(self, session_factory: Callable[[], Session]) -> None:
+        """Relay in a background thread until `stop`"""
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._relay, args=(session_factory,), name="outbox-relay", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_seconds + 1)
+            self._thread = None
+
+    def _relay(self, session_factory: Callable[[], Session]) -> None:
+        purged_at = 0.0
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.poll_seconds)
+            self._wakeup.clear()
+            db = session_factory()
+            try:
+                while not self._stopped.is_set() and self.drain(db) == self.batch_size:
+                    pass  # Backlog: keep draining
+                if time.monotonic() - purged_at >= PURGE_SECONDS:
+                    self.purge(db)
+                    purged_at = time.monotonic()
+            except Exception:
+                db.rollback()
+                logger.exception("Outbox relay failed; retrying")
+                self._stopped.wait(self.poll_seconds)
+            finally:
+                db.close()
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_relay(session: Session) -> None:
+    recorded = session.info.pop(_RECORDED, None)
+    if recorded is not None:
+        recorded.wake()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back(session: Session) -> None:
+    session.info.pop(_RECORDED, None)
+
+
+outbox = Outbox()
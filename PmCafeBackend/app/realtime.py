@@ -0,0 +1,241 @@
+"""
+Cross-worker real-time event fan-out
+
+Order and catalog events recorded in the outbox (app/outbox.py) are sent
+by the outbox relay through a channel to all workers, and each worker
+pushes them to its WebSocket subscribers (app/routers/realtime.py). Since
+every worker takes the events from the same channel, all of them see the
+same order: PostgreSQL delivers notifications in the commit order of the
+sending transactions. Events written by other workers are also republished
+on the local event bus, so the in-memory projections of every worker stay
+current (the writing worker already published them after its commit).
+
+Each event has its outbox id. Workers keep the last REPLAY_SIZE events, so
+a client reconnecting to any worker with the id of the last event it saw
+first gets what it missed. When that id is no longer known (too old, or the
+worker missed events itself) the client gets `sync:required` and reloads
+over REST.
+"""
+import asyncio
+import itertools
+import json
+import logging
+import os
+import threading
+import uuid
+from collections import deque
+from typing import Callable, Deque, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy import select as sql_select
+from sqlalchemy.engine import Connection, make_url
+
+from app.events import EventBus, event_bus
+from app.invalidation import PostgresChannel
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "pmcafe_events"
+
+REPLAY_SIZE = 1000
+SUBSCRIBER_QUEUE_SIZE = 256
+NOTIFY_PAYLOAD_LIMIT = 7900  # PostgreSQL rejects NOTIFY payloads of 8000 bytes or more
+
+SYNC_REQUIRED = "sync:required"
+
+# sync:required reasons
+CURSOR_UNKNOWN = "CURSOR_UNKNOWN"  # lastEventId too old or from before a resync
+SUBSCRIBER_LAGGING = "SUBSCRIBER_LAGGING"  # the client's queue overflowed
+EVENTS_MISSED = "EVENTS_MISSED"  # this worker may have missed events
+
+ResyncHandler = Callable[[], None]
+
+
+def sync_frame(reason: str) -> dict:
+    return {"event": SYNC_REQUIRED, "data": {"reason": reason}}
+
+
+class LoopbackChannel:
+    """Single worker: events go straight back to the local fan-out"""
+
+    def __init__(self):
+        self._fanout: Optional["EventFanout"] = None
+
+    def send(self, message: dict, connection: Optional[Connection] = None) -> None:
+        if self._fanout is not None:
+            self._fanout.receive(message)
+
+    def start(self, fanout: "EventFanout") -> None:
+        self._fanout = fanout
+
+    def stop(self) -> None:
+        self._fanout = None
+
+
+class PostgresEventChannel(PostgresChannel):
+    """
+    PostgreSQL LISTEN/NOTIFY on the events channel
+
+    The NOTIFY is part of the relay's transaction that marks the events
+    published. An event too large for a NOTIFY payload is sent without its
+    data; receivers then resync.
+    """
+
+    def __init__(self, database_url: str, **kwargs):
+        super().__init__(database_url, name=CHANNEL, **kwargs)
+
+    def send(self, message: dict, connection: Optional[Connection] = None) -> None:
+        if connection is None:
+            raise ValueError("PostgresEventChannel sends inside the relay's transaction")
+        payload = json.dumps(message, ensure_ascii=False)
+        if len(payload.encode("utf-8")) > NOTIFY_PAYLOAD_LIMIT:
+            payload = json.dumps({**message, "data": None}, ensure_ascii=False)
+        connection.execute(sql_select(func.pg_notify(self.name, payload)))
+
+
+class EventFanout:
+    """
+    Order and catalog events from every worker, for this worker's subscribers
+
+    Subscribers are asyncio queues bounded at `queue_size`; a client that
+    falls that far behind has its queue replaced by a single `sync:required`
+    frame instead of slowing down the others. Frames are
+    {"id", "event", "data"}; `sync:required` frames have no id.
+    Messages on the channel also carry the writing worker's `origin`.
+    """
+
+    def __init__(
+        self,
+        events: EventBus = event_bus,
+        origin: Optional[str] = None,
+        replay_size: int = REPLAY_SIZE,
+        queue_size: int = SUBSCRIBER_QUEUE_SIZE
+    ):
+        self.events = events
+        self.origin = origin or f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._lock = threading.Lock()
+        self._buffer: Deque[dict] = deque(maxlen=replay_size)
+        self._queue_size = queue_size
+        self._subscribers: List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = []
+        self._resync_handlers: List[ResyncHandler] = []
+        self.channel = LoopbackChannel()
+        self.channel.start(self)
+
+    def use(self, channel, listen: bool = True) -> None:
+        """Switch channel (the previous one is stopped); scripts that only publish pass listen=False"""
+        self.channel.stop()
+        self.channel = channel
+        if listen:
+            channel.start(self)
+
+    def on_resync(self, handler: ResyncHandler) -> ResyncHandler:
+        """Run `handler` whenever this worker may have missed events (projections reload)"""
+        if handler not in self._resync_handlers:
+            self._resync_handlers.append(handler)
+        return handler
+
+    def publish(self, message: dict, connection: Optional[Connection] = None) -> None:
+        """Send an outbox event to every worker ({"id", "origin", "event", "data"}; `connection`: the relay's)"""
+        self.channel.send(message, connection)
+
+    def receive(self, message: dict) -> None:
+        """Channel callback: buffer the event, push it to subscribers, republish other workers' events locally"""
+        if message.get("data") is None:
+            logger.warning("Event %s arrived without data; resyncing", message.get("id"))
+            self.resync()
+            return
+
+        frame = {"id": message["id"], "event": message["event"], "data": message["data"]}
+        with self._lock:
+            self._buffer.append(frame)
+            self._broadcast(frame)
+
+        if message["origin"] != self.origin:
+            self.events.publish(frame["event"], frame["data"])
+
+    def resync(self) -> None:
+        """Events may have been missed: drop the replay buffer, tell every subscriber, reload projections"""
+        with self._lock:
+            self._buffer.clear()
+            self._broadcast(sync_frame(EVENTS_MISSED))
+        for handler in list(self._resync_handlers):
+            try:
+                handler()
+            except Exception:
+                logger.exception("Resync handler %r failed", handler)
+
+    # Subscriptions (called from the event loop)
+
+    def subscribe(self, last_event_id: Optional[int] = None) -> Tuple[asyncio.Queue, List[dict]]:
+        """
+        Register a subscriber on the running loop
+
+        Returns:
+            The subscriber's queue, and the frames to send before it: the
+            events after `last_event_id`, or `sync:required` when that id is
+            unknown (nothing without a `last_event_id`)
+        """
+        queue = asyncio.Queue(maxsize=self._queue_size)
+        with self._lock:
+            backlog = self._since(last_event_id)
+            self._subscribers.append((asyncio.get_running_loop(), queue))
+        return queue, backlog
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        with self._lock:
+            self._subscribers = [(loop, q) for loop, q in self._subscribers if q is not queue]
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def reset(self) -> None:
+        """Forget buffered events (subscribers stay connected)"""
+        with self._lock:
+            self._buffer.clear()
+
+    # Private helper methods (caller holds the lock)
+
+    def _since(self, last_event_id: Optional[int]) -> List[dict]:
+        if last_event_id is None:
+            return []
+        for index, frame in enumerate(self._buffer):
+            if frame["id"] == last_event_id:
+                return list(itertools.islice(self._buffer, index + 1, None))
+        return [sync_frame(CURSOR_UNKNOWN)]
+
+    def _broadcast(self, frame: dict) -> None:
+        for loop, queue in self._subscribers:
+            try:
+                loop.call_soon_threadsafe(self._offer, queue, frame)
+            except RuntimeError:
+                pass  # Subscriber's loop already closed
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue, frame: dict) -> None:
+        """Runs on the subscriber's loop; a client too slow to keep up is told to reload instead"""
+        try:
+            queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(sync_frame(SUBSCRIBER_LAGGING))
+
+
+def event_channel_for(database_url: str, backend: str = "auto"):
+    """
+    Event channel for a deployment
+
+    Args:
+        backend: "postgres", "local" or "auto" (postgres for PostgreSQL URLs)
+    """
+    if backend == "auto":
+        backend = "postgres" if make_url(database_url).get_backend_name() == "postgresql" else "local"
+    if backend == "postgres":
+        return PostgresEventChannel(database_url)
+    if backend == "local":
+        return LoopbackChannel()
+    raise ValueError(f"Unknown event fan-out backend: {backend}")
+
+
+event_fanout = EventFanout()
@@ -15,8 +15,13 @@ from app.schemas.menu import (
     CategoryUpdateRequest, CategoryActiveRequest
 )
 from app.dependencies.auth import get_current_user, get_current_super_user
+from app.dependencies.invalidation import invalidates
+from app.invalidation import CATEGORIES
+from app.services.catalog_cache import catalog_cache
 
-router = APIRouter(prefix="/api/v1/categories", tags=["Categories"])
+router = APIRouter(
+    prefix="/api/v1/categories", tags=["Categories"], dependencies=[Depends(invalidates(CATEGORIES))]
+)
 
 
 @router.get("", response_model=dict)
@@ -28,7 +33,19 @@ def get_categories(
     카테고리 목록 조회 (Public)
 
     - **includeInactive**: 비활성 카테고리 포함 여부 (기본: false)
+    - 메뉴/카테고리/옵션 변경 전까지 캐시에서 응답
     """
+    category_list = catalog_cache.get_or_load(
+        ("categories", includeInactive), lambda: _category_list(db, includeInactive)
+    )
+
+    return {
+        "success": True,
+        "data": category_list
+    }
+
+
+def _category_list(db: Session, includeInactive: bool) -> list:
     query = db.query(Category)
 
     # Filter active categories only (unless includeInactive is True)
@@ -50,10 +67,7 @@ def get_categories(
         }
         category_list.append(cat_data)
 
-    return {
-        "success": True,
-        "data": category_list
-    }
+    return category_list
 
 
 @router.post("", response_model=dict)
@@ -4,6 +4,7 @@ Based on docs/backend/05-cell-api.md
 """
 from fastapi import APIRouter, Depends, status, Query
 from fastapi.responses import JSONResponse
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from datetime import datetime
@@ -14,14 +15,22 @@ from app.models.cell import Cell
 from app.models.transaction import PointTransaction, TransactionType
 from app.models.order import Order
 from app.models.user import User
+from app.utils.columnar import encode_list, list_format
 from app.schemas.cell import (
     CellAuthRequest, CellAuthResponse, CellResponse,
     CellCreateRequest, CellChargeRequest, TransactionResponse,
     TransactionCreatorResponse, TransactionOrderResponse
 )
 from app.dependencies.auth import get_current_user, get_current_super_user
+from app.dependencies.ledger import get_ledger_service
+from app.dependencies.system_settings import get_settings
+from app.dependencies.invalidation import invalidates
+from app.invalidation import CELLS
+from app.services.settings_service import SettingsCache
+from app.services.ledger_service import LedgerService
+from app.exceptions import CellNotFoundError
 
-router = APIRouter(prefix="/api/v1/cells", tags=["Cells"])
+router = APIRouter(prefix="/api/v1/cells", tags=["Cells"], dependencies=[Depends(invalidates(CELLS))])
 
 
 @router.post("/auth", response_model=dict)
@@ -148,15 +157,41 @@ def create_cell(
     }
 
 
+@router.get("/reconciliation", response_model=dict)
+def reconcile_balances(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    ledger: LedgerService = Depends(get_ledger_service)
+):
+    """
+    셀 잔액 정합성 검사 (관리자)
+
+    모든 셀의 잔액을 거래 내역 합계 / 마지막 거래 후 잔액과 비교하고,
+    거래 후 잔액이 이어지지 않는 거래(동시 수정으로 유실된 변경)를 찾습니다.
+    """
+    drifts = ledger.reconcile(db)
+
+    return {
+        "success": True,
+        "data": {
+            "consistent": not drifts,
+            "drifts": drifts
+        }
+    }
+
+
 @router.post("/{cell_id}/charge", response_model=dict)
 def charge_points(
     cell_id: int,
     charge_data: CellChargeRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    settings: SettingsCache = Depends(get_settings)
 ):
     """
     포인트 충전 (관리자)
+
+    - **bonusRate**: 생략하면 bonus_rate 설정 적용
     """
     cell = db.query(Cell).filter(Cell.id == cell_id).first()
     if not cell:
@@ -172,18 +207,22 @@ def charge_points(
         )
 
     # Calculate bonus
-    bonus_amount = int(charge_data.amount * charge_data.bonusRate / 100)
+    bonus_rate = charge_data.bonusRate if charge_data.bonusRate is not None else settings.get("bonus_rate")
+    bonus_amount = int(charge_data.amount * bonus_rate / 100)
     total_amount = charge_data.amount + bonus_amount
 
-    # Update balance
-    cell.balance += total_amount
+    # Update balance (atomic: concurrent payments and refunds are not lost)
+    balance_after = db.execute(
+        update(Cell).where(Cell.id == cell_id).values(balance=Cell.balance + total_amount)
+        .returning(Cell.balance).execution_options(synchronize_session=False)
+    ).scalar()
 
     # Create transaction record
     transaction = PointTransaction(
         cell_id=cell_id,
         type=TransactionType.CHARGE,
         amount=total_amount,
-        balance_after=cell.balance,
+        balance_after=balance_after,
         memo=charge_data.memo,
         created_by=current_user.id
     )
@@ -199,7 +238,7 @@ def charge_points(
             "chargeAmount": charge_data.amount,
             "bonusAmount": bonus_amount,
             "totalAmount": total_amount,
-            "balanceAfter": cell.balance
+            "balanceAfter": balance_after
         }
     }
 
@@ -212,11 +251,14 @@ def get_cell_transactions(
     type: Optional[str] = Query(None, description="Transaction type (CHARGE, USE, REFUND)"),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    response_format: str = Depends(list_format),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     셀 거래 내역 조회 (관리자)
+
+    - **format**: json (기본) 또는 columnar (컬럼 형식)
     """
     # Check if cell exists
     cell = db.query(Cell).filter(Cell.id == cell_id).first()
@@ -291,12 +333,18 @@ def get_cell_transactions(
     # Get total count
     total = query.count()
 
-    # Apply pagination and ordering
-    transactions = query.order_by(PointTransaction.created_at.desc()).limit(limit).offset(offset).all()
+    # Apply pagination and ordering (creator/order joined in the same query)
+    transactions = query.outerjoin(
+        User, User.id == PointTransaction.created_by
+    ).outerjoin(
+        Order, Order.id == PointTransaction.order_id
+    ).add_columns(
+        User.name.label("creator_name"), Order.order_id.label("order_code"), Order.daily_num
+    ).order_by(PointTransaction.created_at.desc()).limit(limit).offset(offset).all()
 
     # Build response
     transaction_list = []
-    for txn in transactions:
+    for txn, creator_name, order_code, daily_num in transactions:
         txn_data = {
             "id": txn.id,
             "type": txn.type.value,
@@ -307,31 +355,113 @@ def get_cell_transactions(
         }
 
         # Add creator info if exists
-        if txn.created_by:
-            creator = db.query(User).filter(User.id == txn.created_by).first()
-            if creator:
-                txn_data["createdBy"] = {
-                    "id": creator.id,
-                    "name": creator.name
-                }
+        if txn.created_by and creator_name is not None:
+            txn_data["createdBy"] = {
+                "id": txn.created_by,
+                "name": creator_name
+            }
 
         # Add order info if exists
-        if txn.order_id:
-            order = db.query(Order).filter(Order.id == txn.order_id).first()
-            if order:
-                txn_data["order"] = {
-                    "orderId": order.order_id,
-                    "dailyNum": order.daily_num
-                }
+        if txn.order_id and order_code is not None:
+            txn_data["order"] = {
+                "orderId": order_code,
+                "dailyNum": daily_num
+            }
 
         transaction_list.append(txn_data)
 
     return {
         "success": True,
         "data": {
-            "transactions": transaction_list,
+            "transactions": encode_list(transaction_list, response_format),
             "total": total,
             "limit": limit,
             "offset": offset
         }
     }
+
+
+@router.get("/{cell_id}/balance", response_model=dict)
+def get_cell_balance_at(
+    cell_id: int,
+    date: str = Query(..., description="Date (YYYY-MM-DD)"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    ledger: LedgerService = Depends(get_ledger_service)
+):
+    """
+    특정일 마감 잔액 조회 (관리자)
+
+    일별 잔액 스냅샷에서 조회하므로 거래 내역 전체를 읽지 않습니다.
+    """
+    try:
+        day = datetime.strptime(date, "%Y-%m-%d").date()
+    except ValueError:
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={
+                "success": False,
+                "error": {
+                    "code": "INVALID_DATE_FORMAT",
+                    "message": "날짜 형식이 올바르지 않습니다 (YYYY-MM-DD)"
+                }
+            }
+        )
+
+    try:
+        balance = ledger.balance_at(db, cell_id, day)
+    except CellNotFoundError as e:
+        return JSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"success": False, "error": {"code": e.code, "message": e.message}}
+        )
+
+    return {
+        "success": True,
+        "data": {
+            "cellId": cell_id,
+            "date": day.isoformat(),
+            "balance": balance
+        }
+    }
+
+
+@router.get("/{cell_id}/statement", response_model=dict)
+def get_cell_statement(
+    cell_id: int,
+    month: str = Query(..., description="Month (YYYY-MM)"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    ledger: LedgerService = Depends(get_ledger_service)
+):
+    """
+    월별 포인트 명세 (관리자)
+
+    기초/기말 잔액과 충전/사용/환불 합계. 일별 스냅샷을 합산합니다.
+    """
+    try:
+        first = datetime.strptime(month, "%Y-%m")
+    except ValueError:
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={
+                "success": False,
+                "error": {
+                    "code": "INVALID_DATE_FORMAT",
+                    "message": "월 형식이 올바르지 않습니다 (YYYY-MM)"
+                }
+            }
+        )
+
+    try:
+        statement = ledger.monthly_statement(db, cell_id, first.year, first.month)
+    except CellNotFoundError as e:
+        return JSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"success": False, "error": {"code": e.code, "message": e.message}}
+        )
+
+    return {
+        "success": True,
+        "data": statement
+    }
@@ -3,7 +3,7 @@ Menu API routes
 Based on docs/backend/02-menu-api.md
 """
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, File, HTTPException, status, Query, UploadFile
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session, joinedload
 
@@ -13,11 +13,48 @@ from app.models.user import User
 from app.schemas.menu import (
     MenuListResponse, MenuDetailResponse, CategoryResponse,
     OptionGroupResponse, OptionItemResponse, MenuCreateRequest,
-    MenuUpdateRequest, MenuSoldOutRequest
+    MenuUpdateRequest, MenuSoldOutRequest, MenuBulkCreateRequest,
+    MenuBulkUpdateRequest, MenuReorderRequest, MenuBulkSoldOutRequest
 )
+from app.services.menu_service import MenuService
+from app.services.menu_image_service import MenuImageService, image_variants
 from app.dependencies.auth import get_current_user, get_current_super_user
+from app.dependencies.menu import get_menu_service, get_menu_image_service
+from app.dependencies.invalidation import invalidates
+from app.invalidation import MENUS
+from app.services.catalog_cache import catalog_cache
+from app.exceptions import (
+    BusinessException,
+    ResourceNotFoundError,
+    DuplicateResourceError,
+    ImageTooLargeError
+)
+
+router = APIRouter(prefix="/api/v1/menus", tags=["Menus"], dependencies=[Depends(invalidates(MENUS))])
+
+
+def _batch_error(e: BusinessException) -> HTTPException:
+    """Map a batch operation error to the API error response"""
+    if isinstance(e, ResourceNotFoundError):
+        status_code = status.HTTP_404_NOT_FOUND
+    elif isinstance(e, DuplicateResourceError):
+        status_code = status.HTTP_409_CONFLICT
+    elif isinstance(e, ImageTooLargeError):
+        status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    else:
+        status_code = status.HTTP_400_BAD_REQUEST
+    return HTTPException(
+        status_code=status_code,
+        detail={"success": False, "error": {"code": e.code, "message": e.message}}
+    )
 
-router = APIRouter(prefix="/api/v1/menus", tags=["Menus"])
+
+def _existing_option_group_ids(db: Session, option_group_ids: List[int]) -> set:
+    """Return which of the given option group IDs exist (single IN query)"""
+    if not option_group_ids:
+        return set()
+    rows = db.query(OptionGroup.id).filter(OptionGroup.id.in_(option_group_ids)).all()
+    return {row.id for row in rows}
 
 
 @router.get("", response_model=dict)
@@ -31,7 +68,20 @@ def get_menus(
 
     - **category_id**: 카테고리별 필터링
     - **include_inactive**: 비활성 메뉴 포함 여부
+    - 메뉴/카테고리/옵션 변경 전까지 캐시에서 응답
     """
+    menu_list = catalog_cache.get_or_load(
+        ("menus", category_id, include_inactive),
+        lambda: _menu_list(db, category_id, include_inactive)
+    )
+
+    return {
+        "success": True,
+        "data": menu_list
+    }
+
+
+def _menu_list(db: Session, category_id: Optional[int], include_inactive: bool) -> List[dict]:
     query = db.query(Menu).options(joinedload(Menu.category))
 
     # Filter by category
@@ -62,15 +112,105 @@ def get_menus(
             ),
             description=menu.description,
             image_url=menu.image_url,
+            image_variants=image_variants(menu.image_url),
             is_sold_out=menu.is_sold_out,
             is_active=menu.is_active,
             display_order=menu.display_order
         )
         menu_list.append(menu_data.model_dump())
 
+    return menu_list
+
+
+@router.post("/bulk", response_model=dict)
+def bulk_create_menus(
+    bulk_data: MenuBulkCreateRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    service: MenuService = Depends(get_menu_service)
+):
+    """
+    메뉴 일괄 생성 (관리자)
+
+    하나라도 실패하면 전체가 반영되지 않습니다.
+    """
+    try:
+        menus = service.bulk_create(db, bulk_data.menus)
+    except BusinessException as e:
+        db.rollback()
+        raise _batch_error(e)
+
     return {
         "success": True,
-        "data": menu_list
+        "data": [{"id": menu.id, "name": menu.name, "price": menu.price} for menu in menus]
+    }
+
+
+@router.put("/bulk", response_model=dict)
+def bulk_update_menus(
+    bulk_data: MenuBulkUpdateRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    service: MenuService = Depends(get_menu_service)
+):
+    """
+    메뉴 일괄 수정 (관리자)
+
+    각 항목은 `id`와 변경할 필드만 포함합니다. 하나라도 실패하면 전체가 반영되지 않습니다.
+    """
+    try:
+        menus = service.bulk_update(db, bulk_data.menus)
+    except BusinessException as e:
+        db.rollback()
+        raise _batch_error(e)
+
+    return {
+        "success": True,
+        "data": [{"id": menu.id, "name": menu.name, "price": menu.price} for menu in menus]
+    }
+
+
+@router.patch("/reorder", response_model=dict)
+def reorder_menus(
+    reorder_data: MenuReorderRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    service: MenuService = Depends(get_menu_service)
+):
+    """
+    메뉴 표시 순서 일괄 변경 (관리자)
+    """
+    try:
+        updated = service.reorder(db, reorder_data.menus)
+    except BusinessException as e:
+        db.rollback()
+        raise _batch_error(e)
+
+    return {
+        "success": True,
+        "data": {"updated": updated}
+    }
+
+
+@router.patch("/sold-out", response_model=dict)
+def bulk_toggle_sold_out(
+    sold_out_data: MenuBulkSoldOutRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    service: MenuService = Depends(get_menu_service)
+):
+    """
+    메뉴 품절 일괄 토글 (관리자)
+    """
+    try:
+        updated = service.set_sold_out(db, sold_out_data.menu_ids, sold_out_data.is_sold_out)
+    except BusinessException as e:
+        db.rollback()
+        raise _batch_error(e)
+
+    return {
+        "success": True,
+        "data": {"updated": updated, "isSoldOut": sold_out_data.is_sold_out}
     }
 
 
@@ -135,6 +275,7 @@ def get_menu_detail(
         ),
         description=menu.description,
         image_url=menu.image_url,
+        image_variants=image_variants(menu.image_url),
         is_sold_out=menu.is_sold_out,
         is_active=menu.is_active,
         display_order=menu.display_order,
@@ -201,10 +342,10 @@ def create_menu(
     db.flush()  # Get the menu ID
 
     # Create menu-option group associations
+    found_group_ids = _existing_option_group_ids(db, menu_data.option_group_ids)
     for idx, option_group_id in enumerate(menu_data.option_group_ids):
         # Check if option group exists
-        opt_group = db.query(OptionGroup).filter(OptionGroup.id == option_group_id).first()
-        if not opt_group:
+        if option_group_id not in found_group_ids:
             db.rollback()
             return JSONResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -316,9 +457,9 @@ def update_menu(
         db.query(MenuOptionGroup).filter(MenuOptionGroup.menu_id == menu_id).delete()
 
         # Create new associations
+        found_group_ids = _existing_option_group_ids(db, menu_data.option_group_ids)
         for idx, option_group_id in enumerate(menu_data.option_group_ids):
-            opt_group = db.query(OptionGroup).filter(OptionGroup.id == option_group_id).first()
-            if not opt_group:
+            if option_group_id not in found_group_ids:
                 db.rollback()
                 return JSONResponse(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -356,7 +497,8 @@ def toggle_sold_out(
     menu_id: int,
     sold_out_data: MenuSoldOutRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    service: MenuService = Depends(get_menu_service)
 ):
     """
     메뉴 품절 토글 (관리자)
@@ -374,8 +516,8 @@ def toggle_sold_out(
             }
         )
 
-    menu.is_sold_out = sold_out_data.is_sold_out
-    db.commit()
+    service.set_sold_out(db, [menu.id], sold_out_data.is_sold_out)
+    db.refresh(menu)
 
     return {
         "success": True,
@@ -387,6 +529,62 @@ def toggle_sold_out(
     }
 
 
+@router.post("/{menu_id}/image", response_model=dict)
+def upload_menu_image(
+    menu_id: int,
+    file: UploadFile = File(..., description="JPEG, PNG or WebP"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    service: MenuImageService = Depends(get_menu_image_service)
+):
+    """
+    메뉴 이미지 업로드 (관리자)
+
+    - **file**: JPEG, PNG, WebP 이미지 (multipart/form-data, 최대 MENU_IMAGE_MAX_BYTES)
+
+    원본을 저장하고 키오스크 목록용(grid, 320px)과 상세용(detail, 800px) WebP/JPEG 파일을 만듭니다.
+    파일 이름은 이미지 내용의 해시이고 1년 immutable 캐시로 제공됩니다. image_url은 상세용 JPEG로 바뀝니다.
+    """
+    try:
+        menu = service.upload(db, menu_id, file.file.read(service.max_bytes + 1))
+    except BusinessException as e:
+        db.rollback()
+        raise _batch_error(e)
+
+    return {
+        "success": True,
+        "data": {
+            "id": menu.id,
+            "image_url": menu.image_url,
+            "image_variants": image_variants(menu.image_url)
+        }
+    }
+
+
+@router.delete("/{menu_id}/image", response_model=dict)
+def delete_menu_image(
+    menu_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    service: MenuImageService = Depends(get_menu_image_service)
+):
+    """
+    메뉴 이미지 제거 (관리자)
+
+    image_url을 비웁니다. 이미 받은 키오스크 캐시와 같은 이미지를 쓰는 다른 메뉴를 위해 파일은 남겨 둡니다.
+    """
+    try:
+        menu = service.remove(db, menu_id)
+    except BusinessException as e:
+        db.rollback()
+        raise _batch_error(e)
+
+    return {
+        "success": True,
+        "data": {"id": menu.id, "image_url": None, "image_variants": None}
+    }
+
+
 @router.delete("/{menu_id}", response_model=dict)
 def delete_menu(
     menu_id: int,
@@ -14,8 +14,13 @@ from app.schemas.menu import (
     OptionItemCreateRequest, OptionItemUpdateRequest
 )
 from app.dependencies.auth import get_current_user, get_current_super_user
+from app.dependencies.invalidation import invalidates
+from app.invalidation import OPTIONS
+from app.services.catalog_cache import catalog_cache
 
-router = APIRouter(prefix="/api/v1/option-groups", tags=["Options"])
+router = APIRouter(
+    prefix="/api/v1/option-groups", tags=["Options"], dependencies=[Depends(invalidates(OPTIONS))]
+)
 
 
 @router.get("", response_model=dict)
@@ -27,7 +32,19 @@ def get_option_groups(
     옵션 그룹 목록 조회 (Public)
 
     - **includeItems**: 옵션 항목 포함 여부 (기본: true)
+    - 메뉴/카테고리/옵션 변경 전까지 캐시에서 응답
     """
+    result = catalog_cache.get_or_load(
+        ("option-groups", includeItems), lambda: _option_group_list(db, includeItems)
+    )
+
+    return {
+        "success": True,
+        "data": result
+    }
+
+
+def _option_group_list(db: Session, includeItems: bool) -> list:
     query = db.query(OptionGroup)
 
     # Include items if requested
@@ -63,10 +80,20 @@ def get_option_groups(
 
         result.append(group_data)
 
-    return {
-        "success": True,
-        "data": result
-    }
+    return result
+
+
+def _duplicate_name(message: str) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={
+            "success": False,
+            "error": {
+                "code": "DUPLICATE_RESOURCE",
+                "message": message
+            }
+        }
+    )
 
 
 @router.post("", response_model=dict)
@@ -78,6 +105,10 @@ def create_option_group(
     """
     옵션 그룹 생성 (관리자)
     """
+    # Check for duplicate group name
+    if db.query(OptionGroup).filter(OptionGroup.name == group_data.name).first():
+        return _duplicate_name("이미 존재하는 옵션 그룹 이름입니다")
+
     # Create option group
     new_group = OptionGroup(
         name=group_data.name,
@@ -126,6 +157,12 @@ def update_option_group(
 
     # Update fields if provided
     if group_data.name is not None:
+        existing = db.query(OptionGroup).filter(
+            OptionGroup.name == group_data.name,
+            OptionGroup.id != group_id
+        ).first()
+        if existing:
+            return _duplicate_name("이미 존재하는 옵션 그룹 이름입니다")
         group.name = group_data.name
 
     if group_data.icon is not None:
@@ -226,6 +263,14 @@ def create_option_item(
             }
         )
 
+    # Check for duplicate item name within the group
+    existing = db.query(OptionItem).filter(
+        OptionItem.option_group_id == group_id,
+        OptionItem.name == item_data.name
+    ).first()
+    if existing:
+        return _duplicate_name("이 옵션 그룹에 이미 존재하는 옵션 항목 이름입니다")
+
     # Create option item
     new_item = OptionItem(
         option_group_id=group_id,
@@ -279,6 +324,13 @@ def update_option_item(
 
     # Update fields if provided
     if item_data.name is not None:
+        existing = db.query(OptionItem).filter(
+            OptionItem.option_group_id == group_id,
+            OptionItem.name == item_data.name,
+            OptionItem.id != item_id
+        ).first()
+        if existing:
+            return _duplicate_name("이 옵션 그룹에 이미 존재하는 옵션 항목 이름입니다")
         item.name = item_data.name
 
     if item_data.price is not None:
@@ -8,17 +8,25 @@ from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.services.order_service import OrderService
+from app.services.kitchen_queue import active_orders
+from app.services.order_metrics import order_metrics
 from app.dependencies.order import get_order_service
+from app.dependencies.auth import get_current_user
+from app.models.user import User
 from app.models.order import OrderStatus, PayType
+from app.utils.columnar import encode_list, list_format
 from app.schemas.order import (
-    CreateOrderRequest, OrderResponse, OrderItemResponse,
-    CellInfoResponse, OrderItemOptionGroup, OrderStatusUpdateRequest
+    CreateOrderRequest, OrderBatchCreateRequest, OrderStatusUpdateRequest, OrderBatchStatusUpdateRequest,
+    OrderCancelRequest, OrderBatchCancelRequest, build_order_response
 )
 from app.exceptions import (
     MissingCellIdError,
     CellNotFoundError,
     InsufficientBalanceError,
-    OrderNotFoundError
+    OrderNotFoundError,
+    InvalidOrderStatusTransitionError,
+    OrderConflictError,
+    KioskInactiveError
 )
 
 router = APIRouter(prefix="/api/v1/orders", tags=["Orders"])
@@ -40,65 +48,18 @@ def create_order(
     """
     try:
         order = service.create_order(db, order_data)
-
-        # Build response
-        cell_info = None
-        if order.cell:
-            cell_info = CellInfoResponse(
-                id=order.cell.id,
-                name=order.cell.name,
-                balance=order.cell.balance
-            )
-
-        response_items = []
-        for order_item in order.items:
-            # Build options
-            option_groups_dict = {}
-            for option in order_item.options:
-                group_name = option.option_group_name
-                if group_name not in option_groups_dict:
-                    option_groups_dict[group_name] = []
-                option_groups_dict[group_name].append({
-                    "name": option.option_item_name,
-                    "price": option.option_item_price
-                })
-
-            selected_options = [
-                OrderItemOptionGroup(
-                    groupName=group_name,
-                    items=[
-                        {"name": item["name"], "price": item["price"]}
-                        for item in items
-                    ]
-                )
-                for group_name, items in option_groups_dict.items()
-            ]
-
-            response_items.append(OrderItemResponse(
-                menuName=order_item.menu_name,
-                menuPrice=order_item.menu_price,
-                quantity=order_item.quantity,
-                selectedOptions=selected_options,
-                totalPrice=order_item.total_price
-            ))
-
-        order_response = OrderResponse(
-            orderId=order.order_id,
-            dailyNum=order.daily_num,
-            payType=order.pay_type.value,
-            cellInfo=cell_info,
-            items=response_items,
-            totalAmount=order.total_amount,
-            status=order.status.value,
-            createdAt=order.created_at,
-            completedAt=order.completed_at
-        )
+        order_response = build_order_response(order, include_balance=True)
 
         return {
             "success": True,
             "data": order_response.model_dump()
         }
 
+    except KioskInactiveError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={"success": False, "error": {"code": e.code, "message": e.message}}
+        )
     except MissingCellIdError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -121,12 +82,52 @@ def create_order(
         )
 
 
+@router.post("/batch", response_model=dict)
+def create_orders(
+    batch_data: OrderBatchCreateRequest,
+    db: Session = Depends(get_db),
+    service: OrderService = Depends(get_order_service)
+):
+    """
+    오프라인 주문 일괄 업로드 (키오스크 로컬 큐)
+
+    - **orders**: 오프라인 중 받은 주문 목록 (최대 100개)
+      - 주문 생성 필드 + **idempotencyKey** (주문마다 고유), **clientCreatedAt** (주문받은 시각)
+
+    한 트랜잭션에서 clientCreatedAt 순서로 생성됩니다. 이미 처리된 idempotencyKey는 새로 만들지 않고
+    기존 주문을 `duplicate: true`로 반환하므로, 응답을 받지 못한 배치는 그대로 다시 보내면 됩니다.
+    생성할 수 없는 주문은 주문별 결과에 에러 코드(MISSING_CELL_ID, CELL_NOT_FOUND,
+    INSUFFICIENT_BALANCE, MENU_NOT_FOUND)로 표시되고 나머지 주문은 생성됩니다.
+    """
+    try:
+        results = service.create_orders(db, batch_data.orders)
+    except KioskInactiveError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={"success": False, "error": {"code": e.code, "message": e.message}}
+        )
+
+    duplicates = sum(1 for r in results if r["duplicate"])
+    failed = sum(1 for r in results if not r["success"])
+
+    return {
+        "success": True,
+        "data": {
+            "results": results,
+            "created": len(results) - duplicates - failed,
+            "duplicates": duplicates,
+            "failed": failed
+        }
+    }
+
+
 @router.get("", response_model=dict)
 def get_orders(
     status_filter: Optional[str] = Query(None, alias="status", pattern="^(PENDING|MAKING|COMPLETED|CANCELLED)$"),
     pay_type_filter: Optional[str] = Query(None, alias="payType", pattern="^(PERSONAL|CELL)$"),
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
+    response_format: str = Depends(list_format),
     db: Session = Depends(get_db),
     service: OrderService = Depends(get_order_service)
 ):
@@ -137,6 +138,7 @@ def get_orders(
     - **payType**: 결제 타입 필터 (PERSONAL, CELL)
     - **limit**: 페이지 크기 (기본: 100)
     - **offset**: 페이지 오프셋 (기본: 0)
+    - **format**: json (기본) 또는 columnar (컬럼 형식, 큰 목록용)
     """
     # Convert string filters to enums
     status_enum = OrderStatus[status_filter] if status_filter else None
@@ -144,67 +146,12 @@ def get_orders(
 
     orders, total = service.get_orders(db, status_enum, pay_type_enum, limit, offset)
 
-    # Build response
-    order_list = []
-    for order in orders:
-        # Get cell info if CELL payment
-        cell_info = None
-        if order.cell:
-            cell_info = CellInfoResponse(
-                id=order.cell.id,
-                name=order.cell.name
-            )
-
-        # Build items
-        items = []
-        for order_item in order.items:
-            # Build options
-            option_groups_dict = {}
-            for option in order_item.options:
-                group_name = option.option_group_name
-                if group_name not in option_groups_dict:
-                    option_groups_dict[group_name] = []
-                option_groups_dict[group_name].append({
-                    "name": option.option_item_name,
-                    "price": option.option_item_price
-                })
-
-            selected_options = [
-                OrderItemOptionGroup(
-                    groupName=group_name,
-                    items=[
-                        {"name": item["name"], "price": item["price"]}
-                        for item in items_list
-                    ]
-                )
-                for group_name, items_list in option_groups_dict.items()
-            ]
-
-            items.append(OrderItemResponse(
-                menuName=order_item.menu_name,
-                menuPrice=order_item.menu_price,
-                quantity=order_item.quantity,
-                selectedOptions=selected_options,
-                totalPrice=order_item.total_price
-            ))
-
-        order_data = OrderResponse(
-            orderId=order.order_id,
-            dailyNum=order.daily_num,
-            payType=order.pay_type.value,
-            cellInfo=cell_info,
-            items=items,
-            totalAmount=order.total_amount,
-            status=order.status.value,
-            createdAt=order.created_at,
-            completedAt=order.completed_at
-        )
-        order_list.append(order_data.model_dump())
+    order_list = [build_order_response(order).model_dump() for order in orders]
 
     return {
         "success": True,
         "data": {
-            "orders": order_list,
+            "orders": encode_list(order_list, response_format),
             "total": total,
             "limit": limit,
             "offset": offset
@@ -212,6 +159,175 @@ def get_orders(
     }
 
 
+@router.get("/active", response_model=dict)
+def get_active_orders(db: Session = Depends(get_db)):
+    """
+    제조 대기/제조 중 주문 목록 (바리스타 화면)
+
+    PENDING, MAKING 주문만 접수 순서대로 반환합니다.
+    서버 메모리의 주문 큐에서 바로 응답하며, DB는 최초 1회만 조회합니다.
+    """
+    active_orders.ensure_loaded(db)
+    orders = active_orders.list()
+
+    return {
+        "success": True,
+        "data": {
+            "orders": orders,
+            "total": len(orders)
+        }
+    }
+
+
+@router.get("/metrics", response_model=dict)
+def get_order_metrics(db: Session = Depends(get_db)):
+    """
+    실시간 제조 지표 (바리스타 화면, 관리자 대시보드)
+
+    - 대기열 길이 (PENDING/MAKING 주문 수)
+    - 최근 15분간 분당 주문/완료 수, 평균 대기 시간 (주문 → 제조 시작), 평균 제조 시간 (제조 시작 → 완료)
+    서버 메모리의 주문 큐와 주문 이벤트로 계산하며 DB는 주문 큐 최초 로드 때만 조회합니다.
+    """
+    order_metrics.ensure_loaded(db)
+
+    return {
+        "success": True,
+        "data": order_metrics.snapshot()
+    }
+
+
+def _reject_cancel(new_status: str) -> None:
+    """Barista status changes cannot cancel: cancelling refunds cells, so it needs an admin"""
+    if new_status == OrderStatus.CANCELLED.value:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "success": False,
+                "error": {
+                    "code": "CANCEL_REQUIRES_ADMIN",
+                    "message": "주문 취소는 관리자 취소 API(POST /api/v1/orders/{orderId}/cancel)로 요청해야 합니다"
+                }
+            }
+        )
+
+
+@router.patch("/status", response_model=dict)
+def update_order_statuses(
+    batch_update: OrderBatchStatusUpdateRequest,
+    db: Session = Depends(get_db),
+    service: OrderService = Depends(get_order_service)
+):
+    """
+    주문 상태 일괄 변경 (마감 시 일괄 완료/취소)
+
+    - **orderIds**: 주문 ID 목록 (최대 500개)
+    - **status**: 변경할 상태
+
+    전환 규칙은 단건 변경과 같습니다. 가능한 주문은 한 트랜잭션에서 한 번의 UPDATE로 변경되고,
+    나머지는 주문별 결과에 에러 코드(ORDER_NOT_FOUND, INVALID_STATUS_TRANSITION, ORDER_CONFLICT)로 표시됩니다.
+    취소(CANCELLED)는 셀 환불이 따르므로 관리자 API(POST /cancel)로만 가능합니다.
+    """
+    _reject_cancel(batch_update.status)
+    results = service.update_order_statuses(db, batch_update.orderIds, OrderStatus[batch_update.status])
+    updated = sum(1 for r in results if r["success"])
+
+    return {
+        "success": True,
+        "data": {
+            "results": results,
+            "updated": updated,
+            "failed": len(results) - updated
+        }
+    }
+
+
+@router.post("/cancel", response_model=dict)
+def cancel_orders(
+    cancel_data: OrderBatchCancelRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    service: OrderService = Depends(get_order_service)
+):
+    """
+    주문 일괄 취소 (관리자, 마감 정리용)
+
+    - **orderIds**: 주문 ID 목록 (최대 500개)
+    - **reason**: 취소 사유 (환불 내역 메모로 저장)
+
+    셀 결제 주문은 같은 트랜잭션에서 셀 잔액이 환불되고 REFUND 거래 내역이 기록됩니다.
+    취소할 수 없는 주문은 주문별 결과에 에러 코드로 표시됩니다.
+    """
+    results = service.update_order_statuses(
+        db, cancel_data.orderIds, OrderStatus.CANCELLED,
+        reason=cancel_data.reason, changed_by=current_user.id
+    )
+    cancelled = sum(1 for r in results if r["success"])
+
+    return {
+        "success": True,
+        "data": {
+            "results": results,
+            "cancelled": cancelled,
+            "failed": len(results) - cancelled,
+            "refundedAmount": sum(r["refund"]["amount"] for r in results if r["refund"])
+        }
+    }
+
+
+@router.post("/{order_id}/cancel", response_model=dict)
+def cancel_order(
+    order_id: str,
+    cancel_data: OrderCancelRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    service: OrderService = Depends(get_order_service)
+):
+    """
+    주문 취소 (관리자)
+
+    - **order_id**: 주문 ID
+    - **reason**: 취소 사유 (선택)
+    - **version** (선택): 화면에서 본 버전
+
+    셀 결제 주문은 셀 잔액 환불과 REFUND 거래 내역 기록이 취소와 함께 처리됩니다.
+    동시에 여러 번 취소해도 환불은 한 번만 일어나고, 나머지 요청은 409 ORDER_CONFLICT입니다.
+    """
+    try:
+        cancelled, refund = service.cancel_order(
+            db, order_id,
+            reason=cancel_data.reason,
+            cancelled_by=current_user.id,
+            expected_version=cancel_data.version
+        )
+
+        return {
+            "success": True,
+            "data": {
+                "orderId": cancelled.order_id,
+                "status": cancelled.status.value,
+                "version": cancelled.version,
+                "refund": refund,
+                "cancelledAt": cancelled.cancelled_at.isoformat() if cancelled.cancelled_at else None
+            }
+        }
+
+    except OrderNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"success": False, "error": {"code": e.code, "message": e.message}}
+        )
+    except InvalidOrderStatusTransitionError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"success": False, "error": {"code": e.code, "message": e.message}}
+        )
+    except OrderConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={"success": False, "error": {"code": e.code, "message": e.message}}
+        )
+
+
 @router.patch("/{order_id}/status", response_model=dict)
 def update_order_status(
     order_id: str,
@@ -223,22 +339,33 @@ def update_order_status(
     주문 상태 변경
 
     - **order_id**: 주문 ID
-    - **status**: 변경할 상태 (PENDING, MAKING, COMPLETED, CANCELLED)
+    - **status**: 변경할 상태 (PENDING, MAKING, COMPLETED)
 
     상태 전환 규칙:
     - PENDING → MAKING → COMPLETED
-    - PENDING → CANCELLED
-    - MAKING → CANCELLED
+    - PENDING/MAKING → CANCELLED (관리자 취소 API)
+
+    - **expectedStatus** / **version** (선택): 화면에서 본 상태/버전. 그 사이 다른 사용자가
+      먼저 변경했다면 409 ORDER_CONFLICT
+    - 취소(CANCELLED)는 셀 환불이 따르므로 관리자 API(POST /{order_id}/cancel)로만 가능합니다
     """
+    _reject_cancel(status_update.status)
+
     try:
         new_status = OrderStatus[status_update.status]
-        updated_order = service.update_order_status(db, order_id, new_status)
+        expected_status = OrderStatus[status_update.expectedStatus] if status_update.expectedStatus else None
+        updated_order = service.update_order_status(
+            db, order_id, new_status,
+            expected_status=expected_status,
+            expected_version=status_update.version
+        )
 
         return {
             "success": True,
             "data": {
                 "orderId": updated_order.order_id,
                 "status": updated_order.status.value,
+                "version": updated_order.version,
                 "updatedAt": updated_order.updated_at.isoformat() if updated_order.updated_at else None
             }
         }
@@ -248,6 +375,16 @@ def update_order_status(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={"success": False, "error": {"code": e.code, "message": e.message}}
         )
+    except InvalidOrderStatusTransitionError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"success": False, "error": {"code": e.code, "message": e.message}}
+        )
+    except OrderConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={"success": False, "error": {"code": e.code, "message": e.message}}
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
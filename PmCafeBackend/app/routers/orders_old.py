@@ -209,6 +209,7 @@ def create_order(
             items=response_items,
             totalAmount=order.total_amount,
             status=order.status.value,
+            version=order.version,
             createdAt=order.created_at,
             completedAt=order.completed_at
         )
@@ -322,6 +323,7 @@ def get_orders(
             items=items,
             totalAmount=order.total_amount,
             status=order.status.value,
+            version=order.version,
             createdAt=order.created_at,
             completedAt=order.completed_at
         )
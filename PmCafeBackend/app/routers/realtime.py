@@ -0,0 +1,94 @@
+"""
+Real-time events WebSocket
+Based on docs/backend/10-websocket.md
+"""
+import asyncio
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, WebSocket, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.events import MENU_SOLD_OUT_CHANGED
+from app.models.user import User
+from app.realtime import EventFanout, event_fanout, SYNC_REQUIRED
+from app.utils.auth import decode_access_token
+
+router = APIRouter(tags=["Realtime"])
+
+HEARTBEAT_SECONDS = 15.0
+HEARTBEAT = "heartbeat"
+
+# Events sent to connections without a token (kiosks)
+PUBLIC_EVENTS = {MENU_SOLD_OUT_CHANGED, SYNC_REQUIRED, HEARTBEAT}
+
+
+def _authenticate(db: Session, token: str) -> bool:
+    """Token belongs to an existing user (the session is released: sockets stay open for hours)"""
+    payload = decode_access_token(token)
+    user_id = payload.get("user_id") if payload else None
+    if user_id is None:
+        return False
+    try:
+        return db.query(User.id).filter(User.id == user_id).first() is not None
+    finally:
+        db.rollback()
+
+
+async def event_socket_stream(
+    websocket: WebSocket,
+    fanout: EventFanout,
+    last_event_id: Optional[int],
+    authenticated: bool,
+    heartbeat: float = HEARTBEAT_SECONDS
+) -> None:
+    """Send missed events, then live events (heartbeats in between) until the client disconnects"""
+    queue, backlog = fanout.subscribe(last_event_id)
+
+    async def send() -> None:
+        for frame in backlog:
+            if authenticated or frame["event"] in PUBLIC_EVENTS:
+                await websocket.send_json(frame)
+        while True:
+            try:
+                frame = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                frame = {"event": HEARTBEAT}
+            if authenticated or frame["event"] in PUBLIC_EVENTS:
+                await websocket.send_json(frame)
+
+    try:
+        await websocket.accept()
+        sender = asyncio.create_task(send())
+        try:
+            while (await websocket.receive())["type"] != "websocket.disconnect":
+                pass  # Clients only listen
+        finally:
+            sender.cancel()
+            await asyncio.gather(sender, return_exceptions=True)
+    finally:
+        fanout.unsubscribe(queue)
+
+
+@router.websocket("/ws")
+async def event_socket(
+    websocket: WebSocket,
+    token: Optional[str] = Query(None, description="Access token (admins)"),
+    last_event_id: Optional[int] = Query(None, alias="lastEventId", description="Last event id received"),
+    db: Session = Depends(get_db)
+):
+    """
+    실시간 이벤트 (WebSocket)
+
+    - `token`: 관리자 토큰 (주문 이벤트). 없으면 메뉴 이벤트만 전송 (키오스크)
+    - `lastEventId`: 재연결 시 마지막으로 받은 이벤트 id, 놓친 이벤트부터 다시 전송
+    - 놓친 이벤트를 보낼 수 없으면 `sync:required` 전송 (REST로 다시 조회)
+    - 잘못된 토큰은 1008 로 연결 거부
+    """
+    authenticated = token is not None and await run_in_threadpool(_authenticate, db, token)
+    if token is not None and not authenticated:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await event_socket_stream(websocket, event_fanout, last_event_id, authenticated)
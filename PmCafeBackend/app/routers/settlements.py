@@ -10,9 +10,13 @@ from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models.settlement import DailySettlement
-from app.models.order import Order, PayType
 from app.models.user import User
 from app.dependencies.auth import get_current_user, get_current_super_user
+from app.dependencies.settlement import get_settlement_service
+from app.services.settlement_service import SettlementService
+from app.exceptions import (
+    SettlementAlreadyConfirmedError, FutureSettlementDateError, SettlementNotFoundError
+)
 
 router = APIRouter(prefix="/api/v1/settlements", tags=["Settlements"])
 
@@ -67,12 +71,14 @@ def get_settlements(
     if isConfirmed is not None:
         query = query.filter(DailySettlement.is_confirmed == isConfirmed)
 
-    # Order by date descending
-    settlements = query.order_by(DailySettlement.date.desc()).all()
+    # Order by date descending (confirmer names joined in the same query)
+    settlements = query.outerjoin(
+        User, User.id == DailySettlement.confirmed_by
+    ).add_columns(User.name.label("confirmer_name")).order_by(DailySettlement.date.desc()).all()
 
     # Build response
     settlement_list = []
-    for settlement in settlements:
+    for settlement, confirmer_name in settlements:
         settlement_data = {
             "id": settlement.id,
             "date": settlement.date.isoformat(),
@@ -82,19 +88,19 @@ def get_settlements(
             "personalRevenue": settlement.personal_revenue,
             "cellOrders": settlement.cell_orders,
             "cellRevenue": settlement.cell_revenue,
+            "cancelledOrders": settlement.cancelled_orders,
+            "cancelledAmount": settlement.cancelled_amount,
             "isConfirmed": settlement.is_confirmed,
             "confirmedAt": settlement.confirmed_at.isoformat() if settlement.confirmed_at else None,
             "notes": settlement.notes
         }
 
         # Add confirmed_by info if exists
-        if settlement.confirmed_by:
-            confirmer = db.query(User).filter(User.id == settlement.confirmed_by).first()
-            if confirmer:
-                settlement_data["confirmedBy"] = {
-                    "id": confirmer.id,
-                    "name": confirmer.name
-                }
+        if settlement.confirmed_by and confirmer_name is not None:
+            settlement_data["confirmedBy"] = {
+                "id": settlement.confirmed_by,
+                "name": confirmer_name
+            }
 
         settlement_list.append(settlement_data)
 
@@ -104,16 +110,19 @@ def get_settlements(
     }
 
 
-@router.post("/{date}/confirm", response_model=dict)
-def confirm_settlement(
+@router.get("/{date}", response_model=dict)
+def get_settlement(
     date: str,
-    current_user: User = Depends(get_current_super_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    settlement_service: SettlementService = Depends(get_settlement_service)
 ):
     """
-    정산 확정 (SUPER 관리자만)
+    일별 정산 상세 조회
+
+    - 합계 + 결제수단/카테고리/메뉴/셀/시간대별 내역
+    - 미리 계산된 정산과 판매 집계에서 조회, 확정된 정산은 캐시에서 응답
     """
-    # Parse date
     try:
         target_date = datetime.strptime(date, "%Y-%m-%d").date()
     except ValueError:
@@ -128,65 +137,60 @@ def confirm_settlement(
             }
         )
 
-    # Check if settlement exists
-    settlement = db.query(DailySettlement).filter(DailySettlement.date == target_date).first()
-
-    # If not exists, create it
-    if not settlement:
-        # Calculate statistics for the date
-        from datetime import timedelta
-        start_datetime = datetime.combine(target_date, datetime.min.time())
-        end_datetime = datetime.combine(target_date, datetime.max.time())
-
-        orders = db.query(Order).filter(
-            Order.created_at >= start_datetime,
-            Order.created_at <= end_datetime
-        ).all()
-
-        total_orders = len(orders)
-        total_revenue = sum(order.total_amount for order in orders)
-
-        personal_orders_list = [o for o in orders if o.pay_type == PayType.PERSONAL]
-        cell_orders_list = [o for o in orders if o.pay_type == PayType.CELL]
-
-        personal_orders = len(personal_orders_list)
-        personal_revenue = sum(o.total_amount for o in personal_orders_list)
-        cell_orders = len(cell_orders_list)
-        cell_revenue = sum(o.total_amount for o in cell_orders_list)
-
-        settlement = DailySettlement(
-            date=target_date,
-            total_orders=total_orders,
-            total_revenue=total_revenue,
-            personal_orders=personal_orders,
-            personal_revenue=personal_revenue,
-            cell_orders=cell_orders,
-            cell_revenue=cell_revenue,
-            is_confirmed=False
+    try:
+        detail = settlement_service.detail(db, target_date)
+    except SettlementNotFoundError as e:
+        return JSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"success": False, "error": {"code": e.code, "message": e.message}}
         )
-        db.add(settlement)
-        db.flush()
 
-    # Check if already confirmed
-    if settlement.is_confirmed:
+    return {
+        "success": True,
+        "data": detail
+    }
+
+
+@router.post("/{date}/confirm", response_model=dict)
+def confirm_settlement(
+    date: str,
+    current_user: User = Depends(get_current_super_user),
+    db: Session = Depends(get_db),
+    settlement_service: SettlementService = Depends(get_settlement_service)
+):
+    """
+    정산 확정 (SUPER 관리자만)
+
+    - 확정 직전에 해당 날짜를 다시 집계 (집계 쿼리 1회, 취소 주문 제외)
+    - 이미 확정된 정산은 409, 미래 날짜는 400
+    """
+    # Parse date
+    try:
+        target_date = datetime.strptime(date, "%Y-%m-%d").date()
+    except ValueError:
         return JSONResponse(
-            status_code=status.HTTP_409_CONFLICT,
+            status_code=status.HTTP_400_BAD_REQUEST,
             content={
                 "success": False,
                 "error": {
-                    "code": "ALREADY_CONFIRMED",
-                    "message": "이미 확정된 정산입니다"
+                    "code": "INVALID_DATE_FORMAT",
+                    "message": "날짜 형식이 올바르지 않습니다 (YYYY-MM-DD)"
                 }
             }
         )
 
-    # Confirm settlement
-    settlement.is_confirmed = True
-    settlement.confirmed_by = current_user.id
-    settlement.confirmed_at = datetime.now()
-
-    db.commit()
-    db.refresh(settlement)
+    try:
+        settlement = settlement_service.confirm(db, target_date, current_user.id)
+    except FutureSettlementDateError as e:
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={"success": False, "error": {"code": e.code, "message": e.message}}
+        )
+    except SettlementAlreadyConfirmedError as e:
+        return JSONResponse(
+            status_code=status.HTTP_409_CONFLICT,
+            content={"success": False, "error": {"code": e.code, "message": e.message}}
+        )
 
     return {
         "success": True,
@@ -2,20 +2,75 @@
 Statistics API routes
 Based on docs/backend/07-statistics-api.md
 """
+import asyncio
+import json
 from datetime import datetime, date
-from typing import Optional
-from fastapi import APIRouter, Depends, Query, status
-from fastapi.responses import JSONResponse
+from typing import AsyncIterator, Optional, Tuple
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
 from app.database import get_db
-from app.models.order import Order, OrderItem, OrderStatus, PayType
+from app.models.order import Order, OrderStatus, PayType
 from app.models.user import User
+from app.utils.columnar import encode_list, list_format
 from app.dependencies.auth import get_current_user
+from app.dependencies.statistics import get_statistics_service
+from app.services.dashboard_service import DashboardAggregate, dashboard_aggregate
+from app.services.statistics_service import StatisticsService
 
 router = APIRouter(prefix="/api/v1/statistics", tags=["Statistics"])
 
+SSE_HEARTBEAT_SECONDS = 15.0
+HEATMAP_INTERVALS = (15, 30, 60)
+
+
+def _parse_date_range(start: Optional[str], end: Optional[str]) -> Tuple[Optional[date], Optional[date]]:
+    """Parse optional YYYY-MM-DD query parameters (raises ValueError)"""
+    return (
+        datetime.strptime(start, "%Y-%m-%d").date() if start else None,
+        datetime.strptime(end, "%Y-%m-%d").date() if end else None,
+    )
+
+
+def _invalid_date_format() -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={
+            "success": False,
+            "error": {
+                "code": "INVALID_DATE_FORMAT",
+                "message": "날짜 형식이 올바르지 않습니다 (YYYY-MM-DD)"
+            }
+        }
+    )
+
+
+def _sse(event: str, data: dict) -> str:
+    """Format one Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def dashboard_event_stream(
+    request: Request,
+    aggregate: DashboardAggregate,
+    heartbeat: float = SSE_HEARTBEAT_SECONDS
+) -> AsyncIterator[str]:
+    """Yield a snapshot, then deltas as orders change, with keep-alive comments in between"""
+    queue = aggregate.subscribe()
+    try:
+        yield _sse("snapshot", aggregate.snapshot())
+        while not await request.is_disconnected():
+            try:
+                event, data = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            yield _sse(event, data)
+    finally:
+        aggregate.unsubscribe(queue)
+
 
 @router.get("/dashboard", response_model=dict)
 def get_dashboard_statistics(
@@ -98,76 +153,143 @@ def get_dashboard_statistics(
     }
 
 
+@router.get("/dashboard/stream")
+def stream_dashboard_statistics(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    오늘 대시보드 통계 실시간 스트림 (관리자, Server-Sent Events)
+
+    - 연결 직후 `snapshot` 이벤트로 전체 카운터 (GET /dashboard 와 같은 형식)
+    - 이후 주문 생성/상태 변경마다 `delta` 이벤트로 변경된 카운터만 전송
+    - 모든 연결이 하나의 메모리 집계를 공유하므로 연결 수와 무관하게 DB 조회는 최초 1회입니다
+    - 스트림은 몇 시간씩 열려 있으므로 응답 전에 DB 연결을 풀에 반납합니다
+    """
+    try:
+        dashboard_aggregate.ensure_loaded(db)
+    finally:
+        db.rollback()
+
+    return StreamingResponse(
+        dashboard_event_stream(request, dashboard_aggregate),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/menus", response_model=dict)
 def get_menu_statistics(
     startDate: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
     endDate: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
     categoryId: Optional[int] = Query(None, description="Filter by category ID"),
+    limit: Optional[int] = Query(None, ge=1, le=100, description="Top N menus by revenue"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    statistics_service: StatisticsService = Depends(get_statistics_service)
 ):
     """
     메뉴별 판매 통계 (관리자)
+
+    - 메뉴 ID 기준 집계, 매출 높은 순
+    - 마감된 날짜는 일별 집계(menu_daily_sales), 이후 날짜만 주문 항목에서 집계
     """
-    # Build query
-    query = db.query(
-        OrderItem.menu_name,
-        func.sum(OrderItem.quantity).label('total_quantity'),
-        func.sum(OrderItem.total_price).label('total_revenue')
-    ).join(Order)
+    try:
+        start, end = _parse_date_range(startDate, endDate)
+    except ValueError:
+        return _invalid_date_format()
 
-    # Filter by date range
-    if startDate:
-        try:
-            start = datetime.strptime(startDate, "%Y-%m-%d")
-            query = query.filter(Order.created_at >= start)
-        except ValueError:
-            return JSONResponse(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                content={
-                    "success": False,
-                    "error": {
-                        "code": "INVALID_DATE_FORMAT",
-                        "message": "날짜 형식이 올바르지 않습니다 (YYYY-MM-DD)"
-                    }
-                }
-            )
+    return {
+        "success": True,
+        "data": statistics_service.menu_statistics(db, start, end, categoryId, limit)
+    }
 
-    if endDate:
-        try:
-            end = datetime.strptime(endDate, "%Y-%m-%d")
-            from datetime import timedelta
-            end = end + timedelta(days=1)
-            query = query.filter(Order.created_at < end)
-        except ValueError:
-            return JSONResponse(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                content={
-                    "success": False,
-                    "error": {
-                        "code": "INVALID_DATE_FORMAT",
-                        "message": "날짜 형식이 올바르지 않습니다 (YYYY-MM-DD)"
-                    }
-                }
-            )
 
-    # Group by menu name
-    query = query.group_by(OrderItem.menu_name).order_by(func.sum(OrderItem.total_price).desc())
+@router.get("/categories", response_model=dict)
+def get_category_statistics(
+    startDate: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
+    endDate: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    statistics_service: StatisticsService = Depends(get_statistics_service)
+):
+    """
+    카테고리별 판매 통계 (관리자)
 
-    results = query.all()
+    - 카테고리별 판매 수량/매출과 매출 비중(%)
+    """
+    try:
+        start, end = _parse_date_range(startDate, endDate)
+    except ValueError:
+        return _invalid_date_format()
 
-    # Build response
-    menu_stats = []
-    for result in results:
-        menu_stats.append({
-            "menuName": result.menu_name,
-            "quantity": int(result.total_quantity),
-            "revenue": int(result.total_revenue)
-        })
+    return {
+        "success": True,
+        "data": statistics_service.category_statistics(db, start, end)
+    }
+
+
+@router.get("/hourly", response_model=dict)
+def get_hourly_statistics(
+    date_param: Optional[str] = Query(None, alias="date", description="Date (YYYY-MM-DD), default: today"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    statistics_service: StatisticsService = Depends(get_statistics_service)
+):
+    """
+    시간대별 주문 통계 (관리자)
+
+    - 시간별 주문 수/매출/판매 수량/평균 제조 시간 (주문~완료, 초)
+    - 주문이 있는 시간만 포함
+    """
+    try:
+        target_date, _ = _parse_date_range(date_param, None)
+    except ValueError:
+        return _invalid_date_format()
+
+    return {
+        "success": True,
+        "data": statistics_service.hourly(db, target_date or date.today())
+    }
+
+
+@router.get("/heatmap", response_model=dict)
+def get_heatmap_statistics(
+    startDate: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
+    endDate: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
+    interval: int = Query(60, description="Slot length in minutes (15, 30, 60)"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    statistics_service: StatisticsService = Depends(get_statistics_service)
+):
+    """
+    요일 x 시간대 히트맵 (관리자)
+
+    - 칸마다 주문 수/매출/판매 수량/평균 제조 시간
+    - 요일별, 시간대별 합계 포함 (요일: 0=월 ... 6=일)
+    - 마감된 날짜는 15분 단위 집계(order_time_buckets)에서 읽으므로 1년 범위도 집계 행만 읽습니다
+    """
+    try:
+        start, end = _parse_date_range(startDate, endDate)
+    except ValueError:
+        return _invalid_date_format()
+
+    if interval not in HEATMAP_INTERVALS:
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={
+                "success": False,
+                "error": {
+                    "code": "INVALID_INTERVAL",
+                    "message": "interval은 15, 30, 60 중 하나여야 합니다"
+                }
+            }
+        )
 
     return {
         "success": True,
-        "data": menu_stats
+        "data": statistics_service.heatmap(db, start, end, interval)
     }
 
 
@@ -175,11 +297,14 @@ def get_menu_statistics(
 def get_daily_statistics(
     startDate: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
     endDate: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
+    response_format: str = Depends(list_format),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     일별 매출 통계 (관리자)
+
+    - **format**: json (기본) 또는 columnar (컬럼 형식)
     """
     # Build query
     query = db.query(
@@ -232,12 +357,12 @@ def get_daily_statistics(
     daily_stats = []
     for result in results:
         daily_stats.append({
-            "date": result.date.isoformat() if result.date else None,
+            "date": str(result.date) if result.date else None,  # date (PostgreSQL) or 'YYYY-MM-DD' (SQLite)
             "totalOrders": int(result.total_orders),
             "totalRevenue": int(result.total_revenue) if result.total_revenue else 0
         })
 
     return {
         "success": True,
-        "data": daily_stats
+        "data": encode_list(daily_stats, response_format)
     }
@@ -0,0 +1,148 @@
+"""
+System settings API routes
+Based on docs/backend/09-settings-api.md
+"""
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.models.user import User
+from app.schemas.setting import SettingUpdateRequest, SettingBatchUpdateRequest, SettingCreateRequest
+from app.dependencies.auth import get_current_user, get_current_super_user
+from app.dependencies.system_settings import get_settings_service
+from app.dependencies.invalidation import invalidates
+from app.invalidation import SETTINGS
+from app.services.settings_service import SettingsService
+from app.exceptions import (
+    AuthorizationError,
+    BusinessException,
+    SettingNotFoundError,
+    InvalidSettingValueError,
+    DuplicateSettingKeyError
+)
+
+router = APIRouter(prefix="/api/v1/settings", tags=["Settings"], dependencies=[Depends(invalidates(SETTINGS))])
+
+ERROR_STATUS = {
+    SettingNotFoundError: status.HTTP_404_NOT_FOUND,
+    InvalidSettingValueError: status.HTTP_400_BAD_REQUEST,
+    DuplicateSettingKeyError: status.HTTP_409_CONFLICT,
+    AuthorizationError: status.HTTP_403_FORBIDDEN,
+}
+
+
+def _error(e: BusinessException) -> JSONResponse:
+    return JSONResponse(
+        status_code=ERROR_STATUS[type(e)],
+        content={"success": False, "error": {"code": e.code, "message": e.message}}
+    )
+
+
+@router.get("", response_model=dict)
+def get_settings(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    service: SettingsService = Depends(get_settings_service)
+):
+    """
+    전체 설정 조회
+
+    - 저장되지 않은 기본 설정도 기본값으로 포함
+    """
+    return {
+        "success": True,
+        "data": service.list_settings(db)
+    }
+
+
+@router.patch("/batch", response_model=dict)
+def update_settings_batch(
+    batch: SettingBatchUpdateRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    service: SettingsService = Depends(get_settings_service)
+):
+    """
+    여러 설정 일괄 변경 (하나라도 실패하면 모두 취소)
+    """
+    try:
+        values = service.update_settings(db, {s.key: s.value for s in batch.settings}, current_user)
+    except (SettingNotFoundError, InvalidSettingValueError, AuthorizationError) as e:
+        return _error(e)
+
+    return {
+        "success": True,
+        "data": {
+            "updated": len(values),
+            "settings": [{"key": key, "value": value} for key, value in values.items()]
+        }
+    }
+
+
+@router.get("/{key}", response_model=dict)
+def get_setting(
+    key: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    service: SettingsService = Depends(get_settings_service)
+):
+    """
+    특정 설정 조회
+    """
+    try:
+        setting = service.get_setting(db, key)
+    except SettingNotFoundError as e:
+        return _error(e)
+
+    return {
+        "success": True,
+        "data": setting
+    }
+
+
+@router.put("/{key}", response_model=dict)
+def update_setting(
+    key: str,
+    update_data: SettingUpdateRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    service: SettingsService = Depends(get_settings_service)
+):
+    """
+    설정 값 변경
+
+    - NORMAL 관리자는 bonus_rate, is_kiosk_active, notification_sound만 변경 가능
+    """
+    try:
+        service.update_settings(db, {key: update_data.value}, current_user)
+    except (SettingNotFoundError, InvalidSettingValueError, AuthorizationError) as e:
+        return _error(e)
+
+    return {
+        "success": True,
+        "data": service.get_setting(db, key)
+    }
+
+
+@router.post("", response_model=dict, status_code=status.HTTP_201_CREATED)
+def create_setting(
+    create_data: SettingCreateRequest,
+    current_user: User = Depends(get_current_super_user),
+    db: Session = Depends(get_db),
+    service: SettingsService = Depends(get_settings_service)
+):
+    """
+    새 설정 추가 (SUPER 관리자만)
+    """
+    try:
+        setting = service.create_setting(
+            db, create_data.key, create_data.value, create_data.description, current_user
+        )
+    except (DuplicateSettingKeyError, InvalidSettingValueError) as e:
+        return _error(e)
+
+    return {
+        "success": True,
+        "data": setting
+    }
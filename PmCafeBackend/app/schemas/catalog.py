@@ -0,0 +1,78 @@
+"""
+Catalog fixture schemas (declarative seed file for init_data)
+"""
+from typing import List, Optional
+from pydantic import BaseModel, Field, model_validator
+
+
+class CatalogCategory(BaseModel):
+    """Catalog category entry (keyed by code)"""
+    code: str = Field(..., min_length=1, max_length=50)
+    name: str = Field(..., min_length=1, max_length=100)
+    display_order: int = 0
+    is_active: bool = True
+
+
+class CatalogOptionItem(BaseModel):
+    """Catalog option item entry (keyed by group + name)"""
+    name: str = Field(..., min_length=1, max_length=100)
+    price: int = Field(0, ge=0)
+    is_default: bool = False
+    display_order: Optional[int] = None
+
+
+class CatalogOptionGroup(BaseModel):
+    """Catalog option group entry (keyed by name)"""
+    name: str = Field(..., min_length=1, max_length=100)
+    icon: Optional[str] = Field(None, max_length=10)
+    type: str = Field(..., pattern="^(SINGLE|MULTIPLE)$")
+    is_required: bool = False
+    display_order: int = 0
+    items: List[CatalogOptionItem] = []
+
+
+class CatalogMenu(BaseModel):
+    """Catalog menu entry (keyed by name)"""
+    name: str = Field(..., min_length=1, max_length=100)
+    eng_name: Optional[str] = Field(None, max_length=100)
+    price: int = Field(..., ge=0)
+    category: str = Field(..., description="Category code")
+    description: Optional[str] = None
+    image_url: Optional[str] = None
+    option_groups: List[str] = Field([], description="Option group names, in display order")
+    display_order: Optional[int] = None
+    is_active: bool = True
+
+
+class CatalogSetting(BaseModel):
+    """Catalog system setting entry (only inserted when missing)"""
+    key: str = Field(..., min_length=1, max_length=100)
+    value: str
+    description: Optional[str] = None
+
+
+class CatalogFile(BaseModel):
+    """Whole catalog file"""
+    categories: List[CatalogCategory] = []
+    option_groups: List[CatalogOptionGroup] = []
+    menus: List[CatalogMenu] = []
+    settings: List[CatalogSetting] = []
+
+    @model_validator(mode="after")
+    def check_unique_keys(self):
+        for label, keys in (
+            ("category code", [c.code for c in self.categories]),
+            ("option group name", [g.name for g in self.option_groups]),
+            ("menu name", [m.name for m in self.menus]),
+            ("setting key", [s.key for s in self.settings]),
+        ):
+            duplicates = sorted({k for k in keys if keys.count(k) > 1})
+            if duplicates:
+                raise ValueError(f"duplicate {label}: {', '.join(duplicates)}")
+
+        for group in self.option_groups:
+            names = [item.name for item in group.items]
+            duplicates = sorted({n for n in names if names.count(n) > 1})
+            if duplicates:
+                raise ValueError(f"duplicate option item in '{group.name}': {', '.join(duplicates)}")
+        return self
@@ -54,7 +54,7 @@ class CellUpdateRequest(BaseModel):
 class CellChargeRequest(BaseModel):
     """Cell charge request schema"""
     amount: int = Field(..., gt=0)
-    bonusRate: int = Field(..., ge=0, le=100)
+    bonusRate: Optional[int] = Field(None, ge=0, le=100)  # 생략 시 bonus_rate 설정
     memo: Optional[str] = None
 
 
@@ -1,7 +1,7 @@
 """
 Menu API schemas
 """
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -48,6 +48,7 @@ class MenuListResponse(BaseModel):
     category: CategoryResponse
     description: Optional[str] = None
     image_url: Optional[str] = None
+    image_variants: Optional[Dict[str, Dict[str, str]]] = None  # {"grid"|"detail": {"webp", "jpeg"}}
     is_sold_out: bool
     is_active: bool
     display_order: int
@@ -65,6 +66,7 @@ class MenuDetailResponse(BaseModel):
     category: CategoryResponse
     description: Optional[str] = None
     image_url: Optional[str] = None
+    image_variants: Optional[Dict[str, Dict[str, str]]] = None
     is_sold_out: bool
     is_active: bool
     display_order: int
@@ -154,3 +156,35 @@ class OptionItemUpdateRequest(BaseModel):
     price: Optional[int] = Field(None, ge=0)
     is_default: Optional[bool] = None
     display_order: Optional[int] = None
+
+
+class MenuBulkCreateRequest(BaseModel):
+    """Bulk menu creation request schema"""
+    menus: List[MenuCreateRequest] = Field(..., min_length=1, max_length=500)
+
+
+class MenuBulkUpdateItem(MenuUpdateRequest):
+    """Bulk menu update item schema"""
+    id: int
+
+
+class MenuBulkUpdateRequest(BaseModel):
+    """Bulk menu update request schema"""
+    menus: List[MenuBulkUpdateItem] = Field(..., min_length=1, max_length=500)
+
+
+class MenuReorderItem(BaseModel):
+    """Menu reorder item schema"""
+    id: int
+    display_order: int
+
+
+class MenuReorderRequest(BaseModel):
+    """Menu reorder request schema"""
+    menus: List[MenuReorderItem] = Field(..., min_length=1, max_length=500)
+
+
+class MenuBulkSoldOutRequest(BaseModel):
+    """Bulk menu sold out toggle request schema"""
+    menu_ids: List[int] = Field(..., min_length=1, max_length=500)
+    is_sold_out: bool
@@ -5,6 +5,8 @@ from datetime import datetime
 from typing import List, Optional
 from pydantic import BaseModel, Field
 
+from app.models.order import Order
+
 
 class OrderItemOptionItem(BaseModel):
     """Order item option item schema"""
@@ -35,6 +37,17 @@ class CreateOrderRequest(BaseModel):
     totalAmount: int = Field(..., gt=0)
 
 
+class QueuedOrderRequest(CreateOrderRequest):
+    """Order taken while the kiosk was offline"""
+    idempotencyKey: str = Field(..., min_length=1, max_length=100)
+    clientCreatedAt: datetime
+
+
+class OrderBatchCreateRequest(BaseModel):
+    """Batch upload of offline-queued orders"""
+    orders: List[QueuedOrderRequest] = Field(..., min_length=1, max_length=100)
+
+
 class CellInfoResponse(BaseModel):
     """Cell info response schema"""
     id: int
@@ -60,10 +73,85 @@ class OrderResponse(BaseModel):
     items: List[OrderItemResponse]
     totalAmount: int
     status: str
+    version: int
     createdAt: datetime
+    makingStartedAt: Optional[datetime] = None
     completedAt: Optional[datetime] = None
 
 
 class OrderStatusUpdateRequest(BaseModel):
     """Order status update request schema"""
     status: str = Field(..., pattern="^(PENDING|MAKING|COMPLETED|CANCELLED)$")
+    expectedStatus: Optional[str] = Field(None, pattern="^(PENDING|MAKING|COMPLETED|CANCELLED)$")
+    version: Optional[int] = Field(None, ge=1)
+
+
+class OrderBatchStatusUpdateRequest(BaseModel):
+    """Batch order status update request schema"""
+    orderIds: List[str] = Field(..., min_length=1, max_length=500)
+    status: str = Field(..., pattern="^(PENDING|MAKING|COMPLETED|CANCELLED)$")
+
+
+class OrderCancelRequest(BaseModel):
+    """Order cancel request schema"""
+    reason: Optional[str] = Field(None, max_length=200)
+    version: Optional[int] = Field(None, ge=1)
+
+
+class OrderBatchCancelRequest(BaseModel):
+    """Batch order cancel request schema"""
+    orderIds: List[str] = Field(..., min_length=1, max_length=500)
+    reason: Optional[str] = Field(None, max_length=200)
+
+
+def build_order_response(order: Order, include_balance: bool = False) -> OrderResponse:
+    """
+    Build OrderResponse from an Order with items, options and cell loaded
+
+    Args:
+        order: Order with eager-loaded items/options/cell
+        include_balance: Include the cell balance (only shown right after ordering)
+    """
+    cell_info = None
+    if order.cell:
+        cell_info = CellInfoResponse(
+            id=order.cell.id,
+            name=order.cell.name,
+            balance=order.cell.balance if include_balance else None
+        )
+
+    items = []
+    for order_item in order.items:
+        # Group options by option group name, keeping selection order
+        option_groups_dict = {}
+        for option in order_item.options:
+            option_groups_dict.setdefault(option.option_group_name, []).append(
+                OrderItemOptionItem(name=option.option_item_name, price=option.option_item_price)
+            )
+
+        selected_options = [
+            OrderItemOptionGroup(groupName=group_name, items=group_items)
+            for group_name, group_items in option_groups_dict.items()
+        ]
+
+        items.append(OrderItemResponse(
+            menuName=order_item.menu_name,
+            menuPrice=order_item.menu_price,
+            quantity=order_item.quantity,
+            selectedOptions=selected_options,
+            totalPrice=order_item.total_price
+        ))
+
+    return OrderResponse(
+        orderId=order.order_id,
+        dailyNum=order.daily_num,
+        payType=order.pay_type.value,
+        cellInfo=cell_info,
+        items=items,
+        totalAmount=order.total_amount,
+        status=order.status.value,
+        version=order.version,
+        createdAt=order.created_at,
+        makingStartedAt=order.making_started_at,
+        completedAt=order.completed_at
+    )
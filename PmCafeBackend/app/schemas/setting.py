@@ -0,0 +1,28 @@
+"""
+System setting API schemas
+"""
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+class SettingUpdateRequest(BaseModel):
+    """Setting value update request schema"""
+    value: str
+
+
+class SettingValue(BaseModel):
+    """Key and value of a batch update"""
+    key: str = Field(..., min_length=1, max_length=100)
+    value: str
+
+
+class SettingBatchUpdateRequest(BaseModel):
+    """Batch setting update request schema"""
+    settings: List[SettingValue] = Field(..., min_length=1)
+
+
+class SettingCreateRequest(BaseModel):
+    """Setting creation request schema"""
+    key: str = Field(..., min_length=1, max_length=100, pattern="^[a-z][a-z0-9_]*$")
+    value: str
+    description: Optional[str] = None
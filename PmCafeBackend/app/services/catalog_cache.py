@@ -0,0 +1,50 @@
+"""
+Catalog Cache - Public menu, category and option group lists kept in memory
+"""
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+from app.invalidation import MENUS, CATEGORIES, OPTIONS, ALL
+
+CATALOG_TOPICS = (MENUS, CATEGORIES, OPTIONS, ALL)
+
+
+class CatalogCache:
+    """
+    Response data of the public catalog lists, by route and query parameters
+
+    Every kiosk loads the catalog, which only changes when an admin edits
+    it: any menus/categories/options invalidation (from this or another
+    worker) drops all entries, since menus embed their category. A load
+    that raced with an invalidation is returned but not kept.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, Any] = {}
+        self._generation = 0
+
+    def get_or_load(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key]
+            generation = self._generation
+
+        value = load()
+        with self._lock:
+            if self._generation == generation:
+                self._entries[key] = value
+        return value
+
+    def handle_invalidation(self, topic: str) -> None:
+        """Invalidation bus handler"""
+        if topic in CATALOG_TOPICS:
+            self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+
+catalog_cache = CatalogCache()
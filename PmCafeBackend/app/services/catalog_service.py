@@ -0,0 +1,328 @@
+"""
+Catalog Service - Declarative, idempotent catalog loading
+"""
+from typing import Dict
+
+import yaml
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.orm import Session
+
+from app.models.menu import Category, OptionGroup, OptionItem, OptionType, Menu, MenuOptionGroup
+from app.models.settlement import SystemSetting
+from app.invalidation import invalidation_bus, MENUS, CATEGORIES, OPTIONS, SETTINGS
+from app.schemas.catalog import CatalogFile
+from app.exceptions import ValidationError
+from app.utils.db import upsert
+
+
+def _empty_counts() -> Dict[str, int]:
+    return {"created": 0, "updated": 0, "unchanged": 0, "removed": 0}
+
+
+class CatalogService:
+    """Service layer for applying a catalog file to the database"""
+
+    def load_file(self, path: str) -> CatalogFile:
+        """
+        Load a YAML (or JSON) catalog file
+
+        Raises:
+            ValidationError: When the file does not match the catalog schema
+        """
+        with open(path, encoding="utf-8") as f:
+            raw = yaml.safe_load(f) or {}
+
+        try:
+            return CatalogFile.model_validate(raw)
+        except ValueError as e:
+            raise ValidationError(f"카탈로그 파일 형식이 올바르지 않습니다: {e}")
+
+    def apply(
+        self,
+        db: Session,
+        catalog: CatalogFile,
+        prune: bool = False,
+        dry_run: bool = False
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Diff the catalog against the database and upsert only what changed
+
+        Everything runs in one transaction: one SELECT per table to diff, then
+        one INSERT ... ON CONFLICT per table for new/changed rows.
+
+        Args:
+            db: Database session
+            catalog: Parsed catalog
+            prune: Deactivate categories/menus and delete option items missing from the catalog
+            dry_run: Compute the report, then roll back
+
+        Returns:
+            Per-table counts of created/updated/unchanged/removed rows
+
+        Raises:
+            ValidationError: When a menu references an unknown category or option group
+        """
+        report = {}
+        try:
+            category_ids = self._apply_categories(db, catalog, prune, report)
+            group_ids = self._apply_option_groups(db, catalog, report)
+            self._apply_option_items(db, catalog, group_ids, prune, report)
+            menu_ids = self._apply_menus(db, catalog, category_ids, prune, report)
+            self._apply_menu_option_groups(db, catalog, menu_ids, group_ids, report)
+            self._apply_settings(db, catalog, report)
+        except Exception:
+            db.rollback()
+            raise
+
+        if dry_run:
+            db.rollback()
+        else:
+            invalidation_bus.mark(db, MENUS, CATEGORIES, OPTIONS, SETTINGS)
+            db.commit()
+
+        return report
+
+    # Private helper methods
+
+    def _apply_categories(self, db: Session, catalog: CatalogFile, prune: bool, report: dict) -> Dict[str, int]:
+        counts = report["categories"] = _empty_counts()
+        existing = {row.code: row for row in db.execute(
+            select(Category.id, Category.code, Category.name, Category.display_order, Category.is_active)
+        ).all()}
+
+        rows = []
+        for category in catalog.categories:
+            values = category.model_dump()
+            current = existing.get(category.code)
+            if current is None:
+                counts["created"] += 1
+            elif (current.name, current.display_order, current.is_active) != (
+                category.name, category.display_order, category.is_active
+            ):
+                counts["updated"] += 1
+            else:
+                counts["unchanged"] += 1
+                continue
+            rows.append(values)
+
+        ids = {code: row.id for code, row in existing.items()}
+        for row in upsert(
+            db, Category.__table__, rows, ["code"],
+            update_columns=["name", "display_order", "is_active"], returning=["id", "code"]
+        ):
+            ids[row.code] = row.id
+
+        if prune:
+            keep = [c.code for c in catalog.categories]
+            stale = [code for code, row in existing.items() if code not in keep and row.is_active]
+            if stale:
+                db.execute(update(Category).where(Category.code.in_(stale)).values(is_active=False))
+                counts["removed"] = len(stale)
+
+        return ids
+
+    def _apply_option_groups(self, db: Session, catalog: CatalogFile, report: dict) -> Dict[str, int]:
+        counts = report["option_groups"] = _empty_counts()
+        existing = {row.name: row for row in db.execute(
+            select(OptionGroup.id, OptionGroup.name, OptionGroup.icon, OptionGroup.type,
+                   OptionGroup.is_required, OptionGroup.display_order)
+        ).all()}
+
+        rows = []
+        for group in catalog.option_groups:
+            values = {
+                "name": group.name,
+                "icon": group.icon,
+                "type": OptionType[group.type],
+                "is_required": group.is_required,
+                "display_order": group.display_order,
+            }
+            current = existing.get(group.name)
+            if current is None:
+                counts["created"] += 1
+            elif (current.icon, current.type, current.is_required, current.display_order) != (
+                values["icon"], values["type"], values["is_required"], values["display_order"]
+            ):
+                counts["updated"] += 1
+            else:
+                counts["unchanged"] += 1
+                continue
+            rows.append(values)
+
+        ids = {name: row.id for name, row in existing.items()}
+        for row in upsert(
+            db, OptionGroup.__table__, rows, ["name"],
+            update_columns=["icon", "type", "is_required", "display_order"], returning=["id", "name"]
+        ):
+            ids[row.name] = row.id
+        return ids
+
+    def _apply_option_items(
+        self,
+        db: Session,
+        catalog: CatalogFile,
+        group_ids: Dict[str, int],
+        prune: bool,
+        report: dict
+    ) -> None:
+        counts = report["option_items"] = _empty_counts()
+        catalog_group_ids = [group_ids[g.name] for g in catalog.option_groups]
+        existing = {(row.option_group_id, row.name): row for row in db.execute(
+            select(OptionItem.id, OptionItem.option_group_id, OptionItem.name, OptionItem.price,
+                   OptionItem.is_default, OptionItem.display_order)
+            .where(OptionItem.option_group_id.in_(catalog_group_ids))
+        ).all()}
+
+        rows = []
+        desired = set()
+        for group in catalog.option_groups:
+            group_id = group_ids[group.name]
+            for idx, item in enumerate(group.items):
+                values = {
+                    "option_group_id": group_id,
+                    "name": item.name,
+                    "price": item.price,
+                    "is_default": item.is_default,
+                    "display_order": item.display_order if item.display_order is not None else idx + 1,
+                }
+                desired.add((group_id, item.name))
+                current = existing.get((group_id, item.name))
+                if current is None:
+                    counts["created"] += 1
+                elif (current.price, current.is_default, current.display_order) != (
+                    values["price"], values["is_default"], values["display_order"]
+                ):
+                    counts["updated"] += 1
+                else:
+                    counts["unchanged"] += 1
+                    continue
+                rows.append(values)
+
+        upsert(
+            db, OptionItem.__table__, rows, ["option_group_id", "name"],
+            update_columns=["price", "is_default", "display_order"]
+        )
+
+        if prune:
+            stale_ids = [row.id for key, row in existing.items() if key not in desired]
+            if stale_ids:
+                db.execute(delete(OptionItem).where(OptionItem.id.in_(stale_ids)))
+                counts["removed"] = len(stale_ids)
+
+    def _apply_menus(
+        self,
+        db: Session,
+        catalog: CatalogFile,
+        category_ids: Dict[str, int],
+        prune: bool,
+        report: dict
+    ) -> Dict[str, int]:
+        counts = report["menus"] = _empty_counts()
+        fields = ["eng_name", "price", "category_id", "description", "image_url", "display_order", "is_active"]
+        existing = {row.name: row for row in db.execute(
+            select(Menu.id, Menu.name, *[getattr(Menu, f) for f in fields])
+        ).all()}
+
+        rows = []
+        for idx, menu in enumerate(catalog.menus):
+            if menu.category not in category_ids:
+                raise ValidationError(f"메뉴 '{menu.name}'의 카테고리 '{menu.category}'를 찾을 수 없습니다")
+
+            values = {
+                "name": menu.name,
+                "eng_name": menu.eng_name,
+                "price": menu.price,
+                "category_id": category_ids[menu.category],
+                "description": menu.description,
+                "image_url": menu.image_url,
+                "display_order": menu.display_order if menu.display_order is not None else idx + 1,
+                "is_active": menu.is_active,
+            }
+            current = existing.get(menu.name)
+            if current is None:
+                counts["created"] += 1
+                values["is_sold_out"] = False
+            elif tuple(getattr(current, f) for f in fields) != tuple(values[f] for f in fields):
+                counts["updated"] += 1
+                values["is_sold_out"] = False
+            else:
+                counts["unchanged"] += 1
+                continue
+            rows.append(values)
+
+        ids = {name: row.id for name, row in existing.items()}
+        # is_sold_out is runtime state: it is only set on insert, never overwritten
+        for row in upsert(
+            db, Menu.__table__, rows, ["name"],
+            update_columns=fields + ["updated_at"], returning=["id", "name"]
+        ):
+            ids[row.name] = row.id
+
+        if prune:
+            keep = {m.name for m in catalog.menus}
+            stale_ids = [row.id for name, row in existing.items() if name not in keep and row.is_active]
+            if stale_ids:
+                db.execute(
+                    update(Menu).where(Menu.id.in_(stale_ids)).values(is_active=False, updated_at=func.now())
+                )
+                counts["removed"] = len(stale_ids)
+
+        return ids
+
+    def _apply_menu_option_groups(
+        self,
+        db: Session,
+        catalog: CatalogFile,
+        menu_ids: Dict[str, int],
+        group_ids: Dict[str, int],
+        report: dict
+    ) -> None:
+        counts = report["menu_option_groups"] = _empty_counts()
+        catalog_menu_ids = [menu_ids[m.name] for m in catalog.menus]
+        existing = {(row.menu_id, row.option_group_id): row for row in db.execute(
+            select(MenuOptionGroup.id, MenuOptionGroup.menu_id, MenuOptionGroup.option_group_id,
+                   MenuOptionGroup.display_order)
+            .where(MenuOptionGroup.menu_id.in_(catalog_menu_ids))
+        ).all()}
+
+        rows = []
+        desired = set()
+        for menu in catalog.menus:
+            menu_id = menu_ids[menu.name]
+            for idx, group_name in enumerate(menu.option_groups):
+                if group_name not in group_ids:
+                    raise ValidationError(f"메뉴 '{menu.name}'의 옵션 그룹 '{group_name}'을 찾을 수 없습니다")
+
+                key = (menu_id, group_ids[group_name])
+                desired.add(key)
+                current = existing.get(key)
+                if current is None:
+                    counts["created"] += 1
+                elif current.display_order != idx:
+                    counts["updated"] += 1
+                else:
+                    counts["unchanged"] += 1
+                    continue
+                rows.append({"menu_id": key[0], "option_group_id": key[1], "display_order": idx})
+
+        upsert(
+            db, MenuOptionGroup.__table__, rows, ["menu_id", "option_group_id"],
+            update_columns=["display_order"]
+        )
+
+        # A menu's option group list is declarative: unlisted links are removed
+        stale_ids = [row.id for key, row in existing.items() if key not in desired]
+        if stale_ids:
+            db.execute(delete(MenuOptionGroup).where(MenuOptionGroup.id.in_(stale_ids)))
+            counts["removed"] = len(stale_ids)
+
+    def _apply_settings(self, db: Session, catalog: CatalogFile, report: dict) -> None:
+        counts = report["settings"] = _empty_counts()
+        existing = set(db.execute(select(SystemSetting.key)).scalars())
+
+        # Setting values are runtime state (e.g. next_order_number): only insert missing keys
+        rows = [s.model_dump() for s in catalog.settings if s.key not in existing]
+        upsert(db, SystemSetting.__table__, rows, ["key"])
+
+        counts["created"] = len(rows)
+        counts["unchanged"] = len(catalog.settings) - len(rows)
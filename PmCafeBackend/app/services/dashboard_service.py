@@ -0,0 +1,203 @@
+"""
+Dashboard Service - In-memory running aggregate for the live dashboard
+"""
+import asyncio
+import threading
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.order import Order
+from app.events import ORDER_CREATED, ORDER_STATUS_CHANGED
+
+# Same counters as GET /api/v1/statistics/dashboard
+COUNTERS = (
+    "totalOrders", "totalRevenue",
+    "personalOrders", "personalRevenue",
+    "cellOrders", "cellRevenue",
+    "pendingOrders", "makingOrders", "completedOrders",
+)
+STATUS_COUNTERS = {"PENDING": "pendingOrders", "MAKING": "makingOrders", "COMPLETED": "completedOrders"}
+PAY_TYPE_COUNTERS = {"PERSONAL": ("personalOrders", "personalRevenue"), "CELL": ("cellOrders", "cellRevenue")}
+
+SUBSCRIBER_QUEUE_SIZE = 1000
+
+
+def _local_date(value: Optional[str]) -> Optional[date]:
+    """Date of an ISO timestamp, in server local time like the dashboard query"""
+    if not value:
+        return None
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is not None:
+        dt = dt.astimezone()
+    return dt.date()
+
+
+class DashboardAggregate:
+    """
+    Today's dashboard counters, kept up to date from order events
+
+    The aggregate is loaded with one query when the first dashboard stream
+    connects, then maintained from `order:created` / `order:status_changed`
+    events, so any number of open dashboards share a single aggregate.
+    Subscribers receive `delta` messages with only the counters that changed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._day: Optional[date] = None
+        self._counters: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        # orderId -> (payType, status); makes replayed/duplicate events harmless
+        self._orders: Dict[str, Tuple[str, str]] = {}
+        self._subscribers: List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = []
+
+    @property
+    def loaded(self) -> bool:
+        return self._day is not None
+
+    def ensure_loaded(self, db: Session, today: Optional[date] = None) -> None:
+        """Load today's orders with one query unless already tracking today"""
+        today = today or date.today()
+        with self._lock:
+            if self._day == today:
+                return
+            self._load(db, today)
+
+    def reload(self, db: Session) -> None:
+        """Re-read today's orders after missed events and push a fresh snapshot to subscribers"""
+        with self._lock:
+            if self._day is None:
+                return
+            self._load(db, date.today())
+            self._broadcast("snapshot", self._snapshot())
+
+    def snapshot(self) -> dict:
+        """Current counters in the GET /statistics/dashboard shape"""
+        with self._lock:
+            self._roll_over(date.today())
+            return self._snapshot()
+
+    def reset(self) -> None:
+        """Forget all state (next stream connection reloads from the database)"""
+        with self._lock:
+            self._day = None
+            self._counters = dict.fromkeys(COUNTERS, 0)
+            self._orders = {}
+
+    def handle_event(self, event: str, data: dict) -> None:
+        """Event bus handler: apply an order event and push the delta to subscribers"""
+        with self._lock:
+            if self._day is None:
+                return  # No dashboard has connected yet: nothing to maintain
+
+            if self._roll_over(date.today()):
+                self._broadcast("snapshot", self._snapshot())
+
+            if event == ORDER_CREATED:
+                if _local_date(data.get("createdAt")) not in (None, self._day):
+                    return
+                delta = self._apply_created(
+                    data["orderId"], data["payType"], data["status"], data["totalAmount"]
+                )
+            elif event == ORDER_STATUS_CHANGED:
+                delta = self._apply_status_changed(data["orderId"], data["status"])
+            else:
+                return
+
+            if delta:
+                self._broadcast("delta", {"date": self._day.isoformat(), "delta": delta})
+
+    # Subscriptions (called from the event loop)
+
+    def subscribe(self) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers.append((asyncio.get_running_loop(), queue))
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        with self._lock:
+            self._subscribers = [(loop, q) for loop, q in self._subscribers if q is not queue]
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    # Private helper methods (caller holds the lock)
+
+    def _load(self, db: Session, today: date) -> None:
+        start = datetime.combine(today, datetime.min.time())
+        end = datetime.combine(today, datetime.max.time())
+        rows = db.query(Order.order_id, Order.pay_type, Order.status, Order.total_amount).filter(
+            Order.created_at >= start,
+            Order.created_at <= end
+        ).all()
+
+        self._reset(today)
+        for row in rows:
+            self._apply_created(row.order_id, row.pay_type.value, row.status.value, row.total_amount)
+
+    def _reset(self, day: date) -> None:
+        self._day = day
+        self._counters = dict.fromkeys(COUNTERS, 0)
+        self._orders = {}
+
+    def _roll_over(self, today: date) -> bool:
+        """Start a fresh day at midnight; new-day orders all arrive as events"""
+        if self._day is None or self._day == today:
+            return False
+        self._reset(today)
+        return True
+
+    def _snapshot(self) -> dict:
+        return {"date": self._day.isoformat() if self._day else None, **self._counters}
+
+    def _apply_created(self, order_id: str, pay_type: str, status: str, amount: int) -> Dict[str, int]:
+        if order_id in self._orders:
+            return {}
+        self._orders[order_id] = (pay_type, status)
+
+        orders_key, revenue_key = PAY_TYPE_COUNTERS[pay_type]
+        delta = {"totalOrders": 1, "totalRevenue": amount, orders_key: 1, revenue_key: amount}
+        if status in STATUS_COUNTERS:
+            delta[STATUS_COUNTERS[status]] = 1
+        return self._add(delta)
+
+    def _apply_status_changed(self, order_id: str, status: str) -> Dict[str, int]:
+        current = self._orders.get(order_id)
+        if current is None or current[1] == status:
+            return {}  # Order from another day, or a duplicate event
+        pay_type, previous = current
+        self._orders[order_id] = (pay_type, status)
+
+        delta = {}
+        if previous in STATUS_COUNTERS:
+            delta[STATUS_COUNTERS[previous]] = -1
+        if status in STATUS_COUNTERS:
+            delta[STATUS_COUNTERS[status]] = 1
+        return self._add(delta)
+
+    def _add(self, delta: Dict[str, int]) -> Dict[str, int]:
+        for key, value in delta.items():
+            self._counters[key] += value
+        return delta
+
+    def _broadcast(self, event: str, data: dict) -> None:
+        for loop, queue in self._subscribers:
+            try:
+                loop.call_soon_threadsafe(self._offer, queue, (event, data))
+            except RuntimeError:
+                pass  # Subscriber's loop already closed
+
+    def _offer(self, queue: asyncio.Queue, message: tuple) -> None:
+        """Runs on the subscriber's loop; a client too slow to keep up gets a fresh snapshot"""
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(("snapshot", self.snapshot()))
+
+
+dashboard_aggregate = DashboardAggregate()
@@ -0,0 +1,92 @@
+"""
+Kitchen Queue - In-memory projection of active (PENDING/MAKING) orders
+"""
+import threading
+from typing import Dict, List
+
+from sqlalchemy.orm import Session, joinedload
+
+from app.models.order import Order, OrderItem, OrderStatus
+from app.schemas.order import build_order_response
+from app.events import ORDER_CREATED, ORDER_STATUS_CHANGED
+
+ACTIVE_STATUSES = (OrderStatus.PENDING.value, OrderStatus.MAKING.value)
+
+
+class ActiveOrderProjection:
+    """
+    Active orders for the barista screen, kept in memory from order events
+
+    Loaded once with a single query (only PENDING/MAKING orders), then
+    maintained from `order:created` / `order:status_changed` events, so
+    reading the queue never touches historical orders. Entries use the
+    same shape as the GET /api/v1/orders list items.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loaded = False
+        # orderId -> order, in creation order (loaded sorted, new orders appended)
+        self._orders: Dict[str, dict] = {}
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def ensure_loaded(self, db: Session) -> None:
+        """Load active orders with one query unless already loaded"""
+        with self._lock:
+            if self._loaded:
+                return
+
+            orders = db.query(Order).options(
+                joinedload(Order.items).joinedload(OrderItem.options),
+                joinedload(Order.cell)
+            ).filter(
+                Order.status.in_([OrderStatus.PENDING, OrderStatus.MAKING])
+            ).order_by(Order.created_at, Order.id).all()
+
+            self._orders = {
+                order.order_id: build_order_response(order).model_dump(mode="json")
+                for order in orders
+            }
+            self._loaded = True
+
+    def list(self) -> List[dict]:
+        """Active orders, oldest first"""
+        with self._lock:
+            return list(self._orders.values())
+
+    def reset(self) -> None:
+        """Forget all state (next read reloads from the database)"""
+        with self._lock:
+            self._loaded = False
+            self._orders = {}
+
+    def handle_event(self, event: str, data: dict) -> None:
+        """Event bus handler: add, update or drop the order"""
+        with self._lock:
+            if not self._loaded or event not in (ORDER_CREATED, ORDER_STATUS_CHANGED):
+                return  # Nothing to maintain until the first read
+
+            order_id = data["orderId"]
+            if event == ORDER_CREATED:
+                if data["status"] in ACTIVE_STATUSES:
+                    self._orders.setdefault(order_id, dict(data))
+            elif event == ORDER_STATUS_CHANGED:
+                if data["status"] not in ACTIVE_STATUSES:
+                    self._orders.pop(order_id, None)
+                elif order_id in self._orders:
+                    self._orders[order_id] = {
+                        **self._orders[order_id],
+                        "status": data["status"],
+                        "version": data["version"],
+                        "makingStartedAt": data.get("makingStartedAt"),
+                    }
+                else:
+                    # An order we never saw became active again: reload on next read
+                    self._loaded = False
+                    self._orders = {}
+
+
+active_orders = ActiveOrderProjection()
@@ -0,0 +1,313 @@
+"""
+Ledger Service - Daily cell balance snapshots and ledger reconciliation
+"""
+import calendar
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import case, func, or_
+from sqlalchemy.orm import Session, aliased
+
+from app.models.cell import Cell
+from app.models.transaction import PointTransaction, TransactionType, CellBalanceSnapshot
+from app.exceptions import CellNotFoundError
+from app.utils.db import upsert
+from app.utils.dates import day_bounds
+
+SNAPSHOT_UPDATE_COLUMNS = (
+    "balance", "last_transaction_id", "charged", "used", "refunded", "transaction_count"
+)
+
+
+class LedgerService:
+    """
+    Service layer for the cell point ledger
+
+    `point_transactions` is the source of truth; `cell_balance_snapshots`
+    holds one closing row per cell per day (balance, last transaction and the
+    day's totals), so a historical balance is one indexed lookup plus at
+    most a short tail of transactions, and monthly statements read ~30
+    snapshot rows instead of the month's transactions.
+    """
+
+    def take_snapshots(self, db: Session, day: date) -> int:
+        """
+        Write (or rewrite) the closing snapshot of every cell with ledger history
+
+        Builds on the previous day's snapshots when they exist, so only the
+        day's transactions are read; otherwise the closing balances before
+        the day come from one GROUP BY over the ledger. All rows are written
+        with a single INSERT ... ON CONFLICT.
+
+        Returns:
+            Number of snapshot rows written
+        """
+        start, end = day_bounds(day)
+
+        previous = {
+            row.cell_id: (row.balance, row.last_transaction_id)
+            for row in db.query(
+                CellBalanceSnapshot.cell_id,
+                CellBalanceSnapshot.balance,
+                CellBalanceSnapshot.last_transaction_id
+            ).filter(CellBalanceSnapshot.snapshot_date == day - timedelta(days=1)).all()
+        }
+        if not previous:
+            previous = self._closing_balances(db, start)
+
+        activity = {
+            row.cell_id: row for row in db.query(
+                PointTransaction.cell_id,
+                func.sum(case((PointTransaction.type == TransactionType.CHARGE, PointTransaction.amount), else_=0)).label("charged"),
+                func.sum(case((PointTransaction.type == TransactionType.USE, -PointTransaction.amount), else_=0)).label("used"),
+                func.sum(case((PointTransaction.type == TransactionType.REFUND, PointTransaction.amount), else_=0)).label("refunded"),
+                func.count(PointTransaction.id).label("transaction_count"),
+                func.max(PointTransaction.id).label("last_id")
+            ).filter(
+                PointTransaction.created_at >= start,
+                PointTransaction.created_at < end
+            ).group_by(PointTransaction.cell_id).all()
+        }
+        closing = {}
+        if activity:
+            closing = dict(
+                db.query(PointTransaction.id, PointTransaction.balance_after).filter(
+                    PointTransaction.id.in_([row.last_id for row in activity.values()])
+                ).all()
+            )
+
+        rows = []
+        for cell_id in sorted(previous.keys() | activity.keys()):
+            day_activity = activity.get(cell_id)
+            if day_activity is not None:
+                balance, last_id = closing[day_activity.last_id], day_activity.last_id
+                totals = {
+                    "charged": day_activity.charged,
+                    "used": day_activity.used,
+                    "refunded": day_activity.refunded,
+                    "transaction_count": day_activity.transaction_count,
+                }
+            else:
+                balance, last_id = previous[cell_id]
+                totals = {"charged": 0, "used": 0, "refunded": 0, "transaction_count": 0}
+
+            rows.append({
+                "cell_id": cell_id,
+                "snapshot_date": day,
+                "balance": balance,
+                "last_transaction_id": last_id,
+                **totals
+            })
+
+        upsert(db, CellBalanceSnapshot.__table__, rows, ("cell_id", "snapshot_date"), SNAPSHOT_UPDATE_COLUMNS)
+        db.commit()
+        return len(rows)
+
+    def snapshot_through(self, db: Session, until: date) -> List[Tuple[date, int]]:
+        """
+        Take snapshots for every day missing up to `until` (nightly job)
+
+        Starts the day after the latest snapshot, or at the first ledger day
+        when there are none, so a missed night is backfilled in order.
+
+        Returns:
+            List of (day, rows written)
+        """
+        latest = db.query(func.max(CellBalanceSnapshot.snapshot_date)).scalar()
+        if latest is not None:
+            day = latest + timedelta(days=1)
+        else:
+            first = db.query(func.min(PointTransaction.created_at)).scalar()
+            if first is None:
+                return []
+            day = first.date()
+
+        written = []
+        while day <= until:
+            written.append((day, self.take_snapshots(db, day)))
+            day += timedelta(days=1)
+        return written
+
+    def balance_at(self, db: Session, cell_id: int, day: date) -> int:
+        """
+        Closing balance of a cell on a day
+
+        One indexed lookup of the latest snapshot on or before the day; when
+        it is older than the day, the balance comes from the last transaction
+        after it (again a single-row lookup).
+
+        Raises:
+            CellNotFoundError: When cell is not found
+        """
+        self._check_cell(db, cell_id)
+        return self._balance_at(db, cell_id, day)
+
+    def monthly_statement(self, db: Session, cell_id: int, year: int, month: int) -> dict:
+        """
+        Monthly statement for a cell
+
+        Opening/closing balances come from `balance_at`; the month's totals
+        are summed from daily snapshots, and only days not covered by
+        snapshots (e.g. today) are aggregated from the ledger.
+
+        Raises:
+            CellNotFoundError: When cell is not found
+        """
+        self._check_cell(db, cell_id)
+
+        first = date(year, month, 1)
+        last = date(year, month, calendar.monthrange(year, month)[1])
+
+        totals = {"charged": 0, "used": 0, "refunded": 0, "transactionCount": 0}
+        covered_until = first - timedelta(days=1)
+        snapshots = db.query(CellBalanceSnapshot).filter(
+            CellBalanceSnapshot.cell_id == cell_id,
+            CellBalanceSnapshot.snapshot_date >= first,
+            CellBalanceSnapshot.snapshot_date <= last
+        ).order_by(CellBalanceSnapshot.snapshot_date).all()
+        for snapshot in snapshots:
+            if snapshot.snapshot_date != covered_until + timedelta(days=1):
+                break  # Gap: aggregate the rest from the ledger
+            covered_until = snapshot.snapshot_date
+            totals["charged"] += snapshot.charged
+            totals["used"] += snapshot.used
+            totals["refunded"] += snapshot.refunded
+            totals["transactionCount"] += snapshot.transaction_count
+
+        if covered_until < last:
+            start, _ = day_bounds(covered_until + timedelta(days=1))
+            _, end = day_bounds(last)
+            tail = db.query(
+                func.coalesce(func.sum(case((PointTransaction.type == TransactionType.CHARGE, PointTransaction.amount), else_=0)), 0).label("charged"),
+                func.coalesce(func.sum(case((PointTransaction.type == TransactionType.USE, -PointTransaction.amount), else_=0)), 0).label("used"),
+                func.coalesce(func.sum(case((PointTransaction.type == TransactionType.REFUND, PointTransaction.amount), else_=0)), 0).label("refunded"),
+                func.count(PointTransaction.id).label("transaction_count")
+            ).filter(
+                PointTransaction.cell_id == cell_id,
+                PointTransaction.created_at >= start,
+                PointTransaction.created_at < end
+            ).one()
+            totals["charged"] += tail.charged
+            totals["used"] += tail.used
+            totals["refunded"] += tail.refunded
+            totals["transactionCount"] += tail.transaction_count
+
+        return {
+            "cellId": cell_id,
+            "month": f"{year:04d}-{month:02d}",
+            "openingBalance": self._balance_at(db, cell_id, first - timedelta(days=1)),
+            "closingBalance": self._balance_at(db, cell_id, last),
+            **totals
+        }
+
+    def reconcile(self, db: Session) -> List[dict]:
+        """
+        Check every cell's balance against its ledger with set-based queries
+
+        A cell drifts when `cells.balance` differs from the sum of its
+        transaction amounts or from the last `balance_after`, or when a
+        transaction's `balance_after` is not the previous one plus its amount
+        (a lost update between two concurrent writers).
+
+        Returns:
+            Drifting cells: {"cellId", "cellName", "balance", "ledgerSum",
+            "lastBalanceAfter", "transactionCount", "chainBreaks"}
+        """
+        previous_balance = func.lag(PointTransaction.balance_after).over(
+            partition_by=PointTransaction.cell_id, order_by=PointTransaction.id
+        )
+        chain = db.query(
+            PointTransaction.cell_id,
+            PointTransaction.amount,
+            PointTransaction.balance_after,
+            previous_balance.label("previous_balance")
+        ).subquery()
+        chain_breaks = dict(
+            db.query(chain.c.cell_id, func.count()).filter(
+                chain.c.balance_after != func.coalesce(chain.c.previous_balance, 0) + chain.c.amount
+            ).group_by(chain.c.cell_id).all()
+        )
+
+        ledger = db.query(
+            PointTransaction.cell_id,
+            func.sum(PointTransaction.amount).label("total"),
+            func.count(PointTransaction.id).label("transaction_count"),
+            func.max(PointTransaction.id).label("last_id")
+        ).group_by(PointTransaction.cell_id).subquery()
+        last = aliased(PointTransaction)
+
+        balance = func.coalesce(Cell.balance, 0)
+        conditions = [
+            balance != func.coalesce(ledger.c.total, 0),
+            balance != func.coalesce(last.balance_after, 0),
+        ]
+        if chain_breaks:
+            conditions.append(Cell.id.in_(list(chain_breaks)))
+
+        rows = db.query(
+            Cell.id, Cell.name, balance.label("balance"),
+            func.coalesce(ledger.c.total, 0).label("ledger_sum"),
+            func.coalesce(ledger.c.transaction_count, 0).label("transaction_count"),
+            last.balance_after
+        ).outerjoin(
+            ledger, ledger.c.cell_id == Cell.id
+        ).outerjoin(
+            last, last.id == ledger.c.last_id
+        ).filter(or_(*conditions)).order_by(Cell.id).all()
+
+        return [
+            {
+                "cellId": row.id,
+                "cellName": row.name,
+                "balance": row.balance,
+                "ledgerSum": row.ledger_sum,
+                "lastBalanceAfter": row.balance_after,
+                "transactionCount": row.transaction_count,
+                "chainBreaks": chain_breaks.get(row.id, 0)
+            }
+            for row in rows
+        ]
+
+    # Private helper methods
+
+    def _check_cell(self, db: Session, cell_id: int) -> None:
+        if db.query(Cell.id).filter(Cell.id == cell_id).first() is None:
+            raise CellNotFoundError(str(cell_id))
+
+    def _balance_at(self, db: Session, cell_id: int, day: date) -> int:
+        snapshot = db.query(
+            CellBalanceSnapshot.snapshot_date,
+            CellBalanceSnapshot.balance,
+            CellBalanceSnapshot.last_transaction_id
+        ).filter(
+            CellBalanceSnapshot.cell_id == cell_id,
+            CellBalanceSnapshot.snapshot_date <= day
+        ).order_by(CellBalanceSnapshot.snapshot_date.desc()).first()
+        if snapshot is not None and snapshot.snapshot_date == day:
+            return snapshot.balance
+
+        _, end = day_bounds(day)
+        query = db.query(PointTransaction.balance_after).filter(
+            PointTransaction.cell_id == cell_id,
+            PointTransaction.created_at < end
+        )
+        if snapshot is not None and snapshot.last_transaction_id is not None:
+            query = query.filter(PointTransaction.id > snapshot.last_transaction_id)
+        last = query.order_by(PointTransaction.id.desc()).first()
+
+        if last is not None:
+            return last.balance_after
+        return snapshot.balance if snapshot is not None else 0
+
+    def _closing_balances(self, db: Session, before: datetime) -> Dict[int, Tuple[int, int]]:
+        """cell_id -> (balance_after, id) of each cell's last transaction before a time"""
+        last_ids = db.query(
+            func.max(PointTransaction.id).label("last_id")
+        ).filter(PointTransaction.created_at < before).group_by(PointTransaction.cell_id).subquery()
+
+        return {
+            row.cell_id: (row.balance_after, row.id)
+            for row in db.query(
+                PointTransaction.cell_id, PointTransaction.balance_after, PointTransaction.id
+            ).join(last_ids, PointTransaction.id == last_ids.c.last_id).all()
+        }
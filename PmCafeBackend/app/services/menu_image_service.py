@@ -0,0 +1,198 @@
+"""
+Menu Image Service - Uploaded menu images and their resized variants
+
+An upload is stored as-is under MEDIA_ROOT/menus/originals and resized
+into one WebP and one JPEG file per variant (kiosk grid and detail view).
+Every file is named by the hash of the uploaded bytes, so a URL always
+serves the same bytes and can be cached forever (see app/media.py), while
+a new image gets new URLs. The same image uploaded twice reuses its files.
+
+The menu's `image_url` points to the detail JPEG; the variant URLs are
+derived from it (`image_variants`), so a menu whose image_url was set to
+an external URL simply has no variants.
+"""
+import hashlib
+import io
+import os
+import re
+import tempfile
+from typing import Dict, Optional
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.menu import Menu
+from app.exceptions import MenuNotFoundError, InvalidImageError, ImageTooLargeError
+
+# Variant name -> longest side in pixels (never upscaled)
+VARIANTS = {"grid": 320, "detail": 800}
+
+# Output format -> (file extension, Pillow format, save options)
+FORMATS = {
+    "webp": ("webp", "WEBP", {"quality": 80, "method": 6}),
+    "jpeg": ("jpg", "JPEG", {"quality": 82, "optimize": True, "progressive": True}),
+}
+
+ACCEPTED_FORMATS = {"JPEG": "jpg", "PNG": "png", "WEBP": "webp"}
+KEY_LENGTH = 16
+
+_DETAIL_FILE = re.compile(rf"/menus/(?P<key>[0-9a-f]{{{KEY_LENGTH}}})-{VARIANTS['detail']}\.jpg$")
+
+
+def image_variants(image_url: Optional[str], base_url: Optional[str] = None) -> Optional[Dict[str, Dict[str, str]]]:
+    """
+    Variant URLs of an uploaded menu image
+
+    Returns:
+        {"grid": {"webp", "jpeg"}, "detail": {"webp", "jpeg"}}, or None when
+        `image_url` is not an uploaded image
+    """
+    base_url = (settings.MEDIA_URL if base_url is None else base_url).rstrip("/")
+    if not image_url or not image_url.startswith(base_url + "/"):
+        return None
+    match = _DETAIL_FILE.search(image_url)
+    if not match:
+        return None
+    return {
+        variant: {name: f"{base_url}/menus/{_variant_file(match['key'], size, ext)}"
+                  for name, (ext, _, _) in FORMATS.items()}
+        for variant, size in VARIANTS.items()
+    }
+
+
+def _variant_file(key: str, size: int, ext: str) -> str:
+    return f"{key}-{size}.{ext}"
+
+
+class MenuImageService:
+    """Service layer for menu image uploads"""
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        base_url: Optional[str] = None,
+        max_bytes: Optional[int] = None
+    ):
+        self.root = root or settings.MEDIA_ROOT
+        self.base_url = (base_url or settings.MEDIA_URL).rstrip("/")
+        self.max_bytes = max_bytes or settings.MENU_IMAGE_MAX_BYTES
+
+    def upload(self, db: Session, menu_id: int, data: bytes) -> Menu:
+        """
+        Store an image for a menu and point the menu at it
+
+        Args:
+            db: Database session
+            menu_id: Menu ID
+            data: Uploaded file contents
+
+        Returns:
+            Updated Menu
+
+        Raises:
+            MenuNotFoundError: When the menu does not exist
+            ImageTooLargeError: When the upload exceeds the size limit
+            InvalidImageError: When the upload is not a JPEG, PNG or WebP image
+        """
+        menu = db.query(Menu).filter(Menu.id == menu_id).first()
+        if not menu:
+            raise MenuNotFoundError(str(menu_id))
+
+        menu.image_url = self.store(data)
+        db.commit()
+        db.refresh(menu)
+        return menu
+
+    def remove(self, db: Session, menu_id: int) -> Menu:
+        """
+        Clear a menu's image (files stay: cached URLs and other menus may use them)
+
+        Raises:
+            MenuNotFoundError: When the menu does not exist
+        """
+        menu = db.query(Menu).filter(Menu.id == menu_id).first()
+        if not menu:
+            raise MenuNotFoundError(str(menu_id))
+
+        menu.image_url = None
+        db.commit()
+        db.refresh(menu)
+        return menu
+
+    def store(self, data: bytes) -> str:
+        """
+        Write the original and its variants (skipping files already there)
+
+        Returns:
+            URL of the detail JPEG (the menu's image_url)
+
+        Raises:
+            ImageTooLargeError: When the upload exceeds the size limit
+            InvalidImageError: When the upload is not a JPEG, PNG or WebP image
+        """
+        if len(data) > self.max_bytes:
+            raise ImageTooLargeError(self.max_bytes)
+
+        image = self._open(data)
+        key = hashlib.sha256(data).hexdigest()[:KEY_LENGTH]
+        menus_dir = os.path.join(self.root, "menus")
+
+        self._write(
+            os.path.join(menus_dir, "originals", f"{key}.{ACCEPTED_FORMATS[image.format]}"),
+            lambda: data
+        )
+
+        image = ImageOps.exif_transpose(image)
+        for size in VARIANTS.values():
+            resized = image.copy()
+            resized.thumbnail((size, size), Image.Resampling.LANCZOS)
+            for ext, pil_format, options in FORMATS.values():
+                self._write(
+                    os.path.join(menus_dir, _variant_file(key, size, ext)),
+                    lambda: self._encode(resized, pil_format, options)
+                )
+
+        return f"{self.base_url}/menus/{_variant_file(key, VARIANTS['detail'], FORMATS['jpeg'][0])}"
+
+    # Private helper methods
+
+    def _open(self, data: bytes) -> Image.Image:
+        try:
+            image = Image.open(io.BytesIO(data))
+            image.load()
+        except (UnidentifiedImageError, Image.DecompressionBombError, OSError, ValueError):
+            raise InvalidImageError()
+        if image.format not in ACCEPTED_FORMATS:
+            raise InvalidImageError()
+        return image
+
+    @staticmethod
+    def _encode(image: Image.Image, pil_format: str, options: dict) -> bytes:
+        if pil_format == "JPEG" and image.mode != "RGB":
+            # No alpha in JPEG: transparent areas become white
+            background = Image.new("RGB", image.size, (255, 255, 255))
+            rgba = image.convert("RGBA")
+            background.paste(rgba, mask=rgba.getchannel("A"))
+            image = background
+        elif pil_format == "WEBP" and image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() or "transparency" in image.info else "RGB")
+
+        buffer = io.BytesIO()
+        image.save(buffer, pil_format, **options)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _write(path: str, render) -> None:
+        """Content-addressed: an existing file already has these bytes"""
+        if os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(render())
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -0,0 +1,221 @@
+"""
+Menu Service - Batch menu management
+"""
+from datetime import datetime
+from typing import Dict, Iterable, List
+
+from sqlalchemy import case, update
+from sqlalchemy.orm import Session
+
+from app.models.menu import Menu, Category, OptionGroup, MenuOptionGroup
+from app.schemas.menu import MenuCreateRequest, MenuBulkUpdateItem, MenuReorderItem
+from app.events import EventBus, event_bus, MENU_SOLD_OUT_CHANGED, menu_sold_out_changed_payload
+from app.outbox import Outbox, outbox
+from app.exceptions import (
+    MenuNotFoundError,
+    CategoryNotFoundError,
+    OptionGroupNotFoundError,
+    DuplicateResourceError,
+    ValidationError
+)
+
+UPDATABLE_FIELDS = ("name", "eng_name", "price", "category_id", "description", "image_url", "display_order")
+
+
+class MenuService:
+    """Service layer for batch menu operations"""
+
+    def __init__(self, events: EventBus = event_bus, outbox: Outbox = outbox):
+        self.events = events
+        self.outbox = outbox
+
+    def bulk_create(self, db: Session, menus_data: List[MenuCreateRequest]) -> List[Menu]:
+        """
+        Create many menus in one transaction
+
+        All referenced categories/option groups and name collisions are checked
+        with one IN query each before anything is written.
+
+        Raises:
+            CategoryNotFoundError: When a category does not exist
+            OptionGroupNotFoundError: When an option group does not exist
+            DuplicateResourceError: When a name is repeated or already taken
+        """
+        names = [m.name for m in menus_data]
+        self._check_unique_in_batch(names)
+        self._validate_categories(db, [m.category_id for m in menus_data])
+        self._validate_option_groups(db, [gid for m in menus_data for gid in m.option_group_ids])
+
+        taken = db.query(Menu.name).filter(Menu.name.in_(names)).first()
+        if taken:
+            raise DuplicateResourceError("메뉴", "name", taken.name)
+
+        menus = [
+            Menu(
+                name=m.name,
+                eng_name=m.eng_name,
+                price=m.price,
+                category_id=m.category_id,
+                description=m.description,
+                image_url=m.image_url,
+                display_order=m.display_order if m.display_order is not None else 0,
+                is_sold_out=False,
+                is_active=True
+            )
+            for m in menus_data
+        ]
+        db.add_all(menus)
+        db.flush()  # Get the menu IDs (batched INSERT)
+
+        db.add_all([
+            MenuOptionGroup(menu_id=menu.id, option_group_id=option_group_id, display_order=idx)
+            for menu, m in zip(menus, menus_data)
+            for idx, option_group_id in enumerate(m.option_group_ids)
+        ])
+
+        db.commit()
+        return menus
+
+    def bulk_update(self, db: Session, menus_data: List[MenuBulkUpdateItem]) -> List[Menu]:
+        """
+        Update many menus in one transaction
+
+        Only provided (non-null) fields are changed. When `option_group_ids` is
+        given, the menu's option groups are replaced.
+
+        Raises:
+            MenuNotFoundError: When a menu does not exist
+            CategoryNotFoundError: When a category does not exist
+            OptionGroupNotFoundError: When an option group does not exist
+            DuplicateResourceError: When a name is repeated or taken by another menu
+            ValidationError: When the same menu appears twice
+        """
+        ids = [m.id for m in menus_data]
+        if len(set(ids)) != len(ids):
+            raise ValidationError("같은 메뉴를 한 요청에서 두 번 수정할 수 없습니다")
+
+        menus = self._get_menus(db, ids)
+
+        new_names = [m.name for m in menus_data if m.name is not None]
+        self._check_unique_in_batch(new_names)
+        self._validate_categories(db, [m.category_id for m in menus_data if m.category_id is not None])
+        self._validate_option_groups(
+            db, [gid for m in menus_data if m.option_group_ids is not None for gid in m.option_group_ids]
+        )
+
+        if new_names:
+            renamed = {m.name: m.id for m in menus_data if m.name is not None}
+            for owner in db.query(Menu.id, Menu.name).filter(Menu.name.in_(new_names)).all():
+                if owner.id != renamed[owner.name]:
+                    raise DuplicateResourceError("메뉴", "name", owner.name)
+
+        for data in menus_data:
+            menu = menus[data.id]
+            for field in UPDATABLE_FIELDS:
+                value = getattr(data, field)
+                if value is not None:
+                    setattr(menu, field, value)
+
+        # Replace option group associations with one DELETE + one INSERT
+        relinked = [m for m in menus_data if m.option_group_ids is not None]
+        if relinked:
+            db.query(MenuOptionGroup).filter(
+                MenuOptionGroup.menu_id.in_([m.id for m in relinked])
+            ).delete(synchronize_session=False)
+            db.add_all([
+                MenuOptionGroup(menu_id=m.id, option_group_id=option_group_id, display_order=idx)
+                for m in relinked
+                for idx, option_group_id in enumerate(m.option_group_ids)
+            ])
+
+        db.commit()
+        return [menus[menu_id] for menu_id in ids]
+
+    def reorder(self, db: Session, items: List[MenuReorderItem]) -> int:
+        """
+        Set display_order for many menus with a single UPDATE ... CASE
+
+        Raises:
+            MenuNotFoundError: When a menu does not exist
+        """
+        orders = {item.id: item.display_order for item in items}
+        self._check_menus_exist(db, orders.keys())
+
+        db.execute(
+            update(Menu)
+            .where(Menu.id.in_(list(orders)))
+            .values(display_order=case(orders, value=Menu.id))
+        )
+        db.commit()
+        return len(orders)
+
+    def set_sold_out(self, db: Session, menu_ids: List[int], is_sold_out: bool) -> int:
+        """
+        Toggle sold-out for many menus with a single UPDATE; a
+        `menu:sold_out_changed` event per menu is recorded in the outbox and
+        published locally after the commit
+
+        Raises:
+            MenuNotFoundError: When a menu does not exist
+        """
+        ids = set(menu_ids)
+        names = {row.id: row.name for row in db.query(Menu.id, Menu.name).filter(Menu.id.in_(ids)).all()}
+        missing = sorted(ids - set(names))
+        if missing:
+            raise MenuNotFoundError(str(missing[0]))
+
+        db.execute(update(Menu).where(Menu.id.in_(ids)).values(is_sold_out=is_sold_out))
+        now = datetime.now()
+        payloads = [
+            menu_sold_out_changed_payload(menu_id, names[menu_id], is_sold_out, now) for menu_id in sorted(ids)
+        ]
+        for payload in payloads:
+            self.outbox.record(db, MENU_SOLD_OUT_CHANGED, payload)
+        db.commit()
+
+        for payload in payloads:
+            self.events.publish(MENU_SOLD_OUT_CHANGED, payload)
+        return len(ids)
+
+    # Private helper methods
+
+    def _get_menus(self, db: Session, ids: Iterable[int]) -> Dict[int, Menu]:
+        """Load menus by ID, raising for the first missing one"""
+        ids = list(ids)
+        menus = {menu.id: menu for menu in db.query(Menu).filter(Menu.id.in_(ids)).all()}
+        for menu_id in ids:
+            if menu_id not in menus:
+                raise MenuNotFoundError(str(menu_id))
+        return menus
+
+    def _check_menus_exist(self, db: Session, ids: Iterable[int]) -> None:
+        ids = set(ids)
+        found = {row.id for row in db.query(Menu.id).filter(Menu.id.in_(ids)).all()}
+        missing = sorted(ids - found)
+        if missing:
+            raise MenuNotFoundError(str(missing[0]))
+
+    def _validate_categories(self, db: Session, category_ids: List[int]) -> None:
+        ids = set(category_ids)
+        if not ids:
+            return
+        found = {row.id for row in db.query(Category.id).filter(Category.id.in_(ids)).all()}
+        missing = sorted(ids - found)
+        if missing:
+            raise CategoryNotFoundError(str(missing[0]))
+
+    def _validate_option_groups(self, db: Session, option_group_ids: List[int]) -> None:
+        ids = set(option_group_ids)
+        if not ids:
+            return
+        found = {row.id for row in db.query(OptionGroup.id).filter(OptionGroup.id.in_(ids)).all()}
+        missing = sorted(ids - found)
+        if missing:
+            raise OptionGroupNotFoundError(str(missing[0]))
+
+    def _check_unique_in_batch(self, names: List[str]) -> None:
+        seen = set()
+        for name in names:
+            if name in seen:
+                raise DuplicateResourceError("메뉴", "name", name)
+            seen.add(name)
@@ -0,0 +1,123 @@
+"""
+Order Metrics - Live queue depth and throughput from a sliding window of order events
+"""
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Callable, Deque, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.events import ORDER_CREATED, ORDER_STATUS_CHANGED
+from app.models.order import OrderStatus
+from app.services.kitchen_queue import ActiveOrderProjection, active_orders
+
+DEFAULT_WINDOW_SECONDS = 15 * 60
+
+
+def _parse(value: str) -> datetime:
+    """Aware datetime of an ISO timestamp (naive values are server local time)"""
+    dt = datetime.fromisoformat(value)
+    return dt if dt.tzinfo is not None else dt.astimezone()
+
+
+def _seconds_between(start: Optional[str], end: Optional[str]) -> Optional[float]:
+    """Seconds between two ISO timestamps from an event payload (None when either is missing)"""
+    if not start or not end:
+        return None
+    return max(0.0, (_parse(end) - _parse(start)).total_seconds())
+
+
+class OrderMetrics:
+    """
+    Live bar metrics for the barista screen and the dashboard
+
+    Queue depth comes from the active order projection; throughput and
+    timings come from the order events of the last `window_seconds`:
+    orders/completions per minute, average wait (created → making started)
+    and average preparation (making started → completed). Nothing is read
+    from the database besides the projection's one-time load, and the window
+    starts empty after a restart.
+    """
+
+    def __init__(
+        self,
+        queue: ActiveOrderProjection = active_orders,
+        window_seconds: int = DEFAULT_WINDOW_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self._lock = threading.Lock()
+        self._queue = queue
+        self._window = window_seconds
+        self._clock = clock
+        self._since = clock()
+        # Receive times (clock) of new orders; (receive time, seconds) samples
+        self._created: Deque[float] = deque()
+        self._waits: Deque[Tuple[float, float]] = deque()
+        self._completions: Deque[Tuple[float, Optional[float]]] = deque()
+
+    def ensure_loaded(self, db: Session) -> None:
+        """Load the active order queue (one query) unless already loaded"""
+        self._queue.ensure_loaded(db)
+
+    def snapshot(self) -> dict:
+        """Current metrics (averages are None until the window has samples)"""
+        now = self._clock()
+        pending = making = 0
+        for order in self._queue.list():
+            if order["status"] == OrderStatus.PENDING.value:
+                pending += 1
+            elif order["status"] == OrderStatus.MAKING.value:
+                making += 1
+
+        with self._lock:
+            self._prune(now)
+            minutes = max(min(now - self._since, self._window), 60) / 60
+            preps = [prep for _, prep in self._completions if prep is not None]
+            return {
+                "windowSeconds": self._window,
+                "pendingOrders": pending,
+                "makingOrders": making,
+                "queueDepth": pending + making,
+                "ordersPerMinute": round(len(self._created) / minutes, 2),
+                "completedPerMinute": round(len(self._completions) / minutes, 2),
+                "avgWaitSeconds": round(sum(w for _, w in self._waits) / len(self._waits)) if self._waits else None,
+                "avgPrepSeconds": round(sum(preps) / len(preps)) if preps else None,
+            }
+
+    def reset(self) -> None:
+        """Forget all samples (the window restarts now)"""
+        with self._lock:
+            self._since = self._clock()
+            self._created.clear()
+            self._waits.clear()
+            self._completions.clear()
+
+    def handle_event(self, event: str, data: dict) -> None:
+        """Event bus handler: record arrivals, queue waits and preparation times"""
+        now = self._clock()
+        with self._lock:
+            if event == ORDER_CREATED:
+                self._created.append(now)
+            elif event == ORDER_STATUS_CHANGED:
+                if data["status"] == OrderStatus.MAKING.value:
+                    wait = _seconds_between(data.get("createdAt"), data.get("makingStartedAt"))
+                    if wait is not None:
+                        self._waits.append((now, wait))
+                elif data["status"] == OrderStatus.COMPLETED.value:
+                    # Orders started before making_started_at existed count as completions only
+                    prep = _seconds_between(data.get("makingStartedAt"), data.get("completedAt"))
+                    self._completions.append((now, prep))
+            self._prune(now)
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self._window
+        while self._created and self._created[0] < cutoff:
+            self._created.popleft()
+        for samples in (self._waits, self._completions):
+            while samples and samples[0][0] < cutoff:
+                samples.popleft()
+
+
+order_metrics = OrderMetrics()
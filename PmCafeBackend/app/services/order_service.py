@@ -4,26 +4,69 @@ Order Service - Business logic for order management
 import time
 import random
 import string
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List, Tuple
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, case, insert, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.order import Order, OrderItem, OrderItemOption, PayType, OrderStatus
 from app.models.cell import Cell
+from app.models.menu import Menu
 from app.models.transaction import PointTransaction, TransactionType
 from app.models.settlement import SystemSetting
-from app.schemas.order import CreateOrderRequest, OrderItemRequest
+from app.schemas.order import CreateOrderRequest, OrderItemRequest, QueuedOrderRequest, build_order_response
+from app.services.settings_service import SettingsCache, settings_cache
+from app.events import (
+    EventBus, event_bus, ORDER_CREATED, ORDER_STATUS_CHANGED,
+    order_created_payload, order_status_changed_payload
+)
+from app.outbox import Outbox, outbox
 from app.exceptions import (
     MissingCellIdError,
     CellNotFoundError,
     InsufficientBalanceError,
+    MenuNotFoundError,
     OrderNotFoundError,
-    InvalidOrderStatusTransitionError
+    InvalidOrderStatusTransitionError,
+    OrderConflictError,
+    KioskInactiveError
+)
+
+# Allowed status transitions: target status -> statuses it can be reached from
+ALLOWED_TRANSITIONS = {
+    OrderStatus.MAKING: (OrderStatus.PENDING,),
+    OrderStatus.COMPLETED: (OrderStatus.MAKING,),
+    OrderStatus.CANCELLED: (OrderStatus.PENDING, OrderStatus.MAKING),
+}
+
+# Columns returned by a status transition UPDATE
+TRANSITION_RETURNING = (
+    Order.id, Order.order_id, Order.daily_num, Order.pay_type, Order.cell_id,
+    Order.total_amount, Order.status, Order.version, Order.created_at,
+    Order.updated_at, Order.making_started_at, Order.completed_at, Order.cancelled_at
 )
 
 
 class OrderService:
-    """Service layer for order business logic"""
+    """
+    Service layer for order business logic
+
+    Order events are recorded in the outbox within the change's transaction
+    (delivered to every worker's sockets by the relay) and published on the
+    local event bus once it commits.
+    """
+
+    def __init__(
+        self,
+        events: EventBus = event_bus,
+        settings: SettingsCache = settings_cache,
+        outbox: Outbox = outbox
+    ):
+        self.events = events
+        self.settings = settings
+        self.outbox = outbox
 
     def create_order(self, db: Session, order_data: CreateOrderRequest) -> Order:
         """
@@ -37,12 +80,16 @@ class OrderService:
             Created Order object
 
         Raises:
+            KioskInactiveError: When the kiosk is deactivated or in maintenance
             MissingCellIdError: When cellId is missing for CELL payment
             CellNotFoundError: When cell is not found
             InsufficientBalanceError: When cell balance is insufficient
         """
-        # Validate cell payment
+        self._check_kiosk_active(db)
+
+        # Validate cell payment and debit the cell
         cell = self._validate_cell_payment(db, order_data)
+        balance_after = self._debit_cell(db, cell, order_data.totalAmount) if cell else None
 
         # Generate order identifiers
         order_id = self._generate_order_id()
@@ -54,15 +101,53 @@ class OrderService:
         # Create order items and options
         self._create_order_items(db, order, order_data.items)
 
-        # Process cell payment if applicable
+        # Record cell payment if applicable
         if cell:
-            self._process_cell_payment(db, cell, order_data.totalAmount, order.id)
+            self._process_cell_payment(db, cell, order_data.totalAmount, order.id, balance_after)
+
+        db.flush()
+        db.refresh(order)  # server-side timestamps for the event
+        payload = order_created_payload(order)
+        self.outbox.record(db, ORDER_CREATED, payload)
 
         db.commit()
         db.refresh(order)
 
+        self.events.publish(ORDER_CREATED, payload)
+
         return order
 
+    def create_orders(self, db: Session, queued: List[QueuedOrderRequest]) -> List[dict]:
+        """
+        Create orders a kiosk queued while offline, in one transaction
+
+        Orders are created in the order they were taken (clientCreatedAt), so
+        daily numbers follow the line at the counter. An idempotency key seen
+        before (an earlier upload, or earlier in this batch) returns the order
+        it created instead of a new one, so a kiosk can resend a batch whose
+        response it lost. An order that cannot be created (missing or unknown
+        cell, insufficient balance, unknown menu) is reported in its result
+        and the rest of the batch is still created. Existing orders, menus and
+        cells are read with one query each.
+
+        Args:
+            db: Database session
+            queued: Queued orders, each with its idempotency key
+
+        Returns:
+            Per-order outcomes in request order:
+            {"idempotencyKey", "success", "duplicate", "order", "error": {"code", "message"} | None}
+
+        Raises:
+            KioskInactiveError: When the kiosk is deactivated or in maintenance (nothing is created)
+        """
+        try:
+            return self._create_queued_orders(db, queued)
+        except IntegrityError:
+            # A concurrent upload of the same keys committed first: they are duplicates now
+            db.rollback()
+            return self._create_queued_orders(db, queued)
+
     def get_orders(
         self,
         db: Session,
@@ -84,8 +169,6 @@ class OrderService:
         Returns:
             Tuple of (orders list, total count)
         """
-        from sqlalchemy.orm import joinedload
-
         # Build query with eager loading
         query = db.query(Order).options(
             joinedload(Order.items).joinedload(OrderItem.options),
@@ -121,8 +204,6 @@ class OrderService:
         Raises:
             OrderNotFoundError: When order is not found
         """
-        from sqlalchemy.orm import joinedload
-
         order = db.query(Order).options(
             joinedload(Order.items).joinedload(OrderItem.options),
             joinedload(Order.cell)
@@ -137,48 +218,420 @@ class OrderService:
         self,
         db: Session,
         order_id: str,
-        new_status: OrderStatus
-    ) -> Order:
+        new_status: OrderStatus,
+        expected_status: Optional[OrderStatus] = None,
+        expected_version: Optional[int] = None
+    ):
         """
-        Update order status
+        Update order status through the transition rules
+
+        PENDING → MAKING → COMPLETED, and PENDING/MAKING → CANCELLED.
+        The change is a single conditional `UPDATE ... WHERE status = :from
+        RETURNING`, so two baristas tapping the same ticket cannot both win.
+        Only a cancellation without `expected_status` may need a second
+        statement (it can come from PENDING or MAKING). Cancelling a CELL
+        order refunds the cell in the same transaction (see `cancel_order`).
 
         Args:
             db: Database session
             order_id: Order ID
             new_status: New status
+            expected_status: Status the caller saw (optional, checked atomically)
+            expected_version: Version the caller saw (optional, checked atomically)
+
+        Returns:
+            Updated order row (order_id, status, version, timestamps, ...)
+
+        Raises:
+            OrderNotFoundError: When order is not found
+            InvalidOrderStatusTransitionError: When the transition is not allowed
+            OrderConflictError: When the order was changed concurrently
+        """
+        row, _ = self._change_status(db, order_id, new_status, expected_status, expected_version)
+        return row
+
+    def cancel_order(
+        self,
+        db: Session,
+        order_id: str,
+        reason: Optional[str] = None,
+        cancelled_by: Optional[int] = None,
+        expected_version: Optional[int] = None
+    ) -> Tuple[object, Optional[dict]]:
+        """
+        Cancel an order and refund its cell payment
+
+        The cancel is the same conditional UPDATE as any other transition, and
+        the refund (cell credit + REFUND transaction) is written in the same
+        transaction only when that UPDATE matched. Concurrent cancels of one
+        order therefore refund exactly once; the loser gets OrderConflictError.
+
+        Args:
+            db: Database session
+            order_id: Order ID
+            reason: Cancellation reason (stored as the refund memo)
+            cancelled_by: Admin user ID (stored on the refund transaction)
+            expected_version: Version the caller saw (optional, checked atomically)
 
         Returns:
-            Updated Order object
+            Tuple of (updated order row, refund dict or None for PERSONAL orders)
+            refund: {"cellId", "amount", "balanceAfter"}
 
         Raises:
             OrderNotFoundError: When order is not found
+            InvalidOrderStatusTransitionError: When the order is already completed
+            OrderConflictError: When the order was changed (or cancelled) concurrently
+        """
+        return self._change_status(
+            db, order_id, OrderStatus.CANCELLED,
+            expected_version=expected_version, reason=reason, changed_by=cancelled_by
+        )
+
+    def update_order_statuses(
+        self,
+        db: Session,
+        order_ids: List[str],
+        new_status: OrderStatus,
+        reason: Optional[str] = None,
+        changed_by: Optional[int] = None
+    ) -> List[dict]:
+        """
+        Apply one status transition to many orders in one transaction
+
+        One SELECT reads the current statuses, then a single set-based UPDATE
+        applies every valid transition. Each order is guarded by the status
+        it was read with, so orders changed concurrently are reported as
+        conflicts instead of being overwritten. Cancelled CELL orders are
+        refunded in the same transaction with one UPDATE on cells and one
+        batched INSERT of REFUND transactions.
+
+        Args:
+            db: Database session
+            order_ids: Order IDs (duplicates are ignored)
+            new_status: Target status
+            reason: Refund memo when cancelling (optional)
+            changed_by: Admin user ID recorded on refunds (optional)
+
+        Returns:
+            Per-order outcomes in request order:
+            {"orderId", "success", "status", "version", "refund", "error": {"code", "message"} | None}
         """
-        order = self.get_order_by_id(db, order_id)
+        order_ids = list(dict.fromkeys(order_ids))
+        sources = ALLOWED_TRANSITIONS.get(new_status, ())
 
-        # Update status
-        order.status = new_status
+        current = dict(
+            db.query(Order.order_id, Order.status).filter(Order.order_id.in_(order_ids)).all()
+        )
 
-        # Update timestamps
-        if new_status == OrderStatus.COMPLETED:
-            order.completed_at = datetime.now()
-        elif new_status == OrderStatus.CANCELLED:
-            order.cancelled_at = datetime.now()
+        errors = {}
+        groups = {}
+        for order_id in order_ids:
+            status = current.get(order_id)
+            if status is None:
+                errors[order_id] = OrderNotFoundError(order_id)
+            elif status == new_status:
+                errors[order_id] = OrderConflictError(order_id)
+            elif status not in sources:
+                errors[order_id] = InvalidOrderStatusTransitionError(status.value, new_status.value)
+            else:
+                groups.setdefault(status, []).append(order_id)
+
+        rows = {}
+        if groups:
+            stmt = update(Order).where(or_(*[
+                and_(Order.order_id.in_(ids), Order.status == status)
+                for status, ids in groups.items()
+            ])).values(**self._transition_values(new_status)).returning(
+                *TRANSITION_RETURNING
+            ).execution_options(synchronize_session=False)
+            rows = {row.order_id: row for row in db.execute(stmt).all()}
+
+        refunds = {}
+        if new_status == OrderStatus.CANCELLED:
+            refunds = self._refund_cell_payments(db, rows.values(), reason, changed_by)
+
+        payloads = {}
+        for order_id in order_ids:
+            if order_id in rows:
+                payloads[order_id] = order_status_changed_payload(rows[order_id], current[order_id].value)
+                self.outbox.record(db, ORDER_STATUS_CHANGED, payloads[order_id])
 
         db.commit()
-        db.refresh(order)
 
-        return order
+        results = []
+        for order_id in order_ids:
+            row = rows.get(order_id)
+            if row is not None:
+                self.events.publish(ORDER_STATUS_CHANGED, payloads[order_id])
+                results.append({
+                    "orderId": order_id, "success": True,
+                    "status": row.status.value, "version": row.version,
+                    "refund": refunds.get(order_id), "error": None
+                })
+                continue
+
+            # Read as transitionable but changed before the UPDATE ran
+            error = errors.get(order_id) or OrderConflictError(order_id)
+            results.append({
+                "orderId": order_id, "success": False,
+                "status": current[order_id].value if order_id in current else None,
+                "version": None, "refund": None,
+                "error": {"code": error.code, "message": error.message}
+            })
+
+        return results
 
     # Private helper methods
 
+    def _check_kiosk_active(self, db: Session) -> None:
+        """Kiosk switches (cached settings, normally no query)"""
+        self.settings.ensure_fresh(db)
+        if self.settings.get("maintenance_mode"):
+            raise KioskInactiveError(self.settings.get("maintenance_message"))
+        if not self.settings.get("is_kiosk_active"):
+            raise KioskInactiveError()
+
+    def _create_queued_orders(self, db: Session, queued: List[QueuedOrderRequest]) -> List[dict]:
+        """One attempt of `create_orders`: create, record events, commit, then publish"""
+        self._check_kiosk_active(db)
+
+        loaded = (joinedload(Order.items).joinedload(OrderItem.options), joinedload(Order.cell))
+        keys = {order_data.idempotencyKey for order_data in queued}
+        existing = {
+            order.idempotency_key: build_order_response(order).model_dump(mode="json")
+            for order in db.query(Order).options(*loaded).filter(Order.idempotency_key.in_(keys))
+        }
+
+        menu_ids = {item.menuId for order_data in queued for item in order_data.items}
+        known_menus = {menu_id for (menu_id,) in db.query(Menu.id).filter(Menu.id.in_(menu_ids))}
+        cell_ids = {order_data.cellId for order_data in queued if order_data.cellId}
+        cells = {cell.id: cell for cell in db.query(Cell).filter(Cell.id.in_(cell_ids))} if cell_ids else {}
+
+        counter = self._daily_num_counter(db)
+        daily_num = int(counter.value)
+
+        created: Dict[str, Order] = {}
+        errors = {}
+        for order_data in sorted(queued, key=lambda o: o.clientCreatedAt.timestamp()):
+            key = order_data.idempotencyKey
+            if key in existing or key in created or key in errors:
+                continue
+            try:
+                for item in order_data.items:
+                    if item.menuId not in known_menus:
+                        raise MenuNotFoundError(str(item.menuId))
+                cell = self._validate_cell_payment(db, order_data, cells)
+                balance_after = self._debit_cell(db, cell, order_data.totalAmount) if cell else None
+            except (MenuNotFoundError, MissingCellIdError, CellNotFoundError, InsufficientBalanceError) as e:
+                errors[key] = e
+                continue
+
+            order = self._create_order_entity(
+                db, order_data, self._generate_order_id(), daily_num, cell,
+                idempotency_key=key, client_created_at=order_data.clientCreatedAt
+            )
+            self._create_order_items(db, order, order_data.items)
+            if cell:
+                self._process_cell_payment(db, cell, order_data.totalAmount, order.id, balance_after)
+            created[key] = order
+            daily_num = (daily_num % 12) + 1
+        counter.value = str(daily_num)
+
+        payloads = {}
+        if created:
+            db.flush()
+            orders = db.query(Order).options(*loaded).filter(
+                Order.id.in_([order.id for order in created.values()])
+            ).populate_existing().all()
+            by_id = {order.id: order for order in orders}
+            for key, order in created.items():
+                payloads[key] = order_created_payload(by_id[order.id])
+                self.outbox.record(db, ORDER_CREATED, payloads[key])
+
+        db.commit()
+
+        for payload in payloads.values():
+            self.events.publish(ORDER_CREATED, payload)
+
+        results = []
+        seen = set()
+        for order_data in queued:
+            key = order_data.idempotencyKey
+            if key in errors:
+                error = errors[key]
+                results.append({
+                    "idempotencyKey": key, "success": False, "duplicate": False, "order": None,
+                    "error": {"code": error.code, "message": error.message}
+                })
+            else:
+                results.append({
+                    "idempotencyKey": key, "success": True,
+                    "duplicate": key in existing or key in seen,
+                    "order": payloads.get(key) or existing[key], "error": None
+                })
+            seen.add(key)
+
+        return results
+
+    def _change_status(
+        self,
+        db: Session,
+        order_id: str,
+        new_status: OrderStatus,
+        expected_status: Optional[OrderStatus] = None,
+        expected_version: Optional[int] = None,
+        reason: Optional[str] = None,
+        changed_by: Optional[int] = None
+    ) -> Tuple[object, Optional[dict]]:
+        """Single-order transition (+ refund when cancelling) and its outbox event, commit, then publish"""
+        sources = ALLOWED_TRANSITIONS.get(new_status, ())
+        if expected_status is not None:
+            if expected_status not in sources:
+                raise InvalidOrderStatusTransitionError(expected_status.value, new_status.value)
+            sources = (expected_status,)
+
+        for previous_status in sources:
+            row = self._transition(db, order_id, previous_status, new_status, expected_version)
+            if row is not None:
+                break
+        else:
+            db.rollback()
+            self._raise_transition_failure(db, order_id, new_status, expected_status, expected_version)
+
+        refund = None
+        if new_status == OrderStatus.CANCELLED:
+            refund = self._refund_cell_payments(db, [row], reason, changed_by).get(order_id)
+
+        payload = order_status_changed_payload(row, previous_status.value)
+        self.outbox.record(db, ORDER_STATUS_CHANGED, payload)
+        db.commit()
+
+        self.events.publish(ORDER_STATUS_CHANGED, payload)
+
+        return row, refund
+
+    def _transition(
+        self,
+        db: Session,
+        order_id: str,
+        from_status: OrderStatus,
+        to_status: OrderStatus,
+        expected_version: Optional[int]
+    ):
+        """Conditional status UPDATE; returns the updated row or None when nothing matched"""
+        stmt = update(Order).where(Order.order_id == order_id, Order.status == from_status)
+        if expected_version is not None:
+            stmt = stmt.where(Order.version == expected_version)
+
+        stmt = stmt.values(**self._transition_values(to_status)).returning(
+            *TRANSITION_RETURNING
+        ).execution_options(synchronize_session=False)
+
+        return db.execute(stmt).first()
+
+    def _transition_values(self, to_status: OrderStatus) -> dict:
+        """SET clause for a status transition"""
+        values = {"status": to_status, "version": Order.version + 1}
+        if to_status == OrderStatus.MAKING:
+            values["making_started_at"] = datetime.now()
+        elif to_status == OrderStatus.COMPLETED:
+            values["completed_at"] = datetime.now()
+        elif to_status == OrderStatus.CANCELLED:
+            values["cancelled_at"] = datetime.now()
+        return values
+
+    def _refund_cell_payments(
+        self,
+        db: Session,
+        cancelled_rows: Iterable,
+        memo: Optional[str],
+        created_by: Optional[int]
+    ) -> Dict[str, dict]:
+        """
+        Credit cells for cancelled CELL orders and write REFUND transactions
+
+        Must run in the transaction of the cancelling UPDATE, on the rows it
+        returned, so each order is refunded at most once. Balances are credited
+        with `balance = balance + :amount` (one UPDATE for all cells), never read
+        then written, so concurrent charges/payments are not lost.
+
+        Returns:
+            orderId -> {"cellId", "amount", "balanceAfter"}
+        """
+        refundable = [
+            row for row in cancelled_rows
+            if row.pay_type == PayType.CELL and row.cell_id is not None and row.total_amount > 0
+        ]
+        if not refundable:
+            return {}
+
+        totals: Dict[int, int] = {}
+        for row in refundable:
+            totals[row.cell_id] = totals.get(row.cell_id, 0) + row.total_amount
+
+        stmt = update(Cell).where(Cell.id.in_(list(totals))).values(
+            balance=Cell.balance + case(totals, value=Cell.id)
+        ).returning(Cell.id, Cell.balance).execution_options(synchronize_session=False)
+        balances = dict(db.execute(stmt).all())
+
+        # Replay the credits per cell to get each transaction's balance_after
+        running = {cell_id: balances[cell_id] - total for cell_id, total in totals.items()}
+        refunds = {}
+        transactions = []
+        for row in refundable:
+            running[row.cell_id] += row.total_amount
+            transactions.append({
+                "cell_id": row.cell_id,
+                "type": TransactionType.REFUND,
+                "amount": row.total_amount,
+                "balance_after": running[row.cell_id],
+                "order_id": row.id,
+                "memo": memo,
+                "created_by": created_by
+            })
+            refunds[row.order_id] = {
+                "cellId": row.cell_id,
+                "amount": row.total_amount,
+                "balanceAfter": running[row.cell_id]
+            }
+
+        db.execute(insert(PointTransaction), transactions)
+        return refunds
+
+    def _raise_transition_failure(
+        self,
+        db: Session,
+        order_id: str,
+        new_status: OrderStatus,
+        expected_status: Optional[OrderStatus],
+        expected_version: Optional[int]
+    ) -> None:
+        """Work out why a conditional update matched nothing (failure path only)"""
+        current = db.query(Order.status, Order.version).filter(Order.order_id == order_id).first()
+        if current is None:
+            raise OrderNotFoundError(order_id)
+
+        if expected_version is not None and current.version != expected_version:
+            raise OrderConflictError(order_id)
+        if current.status == new_status:
+            raise OrderConflictError(order_id)
+        if expected_status is not None and current.status != expected_status:
+            raise OrderConflictError(order_id)
+
+        raise InvalidOrderStatusTransitionError(current.status.value, new_status.value)
+
     def _validate_cell_payment(
         self,
         db: Session,
-        order_data: CreateOrderRequest
+        order_data: CreateOrderRequest,
+        cells: Optional[Dict[int, Cell]] = None
     ) -> Optional[Cell]:
         """
         Validate cell payment requirements
 
+        Args:
+            cells: Cells already loaded by id (batch creation; queried otherwise)
+
         Returns:
             Cell object if CELL payment, None if PERSONAL payment
 
@@ -195,7 +648,10 @@ class OrderService:
             raise MissingCellIdError()
 
         # Find cell
-        cell = db.query(Cell).filter(Cell.id == order_data.cellId).first()
+        if cells is not None:
+            cell = cells.get(order_data.cellId)
+        else:
+            cell = db.query(Cell).filter(Cell.id == order_data.cellId).first()
         if not cell:
             raise CellNotFoundError(str(order_data.cellId))
 
@@ -218,6 +674,17 @@ class OrderService:
         NOTE: This has a race condition issue with concurrent requests.
         TODO: Implement proper locking mechanism (DB lock or Redis)
         """
+        setting = self._daily_num_counter(db)
+
+        current_num = int(setting.value)
+        next_num = (current_num % 12) + 1
+        setting.value = str(next_num)
+        db.commit()
+
+        return current_num
+
+    def _daily_num_counter(self, db: Session) -> SystemSetting:
+        """The next_order_number setting (added to the session if missing, not committed)"""
         setting = db.query(SystemSetting).filter(
             SystemSetting.key == "next_order_number"
         ).first()
@@ -230,15 +697,8 @@ class OrderService:
                 description="다음 주문 번호 (1-12)"
             )
             db.add(setting)
-            db.commit()
-            db.refresh(setting)
 
-        current_num = int(setting.value)
-        next_num = (current_num % 12) + 1
-        setting.value = str(next_num)
-        db.commit()
-
-        return current_num
+        return setting
 
     def _create_order_entity(
         self,
@@ -246,7 +706,9 @@ class OrderService:
         order_data: CreateOrderRequest,
         order_id: str,
         daily_num: int,
-        cell: Optional[Cell]
+        cell: Optional[Cell],
+        idempotency_key: Optional[str] = None,
+        client_created_at: Optional[datetime] = None
     ) -> Order:
         """Create Order entity"""
         order = Order(
@@ -255,7 +717,9 @@ class OrderService:
             pay_type=PayType.CELL if order_data.payType == "CELL" else PayType.PERSONAL,
             cell_id=cell.id if cell else None,
             total_amount=order_data.totalAmount,
-            status=OrderStatus.PENDING
+            status=OrderStatus.PENDING,
+            idempotency_key=idempotency_key,
+            client_created_at=client_created_at
         )
         db.add(order)
         db.flush()  # Get order.id
@@ -310,31 +774,56 @@ class OrderService:
                 )
                 db.add(order_item_option)
 
+    def _debit_cell(self, db: Session, cell: Cell, amount: int) -> int:
+        """
+        Deduct a payment from a cell's balance
+
+        A single conditional `balance = balance - :amount` UPDATE, never read
+        then written, so concurrent charges, payments and refunds are not lost
+        and the balance cannot go negative.
+
+        Returns:
+            Balance after the payment
+
+        Raises:
+            InsufficientBalanceError: When the balance no longer covers the amount
+        """
+        stmt = update(Cell).where(Cell.id == cell.id, Cell.balance >= amount).values(
+            balance=Cell.balance - amount
+        ).returning(Cell.balance).execution_options(synchronize_session=False)
+        balance = db.execute(stmt).scalar()
+        if balance is None:
+            current = db.query(Cell.balance).filter(Cell.id == cell.id).scalar()
+            raise InsufficientBalanceError(current, amount)
+
+        # Keep the loaded cell current without making it dirty
+        set_committed_value(cell, "balance", balance)
+        return balance
+
     def _process_cell_payment(
         self,
         db: Session,
         cell: Cell,
         amount: int,
-        order_id: int
+        order_id: int,
+        balance_after: int
     ) -> None:
         """
-        Process cell payment: deduct balance and create transaction
+        Record a cell payment already deducted by `_debit_cell`
 
         Args:
             db: Database session
             cell: Cell object
-            amount: Amount to deduct
+            amount: Amount deducted
             order_id: Order database ID (not order_id string)
+            balance_after: Balance returned by the debit
         """
-        # Deduct balance
-        cell.balance -= amount
-
         # Create point transaction
         transaction = PointTransaction(
             cell_id=cell.id,
             type=TransactionType.USE,
             amount=-amount,
-            balance_after=cell.balance,
+            balance_after=balance_after,
             order_id=order_id,
             memo=None
         )
@@ -0,0 +1,304 @@
+"""
+Settings Service - System settings with a typed in-process cache
+"""
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.settlement import SystemSetting
+from app.models.user import User, UserRole
+from app.invalidation import SETTINGS, ALL
+from app.exceptions import (
+    AuthorizationError,
+    SettingNotFoundError,
+    InvalidSettingValueError,
+    DuplicateSettingKeyError
+)
+
+DEFAULT_POLL_SECONDS = 5.0
+
+
+class SettingSpec(NamedTuple):
+    """Known setting: value type, default and who may change it"""
+    type: str  # "number", "boolean" or "string"
+    default: str
+    description: str
+    minimum: Optional[int] = None
+    maximum: Optional[int] = None
+    admin_editable: bool = False  # NORMAL admins may change it (SUPER may change everything)
+
+
+SETTING_SPECS: Dict[str, SettingSpec] = {
+    # 주문
+    "next_order_number": SettingSpec("number", "1", "다음 주문 번호 (1-12)", 1, 12),
+    "max_daily_orders": SettingSpec("number", "1000", "일일 최대 주문 건수", 1),
+    "order_timeout_minutes": SettingSpec("number", "30", "주문 자동 완료 시간 (분)", 1),
+    # 포인트
+    "bonus_rate": SettingSpec("number", "10", "포인트 충전 보너스율 (%)", 0, 100, admin_editable=True),
+    "min_charge_amount": SettingSpec("number", "10000", "최소 충전 금액", 0),
+    "max_charge_amount": SettingSpec("number", "1000000", "최대 충전 금액", 0),
+    # 시스템
+    "is_kiosk_active": SettingSpec("boolean", "true", "키오스크 활성화 여부", admin_editable=True),
+    "maintenance_mode": SettingSpec("boolean", "false", "점검 모드"),
+    "maintenance_message": SettingSpec("string", "시스템 점검 중입니다", "점검 안내 메시지"),
+    # 알림
+    "enable_notifications": SettingSpec("boolean", "true", "알림 활성화"),
+    "notification_sound": SettingSpec("boolean", "true", "알림음 활성화", admin_editable=True),
+    "auto_print_receipt": SettingSpec("boolean", "false", "영수증 자동 출력"),
+}
+
+# Counters written on every order: never cached, and ignored by the cache version
+COUNTER_KEYS = ("next_order_number",)
+
+
+def _typed(key: str, value: str) -> Any:
+    """Stored string value as its spec type (unknown keys stay strings)"""
+    spec = SETTING_SPECS.get(key)
+    if spec is None or spec.type == "string":
+        return value
+    if spec.type == "boolean":
+        return value == "true"
+    return int(value)
+
+
+def validate_value(key: str, value: str) -> str:
+    """
+    Normalized string value for a setting
+
+    Raises:
+        InvalidSettingValueError: When the value does not match the spec
+    """
+    spec = SETTING_SPECS.get(key)
+    if spec is None or spec.type == "string":
+        return value
+    if spec.type == "boolean":
+        normalized = value.strip().lower()
+        if normalized not in ("true", "false"):
+            raise InvalidSettingValueError(key, "true 또는 false")
+        return normalized
+
+    try:
+        number = int(value.strip())
+    except ValueError:
+        raise InvalidSettingValueError(key, "정수")
+    if (spec.minimum is not None and number < spec.minimum) or (spec.maximum is not None and number > spec.maximum):
+        bounds = f"{spec.minimum if spec.minimum is not None else ''}~{spec.maximum if spec.maximum is not None else ''}"
+        raise InvalidSettingValueError(key, f"{bounds} 범위의 정수")
+    return str(number)
+
+
+class SettingsCache:
+    """
+    Typed in-process copy of `system_settings` for hot paths
+
+    Loaded with one query on first use. Writes through SettingsService
+    update the local copy immediately; other workers notice a change by
+    polling a version (row count and latest updated_at, counters excluded)
+    at most every `poll_seconds`, so a request normally reads settings
+    without touching the database. A settings invalidation (see
+    app/invalidation.py) makes the next use check the version at once.
+    """
+
+    def __init__(self, poll_seconds: float = DEFAULT_POLL_SECONDS, clock: Callable[[], float] = time.monotonic):
+        self._lock = threading.Lock()
+        self._poll_seconds = poll_seconds
+        self._clock = clock
+        self._values: Optional[Dict[str, str]] = None
+        self._version: Optional[Tuple[int, Any]] = None
+        self._checked_at = 0.0
+
+    def ensure_fresh(self, db: Session) -> None:
+        """Load the settings, or reload them when another worker changed them (polled)"""
+        with self._lock:
+            loaded = self._values is not None
+            if loaded and self._clock() - self._checked_at < self._poll_seconds:
+                return
+
+        if loaded and self._read_version(db) == self._version:
+            with self._lock:
+                self._checked_at = self._clock()
+            return
+        self.load(db)
+
+    def load(self, db: Session) -> None:
+        """Read every cached setting (one query) along with its version"""
+        rows = db.query(SystemSetting.key, SystemSetting.value, SystemSetting.updated_at).filter(
+            SystemSetting.key.notin_(COUNTER_KEYS)
+        ).all()
+        values = {row.key: row.value for row in rows}
+        updated = [row.updated_at for row in rows if row.updated_at is not None]
+        with self._lock:
+            self._values = values
+            self._version = (len(rows), max(updated) if updated else None)
+            self._checked_at = self._clock()
+
+    def get(self, key: str) -> Any:
+        """Typed value of a setting, or its spec default when not stored"""
+        with self._lock:
+            value = self._values.get(key) if self._values is not None else None
+        if value is None:
+            spec = SETTING_SPECS.get(key)
+            if spec is None:
+                return None
+            value = spec.default
+        return _typed(key, value)
+
+    def put(self, key: str, value: str) -> None:
+        """Write-through of a committed change made by this worker"""
+        if key in COUNTER_KEYS:
+            return
+        with self._lock:
+            if self._values is not None:
+                self._values[key] = value
+
+    def handle_invalidation(self, topic: str) -> None:
+        """Invalidation bus handler: check the version on next use instead of waiting for the poll"""
+        if topic in (SETTINGS, ALL):
+            with self._lock:
+                self._checked_at = float("-inf")
+
+    def reset(self) -> None:
+        """Forget the loaded settings (reloaded on next use)"""
+        with self._lock:
+            self._values = None
+            self._version = None
+            self._checked_at = 0.0
+
+    def _read_version(self, db: Session) -> Tuple[int, Any]:
+        count, latest = db.query(func.count(SystemSetting.id), func.max(SystemSetting.updated_at)).filter(
+            SystemSetting.key.notin_(COUNTER_KEYS)
+        ).one()
+        return count, latest
+
+
+settings_cache = SettingsCache()
+
+
+class SettingsService:
+    """
+    Service layer for the system settings API
+
+    Admin reads go to the database (fresh values with their editor); every
+    write validates against SETTING_SPECS, commits and is written through to
+    the settings cache. `updated_at` is set with microseconds so the cache
+    version changes on every write.
+    """
+
+    def __init__(self, cache: SettingsCache = settings_cache):
+        self.cache = cache
+
+    def list_settings(self, db: Session) -> List[dict]:
+        """Stored settings plus known settings not stored yet (with their defaults), by key"""
+        stored = {row["key"]: row for row in self._rows(db)}
+        for key, spec in SETTING_SPECS.items():
+            stored.setdefault(key, {
+                "key": key,
+                "value": spec.default,
+                "description": spec.description,
+                "updatedBy": None,
+                "updatedAt": None,
+            })
+        return [stored[key] for key in sorted(stored)]
+
+    def get_setting(self, db: Session, key: str) -> dict:
+        """
+        Raises:
+            SettingNotFoundError: When the key is neither stored nor known
+        """
+        rows = self._rows(db, key)
+        if rows:
+            return rows[0]
+        spec = SETTING_SPECS.get(key)
+        if spec is None:
+            raise SettingNotFoundError(key)
+        return {"key": key, "value": spec.default, "description": spec.description, "updatedBy": None, "updatedAt": None}
+
+    def update_settings(self, db: Session, values: Dict[str, str], user: User) -> Dict[str, str]:
+        """
+        Change several settings in one transaction (known settings are created when missing)
+
+        Returns:
+            Normalized values by key
+
+        Raises:
+            SettingNotFoundError: When a key is neither stored nor known
+            InvalidSettingValueError: When a value does not match its spec
+            AuthorizationError: When a NORMAL admin changes a SUPER-only setting
+        """
+        existing = {
+            setting.key: setting
+            for setting in db.query(SystemSetting).filter(SystemSetting.key.in_(list(values))).all()
+        }
+        normalized = {}
+        for key, value in values.items():
+            if key not in existing and key not in SETTING_SPECS:
+                raise SettingNotFoundError(key)
+            spec = SETTING_SPECS.get(key)
+            if user.role != UserRole.SUPER and not (spec is not None and spec.admin_editable):
+                raise AuthorizationError(f"{key} 설정은 SUPER 관리자만 변경할 수 있습니다")
+            normalized[key] = validate_value(key, value)
+
+        now = datetime.now()
+        for key, value in normalized.items():
+            setting = existing.get(key)
+            if setting is None:
+                setting = SystemSetting(key=key, description=SETTING_SPECS[key].description)
+                db.add(setting)
+            setting.value = value
+            setting.updated_by = user.id
+            setting.updated_at = now
+        db.commit()
+
+        for key, value in normalized.items():
+            self.cache.put(key, value)
+        return normalized
+
+    def create_setting(self, db: Session, key: str, value: str, description: Optional[str], user: User) -> dict:
+        """
+        Add a setting (SUPER admins; the route checks the role)
+
+        Raises:
+            DuplicateSettingKeyError: When the key is already stored
+            InvalidSettingValueError: When a known key gets an invalid value
+        """
+        if db.query(SystemSetting.id).filter(SystemSetting.key == key).first() is not None:
+            raise DuplicateSettingKeyError(key)
+        value = validate_value(key, value)
+        spec = SETTING_SPECS.get(key)
+        db.add(SystemSetting(
+            key=key,
+            value=value,
+            description=description if description is not None else (spec.description if spec else None),
+            updated_by=user.id,
+            updated_at=datetime.now()
+        ))
+        db.commit()
+
+        self.cache.put(key, value)
+        return self.get_setting(db, key)
+
+    # Private helper methods
+
+    def _rows(self, db: Session, key: Optional[str] = None) -> List[dict]:
+        query = db.query(SystemSetting, User.name.label("updater_name")).outerjoin(
+            User, User.id == SystemSetting.updated_by
+        )
+        if key is not None:
+            query = query.filter(SystemSetting.key == key)
+        return [
+            {
+                "key": row.SystemSetting.key,
+                "value": row.SystemSetting.value,
+                "description": row.SystemSetting.description,
+                "updatedBy": {
+                    "id": row.SystemSetting.updated_by,
+                    "name": row.updater_name
+                } if row.SystemSetting.updated_by else None,
+                "updatedAt": row.SystemSetting.updated_at.isoformat() if row.SystemSetting.updated_at else None,
+            }
+            for row in query.all()
+        ]
@@ -0,0 +1,378 @@
+"""
+Settlement Service - Daily settlement generation and confirmation
+"""
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Set
+
+from sqlalchemy import and_, case, func, update
+from sqlalchemy.orm import Session
+
+from app.models.cell import Cell
+from app.models.order import Order, OrderStatus, PayType
+from app.models.settlement import DailySettlement
+from app.models.transaction import CellBalanceSnapshot
+from app.models.user import User
+from app.services.statistics_service import StatisticsService
+from app.exceptions import (
+    SettlementAlreadyConfirmedError, FutureSettlementDateError, SettlementNotFoundError
+)
+from app.utils.db import upsert
+from app.utils.dates import day_bounds
+
+SETTLEMENT_COLUMNS = (
+    "total_orders", "total_revenue", "personal_orders", "personal_revenue",
+    "cell_orders", "cell_revenue", "cancelled_orders", "cancelled_amount", "calculated_at",
+)
+
+
+def _as_date(value) -> date:
+    """func.date() result: date (PostgreSQL) or 'YYYY-MM-DD' (SQLite)"""
+    return value if isinstance(value, date) else date.fromisoformat(value)
+
+
+def _naive(value: datetime) -> datetime:
+    """Naive server-local time, to compare timestamps written by datetime.now()"""
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return value
+
+
+def _share(part: int, total: int) -> float:
+    return round(part * 100 / total, 1) if total else 0.0
+
+
+class SettlementDetailCache:
+    """
+    Details of confirmed settlements, which never change once confirmed
+
+    Bounded (least recently used days are dropped) and per process; each
+    worker fills its own copy on first read.
+    """
+
+    def __init__(self, max_days: int = 62):
+        self._lock = threading.Lock()
+        self._max_days = max_days
+        self._details: "OrderedDict[date, dict]" = OrderedDict()
+
+    def get(self, day: date) -> Optional[dict]:
+        with self._lock:
+            detail = self._details.get(day)
+            if detail is not None:
+                self._details.move_to_end(day)
+            return detail
+
+    def put(self, day: date, detail: dict) -> None:
+        with self._lock:
+            self._details[day] = detail
+            self._details.move_to_end(day)
+            while len(self._details) > self._max_days:
+                self._details.popitem(last=False)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._details.clear()
+
+
+settlement_details = SettlementDetailCache()
+
+
+class SettlementService:
+    """
+    Service layer for daily settlements
+
+    Settlements are precomputed by the nightly job (scripts/settlements.py)
+    with one aggregate query per run and one INSERT ... ON CONFLICT for all
+    days, so confirming only flips a flag. Totals exclude cancelled orders;
+    an unconfirmed day whose orders are cancelled after it was calculated is
+    recalculated by the next run (and always on confirmation). Confirmed
+    settlements are never rewritten, so their details are cached.
+    """
+
+    def __init__(self, details: SettlementDetailCache = settlement_details):
+        self.details = details
+        self.statistics = StatisticsService()
+
+    def build(
+        self, db: Session, start: date, end: date, include_empty: bool = False, days: Optional[Set[date]] = None
+    ) -> int:
+        """
+        Calculate and store the unconfirmed settlements of [start, end]
+
+        Args:
+            include_empty: Also write zero rows for days without orders
+            days: Only store these days of the range
+
+        Returns:
+            Number of days calculated (confirmed days included, but left unchanged)
+        """
+        day = func.date(Order.created_at)
+        active = Order.status != OrderStatus.CANCELLED
+        cancelled = Order.status == OrderStatus.CANCELLED
+        personal = and_(active, Order.pay_type == PayType.PERSONAL)
+        cell = and_(active, Order.pay_type == PayType.CELL)
+
+        rows = db.query(
+            day.label("day"),
+            func.sum(case((active, 1), else_=0)).label("total_orders"),
+            func.sum(case((active, Order.total_amount), else_=0)).label("total_revenue"),
+            func.sum(case((personal, 1), else_=0)).label("personal_orders"),
+            func.sum(case((personal, Order.total_amount), else_=0)).label("personal_revenue"),
+            func.sum(case((cell, 1), else_=0)).label("cell_orders"),
+            func.sum(case((cell, Order.total_amount), else_=0)).label("cell_revenue"),
+            func.sum(case((cancelled, 1), else_=0)).label("cancelled_orders"),
+            func.sum(case((cancelled, Order.total_amount), else_=0)).label("cancelled_amount")
+        ).filter(
+            Order.created_at >= day_bounds(start)[0],
+            Order.created_at < day_bounds(end)[1]
+        ).group_by(day).all()
+
+        calculated_at = datetime.now()
+        settlements = {
+            _as_date(row.day): {
+                "date": _as_date(row.day),
+                **{column: int(getattr(row, column)) for column in SETTLEMENT_COLUMNS[:-1]},
+                "calculated_at": calculated_at,
+                "is_confirmed": False,
+            }
+            for row in rows
+        }
+        if include_empty:
+            current = start
+            while current <= end:
+                settlements.setdefault(current, {
+                    "date": current,
+                    **dict.fromkeys(SETTLEMENT_COLUMNS[:-1], 0),
+                    "calculated_at": calculated_at,
+                    "is_confirmed": False,
+                })
+                current += timedelta(days=1)
+        if days is not None:
+            settlements = {key: value for key, value in settlements.items() if key in days}
+
+        upsert(
+            db, DailySettlement.__table__, [settlements[key] for key in sorted(settlements)], ("date",),
+            SETTLEMENT_COLUMNS, where=DailySettlement.__table__.c.is_confirmed.isnot(True)
+        )
+        db.commit()
+        return len(settlements)
+
+    def build_through(self, db: Session, until: date, since: Optional[date] = None) -> int:
+        """
+        Nightly job: backfill settlements through `until`, then recalculate stale days
+
+        Backfills every order day without a settlement row, gaps before the
+        latest settlement included, or recalculates [since, until]; either
+        way all days go through a single aggregate query.
+
+        Returns:
+            Number of days calculated
+        """
+        built = 0
+        if since is None:
+            missing = self._unsettled_days(db, until)
+            if missing:
+                built = self.build(db, missing[0], missing[-1], days=set(missing))
+        elif since <= until:
+            built = self.build(db, since, until)
+        return built + len(self.refresh_stale(db))
+
+    def refresh_stale(self, db: Session) -> List[date]:
+        """
+        Recalculate unconfirmed settlements with orders cancelled after their calculation
+
+        Returns:
+            Recalculated days
+        """
+        calculated = dict(
+            db.query(DailySettlement.date, DailySettlement.calculated_at).filter(
+                DailySettlement.is_confirmed.isnot(True)
+            ).all()
+        )
+        if not calculated:
+            return []
+
+        never = [day for day, calculated_at in calculated.items() if calculated_at is None]
+        known = [calculated_at for calculated_at in calculated.values() if calculated_at is not None]
+        stale = set(never)
+        if known:
+            cancellations = db.query(func.date(Order.created_at).label("day"), Order.cancelled_at).filter(
+                Order.status == OrderStatus.CANCELLED,
+                Order.cancelled_at > min(known),
+                Order.created_at >= day_bounds(min(calculated))[0]
+            ).all()
+            for row in cancellations:
+                day = _as_date(row.day)
+                calculated_at = calculated.get(day)
+                if calculated_at is not None and _naive(row.cancelled_at) > _naive(calculated_at):
+                    stale.add(day)
+
+        for day in sorted(stale):
+            self.build(db, day, day, include_empty=True)
+        return sorted(stale)
+
+    def confirm(self, db: Session, day: date, confirmed_by: int) -> DailySettlement:
+        """
+        Confirm a day's settlement, recalculating it first
+
+        The flag is set with a conditional UPDATE, so of two concurrent
+        confirmations only one succeeds.
+
+        Raises:
+            FutureSettlementDateError: When the day is after today
+            SettlementAlreadyConfirmedError: When the day is already confirmed
+        """
+        if day > date.today():
+            raise FutureSettlementDateError()
+
+        confirmed = db.query(DailySettlement.is_confirmed).filter(DailySettlement.date == day).scalar()
+        if confirmed:
+            raise SettlementAlreadyConfirmedError()
+
+        self.build(db, day, day, include_empty=True)
+        result = db.execute(
+            update(DailySettlement).where(
+                DailySettlement.date == day,
+                DailySettlement.is_confirmed.isnot(True)
+            ).values(
+                is_confirmed=True, confirmed_by=confirmed_by, confirmed_at=datetime.now()
+            ).execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            db.rollback()
+            raise SettlementAlreadyConfirmedError()
+        db.commit()
+
+        return db.query(DailySettlement).filter(DailySettlement.date == day).one()
+
+    def detail(self, db: Session, day: date) -> dict:
+        """
+        Settlement of a day with payment, menu, category, cell and hourly breakdowns
+
+        Totals come from the precomputed settlement; menus, categories and
+        hours from the day's orders. Like the totals, every breakdown leaves
+        out cancelled orders (the sales rollups count them, so they are not
+        used here). Confirmed settlements are served from the cache after the
+        first read.
+
+        Raises:
+            SettlementNotFoundError: When the day has no settlement yet
+        """
+        cached = self.details.get(day)
+        if cached is not None:
+            return cached
+
+        row = db.query(DailySettlement, User.name.label("confirmer_name")).outerjoin(
+            User, User.id == DailySettlement.confirmed_by
+        ).filter(DailySettlement.date == day).first()
+        if row is None:
+            raise SettlementNotFoundError()
+        settlement = row.DailySettlement
+
+        menus = self.statistics.menu_statistics(db, day, day, include_cancelled=False)
+        categories: Dict[Optional[int], dict] = {}
+        for menu in menus:
+            category = categories.setdefault(menu["categoryId"], {
+                "categoryId": menu["categoryId"],
+                "categoryName": menu["categoryName"],
+                "quantity": 0,
+                "revenue": 0,
+            })
+            category["quantity"] += menu["quantity"]
+            category["revenue"] += menu["revenue"]
+        menu_revenue = sum(menu["revenue"] for menu in menus)
+
+        detail = {
+            "id": settlement.id,
+            "date": settlement.date.isoformat(),
+            "summary": {
+                "totalOrders": settlement.total_orders,
+                "totalRevenue": settlement.total_revenue,
+                "personalOrders": settlement.personal_orders,
+                "personalRevenue": settlement.personal_revenue,
+                "cellOrders": settlement.cell_orders,
+                "cellRevenue": settlement.cell_revenue,
+                "cancelledOrders": settlement.cancelled_orders,
+                "cancelledAmount": settlement.cancelled_amount,
+            },
+            "paymentBreakdown": {
+                key: {
+                    "orders": orders,
+                    "revenue": revenue,
+                    "percentage": _share(revenue, settlement.total_revenue),
+                }
+                for key, orders, revenue in [
+                    ("personal", settlement.personal_orders, settlement.personal_revenue),
+                    ("cell", settlement.cell_orders, settlement.cell_revenue),
+                ]
+            },
+            "categoryBreakdown": [
+                {**category, "percentage": _share(category["revenue"], menu_revenue)}
+                for category in sorted(categories.values(), key=lambda c: -c["revenue"])
+            ],
+            "menuBreakdown": menus,
+            "cellBreakdown": self._cell_breakdown(db, day),
+            "hourlyBreakdown": self.statistics.hourly(db, day, include_cancelled=False),
+            "isConfirmed": settlement.is_confirmed,
+            "confirmedBy": {
+                "id": settlement.confirmed_by,
+                "name": row.confirmer_name
+            } if settlement.confirmed_by else None,
+            "confirmedAt": settlement.confirmed_at.isoformat() if settlement.confirmed_at else None,
+            "calculatedAt": settlement.calculated_at.isoformat() if settlement.calculated_at else None,
+            "notes": settlement.notes,
+        }
+        if settlement.is_confirmed:
+            self.details.put(day, detail)
+        return detail
+
+    # Private helper methods
+
+    def _unsettled_days(self, db: Session, until: date) -> List[date]:
+        """Days through `until` with orders but no settlement row"""
+        day = func.date(Order.created_at)
+        rows = db.query(day.label("day")).select_from(Order).outerjoin(
+            DailySettlement, DailySettlement.date == day
+        ).filter(
+            Order.created_at < day_bounds(until)[1],
+            DailySettlement.id.is_(None)
+        ).distinct().all()
+        return sorted(_as_date(row.day) for row in rows)
+
+    def _cell_breakdown(self, db: Session, day: date) -> List[dict]:
+        """Cell payments of a day with each cell's closing balance (None before the ledger snapshot)"""
+        start, end = day_bounds(day)
+        revenue = func.sum(Order.total_amount)
+        rows = db.query(
+            Order.cell_id,
+            Cell.name,
+            func.count(Order.id).label("orders"),
+            revenue.label("revenue"),
+            CellBalanceSnapshot.balance
+        ).join(
+            Cell, Cell.id == Order.cell_id
+        ).outerjoin(
+            CellBalanceSnapshot, and_(
+                CellBalanceSnapshot.cell_id == Order.cell_id,
+                CellBalanceSnapshot.snapshot_date == day
+            )
+        ).filter(
+            Order.pay_type == PayType.CELL,
+            Order.status != OrderStatus.CANCELLED,
+            Order.created_at >= start,
+            Order.created_at < end
+        ).group_by(
+            Order.cell_id, Cell.name, CellBalanceSnapshot.balance
+        ).order_by(revenue.desc(), Order.cell_id).all()
+
+        return [
+            {
+                "cellId": row.cell_id,
+                "cellName": row.name,
+                "orders": row.orders,
+                "revenue": int(row.revenue),
+                "closingBalance": row.balance,
+            }
+            for row in rows
+        ]
@@ -0,0 +1,450 @@
+"""
+Statistics Service - Sales reports and time-bucket analytics from per-day rollups
+"""
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func, insert, literal, select, union_all
+from sqlalchemy.orm import Session
+
+from app.models.menu import Category, Menu
+from app.models.order import Order, OrderItem, OrderStatus, MenuDailySales, OrderTimeBucket
+from app.utils.dates import day_bounds
+
+BUCKET_MINUTES = 15
+BUCKET_COUNTERS = ("order_count", "revenue", "item_count", "completed_count", "prep_seconds")
+
+
+def _local(value: datetime) -> datetime:
+    """Naive server-local time of a DB timestamp (same clock as the day bounds)"""
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return value
+
+
+def _slot_time(minute: int) -> str:
+    return f"{minute // 60:02d}:{minute % 60:02d}"
+
+
+def _bucket_totals(counters: Dict[str, int]) -> dict:
+    """Bucket counters in the API shape"""
+    return {
+        "orders": counters["order_count"],
+        "revenue": counters["revenue"],
+        "items": counters["item_count"],
+        "completedOrders": counters["completed_count"],
+        "avgPrepSeconds": (
+            counters["prep_seconds"] // counters["completed_count"] if counters["completed_count"] else None
+        ),
+    }
+
+
+class StatisticsService:
+    """
+    Service layer for sales reports
+
+    `menu_daily_sales` holds one row per menu per closed day (quantity,
+    revenue, orders) and `order_time_buckets` one row per 15 minutes with
+    orders (count, revenue, items, prep time), both written by the nightly
+    rollup. Reports read the rollups for every day up to the latest
+    rolled-up day and aggregate only the remaining days (normally today)
+    from the order tables.
+
+    Menu sales are grouped by `menu_id`; names and categories come from the
+    menus table. Items without a `menu_id` (rows older than the column) are
+    not counted.
+    """
+
+    def rollup_menu_sales(self, db: Session, day: date) -> int:
+        """
+        Write (or rewrite) the menu sales rollup of a day
+
+        Returns:
+            Number of menu rows written
+        """
+        start, end = day_bounds(day)
+        rows = [
+            {
+                "sale_date": day,
+                "menu_id": row.menu_id,
+                "quantity": row.quantity,
+                "revenue": row.revenue,
+                "order_count": row.order_count,
+            }
+            for row in db.query(
+                OrderItem.menu_id,
+                func.sum(OrderItem.quantity).label("quantity"),
+                func.sum(OrderItem.total_price).label("revenue"),
+                func.count(func.distinct(OrderItem.order_id)).label("order_count")
+            ).join(Order, Order.id == OrderItem.order_id).filter(
+                Order.created_at >= start,
+                Order.created_at < end,
+                OrderItem.menu_id.isnot(None)
+            ).group_by(OrderItem.menu_id).all()
+        ]
+
+        db.query(MenuDailySales).filter(MenuDailySales.sale_date == day).delete(synchronize_session=False)
+        if rows:
+            db.execute(insert(MenuDailySales), rows)
+        db.commit()
+        return len(rows)
+
+    def rollup_through(self, db: Session, until: date) -> List[Tuple[date, int]]:
+        """
+        Roll up menu sales for every day after the latest rolled-up day through `until` (nightly job)
+
+        Starts at the first order day when nothing is rolled up yet. Days
+        must be closed: rolling up today would hide its later orders.
+
+        Returns:
+            List of (day, menu rows written)
+        """
+        return self._rollup_days(db, until, MenuDailySales.sale_date, self.rollup_menu_sales)
+
+    def rollup_time_buckets(self, db: Session, day: date) -> int:
+        """
+        Write (or rewrite) the 15-minute order buckets of a day
+
+        Returns:
+            Number of bucket rows written
+        """
+        start, end = day_bounds(day)
+        rows = [
+            {"bucket_date": bucket_date, "minute": minute, "weekday": bucket_date.weekday(), **counters}
+            for (bucket_date, minute), counters in sorted(self._bucket_orders(db, start, end).items())
+        ]
+
+        db.query(OrderTimeBucket).filter(OrderTimeBucket.bucket_date == day).delete(synchronize_session=False)
+        if rows:
+            db.execute(insert(OrderTimeBucket), rows)
+        db.commit()
+        return len(rows)
+
+    def rollup_time_buckets_through(self, db: Session, until: date) -> List[Tuple[date, int]]:
+        """
+        Roll up order buckets for every day after the latest rolled-up day through `until` (nightly job)
+
+        Returns:
+            List of (day, bucket rows written)
+        """
+        return self._rollup_days(db, until, OrderTimeBucket.bucket_date, self.rollup_time_buckets)
+
+    def menu_statistics(
+        self,
+        db: Session,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        category_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        include_cancelled: bool = True
+    ) -> List[dict]:
+        """
+        Sales per menu, best-selling (by revenue) first
+
+        Args:
+            start, end: Inclusive date range (open-ended when None)
+            category_id: Only menus of this category
+            limit: Top N menus
+            include_cancelled: Count cancelled orders, as the rollups do
+                (False reads the order tables for the whole range)
+        """
+        sales = self._sales(db, start, end, category_id, include_cancelled)
+        if sales is None:
+            return []
+
+        revenue = func.sum(sales.c.revenue)
+        query = db.query(
+            sales.c.menu_id,
+            Menu.name,
+            Category.id.label("category_id"),
+            Category.name.label("category_name"),
+            func.sum(sales.c.quantity).label("quantity"),
+            revenue.label("revenue"),
+            func.sum(sales.c.order_count).label("order_count")
+        ).join(
+            Menu, Menu.id == sales.c.menu_id
+        ).outerjoin(
+            Category, Category.id == Menu.category_id
+        ).group_by(
+            sales.c.menu_id, Menu.name, Category.id, Category.name
+        ).order_by(revenue.desc(), sales.c.menu_id)
+        if limit:
+            query = query.limit(limit)
+
+        return [
+            {
+                "menuId": row.menu_id,
+                "menuName": row.name,
+                "categoryId": row.category_id,
+                "categoryName": row.category_name,
+                "quantity": int(row.quantity),
+                "revenue": int(row.revenue),
+                "orderCount": int(row.order_count),
+                "averagePrice": int(row.revenue) // int(row.quantity) if row.quantity else 0
+            }
+            for row in query.all()
+        ]
+
+    def category_statistics(
+        self,
+        db: Session,
+        start: Optional[date] = None,
+        end: Optional[date] = None
+    ) -> List[dict]:
+        """
+        Sales per category with its share of revenue, best-selling first
+
+        Menus without a category are reported under categoryId None.
+        """
+        sales = self._sales(db, start, end)
+        if sales is None:
+            return []
+
+        revenue = func.sum(sales.c.revenue)
+        rows = db.query(
+            Category.id,
+            Category.code,
+            Category.name,
+            func.sum(sales.c.quantity).label("quantity"),
+            revenue.label("revenue")
+        ).select_from(sales).join(
+            Menu, Menu.id == sales.c.menu_id
+        ).outerjoin(
+            Category, Category.id == Menu.category_id
+        ).group_by(
+            Category.id, Category.code, Category.name
+        ).order_by(revenue.desc(), Category.id).all()
+
+        total = sum(int(row.revenue) for row in rows)
+        return [
+            {
+                "categoryId": row.id,
+                "categoryCode": row.code,
+                "categoryName": row.name,
+                "quantity": int(row.quantity),
+                "revenue": int(row.revenue),
+                "percentage": round(int(row.revenue) * 100 / total, 1) if total else 0.0
+            }
+            for row in rows
+        ]
+
+    def hourly(self, db: Session, day: date, include_cancelled: bool = True) -> List[dict]:
+        """Orders, revenue, items and average prep time per hour of a day (see menu_statistics)"""
+        return [
+            {"hour": minute // 60, **_bucket_totals(counters)}
+            for (_, minute), counters in self._time_slots(
+                db, day, day, 60, by_weekday=False, include_cancelled=include_cancelled
+            )
+        ]
+
+    def heatmap(
+        self,
+        db: Session,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        interval: int = 60
+    ) -> dict:
+        """
+        Weekday x time-of-day heatmap of orders, revenue, items and average prep time
+
+        Args:
+            start, end: Inclusive date range (open-ended when None)
+            interval: Slot length in minutes (15, 30 or 60)
+
+        Returns:
+            {"interval", "cells": [{"weekday", "time", ...}], "weekdays": [...], "slots": [...]}
+            with weekday 0 = Monday; only slots with orders are listed
+        """
+        cells = self._time_slots(db, start, end, interval, by_weekday=True)
+
+        weekdays: Dict[int, Dict[str, int]] = {}
+        slots: Dict[int, Dict[str, int]] = {}
+        for (weekday, minute), counters in cells:
+            for key, totals in ((weekday, weekdays), (minute, slots)):
+                merged = totals.setdefault(key, dict.fromkeys(BUCKET_COUNTERS, 0))
+                for counter in BUCKET_COUNTERS:
+                    merged[counter] += counters[counter]
+
+        return {
+            "interval": interval,
+            "cells": [
+                {"weekday": weekday, "time": _slot_time(minute), **_bucket_totals(counters)}
+                for (weekday, minute), counters in cells
+            ],
+            "weekdays": [
+                {"weekday": weekday, **_bucket_totals(weekdays[weekday])} for weekday in sorted(weekdays)
+            ],
+            "slots": [
+                {"time": _slot_time(minute), **_bucket_totals(slots[minute])} for minute in sorted(slots)
+            ],
+        }
+
+    # Private helper methods
+
+    def _rollup_days(self, db: Session, until: date, latest_column, rollup) -> List[Tuple[date, int]]:
+        """Run `rollup` for each day after the latest `latest_column` value (or the first order day)"""
+        latest = db.query(func.max(latest_column)).scalar()
+        if latest is not None:
+            day = latest + timedelta(days=1)
+        else:
+            first = db.query(func.min(Order.created_at)).scalar()
+            if first is None:
+                return []
+            day = _local(first).date()
+
+        written = []
+        while day <= until:
+            written.append((day, rollup(db, day)))
+            day += timedelta(days=1)
+        return written
+
+    def _bucket_orders(
+        self,
+        db: Session,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        include_cancelled: bool = True
+    ) -> Dict[Tuple[date, int], Dict[str, int]]:
+        """(date, minute) -> bucket counters for the orders created in [start, end) (open-ended when None)"""
+        query = db.query(
+            Order.created_at,
+            Order.completed_at,
+            Order.status,
+            Order.total_amount,
+            func.coalesce(func.sum(OrderItem.quantity), 0).label("item_count")
+        ).outerjoin(OrderItem, OrderItem.order_id == Order.id)
+        if start is not None:
+            query = query.filter(Order.created_at >= start)
+        if end is not None:
+            query = query.filter(Order.created_at < end)
+        if not include_cancelled:
+            query = query.filter(Order.status != OrderStatus.CANCELLED)
+        orders = query.group_by(
+            Order.id, Order.created_at, Order.completed_at, Order.status, Order.total_amount
+        ).all()
+
+        buckets: Dict[Tuple[date, int], Dict[str, int]] = {}
+        for order in orders:
+            created = _local(order.created_at)
+            key = (created.date(), (created.hour * 60 + created.minute) // BUCKET_MINUTES * BUCKET_MINUTES)
+            counters = buckets.setdefault(key, dict.fromkeys(BUCKET_COUNTERS, 0))
+            counters["order_count"] += 1
+            counters["revenue"] += order.total_amount
+            counters["item_count"] += int(order.item_count)
+            if order.status == OrderStatus.COMPLETED and order.completed_at is not None:
+                counters["completed_count"] += 1
+                counters["prep_seconds"] += max(0, int((_local(order.completed_at) - created).total_seconds()))
+        return buckets
+
+    def _time_slots(
+        self,
+        db: Session,
+        start: Optional[date],
+        end: Optional[date],
+        interval: int,
+        by_weekday: bool,
+        include_cancelled: bool = True
+    ) -> List[Tuple[Tuple[Optional[int], int], Dict[str, int]]]:
+        """
+        Bucket counters summed per (weekday or None, slot minute), sorted
+
+        Rolled-up days are summed in SQL over `order_time_buckets` (at most
+        7 x 96 groups whatever the range); days after the latest rollup are
+        bucketed from their orders. Without cancelled orders every day is
+        bucketed from its orders (the rollups count them).
+        """
+        covered = db.query(func.max(OrderTimeBucket.bucket_date)).scalar() if include_cancelled else None
+        slots: Dict[Tuple[Optional[int], int], Dict[str, int]] = {}
+
+        def add(key, counters):
+            merged = slots.setdefault(key, dict.fromkeys(BUCKET_COUNTERS, 0))
+            for counter in BUCKET_COUNTERS:
+                merged[counter] += int(counters[counter])
+
+        if covered is not None and (start is None or start <= covered):
+            rollup_end = min(covered, end) if end is not None else covered
+            slot = (OrderTimeBucket.minute // interval * interval).label("slot")
+            weekday = OrderTimeBucket.weekday if by_weekday else literal(None)
+            query = db.query(
+                weekday.label("weekday"),
+                slot,
+                *[func.sum(getattr(OrderTimeBucket, counter)).label(counter) for counter in BUCKET_COUNTERS]
+            ).filter(OrderTimeBucket.bucket_date <= rollup_end)
+            if start is not None:
+                query = query.filter(OrderTimeBucket.bucket_date >= start)
+            group_by = [OrderTimeBucket.weekday, slot] if by_weekday else [slot]
+            for row in query.group_by(*group_by).all():
+                add((row.weekday, row.slot), row._mapping)
+
+        live_start = covered + timedelta(days=1) if covered is not None else None
+        if start is not None and (live_start is None or start > live_start):
+            live_start = start
+        if end is None or live_start is None or live_start <= end:
+            live_from = day_bounds(live_start)[0] if live_start is not None else None
+            live_until = day_bounds(end)[1] if end is not None else None
+            for (bucket_date, minute), counters in self._bucket_orders(
+                db, live_from, live_until, include_cancelled
+            ).items():
+                add((bucket_date.weekday() if by_weekday else None, minute // interval * interval), counters)
+
+        return sorted(slots.items(), key=lambda item: (item[0][0] or 0, item[0][1]))
+
+    def _sales(
+        self,
+        db: Session,
+        start: Optional[date],
+        end: Optional[date],
+        category_id: Optional[int] = None,
+        include_cancelled: bool = True
+    ):
+        """
+        (menu_id, quantity, revenue, order_count) rows covering [start, end]
+
+        Rolled-up days come from `menu_daily_sales`; days after the latest
+        rollup are aggregated from `order_items`. Without cancelled orders
+        every day is aggregated from `order_items` (the rollups count them).
+        Returns None when the range has nothing to read.
+        """
+        covered = db.query(func.max(MenuDailySales.sale_date)).scalar() if include_cancelled else None
+        menu_ids = None
+        if category_id is not None:
+            menu_ids = select(Menu.id).where(Menu.category_id == category_id)
+
+        parts = []
+        if covered is not None and (start is None or start <= covered):
+            rollup_end = min(covered, end) if end is not None else covered
+            rollup = select(
+                MenuDailySales.menu_id,
+                MenuDailySales.quantity,
+                MenuDailySales.revenue,
+                MenuDailySales.order_count
+            ).where(MenuDailySales.sale_date <= rollup_end)
+            if start is not None:
+                rollup = rollup.where(MenuDailySales.sale_date >= start)
+            if menu_ids is not None:
+                rollup = rollup.where(MenuDailySales.menu_id.in_(menu_ids))
+            parts.append(rollup)
+
+        live_start = covered + timedelta(days=1) if covered is not None else None
+        if start is not None and (live_start is None or start > live_start):
+            live_start = start
+        if end is None or live_start is None or live_start <= end:
+            live = select(
+                OrderItem.menu_id,
+                func.sum(OrderItem.quantity).label("quantity"),
+                func.sum(OrderItem.total_price).label("revenue"),
+                func.count(func.distinct(OrderItem.order_id)).label("order_count")
+            ).join(Order, Order.id == OrderItem.order_id).where(OrderItem.menu_id.isnot(None))
+            if live_start is not None:
+                live = live.where(Order.created_at >= day_bounds(live_start)[0])
+            if end is not None:
+                live = live.where(Order.created_at < day_bounds(end)[1])
+            if menu_ids is not None:
+                live = live.where(OrderItem.menu_id.in_(menu_ids))
+            if not include_cancelled:
+                live = live.where(Order.status != OrderStatus.CANCELLED)
+            parts.append(live.group_by(OrderItem.menu_id))
+
+        if not parts:
+            return None
+        return (union_all(*parts) if len(parts) > 1 else parts[0]).subquery()
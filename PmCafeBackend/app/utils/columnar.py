@@ -0,0 +1,128 @@
+"""
+Compact columnar JSON for large list responses
+
+List endpoints take `?format=columnar` to send their list of objects as
+{"columns": [...], "rows": [[...], ...], "strings": [...]} instead:
+
+- keys are listed once in `columns`, and each object becomes a row array
+- a column of objects or of lists of objects (cellInfo, items,
+  selectedOptions) is described by {"name", "columns", "many"}: its values
+  are one nested row array (many=false) or a list of them (many=true)
+- a column of repeating strings (status, option group names) is described
+  by {"name", "strings": true}: its values are indexes into `strings`,
+  which is shared by the whole table, nested columns included
+- other columns are just their name; null stays null, and a key missing
+  from an object decodes as null
+
+`decode` is the inverse (the admin frontend has the same decoder in
+shared/api/columnar.ts).
+"""
+from typing import Any, Dict, List, Tuple, Union
+
+from fastapi import Query
+
+JSON = "json"
+COLUMNAR = "columnar"
+
+Column = Union[str, dict]
+
+
+def list_format(
+    value: str = Query(JSON, alias="format", pattern="^(json|columnar)$", description="json or columnar")
+) -> str:
+    """List response format (dependency)"""
+    return value
+
+
+def encode_list(objects: List[dict], response_format: str) -> Union[List[dict], dict]:
+    """`objects` as requested: unchanged for json, a columnar table for columnar"""
+    return encode(objects) if response_format == COLUMNAR else objects
+
+
+def encode(objects: List[dict]) -> dict:
+    """Encode a list of JSON objects as a columnar table"""
+    strings = _StringTable()
+    columns, rows = _encode_table(objects, strings)
+    return {"columns": columns, "rows": rows, "strings": strings.values}
+
+
+def decode(table: dict) -> List[dict]:
+    """Decode a columnar table back into a list of objects"""
+    return _decode_rows(table["columns"], table["rows"], table["strings"])
+
+
+class _StringTable:
+    """Distinct strings in first-seen order"""
+
+    def __init__(self):
+        self.values: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def ref(self, value: str) -> int:
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self.values)
+            self.values.append(value)
+        return index
+
+
+def _encode_table(objects: List[dict], strings: _StringTable) -> Tuple[List[Column], List[list]]:
+    names = list(dict.fromkeys(key for obj in objects for key in obj))
+    columns = []
+    values_by_column = []
+    for name in names:
+        column, values = _encode_column(name, [obj.get(name) for obj in objects], strings)
+        columns.append(column)
+        values_by_column.append(values)
+
+    rows = [list(row) for row in zip(*values_by_column)] if names else [[] for _ in objects]
+    return columns, rows
+
+
+def _encode_column(name: str, values: List[Any], strings: _StringTable) -> Tuple[Column, List[Any]]:
+    present = [value for value in values if value is not None]
+
+    if present and all(isinstance(value, dict) for value in present):
+        columns, rows = _encode_table(present, strings)
+        nested = iter(rows)
+        return {"name": name, "columns": columns, "many": False}, [
+            next(nested) if value is not None else None for value in values
+        ]
+
+    if any(present) and all(
+        isinstance(value, list) and all(isinstance(item, dict) for item in value) for value in present
+    ):
+        columns, rows = _encode_table([item for value in present for item in value], strings)
+        nested = iter(rows)
+        return {"name": name, "columns": columns, "many": True}, [
+            [next(nested) for _ in value] if value is not None else None for value in values
+        ]
+
+    # Only worth a lookup when values repeat
+    if present and all(isinstance(value, str) for value in present) and len(set(present)) * 2 <= len(present):
+        return {"name": name, "strings": True}, [
+            strings.ref(value) if value is not None else None for value in values
+        ]
+
+    return name, values
+
+
+def _decode_rows(columns: List[Column], rows: List[list], strings: List[str]) -> List[dict]:
+    return [_decode_row(columns, row, strings) for row in rows]
+
+
+def _decode_row(columns: List[Column], row: list, strings: List[str]) -> dict:
+    obj = {}
+    for column, value in zip(columns, row):
+        if isinstance(column, str):
+            obj[column] = value
+            continue
+        if value is not None:
+            if "columns" not in column:
+                value = strings[value]
+            elif column["many"]:
+                value = _decode_rows(column["columns"], value, strings)
+            else:
+                value = _decode_row(column["columns"], value, strings)
+        obj[column["name"]] = value
+    return obj
@@ -0,0 +1,11 @@
+"""
+Date utilities - day boundaries for report queries
+"""
+from datetime import date, datetime, timedelta
+from typing import Tuple
+
+
+def day_bounds(day: date) -> Tuple[datetime, datetime]:
+    """[start, end) of a day, in server local time like the statistics queries"""
+    start = datetime.combine(day, datetime.min.time())
+    return start, start + timedelta(days=1)
@@ -0,0 +1,64 @@
+"""
+Database utilities - dialect-aware bulk statements
+"""
+from typing import Iterable, List, Optional, Sequence
+
+from sqlalchemy import Table
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+
+def _insert_for(db: Session, table: Table):
+    """Return the dialect-specific INSERT construct that supports ON CONFLICT"""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(table)
+    if dialect == "sqlite":
+        return sqlite.insert(table)
+    raise NotImplementedError(f"ON CONFLICT upsert is not supported for dialect '{dialect}'")
+
+
+def upsert(
+    db: Session,
+    table: Table,
+    rows: List[dict],
+    index_elements: Sequence[str],
+    update_columns: Optional[Iterable[str]] = None,
+    returning: Sequence[str] = (),
+    where=None
+) -> list:
+    """
+    Bulk INSERT ... ON CONFLICT in a single statement
+
+    Args:
+        db: Database session
+        table: Target table (e.g. `Menu.__table__`)
+        rows: Rows to insert
+        index_elements: Columns of the unique constraint to conflict on
+        update_columns: Columns to overwrite on conflict; None or empty means DO NOTHING
+        returning: Columns to return for every inserted/updated row
+        where: Condition on the existing row for DO UPDATE (rows failing it are left unchanged)
+
+    Returns:
+        Returned rows (empty list when `returning` is empty)
+    """
+    if not rows:
+        return []
+
+    stmt = _insert_for(db, table).values(rows)
+    update_columns = list(update_columns or [])
+    if update_columns:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(index_elements),
+            set_={column: stmt.excluded[column] for column in update_columns},
+            where=where
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=list(index_elements))
+
+    if returning:
+        stmt = stmt.returning(*[table.c[column] for column in returning])
+        return db.execute(stmt).all()
+
+    db.execute(stmt)
+    return []
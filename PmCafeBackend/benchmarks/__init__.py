@@ -0,0 +1,3 @@
+"""
+P.M CAFE 성능 측정 도구 (부하 테스트 / 마이크로 벤치마크)
+"""
@@ -0,0 +1,115 @@
+"""
+Compare a pytest-benchmark run against the committed baseline
+
+Usage:
+    pytest benchmarks --benchmark-only --benchmark-json=.benchmarks/latest.json
+    python -m benchmarks.compare .benchmarks/latest.json            # compare
+    python -m benchmarks.compare .benchmarks/latest.json --update   # overwrite baseline
+
+Medians are compared because they are the least sensitive to GC pauses and
+other one-off outliers on a developer machine.
+"""
+import argparse
+import json
+import os
+import sys
+from typing import Dict, List, Optional
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def load_run(path: str) -> dict:
+    """Reduce a pytest-benchmark JSON file to {name: timings in ms}"""
+    with open(path, encoding="utf-8") as f:
+        raw = json.load(f)
+
+    benchmarks = {}
+    for bench in raw["benchmarks"]:
+        stats = bench["stats"]
+        benchmarks[bench["name"]] = {
+            "median_ms": round(stats["median"] * 1000, 4),
+            "mean_ms": round(stats["mean"] * 1000, 4),
+            "min_ms": round(stats["min"] * 1000, 4),
+            "rounds": stats["rounds"],
+        }
+
+    commit = raw.get("commit_info", {})
+    return {
+        "commit": commit.get("id"),
+        "machine": raw.get("machine_info", {}).get("node"),
+        "python": raw.get("machine_info", {}).get("python_version"),
+        "benchmarks": benchmarks,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> List[dict]:
+    """Compare medians; a ratio above 1 + threshold is a regression"""
+    rows = []
+    for name in sorted(set(baseline["benchmarks"]) | set(current["benchmarks"])):
+        before: Optional[Dict] = baseline["benchmarks"].get(name)
+        after: Optional[Dict] = current["benchmarks"].get(name)
+        row = {"name": name, "baseline_ms": None, "current_ms": None, "ratio": None, "status": ""}
+
+        if before:
+            row["baseline_ms"] = before["median_ms"]
+        if after:
+            row["current_ms"] = after["median_ms"]
+
+        if before and after:
+            row["ratio"] = after["median_ms"] / before["median_ms"] if before["median_ms"] else None
+            if row["ratio"] is not None and row["ratio"] > 1 + threshold:
+                row["status"] = "REGRESSION"
+            elif row["ratio"] is not None and row["ratio"] < 1 - threshold:
+                row["status"] = "faster"
+        elif after:
+            row["status"] = "new"
+        else:
+            row["status"] = "missing"
+
+        rows.append(row)
+    return rows
+
+
+def print_rows(rows: List[dict]) -> None:
+    header = f"{'benchmark':<44} {'baseline':>10} {'current':>10} {'ratio':>7}  status"
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        baseline = f"{row['baseline_ms']:.3f}" if row["baseline_ms"] is not None else "-"
+        current = f"{row['current_ms']:.3f}" if row["current_ms"] is not None else "-"
+        ratio = f"{row['ratio']:.2f}x" if row["ratio"] is not None else "-"
+        print(f"{row['name']:<44} {baseline:>10} {current:>10} {ratio:>7}  {row['status']}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare benchmark run against baseline")
+    parser.add_argument("run", help="pytest-benchmark JSON (--benchmark-json output)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON path")
+    parser.add_argument("--threshold", type=float, default=0.2, help="허용 오차 (기본: 0.2 = 20%%)")
+    parser.add_argument("--update", action="store_true", help="현재 결과로 baseline 갱신")
+    args = parser.parse_args(argv)
+
+    current = load_run(args.run)
+
+    if args.update or not os.path.exists(args.baseline):
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    rows = compare(baseline, current, args.threshold)
+    print_rows(rows)
+
+    regressions = [row for row in rows if row["status"] == "REGRESSION"]
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) slower than baseline by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
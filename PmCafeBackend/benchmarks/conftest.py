@@ -0,0 +1,60 @@
+"""
+pytest-benchmark configuration and fixtures
+
+Run from PmCafeBackend/:
+    pytest benchmarks --benchmark-only --benchmark-json=.benchmarks/latest.json
+    python -m benchmarks.compare .benchmarks/latest.json
+"""
+import os
+import random
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models import *  # Import all models
+from benchmarks import data
+
+SEED = 20260115
+
+engine = create_engine(
+    "sqlite:///:memory:",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+BenchmarkSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db_session():
+    """Create a fresh database for each benchmark"""
+    Base.metadata.create_all(bind=engine)
+    db = BenchmarkSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def rng():
+    """Deterministic random source"""
+    return random.Random(SEED)
+
+
+@pytest.fixture
+def catalog(db_session, rng):
+    """Seeded menus with option groups"""
+    return data.seed_catalog(db_session, rng)
+
+
+@pytest.fixture
+def cells(db_session):
+    """Seeded cells with effectively unlimited balance"""
+    return data.seed_cells(db_session)
@@ -0,0 +1,191 @@
+"""
+Seeded synthetic data generators for benchmarks
+
+Every generator takes a `random.Random` so the same seed always produces the
+same catalog, carts and order history.
+"""
+import random
+from datetime import datetime, timedelta
+from typing import List
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models import (
+    Category, OptionGroup, OptionItem, OptionType, Menu, MenuOptionGroup,
+    Cell, Order, OrderItem, OrderItemOption, OrderStatus, PayType
+)
+from app.schemas.order import CreateOrderRequest, OrderItemRequest, OrderItemOptionGroup
+
+OPTION_GROUPS = [
+    ("온도 선택", OptionType.SINGLE, [("HOT", 0), ("ICE", 0)]),
+    ("사이즈 선택", OptionType.SINGLE, [("R (Regular)", 0), ("L (Large)", 500)]),
+    ("추가 옵션", OptionType.MULTIPLE, [("샷 추가", 500), ("시럽 추가", 500), ("휘핑크림 추가", 500)]),
+]
+
+
+def seed_catalog(db: Session, rng: random.Random, menu_count: int = 30) -> List[dict]:
+    """
+    Create categories, option groups and menus
+
+    Returns:
+        Menus as dicts with the option groups a kiosk would offer for them
+    """
+    categories = [
+        Category(code="COFFEE", name="커피", display_order=1),
+        Category(code="NON_COFFEE", name="논커피", display_order=2),
+        Category(code="DESSERT", name="디저트", display_order=3),
+    ]
+    db.add_all(categories)
+
+    groups = []
+    for idx, (name, option_type, items) in enumerate(OPTION_GROUPS):
+        group = OptionGroup(name=name, type=option_type, is_required=option_type == OptionType.SINGLE, display_order=idx)
+        db.add(group)
+        db.flush()
+        for item_idx, (item_name, price) in enumerate(items):
+            db.add(OptionItem(option_group_id=group.id, name=item_name, price=price, display_order=item_idx))
+        groups.append({"id": group.id, "name": name, "items": [{"name": n, "price": p} for n, p in items]})
+
+    menus = []
+    for idx in range(menu_count):
+        category = categories[idx % len(categories)]
+        menu = Menu(
+            name=f"{category.name} {idx + 1}",
+            price=rng.choice([2500, 3000, 3500, 4000, 4500, 5000]),
+            category_id=category.id,
+            display_order=idx
+        )
+        db.add(menu)
+        db.flush()
+
+        menu_groups = groups if category.code != "DESSERT" else []
+        for group_idx, group in enumerate(menu_groups):
+            db.add(MenuOptionGroup(menu_id=menu.id, option_group_id=group["id"], display_order=group_idx))
+
+        menus.append({"id": menu.id, "name": menu.name, "price": menu.price, "option_groups": menu_groups})
+
+    db.commit()
+    return menus
+
+
+def seed_cells(db: Session, count: int = 20, balance: int = 1_000_000_000) -> List[Cell]:
+    """Create cells with a balance large enough to never run out during a run"""
+    cells = [
+        Cell(name=f"셀 {idx + 1}", leader=f"셀장 {idx + 1}", phone_last4=f"{idx:04d}", balance=balance)
+        for idx in range(count)
+    ]
+    db.add_all(cells)
+    db.commit()
+    return cells
+
+
+def make_cart(rng: random.Random, menus: List[dict], cart_size: int) -> List[OrderItemRequest]:
+    """Build `cart_size` order lines with random options"""
+    items = []
+    for _ in range(cart_size):
+        menu = rng.choice(menus)
+        selected_options = []
+        for group in menu["option_groups"]:
+            option = rng.choice(group["items"])
+            selected_options.append(OrderItemOptionGroup(
+                groupName=group["name"],
+                items=[{"name": option["name"], "price": option["price"]}]
+            ))
+
+        items.append(OrderItemRequest(
+            menuId=menu["id"],
+            menuName=menu["name"],
+            menuPrice=menu["price"],
+            quantity=rng.randint(1, 3),
+            selectedOptions=selected_options
+        ))
+    return items
+
+
+def make_order_request(
+    rng: random.Random,
+    menus: List[dict],
+    cart_size: int,
+    cell_id: int = None
+) -> CreateOrderRequest:
+    """Build a CreateOrderRequest whose totalAmount matches its lines"""
+    items = make_cart(rng, menus, cart_size)
+    total = sum(
+        (item.menuPrice + sum(o.price for g in item.selectedOptions for o in g.items)) * item.quantity
+        for item in items
+    )
+    return CreateOrderRequest(
+        payType="CELL" if cell_id else "PERSONAL",
+        cellId=cell_id,
+        items=items,
+        totalAmount=total
+    )
+
+
+def seed_orders(
+    db: Session,
+    rng: random.Random,
+    menus: List[dict],
+    count: int,
+    cells: List[Cell] = (),
+    max_cart_size: int = 4,
+    days: int = 30
+) -> None:
+    """
+    Bulk insert `count` historical orders with items and options
+
+    Uses executemany inserts (no ORM unit of work) so large tables seed fast.
+    """
+    now = datetime.now()
+    statuses = [OrderStatus.COMPLETED] * 8 + [OrderStatus.CANCELLED, OrderStatus.PENDING, OrderStatus.MAKING]
+
+    order_rows, item_rows, option_rows = [], [], []
+    order_id = db.query(Order.id).order_by(Order.id.desc()).limit(1).scalar() or 0
+    item_id = db.query(OrderItem.id).order_by(OrderItem.id.desc()).limit(1).scalar() or 0
+
+    for idx in range(count):
+        order_id += 1
+        created_at = now - timedelta(seconds=rng.randint(0, days * 86400))
+        status = rng.choice(statuses)
+        cell = rng.choice(cells) if cells and rng.random() < 0.3 else None
+
+        total = 0
+        for item in make_cart(rng, menus, rng.randint(1, max_cart_size)):
+            item_id += 1
+            option_total = sum(o.price for g in item.selectedOptions for o in g.items)
+            line_total = (item.menuPrice + option_total) * item.quantity
+            total += line_total
+            item_rows.append({
+                "id": item_id, "order_id": order_id, "menu_id": item.menuId,
+                "menu_name": item.menuName, "menu_price": item.menuPrice,
+                "quantity": item.quantity, "total_price": line_total, "created_at": created_at
+            })
+            for group in item.selectedOptions:
+                for option in group.items:
+                    option_rows.append({
+                        "order_item_id": item_id, "option_group_name": group.groupName,
+                        "option_item_name": option.name, "option_item_price": option.price,
+                        "created_at": created_at
+                    })
+
+        order_rows.append({
+            "id": order_id,
+            "order_id": f"ORD-bench-{order_id}",
+            "daily_num": idx % 12 + 1,
+            "pay_type": PayType.CELL if cell else PayType.PERSONAL,
+            "cell_id": cell.id if cell else None,
+            "total_amount": total,
+            "status": status,
+            "created_at": created_at,
+            "updated_at": created_at,
+            "making_started_at": created_at + timedelta(minutes=2) if status == OrderStatus.COMPLETED else None,
+            "completed_at": created_at + timedelta(minutes=5) if status == OrderStatus.COMPLETED else None,
+            "cancelled_at": created_at + timedelta(minutes=2) if status == OrderStatus.CANCELLED else None,
+        })
+
+    db.execute(insert(Order), order_rows)
+    db.execute(insert(OrderItem), item_rows)
+    if option_rows:
+        db.execute(insert(OrderItemOption), option_rows)
+    db.commit()
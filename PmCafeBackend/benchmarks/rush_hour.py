@@ -0,0 +1,457 @@
+"""
+Kiosk rush-hour load test
+
+Simulates N kiosks browsing menus, authenticating cells and posting orders
+while baristas move tickets through their statuses and admins poll the
+dashboard. Reports p50/p95/p99 latency and throughput per endpoint.
+
+Usage:
+    # In-process against a throwaway SQLite file (no server needed)
+    python -m benchmarks.rush_hour --kiosks 8 --baristas 2 --admins 2 --duration 30
+
+    # Against a running server backed by PostgreSQL (seeded with init_data.py)
+    python -m benchmarks.rush_hour --base-url http://localhost:8000 --duration 60
+
+    # Save the report to compare against later runs
+    python -m benchmarks.rush_hour --duration 30 --json reports/rush_hour.json
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ADMIN_USERNAME = "admin"
+ADMIN_PASSWORD = "admin123"
+
+
+@dataclass
+class EndpointStats:
+    """Latency samples for a single endpoint"""
+    latencies_ms: List[float] = field(default_factory=list)
+    errors: int = 0
+
+    def record(self, elapsed_ms: float, ok: bool) -> None:
+        self.latencies_ms.append(elapsed_ms)
+        if not ok:
+            self.errors += 1
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of the given samples (0 when empty)"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class LoadRecorder:
+    """Collects per-endpoint latency samples during a run"""
+
+    def __init__(self):
+        self.stats: Dict[str, EndpointStats] = defaultdict(EndpointStats)
+        self.started_at = time.perf_counter()
+        self.finished_at: Optional[float] = None
+
+    async def request(
+        self,
+        client: httpx.AsyncClient,
+        label: str,
+        method: str,
+        url: str,
+        expected_statuses: Tuple[int, ...] = (),
+        **kwargs
+    ) -> Optional[httpx.Response]:
+        """
+        Send a request and record its latency under `label`
+
+        Responses >= 400 count as errors unless listed in `expected_statuses`.
+        """
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.stats[label].record((time.perf_counter() - start) * 1000, False)
+            return None
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.stats[label].record(
+            elapsed_ms, response.status_code < 400 or response.status_code in expected_statuses
+        )
+        return response
+
+    def finish(self) -> None:
+        self.finished_at = time.perf_counter()
+
+    def report(self) -> dict:
+        """Build the JSON-serialisable report"""
+        duration = (self.finished_at or time.perf_counter()) - self.started_at
+        endpoints = {}
+        for label in sorted(self.stats):
+            stat = self.stats[label]
+            count = len(stat.latencies_ms)
+            endpoints[label] = {
+                "requests": count,
+                "errors": stat.errors,
+                "throughput_rps": round(count / duration, 2) if duration else 0.0,
+                "p50_ms": round(percentile(stat.latencies_ms, 50), 2),
+                "p95_ms": round(percentile(stat.latencies_ms, 95), 2),
+                "p99_ms": round(percentile(stat.latencies_ms, 99), 2),
+                "max_ms": round(max(stat.latencies_ms), 2) if count else 0.0,
+            }
+
+        total = sum(e["requests"] for e in endpoints.values())
+        return {
+            "duration_s": round(duration, 2),
+            "total_requests": total,
+            "total_throughput_rps": round(total / duration, 2) if duration else 0.0,
+            "endpoints": endpoints,
+        }
+
+
+def print_report(report: dict) -> None:
+    """Print the report as a fixed-width table"""
+    header = f"{'endpoint':<42} {'reqs':>7} {'err':>5} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}"
+    print("\n" + header)
+    print("-" * len(header))
+    for label, e in report["endpoints"].items():
+        print(
+            f"{label:<42} {e['requests']:>7} {e['errors']:>5} {e['throughput_rps']:>8.1f} "
+            f"{e['p50_ms']:>8.1f} {e['p95_ms']:>8.1f} {e['p99_ms']:>8.1f} {e['max_ms']:>8.1f}"
+        )
+    print("-" * len(header))
+    print(
+        f"{report['total_requests']} requests in {report['duration_s']}s "
+        f"({report['total_throughput_rps']} req/s)\n"
+    )
+
+
+# Scenario actors
+
+async def kiosk(
+    client: httpx.AsyncClient,
+    recorder: LoadRecorder,
+    cells: List[dict],
+    stop_at: float,
+    rng: random.Random,
+    think_time: float
+) -> None:
+    """Browse menus, pick a few items and place an order (30% cell payments)"""
+    while time.perf_counter() < stop_at:
+        response = await recorder.request(client, "GET /menus", "GET", "/api/v1/menus")
+        if response is None or response.status_code != 200:
+            await asyncio.sleep(think_time)
+            continue
+
+        menus = [m for m in response.json()["data"] if not m["is_sold_out"]]
+        if not menus:
+            await asyncio.sleep(think_time)
+            continue
+
+        items = []
+        for menu in rng.sample(menus, k=min(len(menus), rng.randint(1, 3))):
+            detail = await recorder.request(
+                client, "GET /menus/{id}", "GET", f"/api/v1/menus/{menu['id']}"
+            )
+            selected_options = []
+            if detail is not None and detail.status_code == 200:
+                for group in detail.json()["data"]["option_groups"]:
+                    if group["items"]:
+                        option = rng.choice(group["items"])
+                        selected_options.append({
+                            "groupName": group["name"],
+                            "items": [{"name": option["name"], "price": option["price"]}]
+                        })
+
+            items.append({
+                "menuId": menu["id"],
+                "menuName": menu["name"],
+                "menuPrice": menu["price"],
+                "quantity": rng.randint(1, 2),
+                "selectedOptions": selected_options
+            })
+
+        total = sum(
+            (item["menuPrice"] + sum(o["price"] for g in item["selectedOptions"] for o in g["items"]))
+            * item["quantity"]
+            for item in items
+        )
+        order = {"payType": "PERSONAL", "items": items, "totalAmount": total}
+
+        if cells and rng.random() < 0.3:
+            cell = rng.choice(cells)
+            auth = await recorder.request(
+                client, "POST /cells/auth", "POST", "/api/v1/cells/auth",
+                json={"phoneLast4": cell["phoneLast4"]}
+            )
+            if auth is not None and auth.status_code == 200:
+                order["payType"] = "CELL"
+                order["cellId"] = auth.json()["data"]["id"]
+
+        await recorder.request(client, "POST /orders", "POST", "/api/v1/orders", json=order)
+        await asyncio.sleep(think_time)
+
+
+async def barista(
+    client: httpx.AsyncClient,
+    recorder: LoadRecorder,
+    stop_at: float,
+    think_time: float
+) -> None:
+    """Move the oldest PENDING ticket to MAKING and the oldest MAKING to COMPLETED"""
+    transitions = (("PENDING", "MAKING"), ("MAKING", "COMPLETED"))
+    while time.perf_counter() < stop_at:
+        for current, target in transitions:
+            response = await recorder.request(
+                client, f"GET /orders?status={current}", "GET", "/api/v1/orders",
+                params={"status": current, "limit": 50}
+            )
+            if response is None or response.status_code != 200:
+                continue
+
+            orders = response.json()["data"]["orders"]
+            if orders:
+                # Baristas race for the same ticket: losing with 409 is expected
+                await recorder.request(
+                    client, "PATCH /orders/{id}/status", "PATCH",
+                    f"/api/v1/orders/{orders[-1]['orderId']}/status",
+                    expected_statuses=(409,),
+                    json={"status": target, "expectedStatus": current}
+                )
+        await asyncio.sleep(think_time)
+
+
+async def admin(
+    client: httpx.AsyncClient,
+    recorder: LoadRecorder,
+    token: str,
+    stop_at: float,
+    poll_interval: float
+) -> None:
+    """Poll the dashboard like an open admin tab"""
+    headers = {"Authorization": f"Bearer {token}"}
+    while time.perf_counter() < stop_at:
+        await recorder.request(
+            client, "GET /statistics/dashboard", "GET",
+            "/api/v1/statistics/dashboard", headers=headers
+        )
+        await asyncio.sleep(poll_interval)
+
+
+# Setup
+
+def seed_database(session_factory, cell_count: int, seed: int) -> None:
+    """Seed an empty database with an admin, a small catalog and cells"""
+    import bcrypt
+    from app.models import (
+        User, UserRole, Category, OptionGroup, OptionItem, OptionType,
+        Menu, MenuOptionGroup, Cell
+    )
+
+    rng = random.Random(seed)
+    db = session_factory()
+    try:
+        password_hash = bcrypt.hashpw(ADMIN_PASSWORD.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        db.add(User(username=ADMIN_USERNAME, password_hash=password_hash, name="관리자", role=UserRole.SUPER))
+
+        categories = [
+            Category(code="COFFEE", name="커피", display_order=1),
+            Category(code="NON_COFFEE", name="논커피", display_order=2),
+            Category(code="DESSERT", name="디저트", display_order=3),
+        ]
+        db.add_all(categories)
+
+        temp_group = OptionGroup(name="온도 선택", icon="🌡️", type=OptionType.SINGLE, is_required=True, display_order=1)
+        size_group = OptionGroup(name="사이즈 선택", icon="📏", type=OptionType.SINGLE, is_required=True, display_order=2)
+        db.add_all([temp_group, size_group])
+        db.flush()
+
+        db.add_all([
+            OptionItem(option_group_id=temp_group.id, name="HOT", price=0, is_default=True, display_order=1),
+            OptionItem(option_group_id=temp_group.id, name="ICE", price=0, display_order=2),
+            OptionItem(option_group_id=size_group.id, name="R (Regular)", price=0, is_default=True, display_order=1),
+            OptionItem(option_group_id=size_group.id, name="L (Large)", price=500, display_order=2),
+        ])
+
+        for idx in range(24):
+            category = categories[idx % len(categories)]
+            menu = Menu(
+                name=f"{category.name} 메뉴 {idx + 1}",
+                price=rng.choice([2500, 3000, 3500, 4000, 4500]),
+                category_id=category.id,
+                display_order=idx
+            )
+            db.add(menu)
+            db.flush()
+            if category.code != "DESSERT":
+                db.add(MenuOptionGroup(menu_id=menu.id, option_group_id=temp_group.id, display_order=0))
+                db.add(MenuOptionGroup(menu_id=menu.id, option_group_id=size_group.id, display_order=1))
+
+        for idx in range(cell_count):
+            db.add(Cell(
+                name=f"부하테스트셀 {idx + 1}",
+                leader=f"셀장 {idx + 1}",
+                phone_last4=f"{idx:04d}",
+                balance=100_000_000
+            ))
+
+        db.commit()
+    finally:
+        db.close()
+
+
+async def login(client: httpx.AsyncClient, username: str, password: str) -> str:
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"username": username, "password": password}
+    )
+    response.raise_for_status()
+    return response.json()["data"]["access_token"]
+
+
+async def load_cells(client: httpx.AsyncClient, token: str) -> List[dict]:
+    response = await client.get("/api/v1/cells", headers={"Authorization": f"Bearer {token}"})
+    response.raise_for_status()
+    return response.json()["data"]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    kiosks: int,
+    baristas: int,
+    admins: int,
+    duration: float,
+    seed: int = 42,
+    think_time: float = 0.5,
+    poll_interval: float = 2.0,
+    username: str = ADMIN_USERNAME,
+    password: str = ADMIN_PASSWORD
+) -> dict:
+    """Run the rush-hour scenario against `client` and return the report"""
+    token = await login(client, username, password)
+    cells = await load_cells(client, token)
+
+    recorder = LoadRecorder()
+    stop_at = time.perf_counter() + duration
+
+    actors = [
+        kiosk(client, recorder, cells, stop_at, random.Random(seed + idx), think_time)
+        for idx in range(kiosks)
+    ]
+    actors += [barista(client, recorder, stop_at, think_time) for _ in range(baristas)]
+    actors += [admin(client, recorder, token, stop_at, poll_interval) for _ in range(admins)]
+
+    await asyncio.gather(*actors)
+    recorder.finish()
+    return recorder.report()
+
+
+async def run_in_process(args: argparse.Namespace) -> dict:
+    """Run against the ASGI app directly, backed by a freshly seeded database"""
+    os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+    os.environ.setdefault("SECRET_KEY", "rush-hour-benchmark")
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from app.main import app
+    from app.database import Base, get_db
+
+    database_url = args.database_url
+    tmp_dir = None
+    if database_url is None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        database_url = f"sqlite:///{os.path.join(tmp_dir.name, 'rush_hour.db')}"
+
+    connect_args = {"check_same_thread": False, "timeout": 30} if database_url.startswith("sqlite") else {}
+    engine = create_engine(database_url, connect_args=connect_args, pool_size=20, max_overflow=20)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    seed_database(session_factory, args.cells, args.seed)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    previous_override = app.dependency_overrides.get(get_db)
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://rush-hour") as client:
+            return await run_scenario(
+                client, args.kiosks, args.baristas, args.admins, args.duration,
+                seed=args.seed, think_time=args.think_time, poll_interval=args.poll_interval
+            )
+    finally:
+        if previous_override is None:
+            app.dependency_overrides.pop(get_db, None)
+        else:
+            app.dependency_overrides[get_db] = previous_override
+        engine.dispose()
+        if tmp_dir is not None:
+            tmp_dir.cleanup()
+
+
+async def run_remote(args: argparse.Namespace) -> dict:
+    """Run against an already running server"""
+    limits = httpx.Limits(max_connections=args.kiosks + args.baristas + args.admins + 4)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=30) as client:
+        return await run_scenario(
+            client, args.kiosks, args.baristas, args.admins, args.duration,
+            seed=args.seed, think_time=args.think_time, poll_interval=args.poll_interval,
+            username=args.username, password=args.password
+        )
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="P.M CAFE rush-hour load test")
+    parser.add_argument("--kiosks", type=int, default=8, help="동시 키오스크 수")
+    parser.add_argument("--baristas", type=int, default=2, help="동시 바리스타 화면 수")
+    parser.add_argument("--admins", type=int, default=2, help="대시보드를 보는 관리자 탭 수")
+    parser.add_argument("--duration", type=float, default=30, help="실행 시간 (초)")
+    parser.add_argument("--think-time", type=float, default=0.5, help="액션 사이 대기 시간 (초)")
+    parser.add_argument("--poll-interval", type=float, default=2.0, help="대시보드 폴링 간격 (초)")
+    parser.add_argument("--cells", type=int, default=20, help="시드할 셀 수 (in-process 모드)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--base-url", default=None, help="실행 중인 서버 URL (없으면 in-process)")
+    parser.add_argument("--database-url", default=None, help="in-process 모드 DB URL (기본: 임시 SQLite)")
+    parser.add_argument("--username", default=ADMIN_USERNAME, help="관리자 아이디 (원격 모드)")
+    parser.add_argument("--password", default=ADMIN_PASSWORD, help="관리자 비밀번호 (원격 모드)")
+    parser.add_argument("--json", dest="json_path", default=None, help="리포트를 저장할 JSON 경로")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> dict:
+    args = parse_args(argv)
+    runner = run_remote(args) if args.base_url else run_in_process(args)
+    report = asyncio.run(runner)
+
+    print_report(report)
+    if args.json_path:
+        os.makedirs(os.path.dirname(os.path.abspath(args.json_path)), exist_ok=True)
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"Report saved to {args.json_path}")
+
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+OrderService hot path benchmarks
+"""
+import itertools
+
+import pytest
+
+from app.models.order import Order, OrderStatus, PayType
+from app.schemas.order import build_order_response
+from app.services.order_service import OrderService
+from benchmarks import data
+
+CART_SIZES = [1, 5, 20]
+TABLE_SIZES = [100, 1_000, 10_000]
+
+
+@pytest.mark.parametrize("cart_size", CART_SIZES)
+def test_create_order_personal(benchmark, db_session, catalog, rng, cart_size):
+    """OrderService.create_order with PERSONAL payment"""
+    service = OrderService()
+    requests = itertools.cycle([data.make_order_request(rng, catalog, cart_size) for _ in range(50)])
+
+    order = benchmark(lambda: service.create_order(db_session, next(requests)))
+
+    assert len(order.items) == cart_size
+
+
+@pytest.mark.parametrize("cart_size", CART_SIZES)
+def test_create_order_cell(benchmark, db_session, catalog, cells, rng, cart_size):
+    """OrderService.create_order with CELL payment (balance deduction + transaction)"""
+    service = OrderService()
+    requests = itertools.cycle([
+        data.make_order_request(rng, catalog, cart_size, cell_id=cells[idx % len(cells)].id)
+        for idx in range(50)
+    ])
+
+    order = benchmark(lambda: service.create_order(db_session, next(requests)))
+
+    assert order.pay_type == PayType.CELL
+
+
+@pytest.mark.parametrize("table_size", TABLE_SIZES)
+def test_get_orders(benchmark, db_session, catalog, cells, rng, table_size):
+    """OrderService.get_orders first page over a growing order table"""
+    data.seed_orders(db_session, rng, catalog, table_size, cells)
+    service = OrderService()
+
+    def run():
+        db_session.expunge_all()
+        return service.get_orders(db_session, limit=100)
+
+    orders, total = benchmark(run)
+
+    assert total == table_size
+    assert len(orders) == min(100, table_size)
+
+
+@pytest.mark.parametrize("table_size", TABLE_SIZES)
+def test_get_orders_filtered(benchmark, db_session, catalog, cells, rng, table_size):
+    """OrderService.get_orders filtered by status (barista queue shape)"""
+    data.seed_orders(db_session, rng, catalog, table_size, cells)
+    service = OrderService()
+
+    def run():
+        db_session.expunge_all()
+        return service.get_orders(db_session, status=OrderStatus.PENDING, limit=100)
+
+    orders, _ = benchmark(run)
+
+    assert all(o.status == OrderStatus.PENDING for o in orders)
+
+
+@pytest.mark.parametrize("table_size", TABLE_SIZES)
+def test_update_order_status(benchmark, db_session, catalog, cells, rng, table_size):
+    """OrderService.update_order_status PENDING -> MAKING"""
+    data.seed_orders(db_session, rng, catalog, table_size, cells)
+    service = OrderService()
+    counter = itertools.count()
+
+    def setup():
+        order = Order(
+            order_id=f"ORD-bench-update-{next(counter)}",
+            daily_num=1,
+            pay_type=PayType.PERSONAL,
+            total_amount=3000,
+            status=OrderStatus.PENDING
+        )
+        db_session.add(order)
+        db_session.commit()
+        return (db_session, order.order_id, OrderStatus.MAKING), {}
+
+    updated = benchmark.pedantic(service.update_order_status, setup=setup, rounds=100)
+
+    assert updated.status == OrderStatus.MAKING
+
+
+@pytest.mark.parametrize("cart_size", CART_SIZES)
+def test_build_order_list_response(benchmark, db_session, catalog, cells, rng, cart_size):
+    """Response building for a 100-order page in routers/orders.py"""
+    data.seed_orders(db_session, rng, catalog, 100, cells, max_cart_size=cart_size)
+    orders, _ = OrderService().get_orders(db_session, limit=100)
+
+    result = benchmark(lambda: [build_order_response(order).model_dump() for order in orders])
+
+    assert len(result) == 100
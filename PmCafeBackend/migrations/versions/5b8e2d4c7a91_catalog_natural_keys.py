@@ -0,0 +1,52 @@
+"""Catalog natural keys for idempotent seeding
+
+Existing duplicate names would make the constraints fail, so every
+duplicate except the oldest row (lowest id) is renamed first to
+"<name> (<id>)". Rows are renamed, not merged, so orders and menu links
+keep pointing at them; clean them up from the admin afterwards.
+
+Revision ID: 5b8e2d4c7a91
+Revises: 2903549e002a
+Create Date: 2026-10-19 10:12:08.418223
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8e2d4c7a91'
+down_revision: Union[str, Sequence[str], None] = '2903549e002a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Keep within String(100) after appending " (<id>)"
+_DEDUPE_NAME = "substr(name, 1, 80) || ' (' || CAST(id AS VARCHAR(20)) || ')'"
+
+
+def _rename_duplicates(table: str, key: str) -> None:
+    op.execute(
+        f"UPDATE {table} SET name = {_DEDUPE_NAME} "
+        f"WHERE id NOT IN (SELECT * FROM (SELECT MIN(id) FROM {table} GROUP BY {key}) AS keep)"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _rename_duplicates('option_groups', 'name')
+    _rename_duplicates('option_items', 'option_group_id, name')
+    _rename_duplicates('menus', 'name')
+
+    op.create_unique_constraint('uq_option_groups_name', 'option_groups', ['name'])
+    op.create_unique_constraint('uq_option_items_group_name', 'option_items', ['option_group_id', 'name'])
+    op.create_unique_constraint('uq_menus_name', 'menus', ['name'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_menus_name', 'menus', type_='unique')
+    op.drop_constraint('uq_option_items_group_name', 'option_items', type_='unique')
+    op.drop_constraint('uq_option_groups_name', 'option_groups', type_='unique')
@@ -0,0 +1,28 @@
+"""Order version column for optimistic locking
+
+Revision ID: 8c1f3a6e2b47
+Revises: 5b8e2d4c7a91
+Create Date: 2026-10-19 14:02:51.301877
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c1f3a6e2b47'
+down_revision: Union[str, Sequence[str], None] = '5b8e2d4c7a91'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('orders', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('orders', 'version')
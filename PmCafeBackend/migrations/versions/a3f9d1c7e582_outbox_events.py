@@ -0,0 +1,46 @@
+"""Transactional outbox for real-time events
+
+Revision ID: a3f9d1c7e582
+Revises: d8b3f6a2c914
+Create Date: 2026-10-19 23:12:08.540317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f9d1c7e582'
+down_revision: Union[str, Sequence[str], None] = 'd8b3f6a2c914'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UNPUBLISHED = sa.text("published_at IS NULL")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'outbox_events',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('event', sa.String(length=50), nullable=False),
+        sa.Column('payload', sa.JSON(), nullable=False),
+        sa.Column('origin', sa.String(length=50), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('published_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'idx_outbox_events_unpublished', 'outbox_events', ['id'], unique=False,
+        postgresql_where=UNPUBLISHED, sqlite_where=UNPUBLISHED
+    )
+    op.create_index('idx_outbox_events_published_at', 'outbox_events', ['published_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_outbox_events_published_at', table_name='outbox_events')
+    op.drop_index('idx_outbox_events_unpublished', table_name='outbox_events')
+    op.drop_table('outbox_events')
@@ -0,0 +1,42 @@
+"""Per-day menu sales rollup
+
+Revision ID: a6d2f8c41e73
+Revises: f3c8a1d6b254
+Create Date: 2026-10-19 18:22:07.540913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6d2f8c41e73'
+down_revision: Union[str, Sequence[str], None] = 'f3c8a1d6b254'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'menu_daily_sales',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('sale_date', sa.Date(), nullable=False),
+        sa.Column('menu_id', sa.Integer(), nullable=False),
+        sa.Column('quantity', sa.Integer(), nullable=False),
+        sa.Column('revenue', sa.Integer(), nullable=False),
+        sa.Column('order_count', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['menu_id'], ['menus.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('sale_date', 'menu_id', name='uq_menu_daily_sales_date_menu')
+    )
+    op.create_index(op.f('ix_menu_daily_sales_id'), 'menu_daily_sales', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_menu_daily_sales_id'), table_name='menu_daily_sales')
+    op.drop_table('menu_daily_sales')
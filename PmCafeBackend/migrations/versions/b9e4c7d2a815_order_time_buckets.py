@@ -0,0 +1,44 @@
+"""15-minute order time buckets
+
+Revision ID: b9e4c7d2a815
+Revises: a6d2f8c41e73
+Create Date: 2026-10-19 19:41:26.803152
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9e4c7d2a815'
+down_revision: Union[str, Sequence[str], None] = 'a6d2f8c41e73'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'order_time_buckets',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('bucket_date', sa.Date(), nullable=False),
+        sa.Column('minute', sa.Integer(), nullable=False),
+        sa.Column('weekday', sa.Integer(), nullable=False),
+        sa.Column('order_count', sa.Integer(), nullable=False),
+        sa.Column('revenue', sa.Integer(), nullable=False),
+        sa.Column('item_count', sa.Integer(), nullable=False),
+        sa.Column('completed_count', sa.Integer(), nullable=False),
+        sa.Column('prep_seconds', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('bucket_date', 'minute', name='uq_order_time_buckets_date_minute')
+    )
+    op.create_index(op.f('ix_order_time_buckets_id'), 'order_time_buckets', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_order_time_buckets_id'), table_name='order_time_buckets')
+    op.drop_table('order_time_buckets')
@@ -0,0 +1,28 @@
+"""Order making_started_at timestamp
+
+Revision ID: c5a9e3f17d42
+Revises: b9e4c7d2a815
+Create Date: 2026-10-19 20:37:14.226580
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5a9e3f17d42'
+down_revision: Union[str, Sequence[str], None] = 'b9e4c7d2a815'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('orders', sa.Column('making_started_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('orders', 'making_started_at')
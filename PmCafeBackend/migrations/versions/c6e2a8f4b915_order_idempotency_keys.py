@@ -0,0 +1,32 @@
+"""Idempotency key and client time for offline-queued orders
+
+Revision ID: c6e2a8f4b915
+Revises: a3f9d1c7e582
+Create Date: 2026-10-19 23:58:41.207395
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6e2a8f4b915'
+down_revision: Union[str, Sequence[str], None] = 'a3f9d1c7e582'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('orders', sa.Column('idempotency_key', sa.String(length=100), nullable=True))
+    op.add_column('orders', sa.Column('client_created_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index('uq_orders_idempotency_key', 'orders', ['idempotency_key'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_orders_idempotency_key', table_name='orders')
+    op.drop_column('orders', 'client_created_at')
+    op.drop_column('orders', 'idempotency_key')
@@ -0,0 +1,32 @@
+"""Allow at most one REFUND transaction per order
+
+Revision ID: d47a9c2e5f10
+Revises: 8c1f3a6e2b47
+Create Date: 2026-10-19 15:21:07.448120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd47a9c2e5f10'
+down_revision: Union[str, Sequence[str], None] = '8c1f3a6e2b47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'uq_point_transactions_refund_order', 'point_transactions', ['order_id'], unique=True,
+        postgresql_where=sa.text("type = 'REFUND'"),
+        sqlite_where=sa.text("type = 'REFUND'")
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_point_transactions_refund_order', table_name='point_transactions')
@@ -0,0 +1,32 @@
+"""Settlement cancellation totals and calculation timestamp
+
+Revision ID: d8b3f6a2c914
+Revises: c5a9e3f17d42
+Create Date: 2026-10-19 22:04:51.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8b3f6a2c914'
+down_revision: Union[str, Sequence[str], None] = 'c5a9e3f17d42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('daily_settlements', sa.Column('cancelled_orders', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('daily_settlements', sa.Column('cancelled_amount', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('daily_settlements', sa.Column('calculated_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('daily_settlements', 'calculated_at')
+    op.drop_column('daily_settlements', 'cancelled_amount')
+    op.drop_column('daily_settlements', 'cancelled_orders')
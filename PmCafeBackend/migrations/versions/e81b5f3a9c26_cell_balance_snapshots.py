@@ -0,0 +1,47 @@
+"""Daily cell balance snapshots
+
+Revision ID: e81b5f3a9c26
+Revises: d47a9c2e5f10
+Create Date: 2026-10-19 16:05:42.117395
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e81b5f3a9c26'
+down_revision: Union[str, Sequence[str], None] = 'd47a9c2e5f10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'cell_balance_snapshots',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('cell_id', sa.Integer(), nullable=False),
+        sa.Column('snapshot_date', sa.Date(), nullable=False),
+        sa.Column('balance', sa.Integer(), nullable=False),
+        sa.Column('last_transaction_id', sa.Integer(), nullable=True),
+        sa.Column('charged', sa.Integer(), nullable=False),
+        sa.Column('used', sa.Integer(), nullable=False),
+        sa.Column('refunded', sa.Integer(), nullable=False),
+        sa.Column('transaction_count', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['cell_id'], ['cells.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('cell_id', 'snapshot_date', name='uq_cell_balance_snapshots_cell_date')
+    )
+    op.create_index('idx_cell_balance_snapshots_date', 'cell_balance_snapshots', ['snapshot_date'], unique=False)
+    op.create_index(op.f('ix_cell_balance_snapshots_id'), 'cell_balance_snapshots', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_cell_balance_snapshots_id'), table_name='cell_balance_snapshots')
+    op.drop_index('idx_cell_balance_snapshots_date', table_name='cell_balance_snapshots')
+    op.drop_table('cell_balance_snapshots')
@@ -0,0 +1,67 @@
+"""Composite and partial indexes for the hot query shapes
+
+- orders: (status, created_at), (pay_type, created_at), (cell_id, created_at)
+  for the filtered, newest-first order lists; a partial index on
+  (created_at, id) over PENDING/MAKING orders for the barista queue.
+  They replace the single-column status index.
+- order_items(order_id), order_item_options(order_item_id): foreign keys
+  loaded by every order response.
+- point_transactions: (cell_id, created_at) replaces the cell_id index
+  (transaction history is filtered by cell and sorted by time; a B-tree
+  is scanned backwards for DESC), plus order_id for payment/refund lookups.
+
+Revision ID: f3c8a1d6b254
+Revises: e81b5f3a9c26
+Create Date: 2026-10-19 16:48:13.902551
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c8a1d6b254'
+down_revision: Union[str, Sequence[str], None] = 'e81b5f3a9c26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE_STATUSES = sa.text("status IN ('PENDING', 'MAKING')")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_orders_status_created_at', 'orders', ['status', 'created_at'], unique=False)
+    op.create_index('idx_orders_pay_type_created_at', 'orders', ['pay_type', 'created_at'], unique=False)
+    op.create_index('idx_orders_cell_id_created_at', 'orders', ['cell_id', 'created_at'], unique=False)
+    op.create_index(
+        'idx_orders_active', 'orders', ['created_at', 'id'], unique=False,
+        postgresql_where=ACTIVE_STATUSES, sqlite_where=ACTIVE_STATUSES
+    )
+    op.drop_index('idx_orders_status', table_name='orders')
+
+    op.create_index('idx_order_items_order_id', 'order_items', ['order_id'], unique=False)
+    op.create_index('idx_order_item_options_order_item_id', 'order_item_options', ['order_item_id'], unique=False)
+
+    op.create_index(
+        'idx_point_transactions_cell_id_created_at', 'point_transactions', ['cell_id', 'created_at'], unique=False
+    )
+    op.create_index('idx_point_transactions_order_id', 'point_transactions', ['order_id'], unique=False)
+    op.drop_index('idx_point_transactions_cell_id', table_name='point_transactions')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('idx_point_transactions_cell_id', 'point_transactions', ['cell_id'], unique=False)
+    op.drop_index('idx_point_transactions_order_id', table_name='point_transactions')
+    op.drop_index('idx_point_transactions_cell_id_created_at', table_name='point_transactions')
+
+    op.drop_index('idx_order_item_options_order_item_id', table_name='order_item_options')
+    op.drop_index('idx_order_items_order_id', table_name='order_items')
+
+    op.create_index('idx_orders_status', 'orders', ['status'], unique=False)
+    op.drop_index('idx_orders_active', table_name='orders')
+    op.drop_index('idx_orders_cell_id_created_at', table_name='orders')
+    op.drop_index('idx_orders_pay_type_created_at', table_name='orders')
+    op.drop_index('idx_orders_status_created_at', table_name='orders')
@@ -0,0 +1,424 @@
+"""
+대용량 합성 데이터 생성 스크립트
+
+수년치 주문/주문 항목/옵션/셀/포인트 거래 내역을 결정적인 시드로 생성합니다.
+PostgreSQL에서는 COPY, 그 외 DB에서는 executemany로 청크 단위 삽입합니다.
+
+Usage:
+    python scripts/generate_data.py --days 730 --orders-per-day 150 --cells 60
+    python scripts/generate_data.py --database-url sqlite:///scale.db --create-tables --days 365
+"""
+
+import argparse
+import csv
+import io
+import os
+import random
+import string
+import sys
+import time
+from datetime import date, datetime, timedelta
+from typing import Iterable, List, Optional, Sequence
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, func, insert, select, text
+from sqlalchemy.engine import Connection
+
+from app.database import Base
+from app.models import (
+    Category, Menu, MenuOptionGroup, OptionGroup, OptionItem, OptionType,
+    Cell, Order, OrderItem, OrderItemOption, PointTransaction,
+    OrderStatus, PayType, TransactionType
+)
+
+ORDER_COLUMNS = [
+    "id", "order_id", "daily_num", "pay_type", "cell_id", "total_amount", "status",
+    "created_at", "updated_at", "making_started_at", "completed_at", "cancelled_at",
+]
+ITEM_COLUMNS = [
+    "id", "order_id", "menu_id", "menu_name", "menu_price", "quantity", "total_price", "created_at",
+]
+OPTION_COLUMNS = [
+    "id", "order_item_id", "option_group_name", "option_item_name", "option_item_price", "created_at",
+]
+TRANSACTION_COLUMNS = [
+    "id", "cell_id", "type", "amount", "balance_after", "order_id", "memo", "created_by", "created_at",
+]
+
+# 요일별 주문량 가중치 (월=0 ... 일=6) - 주일 예배 전후에 주문이 몰림
+WEEKDAY_WEIGHTS = [0.15, 0.1, 0.35, 0.1, 0.3, 0.4, 1.0]
+
+# 시간대별 주문 분포 (시, 가중치)
+SUNDAY_HOURS = [(9, 2), (10, 4), (11, 3), (12, 10), (13, 12), (14, 6), (15, 3), (16, 2), (17, 1)]
+WEEKDAY_HOURS = [(10, 1), (11, 1), (12, 2), (13, 2), (18, 2), (19, 4), (20, 3), (21, 1)]
+
+
+class Writer:
+    """Chunked row writer (executemany)"""
+
+    def __init__(self, conn: Connection):
+        self.conn = conn
+        self.tables = {
+            "orders": Order.__table__,
+            "order_items": OrderItem.__table__,
+            "order_item_options": OrderItemOption.__table__,
+            "point_transactions": PointTransaction.__table__,
+        }
+
+    def write(self, table: str, columns: Sequence[str], rows: List[tuple]) -> None:
+        if rows:
+            self.conn.execute(insert(self.tables[table]), [dict(zip(columns, row)) for row in rows])
+
+
+class CopyWriter(Writer):
+    """Chunked row writer using PostgreSQL COPY ... FROM STDIN"""
+
+    def write(self, table: str, columns: Sequence[str], rows: List[tuple]) -> None:
+        if not rows:
+            return
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow(["\\N" if v is None else (v.value if hasattr(v, "value") else v) for v in row])
+        buffer.seek(0)
+
+        cursor = self.conn.connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                buffer
+            )
+        finally:
+            cursor.close()
+
+
+class DataGenerator:
+    """Deterministic generator of a realistic order history"""
+
+    def __init__(
+        self,
+        conn: Connection,
+        seed: int = 42,
+        days: int = 365,
+        orders_per_day: int = 120,
+        cell_count: int = 40,
+        end_date: Optional[date] = None,
+        chunk_size: int = 20_000
+    ):
+        self.conn = conn
+        self.rng = random.Random(seed)
+        self.days = days
+        self.orders_per_day = orders_per_day
+        self.cell_count = cell_count
+        self.end_date = end_date or date.today()
+        self.chunk_size = chunk_size
+        self.is_postgres = conn.dialect.name == "postgresql"
+        self.writer = CopyWriter(conn) if self.is_postgres else Writer(conn)
+
+        self.counts = {"orders": 0, "order_items": 0, "order_item_options": 0, "point_transactions": 0}
+        self._buffers = {name: [] for name in self.counts}
+
+    # Catalog / cells
+
+    def ensure_catalog(self) -> List[dict]:
+        """Use the existing menus, or create a synthetic catalog if there are none"""
+        if self.conn.execute(select(func.count()).select_from(Menu)).scalar() == 0:
+            self._create_catalog()
+
+        groups = {}
+        rows = self.conn.execute(
+            select(OptionGroup.id, OptionGroup.name, OptionGroup.type, OptionItem.name, OptionItem.price)
+            .join(OptionItem, OptionItem.option_group_id == OptionGroup.id)
+            .order_by(OptionGroup.id, OptionItem.display_order)
+        ).all()
+        for group_id, group_name, group_type, item_name, item_price in rows:
+            group = groups.setdefault(group_id, {"name": group_name, "type": group_type, "items": []})
+            group["items"].append((item_name, item_price))
+
+        links = {}
+        for menu_id, group_id in self.conn.execute(
+            select(MenuOptionGroup.menu_id, MenuOptionGroup.option_group_id).order_by(MenuOptionGroup.display_order)
+        ).all():
+            if group_id in groups:
+                links.setdefault(menu_id, []).append(groups[group_id])
+
+        menus = [
+            {"id": menu_id, "name": name, "price": price, "option_groups": links.get(menu_id, [])}
+            for menu_id, name, price in self.conn.execute(
+                select(Menu.id, Menu.name, Menu.price).order_by(Menu.display_order, Menu.id)
+            ).all()
+        ]
+
+        # 인기 메뉴 편중 (Zipf 분포)
+        self.menu_weights = [1 / (rank + 1) ** 1.1 for rank in range(len(menus))]
+        return menus
+
+    def _create_catalog(self) -> None:
+        categories = [("COFFEE", "커피"), ("NON_COFFEE", "논커피"), ("DESSERT", "디저트"), ("SEASONAL", "시즌메뉴")]
+        category_ids = {}
+        for idx, (code, name) in enumerate(categories):
+            existing = self.conn.execute(select(Category.id).where(Category.code == code)).scalar()
+            if existing is None:
+                existing = self.conn.execute(
+                    insert(Category).values(code=code, name=name, display_order=idx + 1, is_active=True)
+                ).inserted_primary_key[0]
+            category_ids[code] = existing
+
+        group_specs = [
+            ("온도 선택", OptionType.SINGLE, [("HOT", 0), ("ICE", 0)]),
+            ("사이즈 선택", OptionType.SINGLE, [("R (Regular)", 0), ("L (Large)", 500)]),
+            ("추가 옵션", OptionType.MULTIPLE, [("샷 추가", 500), ("시럽 추가", 500), ("휘핑크림 추가", 500)]),
+        ]
+        group_ids = []
+        for idx, (name, option_type, items) in enumerate(group_specs):
+            group_id = self.conn.execute(
+                insert(OptionGroup).values(
+                    name=name, type=option_type, is_required=option_type == OptionType.SINGLE, display_order=idx + 1
+                )
+            ).inserted_primary_key[0]
+            self.conn.execute(insert(OptionItem), [
+                {"option_group_id": group_id, "name": n, "price": p, "is_default": i == 0, "display_order": i + 1}
+                for i, (n, p) in enumerate(items)
+            ])
+            group_ids.append(group_id)
+
+        drinks = [
+            ("COFFEE", "아메리카노", 2500), ("COFFEE", "카페라떼", 3000), ("COFFEE", "바닐라라떼", 3500),
+            ("COFFEE", "카푸치노", 3000), ("COFFEE", "카라멜마끼아또", 3500), ("COFFEE", "콜드브루", 3500),
+            ("NON_COFFEE", "초코라떼", 3000), ("NON_COFFEE", "녹차라떼", 3500), ("NON_COFFEE", "레몬에이드", 3500),
+            ("NON_COFFEE", "자몽에이드", 3500), ("NON_COFFEE", "유자차", 3000), ("NON_COFFEE", "캐모마일", 2500),
+            ("DESSERT", "크로플", 3500), ("DESSERT", "쿠키", 2000), ("DESSERT", "마들렌", 2000),
+            ("SEASONAL", "딸기라떼", 4000), ("SEASONAL", "복숭아 아이스티", 3000),
+        ]
+        for idx, (code, name, price) in enumerate(drinks):
+            menu_id = self.conn.execute(
+                insert(Menu).values(
+                    name=name, price=price, category_id=category_ids[code],
+                    display_order=idx + 1, is_active=True, is_sold_out=False
+                )
+            ).inserted_primary_key[0]
+            if code != "DESSERT":
+                self.conn.execute(insert(MenuOptionGroup), [
+                    {"menu_id": menu_id, "option_group_id": group_id, "display_order": order}
+                    for order, group_id in enumerate(group_ids)
+                ])
+
+    def create_cells(self) -> List[int]:
+        """Insert `cell_count` cells with unused phone numbers; returns their ids"""
+        used = set(self.conn.execute(select(Cell.phone_last4)).scalars())
+        available = [f"{n:04d}" for n in range(10_000) if f"{n:04d}" not in used]
+        phones = self.rng.sample(available, k=min(self.cell_count, len(available)))
+
+        cell_ids = []
+        for idx, phone in enumerate(phones):
+            cell_ids.append(self.conn.execute(
+                insert(Cell).values(
+                    name=f"{idx // 8 + 1}교구 {idx % 8 + 1}셀",
+                    leader=f"셀장{idx + 1}",
+                    phone_last4=phone,
+                    balance=0,
+                    is_active=True
+                )
+            ).inserted_primary_key[0])
+        return cell_ids
+
+    # Orders
+
+    def _next_id(self, model) -> int:
+        return (self.conn.execute(select(func.max(model.id))).scalar() or 0) + 1
+
+    def _emit(self, table: str, row: tuple) -> None:
+        buffer = self._buffers[table]
+        buffer.append(row)
+        self.counts[table] += 1
+        if len(buffer) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered rows in FK order"""
+        for table, columns in (
+            ("orders", ORDER_COLUMNS),
+            ("order_items", ITEM_COLUMNS),
+            ("order_item_options", OPTION_COLUMNS),
+            ("point_transactions", TRANSACTION_COLUMNS),
+        ):
+            self.writer.write(table, columns, self._buffers[table])
+            self._buffers[table] = []
+
+    def _order_times(self, day: date) -> List[datetime]:
+        weight = WEEKDAY_WEIGHTS[day.weekday()]
+        count = max(0, int(self.rng.gauss(self.orders_per_day * weight, self.orders_per_day * weight * 0.15)))
+        hours = SUNDAY_HOURS if day.weekday() == 6 else WEEKDAY_HOURS
+        hour_values = [h for h, _ in hours]
+        hour_weights = [w for _, w in hours]
+
+        times = []
+        for hour in self.rng.choices(hour_values, weights=hour_weights, k=count):
+            times.append(datetime.combine(day, datetime.min.time()) + timedelta(
+                hours=hour, seconds=self.rng.randint(0, 3599)
+            ))
+        return sorted(times)
+
+    def generate(self) -> dict:
+        """Generate the full history and return row counts"""
+        menus = self.ensure_catalog()
+        cell_ids = self.create_cells()
+        balances = {cell_id: 0 for cell_id in cell_ids}
+
+        order_pk = self._next_id(Order)
+        item_pk = self._next_id(OrderItem)
+        option_pk = self._next_id(OrderItemOption)
+        txn_pk = self._next_id(PointTransaction)
+
+        start_date = self.end_date - timedelta(days=self.days - 1)
+        statuses = [OrderStatus.COMPLETED, OrderStatus.CANCELLED]
+
+        for day_offset in range(self.days):
+            day = start_date + timedelta(days=day_offset)
+
+            # 주일마다 셀 포인트 충전 (보너스 10%)
+            if day.weekday() == 6:
+                for cell_id in cell_ids:
+                    if balances[cell_id] < 30_000 and self.rng.random() < 0.7:
+                        amount = self.rng.choice([30_000, 50_000, 100_000])
+                        amount += amount // 10
+                        balances[cell_id] += amount
+                        charged_at = datetime.combine(day, datetime.min.time()) + timedelta(hours=9)
+                        self._emit("point_transactions", (
+                            txn_pk, cell_id, TransactionType.CHARGE, amount, balances[cell_id],
+                            None, "정기 충전", None, charged_at
+                        ))
+                        txn_pk += 1
+
+            for daily_idx, created_at in enumerate(self._order_times(day)):
+                lines = []
+                total = 0
+                for _ in range(max(1, min(6, int(self.rng.expovariate(0.8)) + 1))):
+                    menu = self.rng.choices(menus, weights=self.menu_weights, k=1)[0]
+                    options = []
+                    for group in menu["option_groups"]:
+                        if group["type"] == OptionType.SINGLE:
+                            options.append((group["name"],) + self.rng.choice(group["items"]))
+                        elif self.rng.random() < 0.25:
+                            options.append((group["name"],) + self.rng.choice(group["items"]))
+                    quantity = 1 if self.rng.random() < 0.8 else self.rng.randint(2, 4)
+                    line_total = (menu["price"] + sum(o[2] for o in options)) * quantity
+                    total += line_total
+                    lines.append((menu, options, quantity, line_total))
+
+                cell_id = None
+                if cell_ids and self.rng.random() < 0.35:
+                    candidate = self.rng.choice(cell_ids)
+                    if balances[candidate] >= total:
+                        cell_id = candidate
+
+                status = self.rng.choices(statuses, weights=[97, 3], k=1)[0]
+                if (self.end_date - day).days == 0 and self.rng.random() < 0.1:
+                    status = self.rng.choice([OrderStatus.PENDING, OrderStatus.MAKING])
+
+                finished_at = created_at + timedelta(seconds=self.rng.randint(120, 900))
+                # A third of the time waiting in the queue, the rest at the bar
+                started_at = created_at + (finished_at - created_at) / 3
+                order_code = "ORD-{}-{}".format(
+                    int(created_at.timestamp() * 1000),
+                    "".join(self.rng.choices(string.ascii_lowercase + string.digits, k=6))
+                )
+                self._emit("orders", (
+                    order_pk, order_code, daily_idx % 12 + 1,
+                    PayType.CELL if cell_id else PayType.PERSONAL, cell_id, total, status,
+                    created_at, finished_at if status in statuses else created_at,
+                    started_at if status in (OrderStatus.MAKING, OrderStatus.COMPLETED) else None,
+                    finished_at if status == OrderStatus.COMPLETED else None,
+                    finished_at if status == OrderStatus.CANCELLED else None,
+                ))
+
+                for menu, options, quantity, line_total in lines:
+                    self._emit("order_items", (
+                        item_pk, order_pk, menu["id"], menu["name"], menu["price"], quantity, line_total, created_at
+                    ))
+                    for group_name, option_name, option_price in options:
+                        self._emit("order_item_options", (
+                            option_pk, item_pk, group_name, option_name, option_price, created_at
+                        ))
+                        option_pk += 1
+                    item_pk += 1
+
+                if cell_id:
+                    balances[cell_id] -= total
+                    self._emit("point_transactions", (
+                        txn_pk, cell_id, TransactionType.USE, -total, balances[cell_id],
+                        order_pk, None, None, created_at
+                    ))
+                    txn_pk += 1
+                    if status == OrderStatus.CANCELLED:
+                        balances[cell_id] += total
+                        self._emit("point_transactions", (
+                            txn_pk, cell_id, TransactionType.REFUND, total, balances[cell_id],
+                            order_pk, "주문 취소 환불", None, finished_at
+                        ))
+                        txn_pk += 1
+
+                order_pk += 1
+
+        self.flush()
+
+        # 셀 잔액을 마지막 거래 후 잔액과 맞춤
+        for cell_id, balance in balances.items():
+            self.conn.execute(Cell.__table__.update().where(Cell.id == cell_id).values(balance=balance))
+
+        if self.is_postgres:
+            for table in ("orders", "order_items", "order_item_options", "point_transactions"):
+                self.conn.execute(text(
+                    f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE(MAX(id), 1)) FROM {table}"
+                ))
+
+        return dict(self.counts, cells=len(cell_ids))
+
+
+def main(argv: Optional[Iterable[str]] = None) -> dict:
+    parser = argparse.ArgumentParser(description="P.M CAFE 대용량 합성 데이터 생성")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"), help="DB URL (기본: DATABASE_URL)")
+    parser.add_argument("--days", type=int, default=365, help="생성할 기간 (일)")
+    parser.add_argument("--orders-per-day", type=int, default=120, help="주일 기준 하루 주문 수")
+    parser.add_argument("--cells", type=int, default=40, help="생성할 셀 수")
+    parser.add_argument("--end-date", default=None, help="마지막 날짜 (YYYY-MM-DD, 기본: 오늘)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--chunk-size", type=int, default=20_000, help="청크당 행 수")
+    parser.add_argument("--create-tables", action="store_true", help="테이블이 없으면 생성 (마이그레이션 대신)")
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    if not args.database_url:
+        parser.error("--database-url 또는 DATABASE_URL 환경변수가 필요합니다")
+
+    end_date = datetime.strptime(args.end_date, "%Y-%m-%d").date() if args.end_date else None
+    engine = create_engine(args.database_url)
+    if args.create_tables:
+        Base.metadata.create_all(bind=engine)
+
+    print(f"Generating {args.days} days of data (seed={args.seed})...")
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        counts = DataGenerator(
+            conn,
+            seed=args.seed,
+            days=args.days,
+            orders_per_day=args.orders_per_day,
+            cell_count=args.cells,
+            end_date=end_date,
+            chunk_size=args.chunk_size
+        ).generate()
+    elapsed = time.perf_counter() - started
+    engine.dispose()
+
+    total_rows = sum(counts.values())
+    for table, count in counts.items():
+        print(f"  ✅ {table}: {count:,} rows")
+    print(f"Done: {total_rows:,} rows in {elapsed:.1f}s ({total_rows / max(elapsed, 1e-9):,.0f} rows/s)")
+    return counts
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+"""
+인덱스 어드바이저
+
+라우터/서비스의 주요 쿼리 형태를 생성 데이터(scripts/generate_data.py) 위에서 EXPLAIN하고,
+모델에 선언된 복합/부분 인덱스가 있을 때와 없을 때(기존 단일 컬럼 인덱스)의 실행 계획을 비교합니다.
+PostgreSQL에서는 EXPLAIN ANALYZE로 비용과 실행 시간을, SQLite에서는 EXPLAIN QUERY PLAN으로
+풀 스캔 여부만 비교합니다.
+
+기본 동작은 비교 후 DB의 인덱스 상태를 원래대로 되돌립니다. --apply를 주면 모델에 선언된
+인덱스를 남기고 대체된 단일 컬럼 인덱스를 삭제합니다 (운영 DB는 alembic upgrade 사용 권장).
+
+Usage:
+    python scripts/generate_data.py --database-url sqlite:///scale.db --create-tables --days 365
+    python scripts/index_advisor.py --database-url sqlite:///scale.db
+    python scripts/index_advisor.py --json reports/index_advisor.json
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import Index, create_engine, func, inspect, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import Select
+
+from app.database import Base
+from app.models import Order, OrderItem, OrderItemOption, PointTransaction, OrderStatus, PayType
+
+# Indexes added for the query shapes below (see migration f3c8a1d6b254)
+ADVISED_INDEXES = (
+    "idx_orders_status_created_at",
+    "idx_orders_pay_type_created_at",
+    "idx_orders_cell_id_created_at",
+    "idx_orders_active",
+    "idx_order_items_order_id",
+    "idx_order_item_options_order_item_id",
+    "idx_point_transactions_cell_id_created_at",
+    "idx_point_transactions_order_id",
+)
+
+# Single-column indexes they replace
+LEGACY_INDEXES = (
+    Index("idx_orders_status", Order.__table__.c.status),
+    Index("idx_point_transactions_cell_id", PointTransaction.__table__.c.cell_id),
+)
+
+SEQ_SCAN_PATTERNS = (
+    re.compile(r"Seq Scan on (\w+)"),            # PostgreSQL
+    re.compile(r"^SCAN (\w+)\b(?! USING)"),      # SQLite (SCAN t USING INDEX is an index scan)
+)
+INDEX_PATTERNS = (
+    re.compile(r"Index (?:Only )?Scan (?:Backward )?using (\w+)"),  # PostgreSQL
+    re.compile(r"Bitmap Index Scan on (\w+)"),                     # PostgreSQL
+    re.compile(r"USING (?:COVERING )?INDEX (\w+)"),                 # SQLite
+)
+SORT_PATTERNS = (
+    re.compile(r"^Sort\b"),                 # PostgreSQL
+    re.compile(r"^USE TEMP B-TREE FOR"),    # SQLite
+)
+
+
+def _samples(conn: Connection) -> dict:
+    """Realistic parameter values taken from the data"""
+    latest = conn.execute(select(func.max(Order.created_at))).scalar() or datetime.now()
+    if isinstance(latest, str):
+        latest = datetime.fromisoformat(latest)
+    order_ids = conn.execute(select(Order.id).order_by(Order.id.desc()).limit(100)).scalars().all()
+    item_ids = conn.execute(
+        select(OrderItem.id).where(OrderItem.order_id.in_(order_ids or [0]))
+    ).scalars().all()
+    cell_id = conn.execute(
+        select(PointTransaction.cell_id).group_by(PointTransaction.cell_id)
+        .order_by(func.count().desc()).limit(1)
+    ).scalar()
+    order_id = conn.execute(
+        select(PointTransaction.order_id).where(PointTransaction.order_id.isnot(None))
+        .order_by(PointTransaction.id.desc()).limit(1)
+    ).scalar()
+    return {
+        "now": latest,
+        "order_ids": order_ids or [0],
+        "item_ids": item_ids or [0],
+        "cell_id": cell_id or 0,
+        "order_id": order_id or 0,
+    }
+
+
+# name -> statement builder; mirrors the queries issued by the routers/services
+QUERY_SHAPES: Dict[str, Callable[[dict], Select]] = {
+    "orders.list_by_status": lambda s: select(Order).where(
+        Order.status == OrderStatus.PENDING
+    ).order_by(Order.created_at.desc()).limit(100),
+    "orders.list_by_pay_type": lambda s: select(Order).where(
+        Order.pay_type == PayType.CELL
+    ).order_by(Order.created_at.desc()).limit(100),
+    "orders.active": lambda s: select(Order).where(
+        Order.status.in_([OrderStatus.PENDING, OrderStatus.MAKING])
+    ).order_by(Order.created_at, Order.id),
+    "orders.items": lambda s: select(OrderItem).where(OrderItem.order_id.in_(s["order_ids"])),
+    "orders.item_options": lambda s: select(OrderItemOption).where(
+        OrderItemOption.order_item_id.in_(s["item_ids"])
+    ),
+    "orders.by_cell": lambda s: select(Order).where(
+        Order.cell_id == s["cell_id"]
+    ).order_by(Order.created_at.desc()).limit(50),
+    "cells.transactions": lambda s: select(PointTransaction).where(
+        PointTransaction.cell_id == s["cell_id"]
+    ).order_by(PointTransaction.created_at.desc()).limit(50),
+    "cells.transactions_by_order": lambda s: select(PointTransaction).where(
+        PointTransaction.order_id == s["order_id"]
+    ),
+    "ledger.balance_at": lambda s: select(PointTransaction.balance_after).where(
+        PointTransaction.cell_id == s["cell_id"],
+        PointTransaction.created_at < s["now"]
+    ).order_by(PointTransaction.created_at.desc(), PointTransaction.id.desc()).limit(1),
+    "statistics.daily": lambda s: select(
+        func.date(Order.created_at), func.count(Order.id), func.sum(Order.total_amount)
+    ).where(
+        Order.created_at >= s["now"] - timedelta(days=30),
+        Order.created_at < s["now"]
+    ).group_by(func.date(Order.created_at)),
+    "statistics.menus": lambda s: select(
+        OrderItem.menu_name, func.sum(OrderItem.quantity), func.sum(OrderItem.total_price)
+    ).join(Order).where(
+        Order.created_at >= s["now"] - timedelta(days=30),
+        Order.created_at < s["now"]
+    ).group_by(OrderItem.menu_name),
+}
+
+
+def explain(conn: Connection, stmt: Select, analyze: bool = False) -> List[str]:
+    """Plan lines for a statement (EXPLAIN [ANALYZE] on PostgreSQL, EXPLAIN QUERY PLAN on SQLite)"""
+    sql = str(stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+    dialect = conn.dialect.name
+    if dialect == "postgresql":
+        prefix = "EXPLAIN (ANALYZE, BUFFERS) " if analyze else "EXPLAIN "
+        return [row[0] for row in conn.exec_driver_sql(prefix + sql)]
+    if dialect == "sqlite":
+        return [row[-1] for row in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + sql)]
+    raise NotImplementedError(f"EXPLAIN is not supported for dialect '{dialect}'")
+
+
+def _plan_nodes(plan: Iterable[str]) -> List[str]:
+    return [line.strip().lstrip("->").strip() for line in plan]
+
+
+def _matches(plan: Iterable[str], patterns) -> List[str]:
+    found = []
+    for line in _plan_nodes(plan):
+        for pattern in patterns:
+            match = pattern.search(line)
+            if match and match.group(1) not in found:
+                found.append(match.group(1))
+    return found
+
+
+def seq_scans(plan: Iterable[str]) -> List[str]:
+    """Tables read with a full (sequential) scan in a plan"""
+    return _matches(plan, SEQ_SCAN_PATTERNS)
+
+
+def indexes_used(plan: Iterable[str]) -> List[str]:
+    """Indexes a plan reads"""
+    return _matches(plan, INDEX_PATTERNS)
+
+
+def sort_steps(plan: Iterable[str]) -> int:
+    """Explicit sort steps (PostgreSQL Sort nodes, SQLite temp B-trees)"""
+    return sum(1 for line in _plan_nodes(plan) if any(p.search(line) for p in SORT_PATTERNS))
+
+
+def _plan_metrics(plan: List[str]) -> dict:
+    metrics = {
+        "seqScans": seq_scans(plan),
+        "indexes": indexes_used(plan),
+        "sorts": sort_steps(plan),
+        "cost": None,
+        "timeMs": None
+    }
+    if plan:
+        cost = re.search(r"cost=[\d.]+\.\.([\d.]+)", plan[0])
+        if cost:
+            metrics["cost"] = float(cost.group(1))
+    for line in plan:
+        time_ms = re.search(r"Execution Time: ([\d.]+) ms", line)
+        if time_ms:
+            metrics["timeMs"] = float(time_ms.group(1))
+    return metrics
+
+
+def _index_names(conn: Connection, table: str) -> set:
+    return {index["name"] for index in inspect(conn).get_indexes(table)}
+
+
+def _model_index(name: str) -> Index:
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            if index.name == name:
+                return index
+    raise KeyError(name)
+
+
+def _managed_indexes() -> Dict[str, Index]:
+    indexes = {name: _model_index(name) for name in ADVISED_INDEXES}
+    indexes.update({index.name: index for index in LEGACY_INDEXES})
+    return indexes
+
+
+def _ensure(conn: Connection, wanted: Dict[str, bool]) -> None:
+    """Create/drop managed indexes so that each one exists iff wanted[name]"""
+    indexes = _managed_indexes()
+    for name, present in wanted.items():
+        index = indexes[name]
+        exists = name in _index_names(conn, index.table.name)
+        if present and not exists:
+            index.create(bind=conn)
+        elif not present and exists:
+            index.drop(bind=conn)
+
+
+def _set_state(conn: Connection, advised: bool) -> None:
+    """Switch between the legacy indexes (advised=False) and the advised ones, then refresh statistics"""
+    wanted = {name: advised for name in ADVISED_INDEXES}
+    wanted.update({index.name: not advised for index in LEGACY_INDEXES})
+    _ensure(conn, wanted)
+    conn.exec_driver_sql("ANALYZE")
+
+
+def _measure(conn: Connection, samples: dict, analyze: bool) -> Dict[str, dict]:
+    return {
+        name: _plan_metrics(explain(conn, build(samples), analyze=analyze))
+        for name, build in QUERY_SHAPES.items()
+    }
+
+
+def advise(conn: Connection, apply: bool = False, analyze: bool = True) -> Dict[str, dict]:
+    """
+    Compare plans with the legacy indexes vs the advised indexes
+
+    Returns:
+        shape -> {"before": metrics, "after": metrics}
+        metrics = {"seqScans", "indexes", "sorts", "cost", "timeMs"}
+    """
+    original = {
+        name: name in _index_names(conn, index.table.name) for name, index in _managed_indexes().items()
+    }
+    samples = _samples(conn)
+
+    try:
+        _set_state(conn, advised=False)
+        before = _measure(conn, samples, analyze)
+        _set_state(conn, advised=True)
+        after = _measure(conn, samples, analyze)
+    finally:
+        if not apply:
+            _ensure(conn, original)
+
+    return {name: {"before": before[name], "after": after[name]} for name in QUERY_SHAPES}
+
+
+def improved_plan(before: dict, after: dict) -> bool:
+    """Fewer full scans or sorts, or (PostgreSQL) a cheaper plan"""
+    if len(after["seqScans"]) != len(before["seqScans"]):
+        return len(after["seqScans"]) < len(before["seqScans"])
+    if after["sorts"] != before["sorts"]:
+        return after["sorts"] < before["sorts"]
+    return before["cost"] is not None and after["cost"] is not None and after["cost"] < before["cost"]
+
+
+def _format(metrics: dict) -> str:
+    parts = [
+        "seq scan: " + (", ".join(metrics["seqScans"]) or "-"),
+        "index: " + (", ".join(metrics["indexes"]) or "-"),
+        f"sorts: {metrics['sorts']}"
+    ]
+    if metrics["cost"] is not None:
+        parts.append(f"cost {metrics['cost']:.1f}")
+    if metrics["timeMs"] is not None:
+        parts.append(f"{metrics['timeMs']:.2f} ms")
+    return " / ".join(parts)
+
+
+def main(argv: Optional[Iterable[str]] = None) -> dict:
+    parser = argparse.ArgumentParser(description="P.M CAFE 인덱스 어드바이저")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"), help="DB URL (기본: DATABASE_URL)")
+    parser.add_argument("--apply", action="store_true", help="권장 인덱스를 남기고 대체된 인덱스 삭제")
+    parser.add_argument("--no-analyze", action="store_true", help="EXPLAIN만 실행 (PostgreSQL에서 쿼리를 실행하지 않음)")
+    parser.add_argument("--json", default=None, help="결과를 JSON 파일로 저장")
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    if not args.database_url:
+        parser.error("--database-url 또는 DATABASE_URL 환경변수가 필요합니다")
+
+    engine = create_engine(args.database_url)
+    with engine.begin() as conn:
+        report = advise(conn, apply=args.apply, analyze=not args.no_analyze)
+    engine.dispose()
+
+    improved = 0
+    for name, result in report.items():
+        before, after = result["before"], result["after"]
+        better = improved_plan(before, after)
+        improved += better
+        print(f"{'✅' if better else '  '} {name}")
+        print(f"     before: {_format(before)}")
+        print(f"     after:  {_format(after)}")
+    print(f"\n{improved}/{len(report)} query shapes improved" + (" (indexes applied)" if args.apply else ""))
+
+    if args.json:
+        os.makedirs(os.path.dirname(os.path.abspath(args.json)), exist_ok=True)
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,17 @@
 """
 초기 데이터 삽입 스크립트
 
+관리자 계정을 만들고 카탈로그 파일(scripts/catalog.yaml)을 DB에 반영합니다.
+카탈로그는 한 트랜잭션 안에서 변경된 행만 INSERT ... ON CONFLICT로 반영하므로
+여러 번 실행해도 안전합니다.
+
 Usage:
     python scripts/init_data.py
+    python scripts/init_data.py --catalog my_catalog.json --dry-run
+    python scripts/init_data.py --prune   # 카탈로그에 없는 메뉴/카테고리 비활성화
 """
 
+import argparse
 import sys
 import os
 
@@ -13,11 +20,12 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from sqlalchemy.orm import Session
 import bcrypt
-from app.database import SessionLocal
-from app.models import (
-    User, UserRole, Category, OptionGroup, OptionItem,
-    OptionType, SystemSetting
-)
+from app.database import SessionLocal, DATABASE_URL
+from app.invalidation import invalidation_bus, channel_for
+from app.models import User, UserRole
+from app.services.catalog_service import CatalogService
+
+DEFAULT_CATALOG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "catalog.yaml")
 
 
 def init_admin_user(db: Session):
@@ -45,151 +53,44 @@ def init_admin_user(db: Session):
     print("  ✅ Admin user created (username: admin, password: admin123)")
 
 
-def init_categories(db: Session):
-    """카테고리 초기 데이터"""
-    print("Creating categories...")
-
-    categories_data = [
-        {"code": "COFFEE", "name": "커피", "display_order": 1},
-        {"code": "NON_COFFEE", "name": "논커피", "display_order": 2},
-        {"code": "DESSERT", "name": "디저트", "display_order": 3},
-        {"code": "SEASONAL", "name": "시즌메뉴", "display_order": 4},
-    ]
-
-    for cat_data in categories_data:
-        existing = db.query(Category).filter(Category.code == cat_data["code"]).first()
-        if existing:
-            print(f"  ⚠️  Category '{cat_data['name']}' already exists, skipping...")
-            continue
-
-        category = Category(**cat_data)
-        db.add(category)
-        print(f"  ✅ Created category: {cat_data['name']}")
+def init_catalog(db: Session, path: str, prune: bool = False, dry_run: bool = False):
+    """카탈로그 파일 반영"""
+    print(f"Applying catalog: {path}" + (" (dry run)" if dry_run else ""))
 
-    db.commit()
-
-
-def init_option_groups(db: Session):
-    """옵션 그룹 및 항목 초기 데이터"""
-    print("Creating option groups and items...")
+    service = CatalogService()
+    report = service.apply(db, service.load_file(path), prune=prune, dry_run=dry_run)
 
-    # 1. 온도 선택
-    temp_group = db.query(OptionGroup).filter(OptionGroup.name == "온도 선택").first()
-    if not temp_group:
-        temp_group = OptionGroup(
-            name="온도 선택",
-            icon="🌡️",
-            type=OptionType.SINGLE,
-            is_required=True,
-            display_order=1
-        )
-        db.add(temp_group)
-        db.flush()  # ID 생성을 위해 flush
-
-        # 온도 옵션 항목
-        temp_items = [
-            {"name": "HOT", "price": 0, "is_default": True, "display_order": 1},
-            {"name": "ICE", "price": 0, "is_default": False, "display_order": 2},
-        ]
-        for item_data in temp_items:
-            item = OptionItem(option_group_id=temp_group.id, **item_data)
-            db.add(item)
-
-        print("  ✅ Created option group: 온도 선택")
-    else:
-        print("  ⚠️  Option group '온도 선택' already exists, skipping...")
-
-    # 2. 사이즈 선택
-    size_group = db.query(OptionGroup).filter(OptionGroup.name == "사이즈 선택").first()
-    if not size_group:
-        size_group = OptionGroup(
-            name="사이즈 선택",
-            icon="📏",
-            type=OptionType.SINGLE,
-            is_required=True,
-            display_order=2
-        )
-        db.add(size_group)
-        db.flush()
-
-        # 사이즈 옵션 항목
-        size_items = [
-            {"name": "R (Regular)", "price": 0, "is_default": True, "display_order": 1},
-            {"name": "L (Large)", "price": 500, "is_default": False, "display_order": 2},
-        ]
-        for item_data in size_items:
-            item = OptionItem(option_group_id=size_group.id, **item_data)
-            db.add(item)
-
-        print("  ✅ Created option group: 사이즈 선택")
-    else:
-        print("  ⚠️  Option group '사이즈 선택' already exists, skipping...")
-
-    # 3. 추가 옵션
-    extra_group = db.query(OptionGroup).filter(OptionGroup.name == "추가 옵션").first()
-    if not extra_group:
-        extra_group = OptionGroup(
-            name="추가 옵션",
-            icon="➕",
-            type=OptionType.MULTIPLE,
-            is_required=False,
-            display_order=3
+    for table, counts in report.items():
+        print(
+            f"  {table:<20} created={counts['created']} updated={counts['updated']} "
+            f"unchanged={counts['unchanged']} removed={counts['removed']}"
         )
-        db.add(extra_group)
-        db.flush()
-
-        # 추가 옵션 항목
-        extra_items = [
-            {"name": "샷 추가", "price": 500, "is_default": False, "display_order": 1},
-            {"name": "시럽 추가", "price": 500, "is_default": False, "display_order": 2},
-            {"name": "휘핑크림 추가", "price": 500, "is_default": False, "display_order": 3},
-        ]
-        for item_data in extra_items:
-            item = OptionItem(option_group_id=extra_group.id, **item_data)
-            db.add(item)
-
-        print("  ✅ Created option group: 추가 옵션")
-    else:
-        print("  ⚠️  Option group '추가 옵션' already exists, skipping...")
 
-    db.commit()
-
-
-def init_system_settings(db: Session):
-    """시스템 설정 초기 데이터"""
-    print("Creating system settings...")
 
-    settings_data = [
-        {"key": "next_order_number", "value": "1", "description": "다음 주문 번호 (1-12)"},
-        {"key": "bonus_rate", "value": "10", "description": "포인트 충전 보너스율 (%)"},
-        {"key": "is_kiosk_active", "value": "true", "description": "키오스크 활성화 여부"},
-    ]
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="P.M CAFE 초기 데이터 삽입")
+    parser.add_argument("--catalog", default=DEFAULT_CATALOG, help="카탈로그 파일 (YAML 또는 JSON)")
+    parser.add_argument("--prune", action="store_true", help="카탈로그에 없는 카테고리/메뉴 비활성화, 옵션 항목 삭제")
+    parser.add_argument("--dry-run", action="store_true", help="변경 내역만 출력하고 롤백")
+    return parser.parse_args(argv)
 
-    for setting_data in settings_data:
-        existing = db.query(SystemSetting).filter(SystemSetting.key == setting_data["key"]).first()
-        if existing:
-            print(f"  ⚠️  Setting '{setting_data['key']}' already exists, skipping...")
-            continue
 
-        setting = SystemSetting(**setting_data)
-        db.add(setting)
-        print(f"  ✅ Created setting: {setting_data['key']}")
-
-    db.commit()
-
-
-def main():
+def main(argv=None):
     """메인 함수"""
+    args = parse_args(argv)
+
     print("\n" + "="*60)
     print("P.M CAFE - 초기 데이터 삽입 스크립트")
     print("="*60 + "\n")
 
+    # 실행 중인 API 워커의 카탈로그/설정 캐시 무효화 (PostgreSQL NOTIFY)
+    invalidation_bus.use(channel_for(DATABASE_URL), listen=False)
+
     db = SessionLocal()
     try:
-        init_admin_user(db)
-        init_categories(db)
-        init_option_groups(db)
-        init_system_settings(db)
+        if not args.dry_run:
+            init_admin_user(db)
+        init_catalog(db, args.catalog, prune=args.prune, dry_run=args.dry_run)
 
         print("\n" + "="*60)
         print("✅ 초기 데이터 삽입 완료!")
@@ -0,0 +1,74 @@
+"""
+셀 포인트 원장 작업 스크립트 (cron 등으로 매일 실행)
+
+snapshot:  어제(또는 --date)까지 빠진 날짜의 셀별 마감 잔액 스냅샷 생성
+reconcile: 셀 잔액과 거래 내역의 정합성 검사 (불일치가 있으면 종료 코드 1)
+
+Usage:
+    python scripts/ledger.py snapshot
+    python scripts/ledger.py snapshot --date 2026-10-18
+    python scripts/ledger.py reconcile
+"""
+
+import argparse
+import sys
+import os
+from datetime import date, datetime, timedelta
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import SessionLocal
+from app.services.ledger_service import LedgerService
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="P.M CAFE 셀 포인트 원장 작업")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    snapshot = subparsers.add_parser("snapshot", help="일별 잔액 스냅샷 생성 (빠진 날짜 포함)")
+    snapshot.add_argument(
+        "--date",
+        type=lambda value: datetime.strptime(value, "%Y-%m-%d").date(),
+        default=None,
+        help="이 날짜까지 생성 (YYYY-MM-DD, 기본: 어제)"
+    )
+
+    subparsers.add_parser("reconcile", help="셀 잔액 정합성 검사")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """메인 함수"""
+    args = parse_args(argv)
+    service = LedgerService()
+
+    db = SessionLocal()
+    try:
+        if args.command == "snapshot":
+            until = args.date or date.today() - timedelta(days=1)
+            written = service.snapshot_through(db, until)
+            for day, rows in written:
+                print(f"  {day.isoformat()}  {rows} cells")
+            print(f"✅ {len(written)} day(s) snapshotted through {until.isoformat()}")
+            return 0
+
+        drifts = service.reconcile(db)
+        if not drifts:
+            print("✅ All cell balances match the ledger")
+            return 0
+
+        print(f"❌ {len(drifts)} cell(s) drifted from the ledger")
+        for drift in drifts:
+            print(
+                f"  cell {drift['cellId']} ({drift['cellName']}): balance={drift['balance']} "
+                f"ledgerSum={drift['ledgerSum']} lastBalanceAfter={drift['lastBalanceAfter']} "
+                f"chainBreaks={drift['chainBreaks']}"
+            )
+        return 1
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""
+판매 일별 집계 스크립트 (cron 등으로 매일 실행)
+
+어제(또는 --date)까지 빠진 날짜의 집계를 생성합니다.
+- menu_daily_sales: 메뉴별 판매 (메뉴/카테고리 통계)
+- order_time_buckets: 15분 단위 주문 (시간대별 통계, 히트맵)
+
+Usage:
+    python scripts/sales_rollup.py
+    python scripts/sales_rollup.py --date 2026-10-18
+"""
+
+import argparse
+import sys
+import os
+from datetime import date, datetime, timedelta
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import SessionLocal
+from app.services.statistics_service import StatisticsService
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="P.M CAFE 판매 일별 집계")
+    parser.add_argument(
+        "--date",
+        type=lambda value: datetime.strptime(value, "%Y-%m-%d").date(),
+        default=None,
+        help="이 날짜까지 집계 (YYYY-MM-DD, 기본: 어제)"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """메인 함수"""
+    args = parse_args(argv)
+    until = args.date or date.today() - timedelta(days=1)
+
+    db = SessionLocal()
+    try:
+        service = StatisticsService()
+        for name, rollup in [
+            ("menus", service.rollup_through),
+            ("time buckets", service.rollup_time_buckets_through),
+        ]:
+            written = rollup(db, until)
+            for day, rows in written:
+                print(f"  {day.isoformat()}  {rows} {name}")
+            print(f"✅ {name}: {len(written)} day(s) rolled up through {until.isoformat()}")
+        return 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
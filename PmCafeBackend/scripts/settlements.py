@@ -0,0 +1,52 @@
+"""
+일별 정산 생성 스크립트 (cron 등으로 매일 실행)
+
+어제(또는 --date)까지 빠진 날짜의 정산을 한 번의 집계 쿼리로 생성하고,
+계산 이후 주문이 취소된 미확정 정산을 다시 계산합니다.
+확정된 정산은 변경하지 않습니다.
+
+Usage:
+    python scripts/settlements.py
+    python scripts/settlements.py --date 2026-10-18
+    python scripts/settlements.py --since 2026-10-01   # 기간 재계산
+"""
+
+import argparse
+import sys
+import os
+from datetime import date, datetime, timedelta
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import SessionLocal
+from app.services.settlement_service import SettlementService
+
+
+def _date(value: str) -> date:
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="P.M CAFE 일별 정산 생성")
+    parser.add_argument("--date", type=_date, default=None, help="이 날짜까지 생성 (YYYY-MM-DD, 기본: 어제)")
+    parser.add_argument("--since", type=_date, default=None, help="이 날짜부터 다시 계산 (YYYY-MM-DD, 기본: 정산이 없는 주문 날짜만)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """메인 함수"""
+    args = parse_args(argv)
+    until = args.date or date.today() - timedelta(days=1)
+
+    db = SessionLocal()
+    try:
+        built = SettlementService().build_through(db, until, since=args.since)
+        print(f"✅ settlements: {built} day(s) calculated through {until.isoformat()}")
+        return 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
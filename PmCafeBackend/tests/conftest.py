@@ -1,15 +1,30 @@
 """
 pytest configuration and fixtures
 """
+import os
+import tempfile
+from contextlib import contextmanager
+
+# Tests drain the outbox themselves (app.outbox.outbox.drain) instead of a relay thread
+os.environ.setdefault("OUTBOX_RELAY", "false")
+# Uploaded images go to a scratch directory, not ./media
+os.environ.setdefault("MEDIA_ROOT", tempfile.mkdtemp(prefix="pmcafe-media-"))
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
 from app.database import Base, get_db
 from app.models import *  # Import all models
+from app.services.dashboard_service import dashboard_aggregate
+from app.services.kitchen_queue import active_orders
+from app.services.order_metrics import order_metrics
+from app.services.settlement_service import settlement_details
+from app.services.settings_service import settings_cache
+from app.services.catalog_cache import catalog_cache
 
 # Test database (in-memory SQLite)
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
@@ -32,6 +47,9 @@ def db_session():
     finally:
         db.close()
         Base.metadata.drop_all(bind=engine)
+        # Cached settings and catalog belong to this database
+        settings_cache.reset()
+        catalog_cache.reset()
 
 
 @pytest.fixture(scope="function")
@@ -48,6 +66,33 @@ def client(db_session):
         yield test_client
     app.dependency_overrides.clear()
 
+    # In-memory projections must not leak between test databases
+    dashboard_aggregate.reset()
+    active_orders.reset()
+    order_metrics.reset()
+    settlement_details.reset()
+
+
+@contextmanager
+def record_sql(bind):
+    """Record (statement, parameters) for every statement sent through an engine"""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(bind, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(bind, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def capture_sql(db_session):
+    """Context manager factory recording the SQL sent to the test database (or another engine)"""
+    return lambda bind=None: record_sql(bind if bind is not None else db_session.get_bind())
+
 
 @pytest.fixture
 def sample_admin_user(db_session):
@@ -68,6 +113,14 @@ def sample_admin_user(db_session):
     return admin
 
 
+@pytest.fixture
+def admin_headers(client, sample_admin_user):
+    """Authorization headers for the sample admin user"""
+    response = client.post("/api/v1/auth/login", json={"username": "admin", "password": "admin123"})
+    token = response.json()["data"]["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
 @pytest.fixture
 def sample_categories(db_session):
     """Create sample categories"""
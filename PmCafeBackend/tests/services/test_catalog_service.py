@@ -0,0 +1,165 @@
+"""
+Unit tests for CatalogService
+"""
+import json
+import os
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.services.catalog_service import CatalogService
+from app.schemas.catalog import CatalogFile
+from app.models.menu import Category, Menu, MenuOptionGroup, OptionItem
+from app.models.settlement import SystemSetting
+from app.exceptions import ValidationError
+
+CATALOG_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "scripts", "catalog.yaml")
+
+
+@pytest.fixture
+def catalog():
+    return CatalogService().load_file(CATALOG_PATH)
+
+
+@pytest.fixture
+def statements(db_session: Session):
+    """Collect SQL statements executed while the test runs"""
+    collected = []
+
+    def record(conn, cursor, statement, *args):
+        collected.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    yield collected
+    event.remove(engine, "before_cursor_execute", record)
+
+
+class TestCatalogServiceApply:
+    """Test applying a catalog"""
+
+    def test_apply_creates_catalog(self, db_session: Session, catalog: CatalogFile):
+        """Test loading the default catalog into an empty database"""
+        report = CatalogService().apply(db_session, catalog)
+
+        assert report["categories"]["created"] == len(catalog.categories)
+        assert report["menus"]["created"] == len(catalog.menus)
+        assert db_session.query(Menu).count() == len(catalog.menus)
+        assert db_session.query(OptionItem).count() == 7
+
+        americano = db_session.query(Menu).filter(Menu.name == "아메리카노").one()
+        assert americano.category.code == "COFFEE"
+        assert [link.option_group.name for link in americano.option_groups] == ["온도 선택", "사이즈 선택", "추가 옵션"]
+
+    def test_apply_is_idempotent(self, db_session: Session, catalog: CatalogFile, statements):
+        """Test re-applying the same catalog writes nothing"""
+        service = CatalogService()
+        service.apply(db_session, catalog)
+
+        statements.clear()
+        report = service.apply(db_session, catalog)
+
+        for counts in report.values():
+            assert counts["created"] == counts["updated"] == counts["removed"] == 0
+        assert not [s for s in statements if not s.lstrip().upper().startswith("SELECT")]
+
+    def test_apply_diff_updates_changed_rows(self, db_session: Session, catalog: CatalogFile):
+        """Test only changed rows are updated and runtime state is kept"""
+        service = CatalogService()
+        service.apply(db_session, catalog)
+
+        latte = db_session.query(Menu).filter(Menu.name == "카페라떼").one()
+        latte.is_sold_out = True
+        setting = db_session.query(SystemSetting).filter(SystemSetting.key == "next_order_number").one()
+        setting.value = "7"
+        db_session.commit()
+
+        catalog.menus[1].price = 2800
+        catalog.menus[1].option_groups = ["온도 선택"]
+        report = service.apply(db_session, catalog)
+
+        assert report["menus"]["updated"] == 1
+        assert report["menus"]["unchanged"] == len(catalog.menus) - 1
+        assert report["menu_option_groups"]["removed"] == 2
+        assert report["settings"]["unchanged"] == 3
+
+        db_session.expire_all()
+        latte = db_session.query(Menu).filter(Menu.name == "카페라떼").one()
+        assert latte.price == 2800
+        assert latte.is_sold_out is True
+        assert db_session.query(MenuOptionGroup).filter(MenuOptionGroup.menu_id == latte.id).count() == 1
+        assert db_session.query(SystemSetting).filter(SystemSetting.key == "next_order_number").one().value == "7"
+
+    def test_apply_prune(self, db_session: Session, catalog: CatalogFile):
+        """Test prune deactivates menus and deletes option items missing from the catalog"""
+        service = CatalogService()
+        service.apply(db_session, catalog)
+
+        catalog.menus = [m for m in catalog.menus if m.name != "쿠키"]
+        catalog.option_groups[2].items = catalog.option_groups[2].items[:1]
+        report = service.apply(db_session, catalog, prune=True)
+
+        assert report["menus"]["removed"] == 1
+        assert report["option_items"]["removed"] == 2
+        assert db_session.query(Menu).filter(Menu.name == "쿠키").one().is_active is False
+        assert db_session.query(OptionItem).count() == 5
+
+    def test_apply_dry_run_rolls_back(self, db_session: Session, catalog: CatalogFile):
+        """Test dry run reports changes without writing"""
+        report = CatalogService().apply(db_session, catalog, dry_run=True)
+
+        assert report["menus"]["created"] == len(catalog.menus)
+        assert db_session.query(Category).count() == 0
+        assert db_session.query(Menu).count() == 0
+
+    def test_apply_bulk_menu_single_statement_per_table(self, db_session: Session, catalog: CatalogFile, statements):
+        """Test hundreds of menus are written with one INSERT"""
+        catalog.menus = [
+            catalog.menus[0].model_copy(update={"name": f"메뉴 {i}", "price": 1000 + i})
+            for i in range(300)
+        ]
+        report = CatalogService().apply(db_session, catalog)
+
+        assert report["menus"]["created"] == 300
+        assert db_session.query(Menu).count() == 300
+        assert len([s for s in statements if s.lstrip().upper().startswith("INSERT INTO MENUS")]) == 1
+
+    def test_apply_unknown_category_rolls_back(self, db_session: Session, catalog: CatalogFile):
+        """Test an unknown category reference aborts the whole load"""
+        catalog.menus[0].category = "UNKNOWN"
+
+        with pytest.raises(ValidationError):
+            CatalogService().apply(db_session, catalog)
+
+        assert db_session.query(Category).count() == 0
+
+
+class TestCatalogServiceLoadFile:
+    """Test catalog file parsing"""
+
+    def test_load_json_file(self, tmp_path):
+        """Test JSON catalogs are accepted"""
+        path = tmp_path / "catalog.json"
+        path.write_text(json.dumps({
+            "categories": [{"code": "COFFEE", "name": "커피"}],
+            "menus": [{"name": "아메리카노", "price": 2000, "category": "COFFEE"}],
+        }), encoding="utf-8")
+
+        catalog = CatalogService().load_file(str(path))
+
+        assert catalog.menus[0].name == "아메리카노"
+
+    def test_load_file_duplicate_menu(self, tmp_path):
+        """Test duplicate natural keys are rejected"""
+        path = tmp_path / "catalog.json"
+        path.write_text(json.dumps({
+            "categories": [{"code": "COFFEE", "name": "커피"}],
+            "menus": [
+                {"name": "아메리카노", "price": 2000, "category": "COFFEE"},
+                {"name": "아메리카노", "price": 2500, "category": "COFFEE"},
+            ],
+        }), encoding="utf-8")
+
+        with pytest.raises(ValidationError):
+            CatalogService().load_file(str(path))
@@ -0,0 +1,171 @@
+"""
+Unit tests for the live dashboard aggregate
+"""
+import asyncio
+import json
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.events import EventBus
+from app.services.order_service import OrderService
+from app.services.dashboard_service import DashboardAggregate, dashboard_aggregate
+from app.routers.statistics import dashboard_event_stream, stream_dashboard_statistics
+from app.schemas.order import CreateOrderRequest, OrderItemRequest
+from app.models.order import OrderStatus
+
+
+def _order_request(menu, pay_type="PERSONAL", cell_id=None, quantity=1):
+    return CreateOrderRequest(
+        payType=pay_type,
+        cellId=cell_id,
+        items=[OrderItemRequest(menuId=menu.id, menuName=menu.name, menuPrice=menu.price, quantity=quantity)],
+        totalAmount=menu.price * quantity
+    )
+
+
+def _service_with(aggregate: DashboardAggregate) -> OrderService:
+    bus = EventBus()
+    bus.subscribe(aggregate.handle_event)
+    return OrderService(events=bus)
+
+
+class TestDashboardAggregate:
+    """Test incremental dashboard counters"""
+
+    def test_load_matches_existing_orders(self, db_session: Session, test_order):
+        """Test the initial load counts today's orders"""
+        aggregate = DashboardAggregate()
+        aggregate.ensure_loaded(db_session)
+
+        snapshot = aggregate.snapshot()
+        assert snapshot["totalOrders"] == 1
+        assert snapshot["totalRevenue"] == test_order.total_amount
+        assert snapshot["pendingOrders"] == 1
+
+    def test_events_update_counters(self, db_session: Session, test_menu, test_cell):
+        """Test order events are applied without querying the database"""
+        aggregate = DashboardAggregate()
+        aggregate.ensure_loaded(db_session)
+        service = _service_with(aggregate)
+
+        order = service.create_order(db_session, _order_request(test_menu, quantity=2))
+        service.create_order(db_session, _order_request(test_menu, "CELL", test_cell.id))
+        service.update_order_status(db_session, order.order_id, OrderStatus.MAKING)
+        service.update_order_status(db_session, order.order_id, OrderStatus.COMPLETED)
+
+        snapshot = aggregate.snapshot()
+        assert snapshot["totalOrders"] == 2
+        assert snapshot["totalRevenue"] == test_menu.price * 3
+        assert snapshot["personalOrders"] == 1
+        assert snapshot["personalRevenue"] == test_menu.price * 2
+        assert snapshot["cellOrders"] == 1
+        assert snapshot["pendingOrders"] == 1
+        assert snapshot["makingOrders"] == 0
+        assert snapshot["completedOrders"] == 1
+
+    def test_events_ignored_until_loaded(self, db_session: Session, test_menu):
+        """Test no aggregate is maintained while no dashboard is connected"""
+        aggregate = DashboardAggregate()
+        _service_with(aggregate).create_order(db_session, _order_request(test_menu))
+
+        assert aggregate.loaded is False
+
+        aggregate.ensure_loaded(db_session)
+        assert aggregate.snapshot()["totalOrders"] == 1
+
+    def test_duplicate_events_counted_once(self, db_session: Session, test_menu):
+        """Test an order already counted by the load is not counted again by its event"""
+        aggregate = DashboardAggregate()
+        bus = EventBus()
+        captured = []
+        bus.subscribe(lambda event, data: captured.append((event, data)))
+
+        OrderService(events=bus).create_order(db_session, _order_request(test_menu))
+        aggregate.ensure_loaded(db_session)
+        for event, data in captured:
+            aggregate.handle_event(event, data)
+
+        assert aggregate.snapshot()["totalOrders"] == 1
+
+
+class _FakeRequest:
+    def __init__(self):
+        self.disconnected = False
+
+    async def is_disconnected(self):
+        return self.disconnected
+
+
+class TestDashboardStream:
+    """Test the Server-Sent Events generator"""
+
+    def test_stream_sends_snapshot_then_deltas(self, db_session: Session, test_menu):
+        """Test subscribers receive a snapshot then a delta per order event"""
+        aggregate = DashboardAggregate()
+        aggregate.ensure_loaded(db_session)
+        service = _service_with(aggregate)
+
+        async def run():
+            request = _FakeRequest()
+            stream = dashboard_event_stream(request, aggregate, heartbeat=0.05)
+
+            first = await stream.__anext__()
+            service.create_order(db_session, _order_request(test_menu))
+            second = await stream.__anext__()
+
+            assert aggregate.subscriber_count == 1
+            request.disconnected = True
+            await stream.aclose()
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert first.startswith("event: snapshot\n")
+        assert json.loads(first.split("data: ", 1)[1])["totalOrders"] == 0
+        assert second.startswith("event: delta\n")
+        delta = json.loads(second.split("data: ", 1)[1])["delta"]
+        assert delta == {
+            "totalOrders": 1, "totalRevenue": test_menu.price,
+            "personalOrders": 1, "personalRevenue": test_menu.price, "pendingOrders": 1
+        }
+        assert aggregate.subscriber_count == 0
+
+    def test_stream_heartbeat(self, db_session: Session):
+        """Test idle streams send keep-alive comments"""
+        aggregate = DashboardAggregate()
+        aggregate.ensure_loaded(db_session)
+
+        async def run():
+            stream = dashboard_event_stream(_FakeRequest(), aggregate, heartbeat=0.01)
+            await stream.__anext__()
+            message = await stream.__anext__()
+            await stream.aclose()
+            return message
+
+        assert asyncio.run(run()) == ": keep-alive\n\n"
+
+    def test_stream_route_releases_connection(self, db_session: Session):
+        """Test the route checks its pooled connection back in before streaming"""
+        checked_out = []
+
+        def on_checkout(*args):
+            checked_out.append(1)
+
+        def on_checkin(*args):
+            checked_out.pop()
+
+        engine = db_session.get_bind()
+        event.listen(engine, "checkout", on_checkout)
+        event.listen(engine, "checkin", on_checkin)
+        try:
+            response = stream_dashboard_statistics(_FakeRequest(), current_user=None, db=db_session)
+
+            assert response.media_type == "text/event-stream"
+            assert dashboard_aggregate.snapshot()["totalOrders"] == 0
+            assert not db_session.in_transaction()
+            assert checked_out == []
+        finally:
+            event.remove(engine, "checkout", on_checkout)
+            event.remove(engine, "checkin", on_checkin)
+            dashboard_aggregate.reset()
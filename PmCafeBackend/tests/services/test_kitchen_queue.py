@@ -0,0 +1,101 @@
+"""
+Unit tests for the active order projection
+"""
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.events import EventBus
+from app.services.order_service import OrderService
+from app.services.kitchen_queue import ActiveOrderProjection
+from app.schemas.order import CreateOrderRequest, OrderItemRequest
+from app.models.order import Order, OrderStatus
+
+
+def _order_request(menu):
+    return CreateOrderRequest(
+        payType="PERSONAL",
+        items=[OrderItemRequest(menuId=menu.id, menuName=menu.name, menuPrice=menu.price, quantity=1)],
+        totalAmount=menu.price
+    )
+
+
+def _service_with(projection: ActiveOrderProjection) -> OrderService:
+    bus = EventBus()
+    bus.subscribe(projection.handle_event)
+    return OrderService(events=bus)
+
+
+class TestActiveOrderProjection:
+    """Test the in-memory kitchen queue"""
+
+    def test_load_only_active_orders(self, db_session: Session, test_menu):
+        """Test completed and cancelled orders are not loaded"""
+        service = OrderService(events=EventBus())
+        orders = [service.create_order(db_session, _order_request(test_menu)) for _ in range(4)]
+        service.update_order_status(db_session, orders[0].order_id, OrderStatus.MAKING)
+        service.update_order_status(db_session, orders[0].order_id, OrderStatus.COMPLETED)
+        service.update_order_status(db_session, orders[1].order_id, OrderStatus.CANCELLED)
+        service.update_order_status(db_session, orders[2].order_id, OrderStatus.MAKING)
+
+        projection = ActiveOrderProjection()
+        projection.ensure_loaded(db_session)
+
+        assert [(o["orderId"], o["status"]) for o in projection.list()] == [
+            (orders[2].order_id, "MAKING"),
+            (orders[3].order_id, "PENDING"),
+        ]
+
+    def test_reads_do_not_query(self, db_session: Session, test_menu):
+        """Test reads after the first load are served from memory"""
+        projection = ActiveOrderProjection()
+        projection.ensure_loaded(db_session)
+        service = _service_with(projection)
+        order = service.create_order(db_session, _order_request(test_menu))
+
+        statements = []
+        engine = db_session.get_bind()
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            projection.ensure_loaded(db_session)
+            orders = projection.list()
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert statements == []
+        assert [o["orderId"] for o in orders] == [order.order_id]
+
+    def test_events_maintain_queue(self, db_session: Session, test_menu):
+        """Test created orders are added and finished orders removed"""
+        projection = ActiveOrderProjection()
+        projection.ensure_loaded(db_session)
+        service = _service_with(projection)
+
+        first = service.create_order(db_session, _order_request(test_menu))
+        second = service.create_order(db_session, _order_request(test_menu))
+        service.update_order_status(db_session, first.order_id, OrderStatus.MAKING)
+        service.update_order_status(db_session, second.order_id, OrderStatus.CANCELLED)
+
+        assert [(o["orderId"], o["status"]) for o in projection.list()] == [(first.order_id, "MAKING")]
+
+        service.update_order_status(db_session, first.order_id, OrderStatus.COMPLETED)
+        assert projection.list() == []
+
+    def test_unknown_order_reactivated_triggers_reload(self, db_session: Session, test_menu):
+        """Test an order re-entering the queue without its data forces a reload"""
+        projection = ActiveOrderProjection()
+        service = OrderService(events=EventBus())
+        order = service.create_order(db_session, _order_request(test_menu))
+        service.update_order_status(db_session, order.order_id, OrderStatus.CANCELLED)
+        projection.ensure_loaded(db_session)
+
+        db_session.query(Order).filter(Order.order_id == order.order_id).update({"status": OrderStatus.PENDING})
+        db_session.commit()
+        projection.handle_event("order:status_changed", {"orderId": order.order_id, "status": "PENDING"})
+
+        assert projection.loaded is False
+        projection.ensure_loaded(db_session)
+        assert [o["orderId"] for o in projection.list()] == [order.order_id]
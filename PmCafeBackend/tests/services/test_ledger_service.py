@@ -0,0 +1,172 @@
+"""
+Unit tests for LedgerService (balance snapshots and reconciliation)
+"""
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.services.ledger_service import LedgerService
+from app.models.cell import Cell
+from app.models.transaction import PointTransaction, TransactionType, CellBalanceSnapshot
+from app.exceptions import CellNotFoundError
+
+DAY = date(2026, 3, 1)
+
+
+@pytest.fixture
+def ledger_cell(db_session: Session):
+    """Cell with a consistent ledger over three days (balance 12000)
+
+    Mar 1: charge 10000, use 3000 -> 7000
+    Mar 2: (no activity)
+    Mar 3: charge 5000, use 1000, refund 1000 -> 12000
+    """
+    cell = Cell(name="원장셀", leader="리더", phone_last4="4321", balance=0)
+    db_session.add(cell)
+    db_session.commit()
+
+    balance = 0
+    for day_offset, hour, tx_type, amount in [
+        (0, 9, TransactionType.CHARGE, 10000),
+        (0, 11, TransactionType.USE, -3000),
+        (2, 10, TransactionType.CHARGE, 5000),
+        (2, 12, TransactionType.USE, -1000),
+        (2, 13, TransactionType.REFUND, 1000),
+    ]:
+        balance += amount
+        db_session.add(PointTransaction(
+            cell_id=cell.id, type=tx_type, amount=amount, balance_after=balance,
+            created_at=datetime.combine(DAY + timedelta(days=day_offset), datetime.min.time()) + timedelta(hours=hour)
+        ))
+    cell.balance = balance
+    db_session.commit()
+    return cell
+
+
+class TestSnapshots:
+    """Test daily snapshot creation"""
+
+    def test_snapshot_through_backfills_each_day(self, db_session: Session, ledger_cell):
+        """Test days are snapshotted from the first ledger day, carrying quiet days forward"""
+        written = LedgerService().snapshot_through(db_session, DAY + timedelta(days=2))
+
+        assert [day for day, _ in written] == [DAY, DAY + timedelta(days=1), DAY + timedelta(days=2)]
+        snapshots = db_session.query(CellBalanceSnapshot).order_by(CellBalanceSnapshot.snapshot_date).all()
+        assert [(s.balance, s.charged, s.used, s.refunded, s.transaction_count) for s in snapshots] == [
+            (7000, 10000, 3000, 0, 2),
+            (7000, 0, 0, 0, 0),
+            (12000, 5000, 1000, 1000, 3),
+        ]
+
+    def test_snapshot_through_is_incremental(self, db_session: Session, ledger_cell):
+        """Test a second run only adds missing days"""
+        service = LedgerService()
+        service.snapshot_through(db_session, DAY)
+
+        assert [day for day, _ in service.snapshot_through(db_session, DAY + timedelta(days=2))] == [
+            DAY + timedelta(days=1), DAY + timedelta(days=2)
+        ]
+        assert service.snapshot_through(db_session, DAY + timedelta(days=2)) == []
+
+    def test_take_snapshots_rewrites_day(self, db_session: Session, ledger_cell):
+        """Test re-taking a day updates the row in place"""
+        service = LedgerService()
+        service.take_snapshots(db_session, DAY)
+        service.take_snapshots(db_session, DAY)
+
+        assert db_session.query(CellBalanceSnapshot).count() == 1
+
+
+class TestBalanceQueries:
+    """Test balance-at-date and monthly statements"""
+
+    def test_balance_at_with_and_without_snapshots(self, db_session: Session, ledger_cell):
+        """Test balance_at gives the same answers from snapshots and from the ledger"""
+        service = LedgerService()
+        days = [DAY - timedelta(days=1), DAY, DAY + timedelta(days=1), DAY + timedelta(days=2), DAY + timedelta(days=5)]
+        expected = [0, 7000, 7000, 12000, 12000]
+
+        assert [service.balance_at(db_session, ledger_cell.id, d) for d in days] == expected
+
+        service.snapshot_through(db_session, DAY + timedelta(days=1))
+        assert [service.balance_at(db_session, ledger_cell.id, d) for d in days] == expected
+
+    def test_balance_at_follows_ledger_order(self, db_session: Session, ledger_cell):
+        """Test the last transaction is the highest id, as in snapshots, even with skewed created_at"""
+        db_session.add(PointTransaction(
+            cell_id=ledger_cell.id, type=TransactionType.CHARGE, amount=500, balance_after=7500,
+            created_at=datetime.combine(DAY, datetime.min.time()) + timedelta(hours=10)
+        ))
+        db_session.commit()
+        service = LedgerService()
+
+        assert service.balance_at(db_session, ledger_cell.id, DAY) == 7500
+        service.take_snapshots(db_session, DAY)
+        assert db_session.query(CellBalanceSnapshot.balance).scalar() == 7500
+
+    def test_balance_at_unknown_cell(self, db_session: Session):
+        """Test unknown cells raise CellNotFoundError"""
+        with pytest.raises(CellNotFoundError):
+            LedgerService().balance_at(db_session, 9999, DAY)
+
+    def test_monthly_statement(self, db_session: Session, ledger_cell):
+        """Test statement totals agree whether days are snapshotted or not"""
+        service = LedgerService()
+        expected = {
+            "cellId": ledger_cell.id, "month": "2026-03",
+            "openingBalance": 0, "closingBalance": 12000,
+            "charged": 15000, "used": 4000, "refunded": 1000, "transactionCount": 5
+        }
+
+        assert service.monthly_statement(db_session, ledger_cell.id, 2026, 3) == expected
+
+        service.snapshot_through(db_session, DAY + timedelta(days=1))  # Mar 3 left to the ledger
+        assert service.monthly_statement(db_session, ledger_cell.id, 2026, 3) == expected
+
+        statement = service.monthly_statement(db_session, ledger_cell.id, 2026, 4)
+        assert statement["openingBalance"] == statement["closingBalance"] == 12000
+        assert statement["transactionCount"] == 0
+
+
+class TestReconcile:
+    """Test ledger reconciliation"""
+
+    def test_consistent_ledger(self, db_session: Session, ledger_cell):
+        """Test a consistent ledger reports no drift"""
+        assert LedgerService().reconcile(db_session) == []
+
+    def test_balance_drift(self, db_session: Session, ledger_cell):
+        """Test a balance changed outside the ledger is reported"""
+        ledger_cell.balance += 500
+        db_session.commit()
+
+        drifts = LedgerService().reconcile(db_session)
+
+        assert drifts == [{
+            "cellId": ledger_cell.id, "cellName": "원장셀", "balance": 12500,
+            "ledgerSum": 12000, "lastBalanceAfter": 12000, "transactionCount": 5, "chainBreaks": 0
+        }]
+
+    def test_lost_update_breaks_chain(self, db_session: Session, ledger_cell):
+        """Test a transaction written from a stale balance is detected"""
+        # Two concurrent charges both read 12000: the second balance_after should have been 14000
+        db_session.add_all([
+            PointTransaction(cell_id=ledger_cell.id, type=TransactionType.CHARGE, amount=1000, balance_after=13000),
+            PointTransaction(cell_id=ledger_cell.id, type=TransactionType.CHARGE, amount=1000, balance_after=13000),
+        ])
+        ledger_cell.balance = 13000
+        db_session.commit()
+
+        drifts = LedgerService().reconcile(db_session)
+
+        assert len(drifts) == 1
+        assert drifts[0]["ledgerSum"] == 14000
+        assert drifts[0]["chainBreaks"] == 1
+
+    def test_cell_without_transactions(self, db_session: Session, test_cell):
+        """Test a cell with balance but no ledger rows is reported"""
+        drifts = LedgerService().reconcile(db_session)
+
+        assert [d["cellId"] for d in drifts] == [test_cell.id]
+        assert drifts[0]["lastBalanceAfter"] is None
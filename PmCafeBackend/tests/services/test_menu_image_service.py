@@ -0,0 +1,91 @@
+"""
+Unit tests for MenuImageService
+"""
+import io
+import os
+
+import pytest
+from PIL import Image
+from sqlalchemy.orm import Session
+
+from app.services.menu_image_service import MenuImageService, image_variants
+from app.exceptions import MenuNotFoundError, InvalidImageError, ImageTooLargeError
+
+
+def _image_bytes(size=(1200, 900), mode="RGB", fmt="PNG", color=(200, 120, 40)):
+    buffer = io.BytesIO()
+    Image.new(mode, size, color).save(buffer, fmt)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def service(tmp_path):
+    return MenuImageService(root=str(tmp_path), base_url="/media", max_bytes=1024 * 1024)
+
+
+def _open(service, url):
+    return Image.open(os.path.join(service.root, url[len("/media/"):]))
+
+
+class TestMenuImageStore:
+    """Test originals and variants on disk"""
+
+    def test_variants_resized_in_both_formats(self, service):
+        """Test the grid/detail files fit their size in WebP and JPEG, and the original is kept"""
+        url = service.store(_image_bytes())
+        variants = image_variants(url, "/media")
+
+        assert url == variants["detail"]["jpeg"]
+        for name, longest in (("grid", 320), ("detail", 800)):
+            webp = _open(service, variants[name]["webp"])
+            jpeg = _open(service, variants[name]["jpeg"])
+            assert (webp.format, jpeg.format) == ("WEBP", "JPEG")
+            assert max(webp.size) == max(jpeg.size) == longest
+        assert len(os.listdir(os.path.join(service.root, "menus", "originals"))) == 1
+
+    def test_small_image_not_upscaled(self, service):
+        url = service.store(_image_bytes(size=(200, 100)))
+        assert _open(service, image_variants(url, "/media")["detail"]["webp"]).size == (200, 100)
+
+    def test_names_follow_content(self, service):
+        """Test the same bytes give the same URLs and different bytes new ones"""
+        first = service.store(_image_bytes())
+
+        assert service.store(_image_bytes()) == first
+        assert service.store(_image_bytes(color=(0, 0, 0))) != first
+
+    def test_transparent_png_to_jpeg(self, service):
+        """Test alpha is flattened onto white for JPEG"""
+        url = service.store(_image_bytes(size=(400, 400), mode="RGBA", color=(0, 0, 0, 0)))
+        assert _open(service, url).convert("RGB").getpixel((10, 10)) == (255, 255, 255)
+
+    def test_rejects_non_images_and_large_files(self, service):
+        with pytest.raises(InvalidImageError):
+            service.store(b"not an image")
+        with pytest.raises(InvalidImageError):
+            service.store(_image_bytes(fmt="GIF", mode="P", color=1))
+        with pytest.raises(ImageTooLargeError):
+            service.store(b"\0" * (service.max_bytes + 1))
+
+
+class TestMenuImageVariants:
+    """Test variant URLs derived from image_url"""
+
+    def test_external_url_has_no_variants(self):
+        assert image_variants("https://example.com/menus/0123456789abcdef-800.jpg", "/media") is None
+        assert image_variants(None, "/media") is None
+
+
+class TestMenuImageUpload:
+    """Test attaching images to menus"""
+
+    def test_upload_sets_image_url(self, db_session: Session, service, test_menu):
+        menu = service.upload(db_session, test_menu.id, _image_bytes())
+
+        assert image_variants(menu.image_url, "/media") is not None
+
+        assert service.remove(db_session, test_menu.id).image_url is None
+
+    def test_upload_unknown_menu(self, db_session: Session, service):
+        with pytest.raises(MenuNotFoundError):
+            service.upload(db_session, 99999, _image_bytes())
@@ -0,0 +1,154 @@
+"""
+Unit tests for MenuService
+"""
+import pytest
+from sqlalchemy.orm import Session
+
+from app.events import EventBus, MENU_SOLD_OUT_CHANGED
+from app.services.menu_service import MenuService
+from app.schemas.menu import MenuCreateRequest, MenuBulkUpdateItem, MenuReorderItem
+from app.models.menu import Menu, MenuOptionGroup
+from app.exceptions import (
+    MenuNotFoundError,
+    CategoryNotFoundError,
+    OptionGroupNotFoundError,
+    DuplicateResourceError
+)
+
+
+class TestMenuServiceBulkCreate:
+    """Test bulk menu creation"""
+
+    def test_bulk_create_success(self, db_session: Session, sample_categories, sample_option_groups):
+        """Test creating many menus with option groups"""
+        service = MenuService()
+        group_id = sample_option_groups[0].id
+
+        menus = service.bulk_create(db_session, [
+            MenuCreateRequest(name=f"시즌 음료 {i}", price=3000 + i, category_id=sample_categories[3].id,
+                              option_group_ids=[group_id])
+            for i in range(50)
+        ])
+
+        assert len(menus) == 50
+        assert all(menu.id is not None for menu in menus)
+        assert db_session.query(Menu).count() == 50
+        assert db_session.query(MenuOptionGroup).count() == 50
+
+    def test_bulk_create_unknown_option_group_writes_nothing(self, db_session: Session, sample_categories):
+        """Test one invalid reference rejects the whole batch"""
+        service = MenuService()
+
+        with pytest.raises(OptionGroupNotFoundError):
+            service.bulk_create(db_session, [
+                MenuCreateRequest(name="아메리카노", price=2000, category_id=sample_categories[0].id),
+                MenuCreateRequest(name="라떼", price=2500, category_id=sample_categories[0].id,
+                                  option_group_ids=[9999]),
+            ])
+
+        db_session.rollback()
+        assert db_session.query(Menu).count() == 0
+
+    def test_bulk_create_unknown_category(self, db_session: Session, sample_categories):
+        """Test unknown category is rejected"""
+        with pytest.raises(CategoryNotFoundError):
+            MenuService().bulk_create(db_session, [
+                MenuCreateRequest(name="아메리카노", price=2000, category_id=9999),
+            ])
+
+    def test_bulk_create_duplicate_name(self, db_session: Session, sample_categories, test_menu):
+        """Test names already taken are rejected"""
+        with pytest.raises(DuplicateResourceError):
+            MenuService().bulk_create(db_session, [
+                MenuCreateRequest(name=test_menu.name, price=2000, category_id=sample_categories[0].id),
+            ])
+
+
+class TestMenuServiceBulkUpdate:
+    """Test bulk menu update"""
+
+    def test_bulk_update_fields_and_option_groups(self, db_session: Session, sample_categories,
+                                                  sample_option_groups, test_menu):
+        """Test only provided fields change and option groups are replaced"""
+        service = MenuService()
+        other = Menu(name="카페라떼", price=2500, category_id=sample_categories[0].id)
+        db_session.add(other)
+        db_session.commit()
+
+        service.bulk_update(db_session, [
+            MenuBulkUpdateItem(id=test_menu.id, price=2200, option_group_ids=[sample_option_groups[0].id]),
+            MenuBulkUpdateItem(id=other.id, category_id=sample_categories[1].id),
+        ])
+
+        db_session.expire_all()
+        assert test_menu.price == 2200
+        assert test_menu.name == "아메리카노"
+        assert [link.option_group_id for link in test_menu.option_groups] == [sample_option_groups[0].id]
+        assert other.category_id == sample_categories[1].id
+        assert other.price == 2500
+
+    def test_bulk_update_missing_menu(self, db_session: Session, test_menu):
+        """Test unknown menu ID is rejected"""
+        with pytest.raises(MenuNotFoundError):
+            MenuService().bulk_update(db_session, [
+                MenuBulkUpdateItem(id=test_menu.id, price=100),
+                MenuBulkUpdateItem(id=9999, price=100),
+            ])
+
+    def test_bulk_update_name_taken(self, db_session: Session, sample_categories, test_menu):
+        """Test renaming onto another menu's name is rejected"""
+        other = Menu(name="카페라떼", price=2500, category_id=sample_categories[0].id)
+        db_session.add(other)
+        db_session.commit()
+
+        with pytest.raises(DuplicateResourceError):
+            MenuService().bulk_update(db_session, [MenuBulkUpdateItem(id=other.id, name=test_menu.name)])
+
+
+class TestMenuServiceBulkFlags:
+    """Test reorder and sold-out toggling"""
+
+    def test_reorder(self, db_session: Session, sample_categories):
+        """Test display orders are set in one statement"""
+        menus = [Menu(name=f"메뉴 {i}", price=1000, category_id=sample_categories[0].id) for i in range(3)]
+        db_session.add_all(menus)
+        db_session.commit()
+
+        updated = MenuService().reorder(db_session, [
+            MenuReorderItem(id=menu.id, display_order=10 - i) for i, menu in enumerate(menus)
+        ])
+
+        db_session.expire_all()
+        assert updated == 3
+        assert [menu.display_order for menu in menus] == [10, 9, 8]
+
+    def test_set_sold_out(self, db_session: Session, sample_categories, test_menu):
+        """Test sold-out is toggled for all given menus"""
+        other = Menu(name="카페라떼", price=2500, category_id=sample_categories[0].id)
+        db_session.add(other)
+        db_session.commit()
+
+        updated = MenuService().set_sold_out(db_session, [test_menu.id, other.id], True)
+
+        db_session.expire_all()
+        assert updated == 2
+        assert test_menu.is_sold_out is True
+        assert other.is_sold_out is True
+
+    def test_set_sold_out_publishes_events(self, db_session: Session, test_menu):
+        """Test a menu:sold_out_changed event is published per menu after the commit"""
+        bus = EventBus()
+        events = []
+        bus.subscribe(lambda event, data: events.append((event, data["menuId"], data["menuName"], data["isSoldOut"])))
+
+        MenuService(events=bus).set_sold_out(db_session, [test_menu.id], True)
+
+        assert events == [(MENU_SOLD_OUT_CHANGED, test_menu.id, "아메리카노", True)]
+
+    def test_set_sold_out_missing_menu(self, db_session: Session, test_menu):
+        """Test unknown menu ID is rejected without changes"""
+        with pytest.raises(MenuNotFoundError):
+            MenuService().set_sold_out(db_session, [test_menu.id, 9999], True)
+
+        db_session.expire_all()
+        assert test_menu.is_sold_out is False
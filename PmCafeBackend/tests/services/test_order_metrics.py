@@ -0,0 +1,102 @@
+"""
+Unit tests for the live order metrics (sliding window)
+"""
+from sqlalchemy.orm import Session
+
+from app.events import EventBus, ORDER_CREATED, ORDER_STATUS_CHANGED
+from app.services.order_service import OrderService
+from app.services.kitchen_queue import ActiveOrderProjection
+from app.services.order_metrics import OrderMetrics
+from app.schemas.order import CreateOrderRequest, OrderItemRequest
+from app.models.order import Order, OrderStatus
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _order_request(menu):
+    return CreateOrderRequest(
+        payType="PERSONAL",
+        items=[OrderItemRequest(menuId=menu.id, menuName=menu.name, menuPrice=menu.price, quantity=1)],
+        totalAmount=menu.price
+    )
+
+
+def _status_changed(status, created, started=None, completed=None):
+    return {
+        "orderId": "ORD-1", "status": status,
+        "createdAt": created, "makingStartedAt": started, "completedAt": completed
+    }
+
+
+class TestOrderMetrics:
+    """Test queue depth, rates and rolling averages"""
+
+    def test_waits_and_prep_times(self):
+        """Test averages come from the event timestamps"""
+        metrics = OrderMetrics(queue=ActiveOrderProjection(), clock=FakeClock())
+        metrics.handle_event(ORDER_STATUS_CHANGED, _status_changed(
+            "MAKING", "2026-03-01T10:00:00", started="2026-03-01T10:02:00"
+        ))
+        metrics.handle_event(ORDER_STATUS_CHANGED, _status_changed(
+            "MAKING", "2026-03-01T10:00:00", started="2026-03-01T10:04:00"
+        ))
+        metrics.handle_event(ORDER_STATUS_CHANGED, _status_changed(
+            "COMPLETED", "2026-03-01T10:00:00", started="2026-03-01T10:02:00", completed="2026-03-01T10:07:00"
+        ))
+        # Started before the column existed: counted, but no prep sample
+        metrics.handle_event(ORDER_STATUS_CHANGED, _status_changed(
+            "COMPLETED", "2026-03-01T10:00:00", completed="2026-03-01T10:07:00"
+        ))
+
+        snapshot = metrics.snapshot()
+        assert snapshot["avgWaitSeconds"] == 180
+        assert snapshot["avgPrepSeconds"] == 300
+        assert snapshot["completedPerMinute"] == 2.0  # window younger than a minute counts as one minute
+
+    def test_window_slides(self):
+        """Test samples older than the window are dropped and rates use the elapsed window"""
+        clock = FakeClock()
+        metrics = OrderMetrics(queue=ActiveOrderProjection(), window_seconds=600, clock=clock)
+        for _ in range(4):
+            metrics.handle_event(ORDER_CREATED, {"orderId": "ORD-1", "status": "PENDING"})
+
+        clock.now += 120
+        assert metrics.snapshot()["ordersPerMinute"] == 2.0
+
+        clock.now += 300
+        metrics.handle_event(ORDER_CREATED, {"orderId": "ORD-2", "status": "PENDING"})
+        clock.now += 300  # first four fall out of the 10-minute window
+        snapshot = metrics.snapshot()
+        assert snapshot["ordersPerMinute"] == 0.1
+        assert snapshot["avgWaitSeconds"] is None
+
+    def test_queue_depth_and_timestamps_from_service(self, db_session: Session, test_menu):
+        """Test real transitions record making_started_at and feed the metrics without queries"""
+        projection = ActiveOrderProjection()
+        metrics = OrderMetrics(queue=projection)
+        bus = EventBus()
+        bus.subscribe(projection.handle_event)
+        bus.subscribe(metrics.handle_event)
+        service = OrderService(events=bus)
+        metrics.ensure_loaded(db_session)
+
+        orders = [service.create_order(db_session, _order_request(test_menu)) for _ in range(3)]
+        service.update_order_status(db_session, orders[0].order_id, OrderStatus.MAKING)
+        service.update_order_status(db_session, orders[0].order_id, OrderStatus.COMPLETED)
+        service.update_order_status(db_session, orders[1].order_id, OrderStatus.MAKING)
+
+        done = db_session.query(Order).filter(Order.order_id == orders[0].order_id).one()
+        assert done.making_started_at is not None
+        assert done.completed_at >= done.making_started_at
+
+        snapshot = metrics.snapshot()
+        assert (snapshot["pendingOrders"], snapshot["makingOrders"], snapshot["queueDepth"]) == (1, 1, 2)
+        assert snapshot["ordersPerMinute"] == 3.0
+        assert snapshot["avgWaitSeconds"] is not None
+        assert snapshot["avgPrepSeconds"] is not None
@@ -1,18 +1,23 @@
 """
 Unit tests for OrderService
 """
+from datetime import datetime, timedelta
+
 import pytest
 from sqlalchemy.orm import Session
 
 from app.services.order_service import OrderService
-from app.schemas.order import CreateOrderRequest, OrderItemRequest, OrderItemOptionGroup
-from app.models.order import OrderStatus, PayType
+from app.schemas.order import CreateOrderRequest, OrderItemRequest, OrderItemOptionGroup, QueuedOrderRequest
+from app.models.order import Order, OrderStatus, PayType
 from app.models.cell import Cell
+from app.models.outbox import OutboxEvent
 from app.exceptions import (
     MissingCellIdError,
     CellNotFoundError,
     InsufficientBalanceError,
-    OrderNotFoundError
+    OrderNotFoundError,
+    InvalidOrderStatusTransitionError,
+    OrderConflictError
 )
 
 
@@ -200,6 +205,114 @@ class TestOrderServiceCreate:
         assert exc_info.value.required == test_menu.price
 
 
+class TestOrderServiceQueuedCreate:
+    """Test batch creation of offline-queued orders"""
+
+    def _queued(self, menu, key, minutes, pay_type="PERSONAL", cell_id=None, menu_id=None):
+        return QueuedOrderRequest(
+            payType=pay_type,
+            cellId=cell_id,
+            items=[OrderItemRequest(menuId=menu_id or menu.id, menuName=menu.name,
+                                    menuPrice=menu.price, quantity=1)],
+            totalAmount=menu.price,
+            idempotencyKey=key,
+            clientCreatedAt=datetime(2026, 10, 19, 9, 0) + timedelta(minutes=minutes)
+        )
+
+    def test_created_in_client_order(self, db_session: Session, test_menu):
+        """Test orders get daily numbers in the order they were taken, results in request order"""
+        service = OrderService()
+        results = service.create_orders(db_session, [
+            self._queued(test_menu, "k-late", 5),
+            self._queued(test_menu, "k-early", 1)
+        ])
+
+        assert [r["idempotencyKey"] for r in results] == ["k-late", "k-early"]
+        assert all(r["success"] and not r["duplicate"] for r in results)
+        assert [r["order"]["dailyNum"] for r in results] == [2, 1]
+
+        order = db_session.query(Order).filter(Order.idempotency_key == "k-early").one()
+        assert order.order_id == results[1]["order"]["orderId"]
+        assert order.client_created_at.replace(tzinfo=None) == datetime(2026, 10, 19, 9, 1)
+        assert db_session.query(OutboxEvent).count() == 2
+
+    def test_resend_returns_existing_orders(self, db_session: Session, test_menu):
+        """Test a resent batch creates nothing and returns the orders created the first time"""
+        service = OrderService()
+        batch = [self._queued(test_menu, "k-1", 1), self._queued(test_menu, "k-2", 2)]
+        first = service.create_orders(db_session, batch)
+
+        again = service.create_orders(db_session, batch)
+
+        assert [r["duplicate"] for r in again] == [True, True]
+        assert [r["order"]["orderId"] for r in again] == [r["order"]["orderId"] for r in first]
+        assert db_session.query(Order).count() == 2
+        assert db_session.query(OutboxEvent).count() == 2
+
+    def test_repeated_key_in_batch_creates_once(self, db_session: Session, test_menu):
+        """Test a key repeated within one batch is created once"""
+        results = OrderService().create_orders(db_session, [
+            self._queued(test_menu, "k-1", 1), self._queued(test_menu, "k-1", 1)
+        ])
+
+        assert [r["duplicate"] for r in results] == [False, True]
+        assert results[0]["order"] == results[1]["order"]
+        assert db_session.query(Order).count() == 1
+
+    def test_failed_orders_do_not_block_batch(self, db_session: Session, test_menu, test_cell):
+        """Test per-order failures (cumulative cell balance, unknown menu) while the rest is created"""
+        test_cell.balance = test_menu.price * 2 - 1
+        db_session.commit()
+
+        results = OrderService().create_orders(db_session, [
+            self._queued(test_menu, "k-cell-1", 1, "CELL", test_cell.id),
+            self._queued(test_menu, "k-cell-2", 2, "CELL", test_cell.id),
+            self._queued(test_menu, "k-menu", 3, menu_id=99999),
+            self._queued(test_menu, "k-ok", 4)
+        ])
+
+        assert [r["success"] for r in results] == [True, False, False, True]
+        assert results[1]["error"]["code"] == "INSUFFICIENT_BALANCE"
+        assert results[2]["error"]["code"] == "MENU_NOT_FOUND"
+        assert [r["order"]["dailyNum"] for r in (results[0], results[3])] == [1, 2]
+
+        db_session.refresh(test_cell)
+        assert test_cell.balance == test_menu.price - 1
+        assert db_session.query(Order).count() == 2
+
+    def test_payment_keeps_concurrent_credit(self, db_session: Session, test_menu, test_cell, monkeypatch):
+        """Test a credit committed after the cells were loaded is not overwritten by the payments"""
+        from sqlalchemy import update
+        from app.models.transaction import PointTransaction, TransactionType
+
+        initial_balance = test_cell.balance
+        service = OrderService()
+        create_items = service._create_order_items
+
+        def create_items_after_credit(db, order, items):
+            # Another request refunds the cell meanwhile; the loaded cell keeps its old balance
+            db.execute(
+                update(Cell).where(Cell.id == test_cell.id).values(balance=Cell.balance + 1000)
+                .execution_options(synchronize_session=False)
+            )
+            create_items(db, order, items)
+
+        monkeypatch.setattr(service, "_create_order_items", create_items_after_credit)
+        service.create_orders(db_session, [
+            self._queued(test_menu, "k-cell-1", 1, "CELL", test_cell.id),
+            self._queued(test_menu, "k-cell-2", 2, "CELL", test_cell.id)
+        ])
+
+        db_session.refresh(test_cell)
+        assert test_cell.balance == initial_balance + 2000 - test_menu.price * 2
+        payments = db_session.query(PointTransaction.balance_after).filter(
+            PointTransaction.type == TransactionType.USE
+        ).order_by(PointTransaction.id).all()
+        assert [p.balance_after for p in payments] == [
+            initial_balance - test_menu.price, initial_balance + 1000 - test_menu.price * 2
+        ]
+
+
 class TestOrderServiceGet:
     """Test order retrieval"""
 
@@ -273,6 +386,7 @@ class TestOrderServiceUpdate:
     def test_update_order_status_to_completed(self, db_session: Session, test_order):
         """Test updating order status to COMPLETED"""
         service = OrderService()
+        service.update_order_status(db_session, test_order.order_id, OrderStatus.MAKING)
 
         updated_order = service.update_order_status(
             db_session,
@@ -302,3 +416,279 @@ class TestOrderServiceUpdate:
 
         with pytest.raises(OrderNotFoundError):
             service.update_order_status(db_session, "ORD-notexist-123456", OrderStatus.MAKING)
+
+    def test_update_order_status_invalid_transition(self, db_session: Session, test_order):
+        """Test PENDING cannot jump straight to COMPLETED"""
+        service = OrderService()
+
+        with pytest.raises(InvalidOrderStatusTransitionError):
+            service.update_order_status(db_session, test_order.order_id, OrderStatus.COMPLETED)
+
+        db_session.expire_all()
+        assert test_order.status == OrderStatus.PENDING
+
+    def test_update_order_status_from_final_state(self, db_session: Session, test_order):
+        """Test cancelled orders cannot be restarted"""
+        service = OrderService()
+        service.update_order_status(db_session, test_order.order_id, OrderStatus.CANCELLED)
+
+        with pytest.raises(InvalidOrderStatusTransitionError):
+            service.update_order_status(db_session, test_order.order_id, OrderStatus.MAKING)
+
+    def test_update_order_status_concurrent_tap(self, db_session: Session, test_order):
+        """Test the second of two identical transitions loses"""
+        service = OrderService()
+        service.update_order_status(db_session, test_order.order_id, OrderStatus.MAKING)
+
+        with pytest.raises(OrderConflictError):
+            service.update_order_status(db_session, test_order.order_id, OrderStatus.MAKING)
+
+    def test_update_order_status_version(self, db_session: Session, test_order):
+        """Test version increments and stale versions are rejected"""
+        service = OrderService()
+
+        updated = service.update_order_status(
+            db_session, test_order.order_id, OrderStatus.MAKING, expected_version=1
+        )
+        assert updated.version == 2
+
+        with pytest.raises(OrderConflictError):
+            service.update_order_status(
+                db_session, test_order.order_id, OrderStatus.CANCELLED, expected_version=1
+            )
+
+    def test_update_order_status_expected_status(self, db_session: Session, test_order):
+        """Test expected status is checked atomically"""
+        service = OrderService()
+        service.update_order_status(db_session, test_order.order_id, OrderStatus.MAKING)
+
+        with pytest.raises(OrderConflictError):
+            service.update_order_status(
+                db_session, test_order.order_id, OrderStatus.CANCELLED, expected_status=OrderStatus.PENDING
+            )
+
+        cancelled = service.update_order_status(
+            db_session, test_order.order_id, OrderStatus.CANCELLED, expected_status=OrderStatus.MAKING
+        )
+        assert cancelled.status == OrderStatus.CANCELLED
+
+    def test_update_order_status_single_statement(self, db_session: Session, test_order):
+        """Test a status change is one UPDATE ... RETURNING, plus its outbox row"""
+        from sqlalchemy import event
+
+        service = OrderService()
+        statements = []
+        engine = db_session.get_bind()
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            service.update_order_status(db_session, test_order.order_id, OrderStatus.MAKING)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert len(statements) == 2
+        assert statements[0].lstrip().upper().startswith("UPDATE ORDERS")
+        assert "RETURNING" in statements[0].upper()
+        assert statements[1].lstrip().upper().startswith("INSERT INTO OUTBOX_EVENTS")
+
+
+class TestOrderServiceBatchUpdate:
+    """Test batch order status update"""
+
+    def _create_orders(self, db_session, test_menu, count):
+        service = OrderService()
+        return [
+            service.create_order(db_session, CreateOrderRequest(
+                payType="PERSONAL",
+                items=[OrderItemRequest(menuId=test_menu.id, menuName=test_menu.name,
+                                        menuPrice=test_menu.price, quantity=1)],
+                totalAmount=test_menu.price
+            )).order_id
+            for _ in range(count)
+        ]
+
+    def test_batch_update_mixed_outcomes(self, db_session: Session, test_menu):
+        """Test valid transitions apply and the rest report why not"""
+        service = OrderService()
+        pending, making, completed = self._create_orders(db_session, test_menu, 3)
+        service.update_order_status(db_session, making, OrderStatus.MAKING)
+        service.update_order_status(db_session, completed, OrderStatus.MAKING)
+        service.update_order_status(db_session, completed, OrderStatus.COMPLETED)
+
+        results = service.update_order_statuses(
+            db_session, [pending, making, completed, "ORD-missing"], OrderStatus.CANCELLED
+        )
+
+        assert [r["orderId"] for r in results] == [pending, making, completed, "ORD-missing"]
+        assert [r["success"] for r in results] == [True, True, False, False]
+        assert results[2]["error"]["code"] == "INVALID_STATUS_TRANSITION"
+        assert results[3]["error"]["code"] == "ORDER_NOT_FOUND"
+
+    def test_batch_update_single_update_statement(self, db_session: Session, test_menu):
+        """Test all transitions are applied by one UPDATE and events are emitted"""
+        from sqlalchemy import event
+        from app.events import EventBus
+
+        order_ids = self._create_orders(db_session, test_menu, 5)
+        bus = EventBus()
+        published = []
+        bus.subscribe(lambda name, data: published.append((name, data["orderId"], data["previousStatus"])))
+        service = OrderService(events=bus)
+
+        statements = []
+        engine = db_session.get_bind()
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            results = service.update_order_statuses(db_session, order_ids, OrderStatus.MAKING)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert all(r["success"] and r["version"] == 2 for r in results)
+        assert len([s for s in statements if s.lstrip().upper().startswith("UPDATE")]) == 1
+        assert published == [("order:status_changed", order_id, "PENDING") for order_id in order_ids]
+
+
+class TestOrderServiceCancelRefund:
+    """Test cancellation refunds for CELL orders"""
+
+    def _create_cell_order(self, db_session, test_menu, cell, quantity=1):
+        return OrderService().create_order(db_session, CreateOrderRequest(
+            payType="CELL",
+            cellId=cell.id,
+            items=[OrderItemRequest(menuId=test_menu.id, menuName=test_menu.name,
+                                    menuPrice=test_menu.price, quantity=quantity)],
+            totalAmount=test_menu.price * quantity
+        ))
+
+    def _refunds(self, db_session):
+        from app.models.transaction import PointTransaction, TransactionType
+        return db_session.query(PointTransaction).filter(
+            PointTransaction.type == TransactionType.REFUND
+        ).order_by(PointTransaction.id).all()
+
+    def test_cancel_order_refunds_cell(self, db_session: Session, test_menu, test_cell):
+        """Test cancel credits the cell and links a REFUND transaction to the order"""
+        service = OrderService()
+        initial_balance = test_cell.balance
+        order = self._create_cell_order(db_session, test_menu, test_cell, quantity=2)
+
+        row, refund = service.cancel_order(db_session, order.order_id, reason="고객 요청", cancelled_by=None)
+
+        db_session.refresh(test_cell)
+        assert row.status == OrderStatus.CANCELLED
+        assert test_cell.balance == initial_balance
+        assert refund == {"cellId": test_cell.id, "amount": test_menu.price * 2, "balanceAfter": initial_balance}
+
+        refunds = self._refunds(db_session)
+        assert len(refunds) == 1
+        assert refunds[0].order_id == order.id
+        assert refunds[0].amount == test_menu.price * 2
+        assert refunds[0].balance_after == initial_balance
+        assert refunds[0].memo == "고객 요청"
+
+    def test_cancel_order_personal_has_no_refund(self, db_session: Session, test_order):
+        """Test PERSONAL orders are cancelled without a refund"""
+        _, refund = OrderService().cancel_order(db_session, test_order.order_id)
+
+        assert refund is None
+        assert self._refunds(db_session) == []
+
+    def test_cancel_twice_refunds_once(self, db_session: Session, test_menu, test_cell):
+        """Test a second cancel loses the conditional update and refunds nothing"""
+        service = OrderService()
+        initial_balance = test_cell.balance
+        order = self._create_cell_order(db_session, test_menu, test_cell)
+
+        service.cancel_order(db_session, order.order_id)
+        with pytest.raises(OrderConflictError):
+            service.cancel_order(db_session, order.order_id)
+
+        db_session.refresh(test_cell)
+        assert test_cell.balance == initial_balance
+        assert len(self._refunds(db_session)) == 1
+
+    def test_cancel_completed_order_fails(self, db_session: Session, test_menu, test_cell):
+        """Test completed orders cannot be cancelled (and are not refunded)"""
+        service = OrderService()
+        order = self._create_cell_order(db_session, test_menu, test_cell)
+        service.update_order_status(db_session, order.order_id, OrderStatus.MAKING)
+        service.update_order_status(db_session, order.order_id, OrderStatus.COMPLETED)
+
+        with pytest.raises(InvalidOrderStatusTransitionError):
+            service.cancel_order(db_session, order.order_id)
+        assert self._refunds(db_session) == []
+
+    def test_status_update_to_cancelled_refunds(self, db_session: Session, test_menu, test_cell):
+        """Test the generic status update runs the same refund"""
+        order = self._create_cell_order(db_session, test_menu, test_cell)
+
+        OrderService().update_order_status(db_session, order.order_id, OrderStatus.CANCELLED)
+
+        assert len(self._refunds(db_session)) == 1
+
+    def test_batch_cancel_refunds_per_order(self, db_session: Session, test_menu, test_cell):
+        """Test batch cancel credits each cell once and replays balance_after per order"""
+        service = OrderService()
+        other_cell = Cell(name="다른셀", leader="리더", phone_last4="1111", balance=20000)
+        db_session.add(other_cell)
+        db_session.commit()
+
+        first = self._create_cell_order(db_session, test_menu, test_cell)
+        second = self._create_cell_order(db_session, test_menu, test_cell, quantity=2)
+        third = self._create_cell_order(db_session, test_menu, other_cell)
+        db_session.refresh(test_cell)
+        balance_before = test_cell.balance
+
+        results = service.update_order_statuses(
+            db_session, [first.order_id, second.order_id, third.order_id], OrderStatus.CANCELLED,
+            reason="마감 정리"
+        )
+
+        db_session.refresh(test_cell)
+        db_session.refresh(other_cell)
+        assert all(r["success"] for r in results)
+        assert test_cell.balance == balance_before + test_menu.price * 3
+        assert other_cell.balance == 20000
+        assert [r["refund"]["balanceAfter"] for r in results] == [
+            balance_before + test_menu.price, balance_before + test_menu.price * 3, 20000
+        ]
+        assert [t.order_id for t in self._refunds(db_session)] == [first.id, second.id, third.id]
+
+    def test_payment_cannot_overdraw(self, db_session: Session, test_menu, test_cell):
+        """Test the debit is rejected when a concurrent payment already spent the balance"""
+        from sqlalchemy import update
+
+        db_session.execute(
+            update(Cell).where(Cell.id == test_cell.id).values(balance=1000)
+            .execution_options(synchronize_session=False)
+        )
+
+        with pytest.raises(InsufficientBalanceError) as exc_info:
+            self._create_cell_order(db_session, test_menu, test_cell)
+
+        assert exc_info.value.balance == 1000
+        assert db_session.query(Cell.balance).filter(Cell.id == test_cell.id).scalar() == 1000
+        assert db_session.query(Order).count() == 0
+
+    def test_refund_unique_per_order(self, db_session: Session, test_menu, test_cell):
+        """Test the database rejects a second REFUND for the same order"""
+        from sqlalchemy.exc import IntegrityError
+        from app.models.transaction import PointTransaction, TransactionType
+
+        order = self._create_cell_order(db_session, test_menu, test_cell)
+        OrderService().cancel_order(db_session, order.order_id)
+
+        db_session.add(PointTransaction(
+            cell_id=test_cell.id, type=TransactionType.REFUND, amount=1,
+            balance_after=test_cell.balance, order_id=order.id
+        ))
+        with pytest.raises(IntegrityError):
+            db_session.commit()
+        db_session.rollback()
@@ -0,0 +1,176 @@
+"""
+Unit tests for SettingsService and the settings cache
+"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.services.settings_service import SettingsService, SettingsCache
+from app.models.settlement import SystemSetting
+from app.models.user import User, UserRole
+from app.exceptions import (
+    AuthorizationError,
+    SettingNotFoundError,
+    InvalidSettingValueError,
+    DuplicateSettingKeyError
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def normal_admin(db_session: Session):
+    user = User(username="staff", password_hash="x", name="직원", role=UserRole.NORMAL)
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+class TestSettingsCache:
+    """Test typed reads, write-through and polled invalidation"""
+
+    def test_typed_values_and_defaults(self, db_session: Session):
+        """Test stored values are typed and missing known keys fall back to defaults"""
+        db_session.add(SystemSetting(key="bonus_rate", value="15"))
+        db_session.add(SystemSetting(key="custom_banner", value="환영합니다"))
+        db_session.commit()
+        cache = SettingsCache()
+        cache.ensure_fresh(db_session)
+
+        assert cache.get("bonus_rate") == 15
+        assert cache.get("is_kiosk_active") is True
+        assert cache.get("custom_banner") == "환영합니다"
+        assert cache.get("unknown") is None
+
+    def test_reads_without_queries_until_poll(self, db_session: Session, capture_sql):
+        """Test a loaded cache reads nothing within the poll interval, then only the version"""
+        clock = FakeClock()
+        cache = SettingsCache(poll_seconds=5, clock=clock)
+        cache.ensure_fresh(db_session)
+
+        with capture_sql() as statements:
+            cache.ensure_fresh(db_session)
+        assert statements == []
+
+        clock.now += 5
+        with capture_sql() as statements:
+            cache.ensure_fresh(db_session)
+        assert len(statements) == 1
+
+    def test_change_by_another_worker_is_picked_up(self, db_session: Session, sample_admin_user):
+        """Test a write through another cache is seen after the poll interval"""
+        clock = FakeClock()
+        cache = SettingsCache(poll_seconds=5, clock=clock)
+        cache.ensure_fresh(db_session)
+
+        SettingsService(cache=SettingsCache()).update_settings(db_session, {"bonus_rate": "20"}, sample_admin_user)
+        cache.ensure_fresh(db_session)
+        assert cache.get("bonus_rate") == 10
+
+        clock.now += 5
+        cache.ensure_fresh(db_session)
+        assert cache.get("bonus_rate") == 20
+
+    def test_order_counter_does_not_invalidate(self, db_session: Session, capture_sql):
+        """Test next_order_number updates leave the version unchanged"""
+        db_session.add(SystemSetting(key="next_order_number", value="1"))
+        db_session.commit()
+        clock = FakeClock()
+        cache = SettingsCache(poll_seconds=5, clock=clock)
+        cache.ensure_fresh(db_session)
+
+        setting = db_session.query(SystemSetting).filter(SystemSetting.key == "next_order_number").one()
+        setting.value = "2"
+        setting.updated_at = datetime.now()
+        db_session.commit()
+
+        clock.now += 5
+        with capture_sql() as statements:
+            cache.ensure_fresh(db_session)
+        assert len(statements) == 1
+
+    def test_settings_invalidation_forces_version_check(self, db_session: Session, sample_admin_user):
+        """Test another worker's settings invalidation is applied before the poll interval"""
+        clock = FakeClock()
+        cache = SettingsCache(poll_seconds=5, clock=clock)
+        cache.ensure_fresh(db_session)
+        SettingsService(cache=SettingsCache()).update_settings(db_session, {"bonus_rate": "30"}, sample_admin_user)
+
+        cache.handle_invalidation("settings")
+        cache.ensure_fresh(db_session)
+
+        assert cache.get("bonus_rate") == 30
+
+
+class TestSettingsService:
+    """Test validated writes and admin reads"""
+
+    def test_update_writes_through(self, db_session: Session, sample_admin_user):
+        """Test a change is stored, normalized and visible in the cache at once"""
+        cache = SettingsCache()
+        cache.ensure_fresh(db_session)
+        service = SettingsService(cache=cache)
+
+        assert service.update_settings(db_session, {"is_kiosk_active": " FALSE "}, sample_admin_user) == {
+            "is_kiosk_active": "false"
+        }
+        assert cache.get("is_kiosk_active") is False
+        setting = service.get_setting(db_session, "is_kiosk_active")
+        assert setting["value"] == "false"
+        assert setting["updatedBy"] == {"id": sample_admin_user.id, "name": "관리자"}
+
+    @pytest.mark.parametrize("key, value", [
+        ("bonus_rate", "abc"),
+        ("bonus_rate", "101"),
+        ("next_order_number", "0"),
+        ("maintenance_mode", "yes"),
+    ])
+    def test_invalid_values(self, db_session: Session, sample_admin_user, key, value):
+        """Test values are checked against the spec"""
+        with pytest.raises(InvalidSettingValueError):
+            SettingsService(cache=SettingsCache()).update_settings(db_session, {key: value}, sample_admin_user)
+
+    def test_batch_is_all_or_nothing(self, db_session: Session, sample_admin_user):
+        """Test one invalid value leaves every setting unchanged"""
+        service = SettingsService(cache=SettingsCache())
+        with pytest.raises(InvalidSettingValueError):
+            service.update_settings(db_session, {"bonus_rate": "20", "maintenance_mode": "maybe"}, sample_admin_user)
+
+        assert db_session.query(SystemSetting).count() == 0
+
+    def test_unknown_key(self, db_session: Session, sample_admin_user):
+        """Test keys neither stored nor known are not found"""
+        service = SettingsService(cache=SettingsCache())
+        with pytest.raises(SettingNotFoundError):
+            service.update_settings(db_session, {"nope": "1"}, sample_admin_user)
+        with pytest.raises(SettingNotFoundError):
+            service.get_setting(db_session, "nope")
+
+    def test_normal_admin_limited_to_editable_keys(self, db_session: Session, normal_admin):
+        """Test NORMAL admins change only admin-editable settings"""
+        service = SettingsService(cache=SettingsCache())
+        service.update_settings(db_session, {"bonus_rate": "5"}, normal_admin)
+
+        with pytest.raises(AuthorizationError):
+            service.update_settings(db_session, {"maintenance_mode": "true"}, normal_admin)
+
+    def test_list_includes_defaults(self, db_session: Session, sample_admin_user):
+        """Test known settings are listed with their defaults until stored"""
+        service = SettingsService(cache=SettingsCache())
+        service.create_setting(db_session, "custom_banner", "안녕", None, sample_admin_user)
+
+        settings = {s["key"]: s for s in service.list_settings(db_session)}
+        assert settings["custom_banner"]["value"] == "안녕"
+        assert settings["bonus_rate"]["value"] == "10"
+        assert settings["bonus_rate"]["updatedAt"] is None
+
+        with pytest.raises(DuplicateSettingKeyError):
+            service.create_setting(db_session, "custom_banner", "또", None, sample_admin_user)
+
@@ -0,0 +1,238 @@
+"""
+Unit tests for SettlementService (nightly generation and confirmation)
+"""
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.services.settlement_service import SettlementService, SettlementDetailCache
+from app.services.statistics_service import StatisticsService
+from app.models.order import Order, OrderItem, OrderStatus, PayType
+from app.models.settlement import DailySettlement
+from app.exceptions import SettlementAlreadyConfirmedError, FutureSettlementDateError, SettlementNotFoundError
+
+DAY = date(2026, 3, 1)
+
+
+def _at(day_offset: int, hour: int = 10) -> datetime:
+    return datetime.combine(DAY + timedelta(days=day_offset), datetime.min.time()) + timedelta(hours=hour)
+
+
+@pytest.fixture
+def orders(db_session: Session, sample_cell):
+    """Orders over three days (nothing on Mar 2)
+
+    Mar 1: personal 3000, cell 5000, cancelled personal 4000
+    Mar 3: personal 2000
+    """
+    created = []
+    for number, (day_offset, pay_type, amount, cancelled) in enumerate([
+        (0, PayType.PERSONAL, 3000, False),
+        (0, PayType.CELL, 5000, False),
+        (0, PayType.PERSONAL, 4000, True),
+        (2, PayType.PERSONAL, 2000, False),
+    ]):
+        order = Order(
+            order_id=f"ORD-SETTLE-{number}", daily_num=number + 1, pay_type=pay_type,
+            cell_id=sample_cell.id if pay_type == PayType.CELL else None, total_amount=amount,
+            status=OrderStatus.CANCELLED if cancelled else OrderStatus.COMPLETED,
+            created_at=_at(day_offset), cancelled_at=_at(day_offset, 11) if cancelled else None
+        )
+        db_session.add(order)
+        created.append(order)
+    db_session.commit()
+    return created
+
+
+def _settlement(db_session: Session, day: date) -> DailySettlement:
+    db_session.expire_all()
+    return db_session.query(DailySettlement).filter(DailySettlement.date == day).one()
+
+
+class TestBuild:
+    """Test nightly settlement generation"""
+
+    def test_build_through_backfills_from_first_order_day(self, db_session: Session, orders):
+        """Test missing days are calculated in one run, skipping days without orders"""
+        assert SettlementService().build_through(db_session, DAY + timedelta(days=2)) == 2
+
+        settlement = _settlement(db_session, DAY)
+        assert (settlement.total_orders, settlement.total_revenue) == (2, 8000)
+        assert (settlement.personal_orders, settlement.personal_revenue) == (1, 3000)
+        assert (settlement.cell_orders, settlement.cell_revenue) == (1, 5000)
+        assert (settlement.cancelled_orders, settlement.cancelled_amount) == (1, 4000)
+        assert settlement.calculated_at is not None
+        assert not settlement.is_confirmed
+        assert db_session.query(DailySettlement).count() == 2
+
+    def test_build_through_only_missing_days(self, db_session: Session, orders):
+        """Test days that already have a settlement are not calculated again"""
+        service = SettlementService()
+        service.build_through(db_session, DAY)
+
+        assert service.build_through(db_session, DAY + timedelta(days=2)) == 1
+        assert service.build_through(db_session, DAY + timedelta(days=2)) == 0
+
+    def test_build_through_fills_gap_before_latest(self, db_session: Session, orders, sample_admin_user):
+        """Test an order day missing before the latest (confirmed) settlement is backfilled"""
+        service = SettlementService()
+        service.confirm(db_session, DAY + timedelta(days=2), sample_admin_user.id)
+
+        assert service.build_through(db_session, DAY + timedelta(days=2)) == 1
+
+        settlement = _settlement(db_session, DAY)
+        assert (settlement.total_orders, settlement.total_revenue) == (2, 8000)
+        assert _settlement(db_session, DAY + timedelta(days=2)).is_confirmed
+        assert db_session.query(DailySettlement).count() == 2
+
+    def test_confirmed_settlement_is_never_rewritten(self, db_session: Session, orders, sample_admin_user):
+        """Test recalculating a range leaves confirmed days unchanged"""
+        service = SettlementService()
+        service.build_through(db_session, DAY)
+        service.confirm(db_session, DAY, sample_admin_user.id)
+        orders[0].status = OrderStatus.CANCELLED
+        db_session.commit()
+
+        service.build_through(db_session, DAY + timedelta(days=2), since=DAY)
+
+        settlement = _settlement(db_session, DAY)
+        assert settlement.is_confirmed
+        assert settlement.total_revenue == 8000
+
+    def test_late_cancellation_recalculates_day(self, db_session: Session, orders):
+        """Test a day with an order cancelled after its calculation is recalculated"""
+        service = SettlementService()
+        service.build_through(db_session, DAY + timedelta(days=2))
+        calculated_at = _settlement(db_session, DAY).calculated_at
+        orders[3].status = OrderStatus.CANCELLED
+        orders[3].cancelled_at = calculated_at + timedelta(microseconds=1)
+        db_session.commit()
+
+        assert service.refresh_stale(db_session) == [DAY + timedelta(days=2)]
+
+        settlement = _settlement(db_session, DAY + timedelta(days=2))
+        assert (settlement.total_orders, settlement.cancelled_orders, settlement.cancelled_amount) == (0, 1, 2000)
+        assert service.refresh_stale(db_session) == []
+
+
+class TestConfirm:
+    """Test settlement confirmation"""
+
+    def test_confirm_without_nightly_run(self, db_session: Session, orders, sample_admin_user):
+        """Test a day is calculated on confirmation, including days without orders"""
+        service = SettlementService()
+
+        settlement = service.confirm(db_session, DAY, sample_admin_user.id)
+        assert settlement.is_confirmed
+        assert settlement.confirmed_by == sample_admin_user.id
+        assert settlement.total_revenue == 8000
+
+        empty = service.confirm(db_session, DAY + timedelta(days=1), sample_admin_user.id)
+        assert (empty.total_orders, empty.total_revenue) == (0, 0)
+
+    def test_confirm_twice(self, db_session: Session, orders, sample_admin_user):
+        """Test a confirmed day cannot be confirmed again"""
+        service = SettlementService()
+        service.confirm(db_session, DAY, sample_admin_user.id)
+
+        with pytest.raises(SettlementAlreadyConfirmedError):
+            service.confirm(db_session, DAY, sample_admin_user.id)
+
+    def test_confirm_future_date(self, db_session: Session, sample_admin_user):
+        """Test future days cannot be confirmed"""
+        with pytest.raises(FutureSettlementDateError):
+            SettlementService().confirm(db_session, date.today() + timedelta(days=1), sample_admin_user.id)
+
+
+class TestDetail:
+    """Test the settlement detail breakdowns and cache"""
+
+    def test_detail(self, db_session: Session, orders, sample_cell):
+        """Test totals, payment shares and the cell breakdown of a day"""
+        service = SettlementService()
+        service.build_through(db_session, DAY)
+
+        detail = service.detail(db_session, DAY)
+
+        assert detail["summary"]["totalRevenue"] == 8000
+        assert detail["summary"]["cancelledAmount"] == 4000
+        assert detail["paymentBreakdown"]["cell"] == {"orders": 1, "revenue": 5000, "percentage": 62.5}
+        assert detail["cellBreakdown"] == [{
+            "cellId": sample_cell.id, "cellName": sample_cell.name,
+            "orders": 1, "revenue": 5000, "closingBalance": None
+        }]
+        assert detail["hourlyBreakdown"][0]["hour"] == 10
+        assert detail["isConfirmed"] is False
+
+    def test_menu_and_category_breakdown(self, db_session: Session, test_order):
+        """Test menus and categories of the day come from the sales statistics"""
+        service = SettlementService()
+        today = date.today()
+        service.build(db_session, today, today)
+
+        detail = service.detail(db_session, today)
+
+        assert [(m["menuName"], m["quantity"]) for m in detail["menuBreakdown"]] == [("아메리카노", 1)]
+        assert [(c["categoryName"], c["revenue"], c["percentage"]) for c in detail["categoryBreakdown"]] == [
+            ("커피", 5000, 100.0)
+        ]
+
+    def test_breakdowns_exclude_cancelled_orders(self, db_session: Session, test_order, test_menu):
+        """Test menu, category and hourly breakdowns add up to the totals, even once rolled up"""
+        cancelled = Order(
+            order_id="ORD-SETTLE-CANCELLED", daily_num=2, pay_type=PayType.PERSONAL,
+            total_amount=test_menu.price * 2, status=OrderStatus.CANCELLED, cancelled_at=datetime.now()
+        )
+        cancelled.items.append(OrderItem(
+            menu_id=test_menu.id, menu_name=test_menu.name, menu_price=test_menu.price,
+            quantity=2, total_price=test_menu.price * 2
+        ))
+        db_session.add(cancelled)
+        db_session.commit()
+        today = date.today()
+        statistics = StatisticsService()
+        statistics.rollup_menu_sales(db_session, today)
+        statistics.rollup_time_buckets(db_session, today)
+        service = SettlementService()
+        service.build(db_session, today, today)
+
+        detail = service.detail(db_session, today)
+
+        total = detail["summary"]["totalRevenue"]
+        assert (total, detail["summary"]["cancelledOrders"]) == (5000, 1)
+        assert sum(menu["revenue"] for menu in detail["menuBreakdown"]) == total
+        assert [(m["quantity"], m["orderCount"]) for m in detail["menuBreakdown"]] == [(1, 1)]
+        assert sum(category["revenue"] for category in detail["categoryBreakdown"]) == total
+        assert sum(hour["revenue"] for hour in detail["hourlyBreakdown"]) == total
+        assert sum(hour["orders"] for hour in detail["hourlyBreakdown"]) == 1
+
+    def test_only_confirmed_detail_is_cached(self, db_session: Session, orders, sample_admin_user):
+        """Test unconfirmed details are read each time, confirmed ones once"""
+        cache = SettlementDetailCache()
+        service = SettlementService(details=cache)
+        service.build_through(db_session, DAY)
+
+        service.detail(db_session, DAY)
+        assert cache.get(DAY) is None
+
+        service.confirm(db_session, DAY, sample_admin_user.id)
+        detail = service.detail(db_session, DAY)
+        assert detail["confirmedBy"]["name"] == sample_admin_user.name
+        assert cache.get(DAY) is detail
+
+    def test_detail_not_found(self, db_session: Session):
+        """Test a day without a settlement"""
+        with pytest.raises(SettlementNotFoundError):
+            SettlementService().detail(db_session, DAY)
+
+    def test_cache_is_bounded(self):
+        """Test the least recently read day is dropped first"""
+        cache = SettlementDetailCache(max_days=2)
+        for offset in range(2):
+            cache.put(DAY + timedelta(days=offset), {"offset": offset})
+        cache.get(DAY)
+        cache.put(DAY + timedelta(days=2), {"offset": 2})
+
+        assert cache.get(DAY + timedelta(days=1)) is None
+        assert cache.get(DAY) == {"offset": 0}
@@ -0,0 +1,220 @@
+"""
+Unit tests for StatisticsService (menu sales rollup and reports)
+"""
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.services.statistics_service import StatisticsService
+from app.models.menu import Menu
+from app.models.order import Order, OrderItem, OrderStatus, PayType, MenuDailySales, OrderTimeBucket
+
+DAY = date(2026, 3, 1)
+
+
+@pytest.fixture
+def sales(db_session: Session, sample_categories):
+    """Orders over two days for two coffee menus and one dessert
+
+    Mar 1: 아메리카노 x2 (6000) + 케이크 x1 (5000) in one order, 라떼 x1 (4000)
+    Mar 2: 아메리카노 x1 (3000)
+    """
+    coffee, _, dessert, _ = sample_categories
+    menus = {
+        name: Menu(name=name, price=price, category_id=category.id)
+        for name, price, category in [
+            ("아메리카노", 3000, coffee), ("라떼", 4000, coffee), ("케이크", 5000, dessert)
+        ]
+    }
+    db_session.add_all(menus.values())
+    db_session.flush()
+
+    for number, (day_offset, items) in enumerate([
+        (0, [("아메리카노", 2), ("케이크", 1)]),
+        (0, [("라떼", 1)]),
+        (1, [("아메리카노", 1)]),
+    ]):
+        order = Order(
+            order_id=f"ORD-STAT-{number}", daily_num=number + 1, pay_type=PayType.PERSONAL,
+            total_amount=sum(menus[name].price * quantity for name, quantity in items),
+            status=OrderStatus.COMPLETED,
+            created_at=datetime.combine(DAY + timedelta(days=day_offset), datetime.min.time()) + timedelta(hours=10)
+        )
+        db_session.add(order)
+        db_session.flush()
+        db_session.add_all([
+            OrderItem(
+                order_id=order.id, menu_id=menus[name].id, menu_name=name, menu_price=menus[name].price,
+                quantity=quantity, total_price=menus[name].price * quantity
+            )
+            for name, quantity in items
+        ])
+    db_session.commit()
+    return menus
+
+
+class TestRollup:
+    """Test the per-day menu sales rollup"""
+
+    def test_rollup_through_writes_each_day(self, db_session: Session, sales):
+        """Test days are rolled up from the first order day"""
+        written = StatisticsService().rollup_through(db_session, DAY + timedelta(days=1))
+
+        assert written == [(DAY, 3), (DAY + timedelta(days=1), 1)]
+        rows = db_session.query(MenuDailySales).filter(MenuDailySales.sale_date == DAY).all()
+        by_menu = {row.menu_id: (row.quantity, row.revenue, row.order_count) for row in rows}
+        assert by_menu[sales["아메리카노"].id] == (2, 6000, 1)
+        assert by_menu[sales["케이크"].id] == (1, 5000, 1)
+
+    def test_rollup_through_continues_after_latest(self, db_session: Session, sales):
+        """Test only days after the latest rollup are written"""
+        service = StatisticsService()
+        service.rollup_through(db_session, DAY)
+
+        assert service.rollup_through(db_session, DAY + timedelta(days=1)) == [(DAY + timedelta(days=1), 1)]
+
+    def test_rollup_rewrite_drops_stale_rows(self, db_session: Session, sales):
+        """Test rolling up a day again replaces its rows"""
+        service = StatisticsService()
+        service.rollup_menu_sales(db_session, DAY)
+        db_session.query(OrderItem).filter(OrderItem.menu_id == sales["라떼"].id).delete()
+        db_session.commit()
+
+        assert service.rollup_menu_sales(db_session, DAY) == 2
+        assert db_session.query(MenuDailySales).filter(MenuDailySales.menu_id == sales["라떼"].id).count() == 0
+
+
+class TestMenuStatistics:
+    """Test menu/category reports over rollup and live days"""
+
+    @pytest.mark.parametrize("rolled_up_through", [None, DAY, DAY + timedelta(days=1)])
+    def test_same_result_with_or_without_rollup(self, db_session: Session, sales, rolled_up_through):
+        """Test reports match whichever days are rolled up"""
+        service = StatisticsService()
+        if rolled_up_through:
+            service.rollup_through(db_session, rolled_up_through)
+
+        stats = service.menu_statistics(db_session)
+
+        assert [(s["menuName"], s["quantity"], s["revenue"], s["orderCount"]) for s in stats] == [
+            ("아메리카노", 3, 9000, 2),
+            ("케이크", 1, 5000, 1),
+            ("라떼", 1, 4000, 1),
+        ]
+        assert stats[0]["categoryName"] == "커피"
+        assert stats[0]["averagePrice"] == 3000
+
+    def test_date_range(self, db_session: Session, sales):
+        """Test start/end dates are inclusive days, across the rollup boundary"""
+        service = StatisticsService()
+        service.rollup_through(db_session, DAY)
+
+        stats = service.menu_statistics(db_session, DAY + timedelta(days=1), DAY + timedelta(days=1))
+        assert [(s["menuName"], s["quantity"]) for s in stats] == [("아메리카노", 1)]
+
+        stats = service.menu_statistics(db_session, DAY, DAY)
+        assert {s["menuName"] for s in stats} == {"아메리카노", "케이크", "라떼"}
+
+        assert service.menu_statistics(db_session, DAY + timedelta(days=5)) == []
+
+    def test_category_filter_and_limit(self, db_session: Session, sales, sample_categories):
+        """Test categoryId filters menus and limit keeps the top N"""
+        service = StatisticsService()
+        service.rollup_through(db_session, DAY)
+
+        stats = service.menu_statistics(db_session, category_id=sample_categories[0].id)
+        assert [s["menuName"] for s in stats] == ["아메리카노", "라떼"]
+
+        stats = service.menu_statistics(db_session, limit=1)
+        assert [s["menuName"] for s in stats] == ["아메리카노"]
+
+    def test_category_statistics(self, db_session: Session, sales):
+        """Test per-category totals and revenue share"""
+        service = StatisticsService()
+        service.rollup_through(db_session, DAY)
+
+        stats = service.category_statistics(db_session)
+
+        assert [(s["categoryCode"], s["quantity"], s["revenue"], s["percentage"]) for s in stats] == [
+            ("COFFEE", 4, 13000, 72.2),
+            ("DESSERT", 1, 5000, 27.8),
+        ]
+
+
+@pytest.fixture
+def timed_orders(db_session: Session, sales):
+    """Completed/pending orders at known times on Mar 1 (Sunday) and Mar 2 (Monday)
+
+    Mar 1 10:05 completed after 300s, 10:20 completed after 100s, 11:50 pending
+    Mar 2 10:10 completed after 600s
+    (plus the three 10:00 orders of `sales`: two on Mar 1, one on Mar 2)
+    """
+    for number, (day_offset, hour, minute, prep) in enumerate([
+        (0, 10, 5, 300), (0, 10, 20, 100), (0, 11, 50, None), (1, 10, 10, 600)
+    ]):
+        created = datetime.combine(DAY + timedelta(days=day_offset), datetime.min.time()) + timedelta(hours=hour, minutes=minute)
+        db_session.add(Order(
+            order_id=f"ORD-TIME-{number}", daily_num=number + 1, pay_type=PayType.PERSONAL, total_amount=1000,
+            status=OrderStatus.COMPLETED if prep else OrderStatus.PENDING, created_at=created,
+            completed_at=created + timedelta(seconds=prep) if prep else None
+        ))
+    db_session.commit()
+
+
+class TestTimeBuckets:
+    """Test 15-minute bucket rollup, hourly stats and heatmaps"""
+
+    def test_rollup_time_buckets(self, db_session: Session, timed_orders):
+        """Test orders land in 15-minute buckets with item counts and prep time"""
+        service = StatisticsService()
+        assert service.rollup_time_buckets_through(db_session, DAY) == [(DAY, 3)]
+
+        buckets = {
+            b.minute: (b.weekday, b.order_count, b.revenue, b.item_count, b.completed_count, b.prep_seconds)
+            for b in db_session.query(OrderTimeBucket).filter(OrderTimeBucket.bucket_date == DAY).all()
+        }
+        assert buckets == {
+            600: (6, 3, 16000, 4, 1, 300),  # 10:00-10:15: two `sales` orders (no completion time) + 10:05
+            615: (6, 1, 1000, 0, 1, 100),
+            705: (6, 1, 1000, 0, 0, 0),
+        }
+
+    def test_hourly(self, db_session: Session, timed_orders):
+        """Test hourly totals and average prep time of completed orders"""
+        stats = StatisticsService().hourly(db_session, DAY)
+
+        assert [(h["hour"], h["orders"], h["completedOrders"], h["avgPrepSeconds"]) for h in stats] == [
+            (10, 4, 2, 200),
+            (11, 1, 0, None),
+        ]
+
+    @pytest.mark.parametrize("rolled_up_through", [None, DAY, DAY + timedelta(days=1)])
+    def test_heatmap_same_with_or_without_rollup(self, db_session: Session, timed_orders, rolled_up_through):
+        """Test the heatmap matches whichever days are rolled up"""
+        service = StatisticsService()
+        if rolled_up_through:
+            service.rollup_time_buckets_through(db_session, rolled_up_through)
+
+        heatmap = service.heatmap(db_session, interval=60)
+
+        assert heatmap["interval"] == 60
+        assert [(c["weekday"], c["time"], c["orders"]) for c in heatmap["cells"]] == [
+            (0, "10:00", 2),
+            (6, "10:00", 4),
+            (6, "11:00", 1),
+        ]
+        assert [(w["weekday"], w["orders"]) for w in heatmap["weekdays"]] == [(0, 2), (6, 5)]
+        assert [(s["time"], s["orders"], s["avgPrepSeconds"]) for s in heatmap["slots"]] == [
+            ("10:00", 6, 333),
+            ("11:00", 1, None),
+        ]
+
+    def test_heatmap_interval_and_range(self, db_session: Session, timed_orders):
+        """Test 15-minute slots and the date range"""
+        service = StatisticsService()
+        service.rollup_time_buckets_through(db_session, DAY)
+
+        heatmap = service.heatmap(db_session, DAY, DAY, interval=15)
+
+        assert [(c["time"], c["orders"]) for c in heatmap["cells"]] == [("10:00", 3), ("10:15", 1), ("11:45", 1)]
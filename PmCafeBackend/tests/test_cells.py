@@ -49,3 +49,51 @@ class TestCellAuth:
             json={}
         )
         assert response.status_code == 422  # Validation error
+
+
+class TestCellLedger:
+    """Test balance-at-date, statement and reconciliation endpoints"""
+
+    def test_balance_statement_and_reconciliation(self, client, admin_headers, sample_cell):
+        """Test a charge shows up in balance, statement and a clean reconciliation"""
+        from datetime import date
+
+        response = client.post(
+            f"/api/v1/cells/{sample_cell.id}/charge",
+            json={"amount": 10000, "bonusRate": 0},
+            headers=admin_headers
+        )
+        assert response.status_code == 200
+
+        today = date.today()
+        response = client.get(
+            f"/api/v1/cells/{sample_cell.id}/balance", params={"date": today.isoformat()}, headers=admin_headers
+        )
+        assert response.status_code == 200
+        assert response.json()["data"]["balance"] == 20000
+
+        response = client.get(
+            f"/api/v1/cells/{sample_cell.id}/statement", params={"month": today.strftime("%Y-%m")}, headers=admin_headers
+        )
+        assert response.status_code == 200
+        assert response.json()["data"]["charged"] == 10000
+
+        response = client.get("/api/v1/cells/reconciliation", headers=admin_headers)
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["consistent"] is False  # sample_cell starts with 10000 outside the ledger
+        assert data["drifts"][0]["ledgerSum"] == 10000
+
+    def test_balance_invalid_date(self, client, admin_headers, sample_cell):
+        """Test invalid dates are rejected"""
+        response = client.get(
+            f"/api/v1/cells/{sample_cell.id}/balance", params={"date": "2026/01/01"}, headers=admin_headers
+        )
+        assert response.status_code == 400
+        assert response.json()["error"]["code"] == "INVALID_DATE_FORMAT"
+
+    def test_statement_cell_not_found(self, client, admin_headers):
+        """Test unknown cells return 404"""
+        response = client.get("/api/v1/cells/9999/statement", params={"month": "2026-01"}, headers=admin_headers)
+        assert response.status_code == 404
+        assert response.json()["error"]["code"] == "CELL_NOT_FOUND"
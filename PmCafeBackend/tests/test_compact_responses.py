@@ -0,0 +1,101 @@
+"""
+Compressed and columnar list response tests
+"""
+from app.utils.columnar import encode, decode
+
+
+ORDERS = [
+    {
+        "orderId": "ORD-1", "status": "PENDING", "cellInfo": None, "totalAmount": 5500,
+        "items": [{
+            "menuName": "아메리카노", "quantity": 1,
+            "selectedOptions": [{"groupName": "샷 추가", "items": [{"name": "1샷", "price": 500}]}]
+        }]
+    },
+    {
+        "orderId": "ORD-2", "status": "PENDING", "cellInfo": {"id": 1, "name": "사랑셀"}, "totalAmount": 10000,
+        "items": [
+            {"menuName": "아메리카노", "quantity": 1, "selectedOptions": []},
+            {"menuName": "아메리카노", "quantity": 1, "selectedOptions": [{"groupName": "샷 추가", "items": []}]}
+        ]
+    }
+]
+
+
+class TestColumnarEncoding:
+    """Test the columnar table format"""
+
+    def test_round_trip(self):
+        """Test nested objects, lists and nulls decode back unchanged"""
+        assert decode(encode(ORDERS)) == ORDERS
+
+    def test_keys_and_repeated_strings_sent_once(self):
+        """Test keys become columns and repeating strings become indexes"""
+        table = encode(ORDERS)
+
+        assert table["columns"][:2] == ["orderId", {"name": "status", "strings": True}]
+        assert [row[1] for row in table["rows"]] == [0, 0]
+        assert table["strings"].count("아메리카노") == 1
+        assert table["strings"].count("샷 추가") == 1
+        assert "ORD-1" not in table["strings"]  # unique values stay inline
+
+    def test_missing_keys_decode_as_null(self):
+        """Test objects with optional keys share one set of columns"""
+        table = encode([{"id": 1}, {"id": 2, "order": {"dailyNum": 3}}])
+
+        assert decode(table) == [{"id": 1, "order": None}, {"id": 2, "order": {"dailyNum": 3}}]
+
+    def test_empty_list(self):
+        assert encode([]) == {"columns": [], "rows": [], "strings": []}
+
+
+class TestCompactResponses:
+    """Test list endpoints with ?format=columnar and gzip"""
+
+    def _create_orders(self, client, menu, count):
+        for _ in range(count):
+            client.post("/api/v1/orders", json={
+                "payType": "PERSONAL",
+                "items": [{
+                    "menuId": menu.id, "menuName": menu.name, "menuPrice": menu.price, "quantity": 1,
+                    "selectedOptions": [{"groupName": "사이즈", "items": [{"name": "Large", "price": 0}]}]
+                }],
+                "totalAmount": menu.price
+            })
+
+    def test_orders_columnar_matches_json(self, client, test_menu):
+        """Test the columnar order list decodes to the JSON order list"""
+        self._create_orders(client, test_menu, 3)
+
+        plain = client.get("/api/v1/orders").json()["data"]
+        compact = client.get("/api/v1/orders?format=columnar").json()["data"]
+
+        assert compact["total"] == plain["total"] == 3
+        assert decode(compact["orders"]) == plain["orders"]
+
+    def test_transactions_and_daily_columnar(self, client, admin_headers, test_cell):
+        """Test the other list endpoints accept the format"""
+        client.post(f"/api/v1/cells/{test_cell.id}/charge", json={"amount": 10000}, headers=admin_headers)
+
+        transactions = client.get(
+            f"/api/v1/cells/{test_cell.id}/transactions?format=columnar", headers=admin_headers
+        ).json()["data"]["transactions"]
+        assert decode(transactions)[0]["type"] == "CHARGE"
+
+        daily = client.get("/api/v1/statistics/daily?format=columnar", headers=admin_headers).json()["data"]
+        assert set(daily) == {"columns", "rows", "strings"}
+
+    def test_unknown_format_rejected(self, client):
+        assert client.get("/api/v1/orders?format=xml").status_code == 422
+
+    def test_large_response_gzipped(self, client, test_menu):
+        """Test responses over the threshold are gzipped when the client accepts it"""
+        self._create_orders(client, test_menu, 10)
+
+        response = client.get("/api/v1/orders", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert int(response.headers["content-length"]) < len(response.content)
+
+        small = client.get("/health", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in small.headers
+
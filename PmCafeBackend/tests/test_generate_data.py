@@ -0,0 +1,51 @@
+"""
+Synthetic data generator tests
+"""
+from datetime import date
+
+from sqlalchemy import func, select
+
+from app.models import Cell, Order, OrderItem, PointTransaction
+from scripts.generate_data import DataGenerator
+
+
+def _generate(conn, seed=7):
+    return DataGenerator(
+        conn, seed=seed, days=14, orders_per_day=30, cell_count=5,
+        end_date=date(2026, 1, 18), chunk_size=50
+    ).generate()
+
+
+def test_generate_is_deterministic(db_session):
+    """Same seed produces the same history"""
+    conn = db_session.connection()
+    counts = _generate(conn)
+    first_run = conn.execute(select(Order.order_id, Order.total_amount).order_by(Order.id)).all()
+
+    assert counts["orders"] == len(first_run) > 0
+    assert counts["order_items"] == conn.execute(select(func.count()).select_from(OrderItem)).scalar()
+
+    db_session.rollback()
+    conn = db_session.connection()
+    _generate(conn)
+    second_run = conn.execute(select(Order.order_id, Order.total_amount).order_by(Order.id)).all()
+
+    assert second_run == first_run
+
+
+def test_generated_balances_match_ledger(db_session):
+    """Cell balances equal the last balance_after of their transactions"""
+    conn = db_session.connection()
+    _generate(conn)
+
+    for cell_id, balance in conn.execute(select(Cell.id, Cell.balance)).all():
+        last = conn.execute(
+            select(PointTransaction.balance_after)
+            .where(PointTransaction.cell_id == cell_id)
+            .order_by(PointTransaction.id.desc())
+            .limit(1)
+        ).scalar()
+        total = conn.execute(
+            select(func.coalesce(func.sum(PointTransaction.amount), 0)).where(PointTransaction.cell_id == cell_id)
+        ).scalar()
+        assert balance == (last or 0) == total
@@ -0,0 +1,63 @@
+"""
+Index advisor tests
+"""
+from datetime import date
+
+from sqlalchemy import inspect
+
+from scripts.generate_data import DataGenerator
+from scripts.index_advisor import ADVISED_INDEXES, advise, seq_scans, indexes_used
+
+
+def _index_names(conn):
+    inspector = inspect(conn)
+    return {
+        index["name"]
+        for table in ("orders", "order_items", "order_item_options", "point_transactions")
+        for index in inspector.get_indexes(table)
+    }
+
+
+def test_advised_indexes_remove_full_scans(db_session):
+    """Foreign key lookups stop scanning whole tables and the hot shapes use the new indexes"""
+    conn = db_session.connection()
+    DataGenerator(
+        conn, seed=3, days=90, orders_per_day=60, cell_count=10,
+        end_date=date(2026, 1, 18), chunk_size=5000
+    ).generate()
+
+    report = advise(conn, analyze=False)
+
+    assert report["orders.items"]["before"]["seqScans"] == ["order_items"]
+    assert report["orders.items"]["after"]["seqScans"] == []
+    assert report["cells.transactions_by_order"]["after"]["seqScans"] == []
+    assert report["orders.active"]["after"]["indexes"] == ["idx_orders_active"]
+    assert report["cells.transactions"]["after"]["sorts"] == 0
+    for name, result in report.items():
+        assert len(result["after"]["seqScans"]) <= len(result["before"]["seqScans"]), name
+
+
+def test_advise_restores_index_state(db_session):
+    """Without --apply the database keeps the indexes it had"""
+    conn = db_session.connection()
+    before = _index_names(conn)
+
+    advise(conn, analyze=False)
+
+    assert _index_names(conn) == before
+    assert set(ADVISED_INDEXES) <= before
+
+
+def test_plan_parsing():
+    """PostgreSQL and SQLite plan lines are both understood"""
+    postgres = [
+        "Limit  (cost=0.29..8.31 rows=1 width=4)",
+        "  ->  Index Scan Backward using idx_orders_status_created_at on orders  (cost=0.29..8.31 rows=1 width=4)",
+        "  ->  Seq Scan on order_items  (cost=0.00..35.50 rows=2550 width=4)",
+    ]
+    sqlite = ["SCAN orders USING INDEX idx_orders_active", "SCAN order_items"]
+
+    assert seq_scans(postgres) == ["order_items"]
+    assert indexes_used(postgres) == ["idx_orders_status_created_at"]
+    assert seq_scans(sqlite) == ["order_items"]
+    assert indexes_used(sqlite) == ["idx_orders_active"]
@@ -0,0 +1,130 @@
+"""
+Cross-worker cache invalidation tests
+"""
+import pytest
+from sqlalchemy.orm import Session
+
+from app.invalidation import InvalidationBus, MemoryChannel, LocalChannel, invalidation_bus, MENUS, CELLS, ALL
+from app.models.menu import Menu
+from app.services.catalog_cache import catalog_cache
+
+
+@pytest.fixture
+def workers():
+    """Two buses joined by a memory channel, recording what each receives"""
+    channel = MemoryChannel()
+    buses = [InvalidationBus(origin="a"), InvalidationBus(origin="b")]
+    received = {bus.origin: [] for bus in buses}
+    for bus in buses:
+        bus.use(channel)
+        bus.subscribe(received[bus.origin].append)
+    yield buses, received
+    channel.stop()
+
+
+class TestInvalidationBus:
+    """Test delivery on commit, versions and gaps"""
+
+    def test_commit_invalidates_every_worker(self, db_session: Session, workers):
+        """Test marked topics reach the local and the other worker once committed"""
+        (a, _), received = workers
+        a.mark(db_session, MENUS)
+        assert received == {"a": [], "b": []}
+
+        db_session.commit()
+        assert received == {"a": [MENUS], "b": [MENUS]}
+
+    def test_rollback_invalidates_nothing(self, db_session: Session, workers):
+        """Test a rolled-back transaction sends nothing"""
+        (a, _), received = workers
+        a.mark(db_session, CELLS)
+        db_session.rollback()
+
+        assert received == {"a": [], "b": []}
+
+    def test_each_commit_sends_its_own_topics(self, db_session: Session, workers):
+        """Test topics are sent once, not again by the session's next commit"""
+        (a, _), received = workers
+        a.mark(db_session, MENUS)
+        db_session.commit()
+        db_session.commit()
+
+        assert received == {"a": [MENUS], "b": [MENUS]}
+
+    def test_rolled_back_topics_not_sent_later(self, db_session: Session, workers):
+        """Test topics marked before a rollback are dropped, not sent with the next commit"""
+        (a, _), received = workers
+        a.mark(db_session, CELLS)
+        db_session.rollback()
+        a.mark(db_session, MENUS)
+        db_session.commit()
+
+        assert received == {"a": [MENUS], "b": [MENUS]}
+
+    def test_gap_invalidates_everything(self, workers):
+        """Test a missed message makes the receiver drop every topic"""
+        (_, b), received = workers
+        b.receive({"topic": MENUS, "origin": "c", "seq": 1})
+        b.receive({"topic": CELLS, "origin": "c", "seq": 3})
+        b.receive({"topic": MENUS, "origin": "c", "seq": 2})
+
+        assert received["b"] == [MENUS, ALL, MENUS]
+
+    def test_failing_handler_does_not_fail_writer(self, db_session: Session, workers):
+        """Test handler errors are logged, not raised"""
+        (a, _), received = workers
+        a.subscribe(lambda topic: 1 / 0)
+        a.mark(db_session, MENUS)
+        db_session.commit()
+
+        assert received["b"] == [MENUS]
+
+
+class TestCatalogCache:
+    """Test the public catalog lists are cached until invalidated"""
+
+    def test_menus_served_from_cache(self, client, test_menu, capture_sql):
+        """Test the second menu list reads nothing"""
+        client.get("/api/v1/menus")
+        with capture_sql() as statements:
+            response = client.get("/api/v1/menus")
+
+        assert statements == []
+        assert [m["name"] for m in response.json()["data"]] == ["아메리카노"]
+
+    def test_admin_write_invalidates(self, client, admin_headers, test_menu):
+        """Test a menu change is visible at once"""
+        client.get("/api/v1/menus")
+        response = client.patch(
+            f"/api/v1/menus/{test_menu.id}/sold-out", json={"is_sold_out": True}, headers=admin_headers
+        )
+        assert response.status_code == 200
+
+        response = client.get("/api/v1/menus")
+        assert response.json()["data"][0]["is_sold_out"] is True
+
+    def test_other_worker_write_invalidates(self, client, db_session: Session, test_menu):
+        """Test a write committed by another worker drops this worker's catalog"""
+        channel = MemoryChannel()
+        other = InvalidationBus(origin="other-worker")
+        invalidation_bus.use(channel)
+        other.use(channel)
+        try:
+            client.get("/api/v1/menus")
+            db_session.query(Menu).filter(Menu.id == test_menu.id).update({"name": "콜드브루"})
+            other.mark(db_session, MENUS)
+            db_session.commit()
+
+            response = client.get("/api/v1/menus")
+            assert response.json()["data"][0]["name"] == "콜드브루"
+        finally:
+            invalidation_bus.use(LocalChannel())
+
+    def test_load_racing_invalidation_is_not_kept(self):
+        """Test data loaded across an invalidation is returned but not cached"""
+        def load():
+            catalog_cache.handle_invalidation(MENUS)
+            return ["stale"]
+
+        assert catalog_cache.get_or_load("key", load) == ["stale"]
+        assert catalog_cache.get_or_load("key", lambda: ["fresh"]) == ["fresh"]
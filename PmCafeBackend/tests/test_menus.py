@@ -2,7 +2,10 @@
 Menu API tests
 Based on docs/backend/02-menu-api.md
 """
+import io
+
 import pytest
+from PIL import Image
 
 
 class TestMenusList:
@@ -120,3 +123,118 @@ class TestMenuDetail:
         data = response.json()
         assert data["success"] is False
         assert data["error"]["code"] == "MENU_NOT_FOUND"
+
+
+class TestMenuBulk:
+    """Test batch menu endpoints"""
+
+    def test_bulk_create(self, client, admin_headers, sample_categories, sample_option_groups):
+        """Test POST /api/v1/menus/bulk"""
+        response = client.post("/api/v1/menus/bulk", headers=admin_headers, json={
+            "menus": [
+                {"name": "딸기라떼", "price": 3500, "category_id": sample_categories[3].id,
+                 "option_group_ids": [sample_option_groups[0].id]},
+                {"name": "딸기에이드", "price": 3500, "category_id": sample_categories[3].id},
+            ]
+        })
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert [m["name"] for m in data["data"]] == ["딸기라떼", "딸기에이드"]
+
+    def test_bulk_create_unknown_option_group(self, client, admin_headers, sample_categories):
+        """Test one invalid option group rejects the whole batch"""
+        response = client.post("/api/v1/menus/bulk", headers=admin_headers, json={
+            "menus": [
+                {"name": "딸기라떼", "price": 3500, "category_id": sample_categories[3].id},
+                {"name": "딸기에이드", "price": 3500, "category_id": sample_categories[3].id,
+                 "option_group_ids": [999]},
+            ]
+        })
+        assert response.status_code == 404
+        assert response.json()["error"]["code"] == "OPTION_GROUP_NOT_FOUND"
+        assert client.get("/api/v1/menus").json()["data"] == []
+
+    def test_bulk_update(self, client, admin_headers, test_menu):
+        """Test PUT /api/v1/menus/bulk"""
+        response = client.put("/api/v1/menus/bulk", headers=admin_headers, json={
+            "menus": [{"id": test_menu.id, "price": 2800}]
+        })
+        assert response.status_code == 200
+        assert response.json()["data"][0]["price"] == 2800
+
+    def test_bulk_sold_out_and_reorder(self, client, admin_headers, test_menu):
+        """Test PATCH /api/v1/menus/sold-out and /reorder"""
+        response = client.patch("/api/v1/menus/sold-out", headers=admin_headers, json={
+            "menu_ids": [test_menu.id], "is_sold_out": True
+        })
+        assert response.status_code == 200
+        assert response.json()["data"]["updated"] == 1
+
+        response = client.patch("/api/v1/menus/reorder", headers=admin_headers, json={
+            "menus": [{"id": test_menu.id, "display_order": 5}]
+        })
+        assert response.status_code == 200
+
+        menu = client.get(f"/api/v1/menus/{test_menu.id}").json()["data"]
+        assert menu["is_sold_out"] is True
+        assert menu["display_order"] == 5
+
+    def test_bulk_requires_auth(self, client):
+        """Test batch endpoints require authentication"""
+        response = client.patch("/api/v1/menus/sold-out", json={"menu_ids": [1], "is_sold_out": True})
+        assert response.status_code in (401, 403)
+
+
+class TestMenuImage:
+    """Test POST/DELETE /api/v1/menus/{id}/image and serving the files"""
+
+    def _upload(self, client, admin_headers, menu_id, size=(1000, 1000)):
+        buffer = io.BytesIO()
+        Image.new("RGB", size, (90, 60, 30)).save(buffer, "JPEG")
+        return client.post(
+            f"/api/v1/menus/{menu_id}/image", headers=admin_headers,
+            files={"file": ("latte.jpg", buffer.getvalue(), "image/jpeg")}
+        )
+
+    def test_upload_exposes_variants_in_catalog(self, client, admin_headers, test_menu):
+        """Test the list and detail responses carry the variant URLs after an upload"""
+        response = self._upload(client, admin_headers, test_menu.id)
+        assert response.status_code == 200
+        variants = response.json()["data"]["image_variants"]
+        assert set(variants) == {"grid", "detail"}
+
+        assert client.get("/api/v1/menus").json()["data"][0]["image_variants"] == variants
+        detail = client.get(f"/api/v1/menus/{test_menu.id}").json()["data"]
+        assert detail["image_url"] == variants["detail"]["jpeg"]
+
+    def test_variant_served_immutable(self, client, admin_headers, test_menu):
+        """Test media files are served with a long immutable cache and without gzip"""
+        variants = self._upload(client, admin_headers, test_menu.id).json()["data"]["image_variants"]
+
+        response = client.get(variants["grid"]["webp"], headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/webp"
+        assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+        assert "content-encoding" not in response.headers
+
+        assert "cache-control" not in client.get("/media/menus/missing.webp").headers
+
+    def test_invalid_upload(self, client, admin_headers, test_menu):
+        response = client.post(
+            f"/api/v1/menus/{test_menu.id}/image", headers=admin_headers,
+            files={"file": ("menu.txt", b"hello", "text/plain")}
+        )
+        assert response.status_code == 400
+        assert response.json()["error"]["code"] == "INVALID_IMAGE"
+
+    def test_delete_image(self, client, admin_headers, test_menu):
+        self._upload(client, admin_headers, test_menu.id)
+
+        response = client.delete(f"/api/v1/menus/{test_menu.id}/image", headers=admin_headers)
+        assert response.status_code == 200
+        assert client.get(f"/api/v1/menus/{test_menu.id}").json()["data"]["image_variants"] is None
+
+    def test_upload_requires_auth(self, client, test_menu):
+        response = client.post(f"/api/v1/menus/{test_menu.id}/image", files={"file": ("a.jpg", b"x", "image/jpeg")})
+        assert response.status_code in (401, 403)
@@ -66,3 +66,67 @@ class TestOptionGroupList:
         assert data["data"][0]["name"] == "그룹1"
         assert data["data"][1]["name"] == "그룹2"
         assert data["data"][2]["name"] == "그룹3"
+
+
+class TestOptionDuplicateNames:
+    """Test duplicate option names are rejected with 409"""
+
+    def test_create_duplicate_group(self, client, admin_headers, sample_option_groups):
+        response = client.post(
+            "/api/v1/option-groups",
+            json={"name": "온도 선택", "type": "SINGLE"},
+            headers=admin_headers
+        )
+        assert response.status_code == 409
+        assert response.json()["error"]["code"] == "DUPLICATE_RESOURCE"
+
+    def test_rename_group_to_existing_name(self, client, admin_headers, sample_option_groups):
+        created = client.post(
+            "/api/v1/option-groups",
+            json={"name": "사이즈 선택", "type": "SINGLE"},
+            headers=admin_headers
+        ).json()["data"]
+
+        response = client.put(
+            f"/api/v1/option-groups/{created['id']}", json={"name": "온도 선택"}, headers=admin_headers
+        )
+        assert response.status_code == 409
+        assert response.json()["error"]["code"] == "DUPLICATE_RESOURCE"
+
+        # Keeping its own name is not a conflict
+        response = client.put(
+            f"/api/v1/option-groups/{created['id']}", json={"name": "사이즈 선택"}, headers=admin_headers
+        )
+        assert response.status_code == 200
+
+    def test_duplicate_item_within_group(self, client, admin_headers, sample_option_groups):
+        """Test item names are unique per group, not across groups"""
+        group_id = sample_option_groups[0].id
+
+        response = client.post(
+            f"/api/v1/option-groups/{group_id}/items", json={"name": "HOT", "price": 0}, headers=admin_headers
+        )
+        assert response.status_code == 409
+        assert response.json()["error"]["code"] == "DUPLICATE_RESOURCE"
+
+        other = client.post(
+            "/api/v1/option-groups", json={"name": "샷 추가", "type": "MULTIPLE"}, headers=admin_headers
+        ).json()["data"]
+        response = client.post(
+            f"/api/v1/option-groups/{other['id']}/items", json={"name": "HOT", "price": 0}, headers=admin_headers
+        )
+        assert response.status_code == 200
+
+    def test_rename_item_to_existing_name(self, client, admin_headers, db_session, sample_option_groups):
+        from app.models.menu import OptionItem
+
+        group_id = sample_option_groups[0].id
+        ice = db_session.query(OptionItem).filter(
+            OptionItem.option_group_id == group_id, OptionItem.name == "ICE"
+        ).first()
+
+        response = client.put(
+            f"/api/v1/option-groups/{group_id}/items/{ice.id}", json={"name": "HOT"}, headers=admin_headers
+        )
+        assert response.status_code == 409
+        assert response.json()["error"]["code"] == "DUPLICATE_RESOURCE"
@@ -199,6 +199,66 @@ class TestOrderCreate:
         assert response.status_code == 422  # Validation error
 
 
+class TestOrderBatchCreate:
+    """Test offline order batch upload"""
+
+    def _queued(self, menu, key, client_created_at="2026-10-19T09:00:00+09:00"):
+        return {
+            "payType": "PERSONAL",
+            "items": [{"menuId": menu.id, "menuName": menu.name, "menuPrice": menu.price, "quantity": 1}],
+            "totalAmount": menu.price,
+            "idempotencyKey": key,
+            "clientCreatedAt": client_created_at
+        }
+
+    def test_batch_create_and_resend(self, client, test_menu):
+        """Test a batch is created once, and a resend reports duplicates"""
+        body = {"orders": [
+            self._queued(test_menu, "kiosk1-0001"),
+            self._queued(test_menu, "kiosk1-0002", "2026-10-19T09:05:00+09:00")
+        ]}
+
+        response = client.post("/api/v1/orders/batch", json=body)
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert (data["created"], data["duplicates"], data["failed"]) == (2, 0, 0)
+        assert data["results"][0]["order"]["orderId"].startswith("ORD-")
+
+        data = client.post("/api/v1/orders/batch", json=body).json()["data"]
+        assert (data["created"], data["duplicates"], data["failed"]) == (0, 2, 0)
+
+        listed = client.get("/api/v1/orders").json()["data"]
+        assert listed["total"] == 2
+
+    def test_batch_create_reports_failures(self, client, test_menu):
+        """Test an order that cannot be created does not fail the batch"""
+        bad = self._queued(test_menu, "kiosk1-0003")
+        bad["payType"] = "CELL"
+
+        data = client.post("/api/v1/orders/batch", json={"orders": [
+            bad, self._queued(test_menu, "kiosk1-0004")
+        ]}).json()["data"]
+
+        assert (data["created"], data["failed"]) == (1, 1)
+        assert data["results"][0]["error"]["code"] == "MISSING_CELL_ID"
+
+    def test_batch_create_kiosk_inactive(self, client, admin_headers, test_menu):
+        """Test nothing is created while the kiosk is deactivated"""
+        client.put("/api/v1/settings/is_kiosk_active", json={"value": "false"}, headers=admin_headers)
+
+        response = client.post("/api/v1/orders/batch", json={"orders": [self._queued(test_menu, "kiosk1-0005")]})
+        assert response.status_code == 503
+        assert response.json()["error"]["code"] == "KIOSK_INACTIVE"
+
+    def test_batch_create_requires_idempotency_key(self, client, test_menu):
+        """Test every queued order needs its idempotency key"""
+        order = self._queued(test_menu, "kiosk1-0006")
+        del order["idempotencyKey"]
+
+        response = client.post("/api/v1/orders/batch", json={"orders": [order]})
+        assert response.status_code == 422
+
+
 class TestOrderList:
     """Test GET /api/v1/orders"""
 
@@ -399,3 +459,183 @@ class TestOrderStatusUpdate:
             json={"status": "INVALID"}
         )
         assert response.status_code == 422  # Validation error
+
+
+    def test_update_order_status_invalid_transition(self, client, test_order):
+        """Test PENDING -> COMPLETED is rejected"""
+        response = client.patch(
+            f"/api/v1/orders/{test_order.order_id}/status",
+            json={"status": "COMPLETED"}
+        )
+        assert response.status_code == 400
+        assert response.json()["error"]["code"] == "INVALID_STATUS_TRANSITION"
+
+    def test_update_order_status_conflict(self, client, test_order):
+        """Test a stale version returns 409"""
+        first = client.patch(
+            f"/api/v1/orders/{test_order.order_id}/status",
+            json={"status": "MAKING", "version": 1}
+        )
+        assert first.status_code == 200
+        assert first.json()["data"]["version"] == 2
+
+        second = client.patch(
+            f"/api/v1/orders/{test_order.order_id}/status",
+            json={"status": "COMPLETED", "version": 1}
+        )
+        assert second.status_code == 409
+        assert second.json()["error"]["code"] == "ORDER_CONFLICT"
+
+
+    def test_stale_list_version_conflicts(self, client, test_menu):
+        """Test two baristas acting on the version they both loaded from the list: the second gets 409"""
+        created = client.post("/api/v1/orders", json={
+            "payType": "PERSONAL",
+            "items": [{"menuId": test_menu.id, "menuName": test_menu.name, "menuPrice": test_menu.price, "quantity": 1}],
+            "totalAmount": test_menu.price
+        }).json()["data"]
+        assert created["version"] == 1
+
+        listed = client.get("/api/v1/orders").json()["data"]["orders"][0]
+        url = f"/api/v1/orders/{listed['orderId']}/status"
+
+        first = client.patch(url, json={"status": "MAKING", "version": listed["version"]})
+        second = client.patch(url, json={"status": "MAKING", "version": listed["version"]})
+
+        assert first.status_code == 200
+        assert second.status_code == 409
+        assert second.json()["error"]["code"] == "ORDER_CONFLICT"
+
+    def test_batch_update_order_status(self, client, test_order):
+        """Test PATCH /api/v1/orders/status"""
+        response = client.patch("/api/v1/orders/status", json={
+            "orderIds": [test_order.order_id, "ORD-nonexistent"],
+            "status": "MAKING"
+        })
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["updated"] == 1
+        assert data["failed"] == 1
+        assert data["results"][0]["status"] == "MAKING"
+        assert data["results"][1]["error"]["code"] == "ORDER_NOT_FOUND"
+
+    def test_status_update_cannot_cancel(self, client, db_session, test_order):
+        """Test both status endpoints reject CANCELLED (refunds go through the admin cancel API)"""
+        single = client.patch(f"/api/v1/orders/{test_order.order_id}/status", json={"status": "CANCELLED"})
+        batch = client.patch("/api/v1/orders/status", json={
+            "orderIds": [test_order.order_id], "status": "CANCELLED"
+        })
+
+        for response in (single, batch):
+            assert response.status_code == 400
+            assert response.json()["error"]["code"] == "CANCEL_REQUIRES_ADMIN"
+        db_session.refresh(test_order)
+        assert test_order.status.value == "PENDING"
+
+
+class TestOrderCancel:
+    """Test order cancellation endpoints"""
+
+    def _create_cell_order(self, client, sample_cell, menu):
+        response = client.post("/api/v1/orders", json={
+            "payType": "CELL",
+            "cellId": sample_cell.id,
+            "items": [{"menuId": menu.id, "menuName": menu.name, "menuPrice": menu.price, "quantity": 1}],
+            "totalAmount": menu.price
+        })
+        assert response.status_code == 201
+        return response.json()["data"]["orderId"]
+
+    def test_cancel_order_refunds_cell(self, client, admin_headers, sample_cell, test_menu, db_session):
+        """Test POST /api/v1/orders/{orderId}/cancel refunds the cell"""
+        initial_balance = sample_cell.balance
+        order_id = self._create_cell_order(client, sample_cell, test_menu)
+
+        response = client.post(
+            f"/api/v1/orders/{order_id}/cancel", json={"reason": "고객 요청"}, headers=admin_headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["status"] == "CANCELLED"
+        assert data["refund"] == {"cellId": sample_cell.id, "amount": test_menu.price, "balanceAfter": initial_balance}
+        assert data["cancelledAt"] is not None
+
+        again = client.post(f"/api/v1/orders/{order_id}/cancel", json={}, headers=admin_headers)
+        assert again.status_code == 409
+
+        db_session.refresh(sample_cell)
+        assert sample_cell.balance == initial_balance
+
+    def test_cancel_order_requires_auth(self, client, test_order):
+        """Test cancellation is admin only"""
+        response = client.post(f"/api/v1/orders/{test_order.order_id}/cancel", json={})
+        assert response.status_code in (401, 403)
+
+    def test_cancel_order_not_found(self, client, admin_headers):
+        """Test cancelling a missing order returns 404"""
+        response = client.post("/api/v1/orders/ORD-nonexistent/cancel", json={}, headers=admin_headers)
+        assert response.status_code == 404
+
+    def test_batch_cancel(self, client, admin_headers, sample_cell, test_menu, test_order):
+        """Test POST /api/v1/orders/cancel"""
+        order_id = self._create_cell_order(client, sample_cell, test_menu)
+
+        response = client.post("/api/v1/orders/cancel", json={
+            "orderIds": [order_id, test_order.order_id, "ORD-nonexistent"],
+            "reason": "마감 정리"
+        }, headers=admin_headers)
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["cancelled"] == 2
+        assert data["failed"] == 1
+        assert data["refundedAmount"] == test_menu.price
+        assert data["results"][0]["refund"]["cellId"] == sample_cell.id
+        assert data["results"][1]["refund"] is None
+
+
+class TestActiveOrders:
+    """Test GET /api/v1/orders/active"""
+
+    def _create_order(self, client, menu):
+        response = client.post("/api/v1/orders", json={
+            "payType": "PERSONAL",
+            "items": [{"menuId": menu.id, "menuName": menu.name, "menuPrice": menu.price, "quantity": 1}],
+            "totalAmount": menu.price
+        })
+        return response.json()["data"]["orderId"]
+
+    def test_active_orders_follow_status_changes(self, client, test_menu, test_order):
+        """Test the queue is loaded once and then follows order events"""
+        response = client.get("/api/v1/orders/active")
+        assert response.status_code == 200
+        assert [o["orderId"] for o in response.json()["data"]["orders"]] == [test_order.order_id]
+
+        new_order_id = self._create_order(client, test_menu)
+        client.patch(f"/api/v1/orders/{test_order.order_id}/status", json={"status": "MAKING"})
+
+        orders = client.get("/api/v1/orders/active").json()["data"]["orders"]
+        assert [(o["orderId"], o["status"], o["version"]) for o in orders] == [
+            (test_order.order_id, "MAKING", 2),
+            (new_order_id, "PENDING", 1),
+        ]
+
+        client.patch(f"/api/v1/orders/{test_order.order_id}/status", json={"status": "COMPLETED"})
+
+        data = client.get("/api/v1/orders/active").json()["data"]
+        assert data["total"] == 1
+        assert data["orders"][0]["orderId"] == new_order_id
+        assert data["orders"][0]["items"][0]["menuName"] == test_menu.name
+
+
+class TestOrderMetrics:
+    """Test GET /api/v1/orders/metrics"""
+
+    def test_metrics(self, client, test_order):
+        """Test queue depth is served from the kitchen queue"""
+        response = client.get("/api/v1/orders/metrics")
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["queueDepth"] == data["pendingOrders"] == 1
+        assert data["avgPrepSeconds"] is None
@@ -0,0 +1,150 @@
+"""
+Transactional outbox tests
+"""
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.events import ORDER_CREATED, ORDER_STATUS_CHANGED
+from app.models.order import OrderStatus
+from app.models.outbox import OutboxEvent
+from app.outbox import Outbox
+from app.realtime import EventFanout
+from app.schemas.order import CreateOrderRequest, OrderItemRequest
+from app.services.order_service import OrderService
+from app.exceptions import InsufficientBalanceError
+
+
+class RecordingFanout(EventFanout):
+    """Fan-out that records what the relay sends"""
+
+    def __init__(self):
+        super().__init__(origin="test")
+        self.sent = []
+
+    def publish(self, message, connection=None):
+        self.sent.append(message)
+
+
+@pytest.fixture
+def fanout():
+    return RecordingFanout()
+
+
+@pytest.fixture
+def box(fanout):
+    return Outbox(fanout=fanout, batch_size=2)
+
+
+def _order_request(menu, pay_type="PERSONAL", cell_id=None, quantity=1):
+    return CreateOrderRequest(
+        payType=pay_type,
+        cellId=cell_id,
+        items=[OrderItemRequest(menuId=menu.id, menuName=menu.name, menuPrice=menu.price, quantity=quantity)],
+        totalAmount=menu.price * quantity
+    )
+
+
+class TestOutboxRecord:
+    """Test events are written with the change"""
+
+    def test_order_and_event_commit_together(self, db_session: Session, box, test_menu):
+        """Test creating an order writes an unpublished order:created row"""
+        order = OrderService(outbox=box).create_order(db_session, _order_request(test_menu))
+
+        row = db_session.query(OutboxEvent).one()
+        assert row.event == ORDER_CREATED
+        assert row.payload["orderId"] == order.order_id
+        assert row.payload["createdAt"] is not None
+        assert row.origin == "test"
+        assert row.published_at is None
+
+    def test_failed_order_records_nothing(self, db_session: Session, box, test_menu, test_cell):
+        """Test an order that fails before commit leaves no event behind"""
+        service = OrderService(outbox=box)
+        with pytest.raises(InsufficientBalanceError):
+            service.create_order(db_session, _order_request(test_menu, "CELL", test_cell.id, quantity=1000))
+        db_session.rollback()
+
+        assert db_session.query(OutboxEvent).count() == 0
+
+    def test_status_change_records_event(self, db_session: Session, box, test_order):
+        """Test a status change writes order:status_changed with the previous status"""
+        OrderService(outbox=box).update_order_status(db_session, test_order.order_id, OrderStatus.MAKING)
+
+        row = db_session.query(OutboxEvent).one()
+        assert row.event == ORDER_STATUS_CHANGED
+        assert (row.payload["status"], row.payload["previousStatus"]) == ("MAKING", "PENDING")
+
+    def test_commit_wakes_relay(self, db_session: Session, box, test_order):
+        """Test the relay is woken by the commit, not before"""
+        box.record(db_session, ORDER_STATUS_CHANGED, {"orderId": test_order.order_id})
+        assert not box._wakeup.is_set()
+
+        db_session.commit()
+        assert box._wakeup.is_set()
+
+
+class TestOutboxDrain:
+    """Test the relay side"""
+
+    def _record(self, db, box, count):
+        for n in range(count):
+            box.record(db, ORDER_CREATED, {"orderId": f"ORD-{n}"})
+        db.commit()
+
+    def test_drain_sends_in_id_order_by_batch(self, db_session: Session, box, fanout):
+        """Test batches of `batch_size` in id order, each marked published"""
+        self._record(db_session, box, 3)
+
+        assert box.drain(db_session) == 2
+        assert box.drain(db_session) == 1
+        assert box.drain(db_session) == 0
+
+        ids = [row.id for row in db_session.query(OutboxEvent).order_by(OutboxEvent.id)]
+        assert [message["id"] for message in fanout.sent] == ids
+        assert [message["data"]["orderId"] for message in fanout.sent] == ["ORD-0", "ORD-1", "ORD-2"]
+        assert db_session.query(OutboxEvent).filter(OutboxEvent.published_at.is_(None)).count() == 0
+
+    def test_failed_commit_sends_again(self, db_session: Session, box, fanout, monkeypatch):
+        """Test at-least-once: a batch whose commit fails is sent again by the next drain"""
+        self._record(db_session, box, 1)
+
+        def fail():
+            raise RuntimeError("connection lost")
+
+        monkeypatch.setattr(db_session, "commit", fail)
+        with pytest.raises(RuntimeError):
+            box.drain(db_session)
+        monkeypatch.undo()
+        db_session.rollback()
+
+        assert box.drain(db_session) == 1
+        assert [message["id"] for message in fanout.sent] == [fanout.sent[0]["id"]] * 2
+
+    def test_purge_keeps_unpublished_and_recent(self, db_session: Session, box):
+        """Test only events published before the cutoff are deleted"""
+        self._record(db_session, box, 3)
+        old, recent, pending = db_session.query(OutboxEvent).order_by(OutboxEvent.id).all()
+        old.published_at = datetime.now() - timedelta(days=2)
+        recent.published_at = datetime.now()
+        db_session.commit()
+
+        assert box.purge(db_session) == 1
+        assert {row.id for row in db_session.query(OutboxEvent)} == {recent.id, pending.id}
+
+    def test_relay_thread_delivers_after_commit(self, db_session: Session, box, fanout):
+        """Test the background relay drains what a commit recorded"""
+        box.poll_seconds = 0.05
+        box.start(sessionmaker(bind=db_session.get_bind()))
+        try:
+            self._record(db_session, box, 1)
+            deadline = time.monotonic() + 2
+            while not fanout.sent and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            box.stop()
+
+        assert [message["data"]["orderId"] for message in fanout.sent] == ["ORD-0"]
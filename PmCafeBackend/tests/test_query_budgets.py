@@ -0,0 +1,258 @@
+"""
+Query budget / plan regression tests
+
+Every read endpoint has a maximum number of SQL statements. The count is
+measured twice, before and after adding more data, so an N+1 query fails
+even while it is still under budget.
+
+With PLAN_DATABASE_URL pointing at a throwaway PostgreSQL database, the
+statements each endpoint sends are also EXPLAINed against generated data
+(one year, created on first run) and a sequential scan on `orders` fails
+the test. Plans are written to PLAN_OUTPUT_DIR when it is set.
+
+    PLAN_DATABASE_URL=postgresql://localhost/pmcafe_plans PLAN_OUTPUT_DIR=.plans pytest tests/test_query_budgets.py
+"""
+import os
+import re
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.main import app
+from app.database import Base, get_db
+from app.models import (
+    Cell, Category, Menu, OptionGroup, OptionItem, OptionType, MenuOptionGroup,
+    Order, OrderItem, OrderItemOption, OrderStatus, PayType,
+    PointTransaction, TransactionType, DailySettlement, User, UserRole
+)
+from app.services.dashboard_service import dashboard_aggregate
+from app.services.kitchen_queue import active_orders
+from app.services.settlement_service import SettlementService, settlement_details
+from app.services.catalog_cache import catalog_cache
+from scripts.index_advisor import seq_scans
+
+TODAY = date.today()
+MONTH = TODAY.strftime("%Y-%m")
+MONTH_START = TODAY.replace(day=1).isoformat()
+
+# path -> maximum statements (authenticated routes include the user lookup)
+ROUTE_BUDGETS = {
+    "/api/v1/menus": 1,
+    "/api/v1/menus/{menu_id}": 1,
+    "/api/v1/categories": 1,
+    "/api/v1/option-groups": 1,
+    "/api/v1/cells": 2,
+    "/api/v1/cells/{cell_id}/transactions": 4,
+    "/api/v1/cells/{cell_id}/statement?month=" + MONTH: 8,
+    "/api/v1/cells/reconciliation": 3,
+    "/api/v1/orders": 2,
+    "/api/v1/orders?status=PENDING": 2,
+    "/api/v1/orders/active": 1,
+    "/api/v1/orders/metrics": 1,
+    "/api/v1/statistics/dashboard": 2,
+    "/api/v1/statistics/menus": 3,
+    "/api/v1/statistics/menus?startDate=" + MONTH_START: 3,
+    "/api/v1/statistics/categories?startDate=" + MONTH_START: 3,
+    "/api/v1/statistics/hourly": 4,
+    "/api/v1/statistics/heatmap?startDate=" + MONTH_START: 4,
+    "/api/v1/statistics/daily": 2,
+    "/api/v1/statistics/daily?startDate=" + MONTH_START: 2,
+    "/api/v1/settlements": 2,
+    "/api/v1/settlements/{settlement_date}": 7,
+    "/api/v1/settings": 2,
+}
+
+# Routes that read every order by design (no date filter, nothing rolled up): sequential scans allowed
+SEQ_SCAN_ALLOWED = {
+    "/api/v1/orders",
+    "/api/v1/statistics/menus",
+    "/api/v1/statistics/daily",
+}
+
+
+def _get(client, path, headers, ids):
+    # Projections load lazily; measure the cold path every time
+    active_orders.reset()
+    dashboard_aggregate.reset()
+    settlement_details.reset()
+    catalog_cache.reset()
+    response = client.get(path.format(**ids), headers=headers)
+    assert response.status_code == 200, response.text
+    return response
+
+
+class LedgerSeed:
+    """Grows a small but complete dataset: orders with items/options, cell payments, settlements"""
+
+    def __init__(self, db, admin):
+        self.db = db
+        self.admin = admin
+        self.orders = 0
+
+        category = Category(code="COFFEE", name="커피", display_order=1)
+        group = OptionGroup(name="온도", type=OptionType.SINGLE, is_required=True)
+        self.cell = Cell(name="청년부", leader="김셀장", phone_last4="1234", balance=0)
+        db.add_all([category, group, self.cell])
+        db.flush()
+        db.add(OptionItem(option_group_id=group.id, name="ICE", price=0))
+        self.menu = Menu(name="아메리카노", price=3000, category_id=category.id)
+        db.add(self.menu)
+        db.flush()
+        db.add(MenuOptionGroup(menu_id=self.menu.id, option_group_id=group.id))
+        db.commit()
+        self.ids = {
+            "menu_id": self.menu.id, "cell_id": self.cell.id,
+            "settlement_date": (TODAY - timedelta(days=1)).isoformat()
+        }
+
+    def grow(self, count):
+        db = self.db
+        for _ in range(count):
+            self.orders += 1
+            amount = self.menu.price * 2
+            self.cell.balance += amount
+            db.add(PointTransaction(
+                cell_id=self.cell.id, type=TransactionType.CHARGE, amount=amount,
+                balance_after=self.cell.balance, created_by=self.admin.id
+            ))
+
+            order = Order(
+                order_id=f"ORD-BUDGET-{self.orders}", daily_num=self.orders % 12 + 1,
+                pay_type=PayType.CELL, cell_id=self.cell.id, total_amount=amount,
+                status=OrderStatus.PENDING
+            )
+            db.add(order)
+            db.flush()
+            for _ in range(2):
+                item = OrderItem(
+                    order_id=order.id, menu_id=self.menu.id, menu_name=self.menu.name,
+                    menu_price=self.menu.price, quantity=1, total_price=self.menu.price
+                )
+                db.add(item)
+                db.flush()
+                db.add(OrderItemOption(
+                    order_item_id=item.id, option_group_name="온도",
+                    option_item_name="ICE", option_item_price=0
+                ))
+
+            self.cell.balance -= amount
+            db.add(PointTransaction(
+                cell_id=self.cell.id, type=TransactionType.USE, amount=-amount,
+                balance_after=self.cell.balance, order_id=order.id
+            ))
+            db.add(DailySettlement(
+                date=TODAY - timedelta(days=self.orders), total_orders=1, total_revenue=amount,
+                is_confirmed=True, confirmed_by=self.admin.id, confirmed_at=datetime.now()
+            ))
+        db.commit()
+
+
+class TestStatementBudgets:
+    """Statement counts per route, constant in the amount of data"""
+
+    @pytest.mark.parametrize("path, budget", ROUTE_BUDGETS.items(), ids=list(ROUTE_BUDGETS))
+    def test_route_statement_budget(
+        self, client, db_session, admin_headers, sample_admin_user, capture_sql, path, budget
+    ):
+        seed = LedgerSeed(db_session, sample_admin_user)
+        counts = []
+        for count in (2, 10):
+            seed.grow(count)
+            db_session.expire_all()
+            with capture_sql() as statements:
+                _get(client, path, admin_headers, seed.ids)
+            counts.append(len(statements))
+
+        assert counts[0] == counts[1], f"{path}: statements grow with data {counts} (N+1 query)"
+        assert counts[1] <= budget, f"{path}: {counts[1]} statements, budget {budget}"
+
+
+PLAN_DATABASE_URL = os.getenv("PLAN_DATABASE_URL")
+PLAN_OUTPUT_DIR = os.getenv("PLAN_OUTPUT_DIR")
+
+
+@pytest.fixture(scope="module")
+def plan_engine():
+    """PostgreSQL stand-in with a year of generated data (created once, kept between runs)"""
+    from scripts.generate_data import DataGenerator
+    import bcrypt
+
+    engine = create_engine(PLAN_DATABASE_URL)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        if conn.execute(select(func.count()).select_from(Order)).scalar() == 0:
+            DataGenerator(conn, seed=42, days=365, orders_per_day=150, cell_count=40).generate()
+        if conn.execute(select(User.id).where(User.username == "admin")).first() is None:
+            conn.execute(User.__table__.insert().values(
+                username="admin", name="관리자", role=UserRole.SUPER,
+                password_hash=bcrypt.hashpw(b"admin123", bcrypt.gensalt()).decode("utf-8")
+            ))
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.exec_driver_sql("ANALYZE")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def plan_client(plan_engine):
+    session = sessionmaker(bind=plan_engine)()
+
+    def override_get_db():
+        yield session
+
+    yesterday = TODAY - timedelta(days=1)
+    SettlementService().build_through(session, yesterday)
+
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as test_client:
+        token = test_client.post(
+            "/api/v1/auth/login", json={"username": "admin", "password": "admin123"}
+        ).json()["data"]["access_token"]
+        ids = {
+            "menu_id": session.execute(select(func.min(Menu.id))).scalar(),
+            "cell_id": session.execute(
+                select(PointTransaction.cell_id).group_by(PointTransaction.cell_id)
+                .order_by(func.count().desc()).limit(1)
+            ).scalar(),
+            "settlement_date": yesterday.isoformat(),
+        }
+        yield test_client, {"Authorization": f"Bearer {token}"}, ids
+    app.dependency_overrides.clear()
+    session.close()
+    active_orders.reset()
+    dashboard_aggregate.reset()
+    settlement_details.reset()
+
+
+@pytest.mark.skipif(not PLAN_DATABASE_URL, reason="PLAN_DATABASE_URL (PostgreSQL) not set")
+class TestQueryPlans:
+    """EXPLAIN every statement a route sends; no sequential scans on orders"""
+
+    @pytest.mark.parametrize("path", list(ROUTE_BUDGETS), ids=list(ROUTE_BUDGETS))
+    def test_route_plans(self, plan_engine, plan_client, capture_sql, path):
+        client, headers, ids = plan_client
+        with capture_sql(plan_engine) as statements:
+            _get(client, path, headers, ids)
+
+        plans = []
+        with plan_engine.connect() as conn:
+            for statement, parameters in statements:
+                if not statement.lstrip().upper().startswith("SELECT"):
+                    continue
+                plan = [row[0] for row in conn.exec_driver_sql("EXPLAIN " + statement, parameters)]
+                plans.append((statement, plan))
+
+        if PLAN_OUTPUT_DIR:
+            os.makedirs(PLAN_OUTPUT_DIR, exist_ok=True)
+            slug = re.sub(r"[^A-Za-z0-9]+", "_", path).strip("_")
+            with open(os.path.join(PLAN_OUTPUT_DIR, f"{slug}.txt"), "w") as f:
+                for statement, plan in plans:
+                    f.write(statement + "\n\n" + "\n".join(plan) + "\n\n" + "-" * 80 + "\n")
+
+        if path in SEQ_SCAN_ALLOWED:
+            return
+        for statement, plan in plans:
+            assert "orders" not in seq_scans(plan), f"{path}: sequential scan on orders\n{statement}\n" + "\n".join(plan)
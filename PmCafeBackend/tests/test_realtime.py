@@ -0,0 +1,209 @@
+"""
+Cross-worker event fan-out and WebSocket tests
+"""
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from app.events import EventBus, ORDER_CREATED, ORDER_STATUS_CHANGED, MENU_SOLD_OUT_CHANGED
+from app.invalidation import MemoryChannel
+from app.models.outbox import OutboxEvent
+from app.outbox import outbox
+from app.realtime import (
+    EventFanout, event_fanout, SYNC_REQUIRED, CURSOR_UNKNOWN, SUBSCRIBER_LAGGING, EVENTS_MISSED
+)
+
+
+@pytest.fixture
+def workers():
+    """Two workers (event bus + fan-out) joined by a memory channel, recording their bus events"""
+    channel = MemoryChannel()
+    fanouts = []
+    received = {}
+    for origin in ("a", "b"):
+        bus = EventBus()
+        fanout = EventFanout(events=bus, origin=origin, replay_size=3, queue_size=2)
+        received[origin] = []
+        bus.subscribe(lambda event, data, log=received[origin]: log.append((event, data["orderId"])))
+        fanout.use(channel)
+        fanouts.append(fanout)
+    yield fanouts, received
+    channel.stop()
+
+
+def _message(event_id, origin="a", event=ORDER_CREATED):
+    return {"id": event_id, "origin": origin, "event": event, "data": {"orderId": f"ORD-{event_id}"}}
+
+
+def _subscribe(fanout, last_event_id=None):
+    """Subscribe outside a running loop (frames are delivered once the loop runs)"""
+    loop = asyncio.new_event_loop()
+
+    async def subscribe():
+        return fanout.subscribe(last_event_id)
+
+    queue, backlog = loop.run_until_complete(subscribe())
+    return loop, queue, backlog
+
+
+def _drain(loop, queue):
+    loop.run_until_complete(asyncio.sleep(0))
+    frames = []
+    while not queue.empty():
+        frames.append(queue.get_nowait())
+    return frames
+
+
+class TestEventFanout:
+    """Test delivery across workers, replay and slow subscribers"""
+
+    def test_event_republished_on_other_workers_only(self, workers):
+        """Test the writing worker (already published locally) does not get its own event again"""
+        (a, b), received = workers
+        a.publish(_message(1, origin="a"))
+
+        assert received["a"] == []
+        assert received["b"] == [(ORDER_CREATED, "ORD-1")]
+
+    def test_workers_buffer_same_ids_in_same_order(self, workers):
+        """Test every worker buffers every event, whichever worker relayed it"""
+        (a, b), _ = workers
+        a.publish(_message(1, origin="b"))
+        b.publish(_message(2, origin="a"))
+
+        for fanout in (a, b):
+            _, _, backlog = _subscribe(fanout, 1)
+            assert [(f["id"], f["data"]["orderId"]) for f in backlog] == [(2, "ORD-2")]
+
+    def test_replay_after_last_event_id(self, workers):
+        """Test a reconnecting subscriber gets exactly the events after its cursor"""
+        (a, b), _ = workers
+        for n in range(1, 4):
+            a.publish(_message(n))
+
+        _, _, backlog = _subscribe(b, 1)
+        assert [frame["id"] for frame in backlog] == [2, 3]
+        assert _subscribe(b, 3)[2] == []
+        assert _subscribe(b)[2] == []
+
+    def test_unknown_cursor_requires_sync(self, workers):
+        """Test a cursor older than the replay buffer asks the client to reload"""
+        (a, b), _ = workers
+        for n in range(1, 5):
+            a.publish(_message(n))
+
+        _, _, backlog = _subscribe(b, 1)
+        assert backlog == [{"event": SYNC_REQUIRED, "data": {"reason": CURSOR_UNKNOWN}}]
+
+    def test_live_events_reach_subscribers(self, workers):
+        """Test subscribers of every worker receive live frames"""
+        (a, b), _ = workers
+        loop, queue, _ = _subscribe(b)
+        a.publish(_message(7, event=ORDER_STATUS_CHANGED))
+
+        frames = _drain(loop, queue)
+        assert [(f["id"], f["event"]) for f in frames] == [(7, ORDER_STATUS_CHANGED)]
+        loop.close()
+
+    def test_lagging_subscriber_gets_sync_required(self, workers):
+        """Test an overflowing queue is replaced by a single sync:required frame"""
+        (a, b), _ = workers
+        loop, queue, _ = _subscribe(b)
+        for n in range(1, 4):
+            a.publish(_message(n))
+
+        frames = _drain(loop, queue)
+        assert frames == [{"event": SYNC_REQUIRED, "data": {"reason": SUBSCRIBER_LAGGING}}]
+        loop.close()
+
+    def test_event_without_data_resyncs(self, workers):
+        """Test an event too large for the channel makes receivers reload and drop the buffer"""
+        (a, b), _ = workers
+        reloads = []
+        b.on_resync(lambda: reloads.append(True))
+        a.publish(_message(1))
+        loop, queue, _ = _subscribe(b)
+
+        b.receive({**_message(2), "data": None})
+
+        assert reloads == [True]
+        assert _drain(loop, queue) == [{"event": SYNC_REQUIRED, "data": {"reason": EVENTS_MISSED}}]
+        assert _subscribe(b, 1)[2][0]["event"] == SYNC_REQUIRED
+        loop.close()
+
+
+class TestEventSocket:
+    """Test the /ws endpoint"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_fanout(self):
+        event_fanout.reset()
+        yield
+        event_fanout.reset()
+
+    def _token(self, admin_headers):
+        return admin_headers["Authorization"].split(" ", 1)[1]
+
+    def _create_order(self, client, menu):
+        return client.post("/api/v1/orders", json={
+            "payType": "PERSONAL",
+            "items": [{
+                "menuId": menu.id, "menuName": menu.name, "menuPrice": menu.price,
+                "quantity": 1, "selectedOptions": []
+            }],
+            "totalAmount": menu.price
+        }).json()["data"]["orderId"]
+
+    def _relay(self, db_session):
+        """What the relay thread does after a commit"""
+        assert outbox.drain(db_session) > 0
+
+    def test_admin_receives_new_orders(self, client: TestClient, db_session, admin_headers, test_menu):
+        """Test an authenticated socket gets order:created with an event id"""
+        with client.websocket_connect(f"/ws?token={self._token(admin_headers)}") as ws:
+            order_id = self._create_order(client, test_menu)
+            self._relay(db_session)
+            frame = ws.receive_json()
+
+        assert frame["event"] == ORDER_CREATED
+        assert frame["data"]["orderId"] == order_id
+        assert frame["id"] == db_session.query(OutboxEvent.id).scalar()
+
+    def test_reconnect_replays_missed_events(self, client: TestClient, db_session, admin_headers, test_menu):
+        """Test reconnecting with lastEventId sends the events created while disconnected"""
+        token = self._token(admin_headers)
+        with client.websocket_connect(f"/ws?token={token}") as ws:
+            self._create_order(client, test_menu)
+            self._relay(db_session)
+            last_id = ws.receive_json()["id"]
+
+        missed = self._create_order(client, test_menu)
+        self._relay(db_session)
+
+        with client.websocket_connect(f"/ws?token={token}&lastEventId={last_id}") as ws:
+            frame = ws.receive_json()
+        assert frame["data"]["orderId"] == missed
+
+    def test_anonymous_socket_gets_menu_events_only(
+        self, client: TestClient, db_session, admin_headers, test_menu
+    ):
+        """Test kiosks without a token receive sold-out changes but no orders"""
+        with client.websocket_connect("/ws") as ws:
+            self._create_order(client, test_menu)
+            client.patch(f"/api/v1/menus/{test_menu.id}/sold-out", json={"is_sold_out": True}, headers=admin_headers)
+            self._relay(db_session)
+            frame = ws.receive_json()
+
+        assert frame["event"] == MENU_SOLD_OUT_CHANGED
+        assert frame["data"] == {
+            "menuId": test_menu.id, "menuName": "아메리카노", "isSoldOut": True, "updatedAt": frame["data"]["updatedAt"]
+        }
+
+    def test_invalid_token_is_rejected(self, client: TestClient, db_session):
+        """Test an invalid token closes the connection"""
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            with client.websocket_connect("/ws?token=invalid") as ws:
+                ws.receive_json()
+        assert exc_info.value.code == 1008
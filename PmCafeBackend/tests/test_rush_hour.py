@@ -0,0 +1,42 @@
+"""
+Rush-hour load test runner tests
+"""
+from benchmarks.rush_hour import LoadRecorder, percentile, main
+
+
+def test_percentile_nearest_rank():
+    """Test nearest-rank percentile calculation"""
+    samples = [float(i) for i in range(1, 101)]
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 95) == 95.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([], 99) == 0.0
+
+
+def test_report_counts_errors():
+    """Test per-endpoint report aggregation"""
+    recorder = LoadRecorder()
+    recorder.stats["GET /menus"].record(10.0, True)
+    recorder.stats["GET /menus"].record(30.0, False)
+    recorder.finish()
+
+    report = recorder.report()
+    endpoint = report["endpoints"]["GET /menus"]
+    assert endpoint["requests"] == 2
+    assert endpoint["errors"] == 1
+    assert endpoint["max_ms"] == 30.0
+    assert report["total_requests"] == 2
+
+
+def test_in_process_scenario_smoke(tmp_path):
+    """Test a short in-process run exercises every actor"""
+    report = main([
+        "--duration", "1", "--kiosks", "2", "--baristas", "1", "--admins", "1",
+        "--think-time", "0.05", "--poll-interval", "0.2",
+        "--json", str(tmp_path / "report.json")
+    ])
+
+    assert (tmp_path / "report.json").exists()
+    assert "POST /orders" in report["endpoints"]
+    assert "GET /statistics/dashboard" in report["endpoints"]
+    assert report["endpoints"]["GET /statistics/dashboard"]["errors"] == 0
@@ -0,0 +1,81 @@
+"""
+System settings API tests
+"""
+from app.models.settlement import SystemSetting
+
+
+class TestSettingsApi:
+    """Test the settings endpoints"""
+
+    def test_list_and_get(self, client, admin_headers):
+        """Test known settings are listed with defaults"""
+        response = client.get("/api/v1/settings", headers=admin_headers)
+        assert response.status_code == 200
+        assert "bonus_rate" in [s["key"] for s in response.json()["data"]]
+
+        response = client.get("/api/v1/settings/bonus_rate", headers=admin_headers)
+        assert response.json()["data"]["value"] == "10"
+
+        response = client.get("/api/v1/settings/nope", headers=admin_headers)
+        assert response.status_code == 404
+        assert response.json()["error"]["code"] == "SETTING_NOT_FOUND"
+
+    def test_update(self, client, admin_headers):
+        """Test a value is changed and invalid values are rejected"""
+        response = client.put("/api/v1/settings/bonus_rate", json={"value": "15"}, headers=admin_headers)
+        assert response.status_code == 200
+        assert response.json()["data"]["value"] == "15"
+        assert response.json()["data"]["updatedBy"]["name"] == "관리자"
+
+        response = client.put("/api/v1/settings/bonus_rate", json={"value": "many"}, headers=admin_headers)
+        assert response.status_code == 400
+        assert response.json()["error"]["code"] == "INVALID_VALUE"
+
+    def test_batch_update(self, client, admin_headers):
+        """Test several settings change together"""
+        response = client.patch("/api/v1/settings/batch", json={"settings": [
+            {"key": "bonus_rate", "value": "15"},
+            {"key": "is_kiosk_active", "value": "false"},
+        ]}, headers=admin_headers)
+        assert response.status_code == 200
+        assert response.json()["data"]["updated"] == 2
+
+    def test_create(self, client, admin_headers, db_session):
+        """Test SUPER admins add settings once"""
+        body = {"key": "custom_banner", "value": "환영합니다"}
+        response = client.post("/api/v1/settings", json=body, headers=admin_headers)
+        assert response.status_code == 201
+        assert db_session.query(SystemSetting).filter(SystemSetting.key == "custom_banner").count() == 1
+
+        response = client.post("/api/v1/settings", json=body, headers=admin_headers)
+        assert response.status_code == 409
+        assert response.json()["error"]["code"] == "DUPLICATE_KEY"
+
+
+class TestSettingsHotPaths:
+    """Test settings applied by order creation and point charging"""
+
+    def test_order_rejected_when_kiosk_inactive(self, client, admin_headers, test_menu):
+        """Test orders are refused right after the kiosk is deactivated"""
+        client.put("/api/v1/settings/is_kiosk_active", json={"value": "false"}, headers=admin_headers)
+
+        response = client.post("/api/v1/orders", json={
+            "payType": "PERSONAL",
+            "items": [{"menuId": test_menu.id, "menuName": test_menu.name, "menuPrice": test_menu.price, "quantity": 1}],
+            "totalAmount": test_menu.price
+        })
+        assert response.status_code == 503
+        assert response.json()["error"]["code"] == "KIOSK_INACTIVE"
+
+    def test_charge_uses_bonus_rate_setting(self, client, admin_headers, sample_cell):
+        """Test bonusRate defaults to the bonus_rate setting"""
+        client.put("/api/v1/settings/bonus_rate", json={"value": "20"}, headers=admin_headers)
+
+        response = client.post(f"/api/v1/cells/{sample_cell.id}/charge", json={"amount": 10000}, headers=admin_headers)
+        assert response.status_code == 200
+        assert response.json()["data"]["bonusAmount"] == 2000
+
+        response = client.post(
+            f"/api/v1/cells/{sample_cell.id}/charge", json={"amount": 10000, "bonusRate": 0}, headers=admin_headers
+        )
+        assert response.json()["data"]["bonusAmount"] == 0
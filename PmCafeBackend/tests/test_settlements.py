@@ -0,0 +1,68 @@
+"""
+Settlement API tests
+"""
+from datetime import date, timedelta
+
+
+class TestConfirmSettlement:
+    """Test the settlement confirmation endpoint"""
+
+    def test_confirm(self, client, admin_headers, test_order):
+        """Test today's orders are settled and confirmed"""
+        today = date.today().isoformat()
+        response = client.post(f"/api/v1/settlements/{today}/confirm", headers=admin_headers)
+        assert response.status_code == 200
+        assert response.json()["data"]["isConfirmed"] is True
+
+        response = client.get("/api/v1/settlements", headers=admin_headers)
+        settlement = response.json()["data"][0]
+        assert (settlement["date"], settlement["totalOrders"], settlement["cancelledOrders"]) == (today, 1, 0)
+
+    def test_confirm_twice(self, client, admin_headers):
+        """Test a second confirmation is a conflict"""
+        today = date.today().isoformat()
+        client.post(f"/api/v1/settlements/{today}/confirm", headers=admin_headers)
+
+        response = client.post(f"/api/v1/settlements/{today}/confirm", headers=admin_headers)
+        assert response.status_code == 409
+        assert response.json()["error"]["code"] == "ALREADY_CONFIRMED"
+
+    def test_confirm_future_date(self, client, admin_headers):
+        """Test future dates are rejected"""
+        tomorrow = (date.today() + timedelta(days=1)).isoformat()
+        response = client.post(f"/api/v1/settlements/{tomorrow}/confirm", headers=admin_headers)
+        assert response.status_code == 400
+        assert response.json()["error"]["code"] == "FUTURE_DATE"
+
+    def test_invalid_date(self, client, admin_headers):
+        """Test malformed dates are rejected"""
+        response = client.post("/api/v1/settlements/2026-13-01/confirm", headers=admin_headers)
+        assert response.status_code == 400
+        assert response.json()["error"]["code"] == "INVALID_DATE_FORMAT"
+
+
+class TestSettlementDetail:
+    """Test the settlement detail endpoint"""
+
+    def test_detail(self, client, admin_headers, test_order):
+        """Test a confirmed day is returned with its breakdowns"""
+        today = date.today().isoformat()
+        client.post(f"/api/v1/settlements/{today}/confirm", headers=admin_headers)
+
+        response = client.get(f"/api/v1/settlements/{today}", headers=admin_headers)
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["summary"]["totalOrders"] == 1
+        assert data["confirmedBy"]["name"] == "관리자"
+        assert [m["menuName"] for m in data["menuBreakdown"]] == ["아메리카노"]
+
+    def test_not_found(self, client, admin_headers):
+        """Test a day without a settlement"""
+        response = client.get("/api/v1/settlements/2026-01-01", headers=admin_headers)
+        assert response.status_code == 404
+        assert response.json()["error"]["code"] == "SETTLEMENT_NOT_FOUND"
+
+    def test_requires_auth(self, client):
+        """Test the detail is for admins only"""
+        response = client.get("/api/v1/settlements/2026-01-01")
+        assert response.status_code == 401
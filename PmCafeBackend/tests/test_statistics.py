@@ -0,0 +1,78 @@
+"""
+Statistics API tests
+"""
+
+
+class TestMenuStatistics:
+    """Test menu and category sales endpoints"""
+
+    def test_menu_statistics(self, client, admin_headers, test_order, test_menu, sample_categories):
+        """Test menus are reported by id with their category"""
+        response = client.get("/api/v1/statistics/menus", headers=admin_headers)
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data == [{
+            "menuId": test_menu.id,
+            "menuName": "아메리카노",
+            "categoryId": sample_categories[0].id,
+            "categoryName": "커피",
+            "quantity": 1,
+            "revenue": 5000,
+            "orderCount": 1,
+            "averagePrice": 5000
+        }]
+
+    def test_menu_statistics_category_filter(self, client, admin_headers, test_order, sample_categories):
+        """Test categoryId is applied"""
+        response = client.get(
+            "/api/v1/statistics/menus", params={"categoryId": sample_categories[2].id}, headers=admin_headers
+        )
+        assert response.status_code == 200
+        assert response.json()["data"] == []
+
+    def test_category_statistics(self, client, admin_headers, test_order):
+        """Test categories carry their revenue share"""
+        response = client.get("/api/v1/statistics/categories", headers=admin_headers)
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert [(c["categoryCode"], c["revenue"], c["percentage"]) for c in data] == [("COFFEE", 5000, 100.0)]
+
+    def test_invalid_date(self, client, admin_headers):
+        """Test invalid dates are rejected"""
+        response = client.get("/api/v1/statistics/menus", params={"startDate": "2026/01/01"}, headers=admin_headers)
+        assert response.status_code == 400
+        assert response.json()["error"]["code"] == "INVALID_DATE_FORMAT"
+
+    def test_requires_auth(self, client):
+        """Test the report is admin-only"""
+        response = client.get("/api/v1/statistics/categories")
+        assert response.status_code in (401, 403)
+
+
+class TestTimeStatistics:
+    """Test hourly and heatmap endpoints"""
+
+    def test_hourly(self, client, admin_headers, test_order):
+        """Test today's order shows up in its hour"""
+        response = client.get("/api/v1/statistics/hourly", headers=admin_headers)
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert len(data) == 1
+        assert data[0]["orders"] == 1
+        assert data[0]["items"] == 1
+        assert data[0]["avgPrepSeconds"] is None
+
+    def test_heatmap(self, client, admin_headers, test_order):
+        """Test the heatmap has one cell and matching marginals"""
+        response = client.get("/api/v1/statistics/heatmap", params={"interval": 15}, headers=admin_headers)
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["interval"] == 15
+        assert len(data["cells"]) == 1
+        assert data["weekdays"][0]["revenue"] == data["slots"][0]["revenue"] == 5000
+
+    def test_heatmap_invalid_interval(self, client, admin_headers):
+        """Test only 15/30/60 minute slots are accepted"""
+        response = client.get("/api/v1/statistics/heatmap", params={"interval": 7}, headers=admin_headers)
+        assert response.status_code == 400
+        assert response.json()["error"]["code"] == "INVALID_INTERVAL"
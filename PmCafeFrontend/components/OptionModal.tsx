@@ -101,7 +101,14 @@ const OptionModal: React.FC<OptionModalProps> = ({ menu, isOpen, onClose, onAddT
       >
         {/* Header Image & Close */}
         <div className="relative h-48 bg-[#3D3D3D] shrink-0">
-          <img src={menu.imageUrl} alt={menu.name} className="w-full h-full object-cover opacity-90" />
+          {menu.imageVariants ? (
+            <picture>
+              <source srcSet={menu.imageVariants.detail.webp} type="image/webp" />
+              <img src={menu.imageVariants.detail.jpeg} alt={menu.name} className="w-full h-full object-cover opacity-90" />
+            </picture>
+          ) : (
+            <img src={menu.imageUrl} alt={menu.name} className="w-full h-full object-cover opacity-90" />
+          )}
           <div className="absolute top-0 inset-x-0 h-16 bg-gradient-to-b from-black/60 to-transparent"></div>
           <button 
             onClick={onClose}
@@ -28,7 +28,19 @@ export const MenuCard = React.memo(({ item, onClick }: MenuCardProps) => {
       `}
     >
       <div className="aspect-square bg-[#3D3D3D] relative">
-        <img src={item.imageUrl} alt={item.name} className="w-full h-full object-cover" />
+        {item.imageVariants ? (
+          <picture>
+            <source srcSet={item.imageVariants.grid.webp} type="image/webp" />
+            <img
+              src={item.imageVariants.grid.jpeg}
+              alt={item.name}
+              loading="lazy"
+              className="w-full h-full object-cover"
+            />
+          </picture>
+        ) : (
+          <img src={item.imageUrl} alt={item.name} className="w-full h-full object-cover" />
+        )}
         {item.isSoldOut && (
           <div className="absolute inset-0 bg-black/60 flex items-center justify-center">
             <span className="text-white font-bold border-2 border-white px-4 py-1 transform -rotate-12">SOLD OUT</span>
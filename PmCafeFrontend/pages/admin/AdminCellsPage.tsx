@@ -2,7 +2,7 @@ import React, { useState, useEffect } from 'react';
 import { AdminLayout } from '../../components/AdminLayout';
 import { Plus, Search, Edit, CreditCard, X, History } from 'lucide-react';
 import { CellInfo } from '../../types';
-import { cellApi } from '../../shared/api/cells';
+import { cellApi, CellTransaction } from '../../shared/api/cells';
 
 interface AdminCellsPageProps {
   onLogout?: () => void;
@@ -489,25 +489,8 @@ interface TransactionHistoryModalProps {
   onClose: () => void;
 }
 
-interface Transaction {
-  id: number;
-  type: 'CHARGE' | 'USE' | 'REFUND';
-  amount: number;
-  balanceAfter: number;
-  memo?: string;
-  createdAt: string;
-  createdBy?: {
-    id: number;
-    name: string;
-  };
-  order?: {
-    orderId: string;
-    dailyNum: number;
-  };
-}
-
 const TransactionHistoryModal: React.FC<TransactionHistoryModalProps> = ({ cell, onClose }) => {
-  const [transactions, setTransactions] = useState<Transaction[]>([]);
+  const [transactions, setTransactions] = useState<CellTransaction[]>([]);
   const [isLoading, setIsLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [filters, setFilters] = useState({
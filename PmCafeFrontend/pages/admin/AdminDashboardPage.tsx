@@ -31,9 +31,10 @@ export const AdminDashboardPage: React.FC<AdminDashboardPageProps> = ({ onLogout
       // 메뉴별 판매 통계 가져오기 (오늘 데이터)
       const menuStatsData = await statisticsApi.getMenuStats({
         startDate: today,
-        endDate: today
+        endDate: today,
+        limit: 5 // TOP 5만
       });
-      setTopMenus(menuStatsData.slice(0, 5)); // TOP 5만
+      setTopMenus(menuStatsData);
     } catch (err) {
       console.error('Failed to fetch dashboard data:', err);
       setError('통계 데이터를 불러오는데 실패했습니다');
@@ -2,6 +2,7 @@
  * Cell API
  */
 import apiClient from './client';
+import { decodeColumnar } from './columnar';
 
 export interface CellAuthRequest {
   phoneLast4: string;
@@ -26,6 +27,23 @@ export interface ChargeCellRequest {
   memo?: string;
 }
 
+export interface CellTransaction {
+  id: number;
+  type: 'CHARGE' | 'USE' | 'REFUND';
+  amount: number;
+  balanceAfter: number;
+  memo?: string;
+  createdAt: string;
+  createdBy?: {
+    id: number;
+    name: string;
+  };
+  order?: {
+    orderId: string;
+    dailyNum: number;
+  };
+}
+
 export const cellApi = {
   /**
    * 셀 인증 (휴대폰 뒷4자리)
@@ -75,8 +93,15 @@ export const cellApi = {
     type?: string;
     limit?: number;
     offset?: number;
-  }): Promise<any[]> => {
-    const response = await apiClient.get(`/api/v1/cells/${cellId}/transactions`, { params });
-    return response;
+  }): Promise<{
+    transactions: CellTransaction[];
+    total: number;
+    limit: number;
+    offset: number;
+  }> => {
+    const response: any = await apiClient.get(`/api/v1/cells/${cellId}/transactions`, {
+      params: { ...params, format: 'columnar' },
+    });
+    return { ...response, transactions: decodeColumnar<CellTransaction>(response.transactions) };
   },
 };
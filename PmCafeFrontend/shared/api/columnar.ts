@@ -0,0 +1,40 @@
+/**
+ * Columnar list decoding
+ * 목록 API의 `?format=columnar` 응답을 객체 배열로 되돌림 (백엔드 app/utils/columnar.py)
+ */
+
+type ColumnarColumn =
+  | string
+  | { name: string; strings: true }
+  | { name: string; columns: ColumnarColumn[]; many: boolean };
+
+export interface ColumnarTable {
+  columns: ColumnarColumn[];
+  rows: unknown[][];
+  strings: string[];
+}
+
+const decodeRow = (columns: ColumnarColumn[], row: unknown[], strings: string[]) => {
+  const obj: Record<string, unknown> = {};
+  columns.forEach((column, index) => {
+    let value = row[index];
+    if (typeof column === 'string') {
+      obj[column] = value;
+      return;
+    }
+    if (value !== null && value !== undefined) {
+      if (!('columns' in column)) {
+        value = strings[value as number];
+      } else if (column.many) {
+        value = (value as unknown[][]).map((nested) => decodeRow(column.columns, nested, strings));
+      } else {
+        value = decodeRow(column.columns, value as unknown[], strings);
+      }
+    }
+    obj[column.name] = value ?? null;
+  });
+  return obj;
+};
+
+export const decodeColumnar = <T>(table: ColumnarTable): T[] =>
+  table.rows.map((row) => decodeRow(table.columns, row, table.strings) as T);
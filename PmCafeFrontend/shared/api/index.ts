@@ -11,7 +11,7 @@ export { categoryApi } from './categories';
 export { settlementApi } from './settlements';
 
 export type { LoginRequest, LoginResponse, UserInfo } from './auth';
-export type { CellAuthRequest } from './cells';
+export type { CellAuthRequest, CellTransaction } from './cells';
 export type { CreateOrderRequest, OrderListParams, UpdateOrderStatusRequest } from './orders';
 export type { DashboardStats, MenuStats, DailyStats } from './statistics';
 export type { Category, CategoryCreateRequest, CategoryUpdateRequest } from './categories';
@@ -2,7 +2,7 @@
  * Menu API
  */
 import apiClient from './client';
-import { MenuItem } from '../../types';
+import { MenuImageVariants, MenuItem } from '../../types';
 
 export interface CreateMenuRequest {
   name: string;
@@ -26,6 +26,17 @@ export interface UpdateMenuRequest {
   option_group_ids?: number[];
 }
 
+/**
+ * API 응답(snake_case)의 이미지/품절 필드를 MenuItem(camelCase) 필드로 변환
+ */
+const toMenuItem = (menu: any): MenuItem => ({
+  ...menu,
+  engName: menu.eng_name,
+  imageUrl: menu.image_url,
+  imageVariants: menu.image_variants ?? null,
+  isSoldOut: menu.is_sold_out,
+});
+
 export const menuApi = {
   /**
    * 메뉴 목록 조회
@@ -34,8 +45,8 @@ export const menuApi = {
     category_id?: number;
     include_inactive?: boolean;
   }): Promise<MenuItem[]> => {
-    const response = await apiClient.get('/api/v1/menus', { params });
-    return response;
+    const response: any = await apiClient.get('/api/v1/menus', { params });
+    return response.map(toMenuItem);
   },
 
   /**
@@ -43,7 +54,7 @@ export const menuApi = {
    */
   getMenuDetail: async (menuId: number): Promise<MenuItem> => {
     const response = await apiClient.get(`/api/v1/menus/${menuId}`);
-    return response;
+    return toMenuItem(response);
   },
 
   /**
@@ -70,6 +81,29 @@ export const menuApi = {
     return response;
   },
 
+  /**
+   * 메뉴 이미지 업로드 (관리자) - 리사이즈된 WebP/JPEG URL 반환
+   */
+  uploadMenuImage: async (menuId: number, file: File): Promise<{
+    id: number;
+    image_url: string;
+    image_variants: MenuImageVariants;
+  }> => {
+    const formData = new FormData();
+    formData.append('file', file);
+    const response = await apiClient.post(`/api/v1/menus/${menuId}/image`, formData, {
+      headers: { 'Content-Type': 'multipart/form-data' },
+    });
+    return response;
+  },
+
+  /**
+   * 메뉴 이미지 제거 (관리자)
+   */
+  deleteMenuImage: async (menuId: number): Promise<void> => {
+    await apiClient.delete(`/api/v1/menus/${menuId}/image`);
+  },
+
   /**
    * 메뉴 삭제 (SUPER 관리자)
    */
@@ -2,6 +2,7 @@
  * Order API
  */
 import apiClient from './client';
+import { decodeColumnar } from './columnar';
 import { Order, PaymentMode } from '../../types';
 
 export interface CreateOrderRequest {
@@ -23,6 +24,19 @@ export interface CreateOrderRequest {
   totalAmount: number;
 }
 
+export interface QueuedOrderRequest extends CreateOrderRequest {
+  idempotencyKey: string;
+  clientCreatedAt: string;
+}
+
+export interface QueuedOrderResult {
+  idempotencyKey: string;
+  success: boolean;
+  duplicate: boolean;
+  order: Order | null;
+  error: { code: string; message: string } | null;
+}
+
 export interface OrderListParams {
   status?: string;
   payType?: string;
@@ -32,6 +46,8 @@ export interface OrderListParams {
 
 export interface UpdateOrderStatusRequest {
   status: string;
+  expectedStatus?: string;
+  version?: number; // 목록에서 받은 주문 버전 (다르면 409 ORDER_CONFLICT)
 }
 
 export const orderApi = {
@@ -43,6 +59,19 @@ export const orderApi = {
     return response;
   },
 
+  /**
+   * 오프라인 주문 일괄 업로드
+   */
+  createOrdersBatch: async (orders: QueuedOrderRequest[]): Promise<{
+    results: QueuedOrderResult[];
+    created: number;
+    duplicates: number;
+    failed: number;
+  }> => {
+    const response = await apiClient.post('/api/v1/orders/batch', { orders });
+    return response;
+  },
+
   /**
    * 주문 목록 조회
    */
@@ -52,8 +81,10 @@ export const orderApi = {
     limit: number;
     offset: number;
   }> => {
-    const response = await apiClient.get('/api/v1/orders', { params });
-    return response;
+    const response: any = await apiClient.get('/api/v1/orders', {
+      params: { ...params, format: 'columnar' },
+    });
+    return { ...response, orders: decodeColumnar<Order>(response.orders) };
   },
 
   /**
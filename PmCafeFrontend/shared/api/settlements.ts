@@ -12,6 +12,8 @@ export interface DailySettlement {
   personalRevenue: number;
   cellOrders: number;
   cellRevenue: number;
+  cancelledOrders: number;
+  cancelledAmount: number;
   isConfirmed: boolean;
   confirmedBy?: {
     id: number;
@@ -22,6 +24,59 @@ export interface DailySettlement {
   createdAt: string;
 }
 
+export interface SettlementDetail {
+  id: number;
+  date: string; // YYYY-MM-DD
+  summary: {
+    totalOrders: number;
+    totalRevenue: number;
+    personalOrders: number;
+    personalRevenue: number;
+    cellOrders: number;
+    cellRevenue: number;
+    cancelledOrders: number;
+    cancelledAmount: number;
+  };
+  paymentBreakdown: Record<'personal' | 'cell', { orders: number; revenue: number; percentage: number }>;
+  categoryBreakdown: {
+    categoryId: number | null;
+    categoryName: string | null;
+    quantity: number;
+    revenue: number;
+    percentage: number;
+  }[];
+  menuBreakdown: {
+    menuId: number;
+    menuName: string;
+    categoryId: number | null;
+    categoryName: string | null;
+    quantity: number;
+    revenue: number;
+    orderCount: number;
+    averagePrice: number;
+  }[];
+  cellBreakdown: {
+    cellId: number;
+    cellName: string;
+    orders: number;
+    revenue: number;
+    closingBalance: number | null;
+  }[];
+  hourlyBreakdown: {
+    hour: number;
+    orders: number;
+    revenue: number;
+    items: number;
+    completedOrders: number;
+    avgPrepSeconds: number | null;
+  }[];
+  isConfirmed: boolean;
+  confirmedBy: { id: number; name: string } | null;
+  confirmedAt: string | null;
+  calculatedAt: string | null;
+  notes: string | null;
+}
+
 export interface SettlementListParams {
   startDate?: string; // YYYY-MM-DD
   endDate?: string; // YYYY-MM-DD
@@ -39,7 +94,7 @@ export const settlementApi = {
   /**
    * 특정 날짜 정산 조회
    */
-  getSettlementByDate: async (date: string): Promise<DailySettlement> => {
+  getSettlementByDate: async (date: string): Promise<SettlementDetail> => {
     return apiClient.get(`/api/v1/settlements/${date}`);
   },
 
@@ -2,6 +2,7 @@
  * Statistics API
  */
 import apiClient from './client';
+import { decodeColumnar } from './columnar';
 
 export interface DashboardStats {
   date: string;
@@ -17,9 +18,14 @@ export interface DashboardStats {
 }
 
 export interface MenuStats {
+  menuId: number;
   menuName: string;
+  categoryId: number | null;
+  categoryName: string | null;
   quantity: number;
   revenue: number;
+  orderCount: number;
+  averagePrice: number;
 }
 
 export interface DailyStats {
@@ -49,6 +55,7 @@ export const statisticsApi = {
     startDate?: string;
     endDate?: string;
     categoryId?: number;
+    limit?: number;
   }): Promise<MenuStats[]> => {
     const response = await apiClient.get('/api/v1/statistics/menus', { params });
     return response;
@@ -61,7 +68,9 @@ export const statisticsApi = {
     startDate?: string;
     endDate?: string;
   }): Promise<DailyStats[]> => {
-    const response = await apiClient.get('/api/v1/statistics/daily', { params });
-    return response;
+    const response: any = await apiClient.get('/api/v1/statistics/daily', {
+      params: { ...params, format: 'columnar' },
+    });
+    return decodeColumnar<DailyStats>(response);
   },
 };
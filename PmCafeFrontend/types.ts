@@ -19,6 +19,11 @@ export interface OptionGroup {
   items: OptionItem[];
 }
 
+export interface MenuImageVariants {
+  grid: { webp: string; jpeg: string };
+  detail: { webp: string; jpeg: string };
+}
+
 export interface MenuItem {
   id: number;
   name: string;
@@ -27,6 +32,7 @@ export interface MenuItem {
   category: Category;
   description: string;
   imageUrl: string;
+  imageVariants?: MenuImageVariants | null; // 업로드한 이미지의 리사이즈 파일 (grid 320px, detail 800px)
   isSoldOut?: boolean;
   optionGroups: OptionGroup[]; // In a real app, this might be a relation ID
 }
@@ -60,6 +66,7 @@ export interface Order {
   items: CartItem[];
   totalAmount: number;
   status: OrderStatus;
+  version?: number;
   createdAt: Date;
   completedAt?: Date;
 }